@@ -5,6 +5,7 @@ from .context import AgentContext, SendFileAction, build_system_prompt
 from .base import BaseAgent
 from .recursive import RecursiveAgent
 from .status import StatusCallback, StatusPhase, ToolStatus
+from .streaming import StreamCallback
 
 __all__ = [
     "AgentProfile",
@@ -15,5 +16,6 @@ __all__ = [
     "RecursiveAgent",
     "StatusCallback",
     "StatusPhase",
+    "StreamCallback",
     "ToolStatus",
 ]
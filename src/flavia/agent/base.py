@@ -1,8 +1,12 @@
 """Base agent class for flavIA."""
 
 import json
+import threading
+import weakref
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.thread import _threads_queues, _worker
+from typing import Any, Callable, Optional
 
 import httpx
 from openai import (
@@ -19,6 +23,41 @@ from flavia.tools import registry
 from .context import AgentContext, build_system_prompt, build_tools_description
 from .profile import AgentProfile
 from .status import StatusCallback, ToolStatus
+from .streaming import StreamAssembler, StreamCallback
+
+
+class _DaemonThreadPoolExecutor(ThreadPoolExecutor):
+    """Thread pool executor that uses daemon threads.
+
+    Daemon workers ensure the CLI can exit cleanly even if sub-agent tasks
+    or tool calls are still running after an interruption.
+    """
+
+    def _adjust_thread_count(self) -> None:
+        # Mirrors ThreadPoolExecutor internals, but marks workers as daemon.
+        if self._idle_semaphore.acquire(timeout=0):
+            return
+
+        def weakref_cb(_, q=self._work_queue):
+            q.put(None)
+
+        num_threads = len(self._threads)
+        if num_threads < self._max_workers:
+            thread_name = f"{self._thread_name_prefix or self}_{num_threads}"
+            t = threading.Thread(
+                name=thread_name,
+                target=_worker,
+                args=(
+                    weakref.ref(self, weakref_cb),
+                    self._work_queue,
+                    self._initializer,
+                    self._initargs,
+                ),
+            )
+            t.daemon = True
+            t.start()
+            self._threads.add(t)
+            _threads_queues[t] = self._work_queue
 
 
 class BaseAgent(ABC):
@@ -31,9 +70,13 @@ class BaseAgent(ABC):
         agent_id: str = "main",
         depth: int = 0,
         parent_id: Optional[str] = None,
+        client: Optional[OpenAI] = None,
+        schema_cache: Optional[dict[tuple, list[dict[str, Any]]]] = None,
     ):
         self.settings = settings
         self.profile = profile
+        # Tool schemas shared across an agent tree (see _build_tool_schemas)
+        self._schema_cache = schema_cache
 
         # Resolve provider and model using new multi-provider system
         self.provider, self.model_id = settings.resolve_model_with_provider(profile.model)
@@ -47,7 +90,8 @@ class BaseAgent(ABC):
         )
         self.context.rag_debug = bool(getattr(settings, "rag_debug", False))
 
-        self.client = self._create_openai_client(self.provider)
+        # Sub-agents pass the parent's client to share its HTTP connection pool.
+        self.client = client if client is not None else self._create_openai_client(self.provider)
 
         self.tool_schemas = self._build_tool_schemas()
         self.messages: list[dict[str, Any]] = []
@@ -64,6 +108,8 @@ class BaseAgent(ABC):
 
         # Status callback for real-time tool status updates
         self.status_callback: Optional[StatusCallback] = None
+        # Receives text deltas when STREAM_RESPONSES is enabled (not inherited by sub-agents)
+        self.stream_callback: Optional[StreamCallback] = None
         (
             self.profile.compact_threshold,
             self.profile.compact_threshold_source,
@@ -73,12 +119,28 @@ class BaseAgent(ABC):
 
     def _build_tool_schemas(self) -> list[dict[str, Any]]:
         """Build OpenAI tool schemas for available tools."""
-        return registry.build_schemas(
+        cache = getattr(self, "_schema_cache", None)
+        key = None
+        if cache is not None:
+            names = self.profile.tools if self.profile.tools else registry.list_tools()
+            available = tuple(
+                name
+                for name in names
+                if (tool := registry.get(name)) is not None and tool.is_available(self.context)
+            )
+            key = (available, tuple(sorted(self.profile.subagents or {})))
+            if key in cache:
+                return cache[key]
+
+        schemas = registry.build_schemas(
             tool_names=self.profile.tools if self.profile.tools else None,
             agent_context=self.context,
             models=self.settings.models,
             subagents=self.profile.subagents,
         )
+        if key is not None:
+            cache[key] = schemas
+        return schemas
 
     def _resolve_max_context_tokens(self) -> int:
         """Resolve max context window size from provider model config.
@@ -544,6 +606,8 @@ class BaseAgent(ABC):
         )
 
         try:
+            if getattr(self.settings, "stream_responses", False):
+                return self._call_llm_streaming(kwargs)
             response = self.client.chat.completions.create(**kwargs)
             self._update_token_usage(getattr(response, "usage", None))
             return response.choices[0].message
@@ -567,6 +631,62 @@ class BaseAgent(ABC):
                 f"API error from provider '{provider_hint}' (status {e.status_code}): {e.message}"
             ) from e
 
+    def _call_llm_streaming(self, kwargs: dict[str, Any]) -> Any:
+        """Stream a completion, forwarding text deltas to ``stream_callback``.
+
+        Tool-call deltas are assembled into complete calls, and TTFT and
+        tokens/sec are reported through the status callback. Providers that
+        reject ``stream_options`` get one retry without it (and it is not
+        sent again); completion tokens are then estimated from the chunks.
+        """
+        agent_id = self.context.agent_id
+        depth = self.context.current_depth
+        callback = getattr(self, "stream_callback", None)
+        assembler = StreamAssembler()
+        if getattr(self, "_stream_usage_supported", True):
+            try:
+                stream = self.client.chat.completions.create(
+                    **kwargs, stream=True, stream_options={"include_usage": True}
+                )
+            except APIStatusError as e:
+                self.log(f"LLM stream: retrying without stream_options ({e.status_code})")
+                stream = self.client.chat.completions.create(**kwargs, stream=True)
+                self._stream_usage_supported = False
+        else:
+            stream = self.client.chat.completions.create(**kwargs, stream=True)
+        try:
+            for chunk in stream:
+                first = assembler.first_token_at is None
+                text = assembler.add(chunk)
+                if first and assembler.first_token_at is not None:
+                    self._notify_status(ToolStatus.streaming_llm(assembler.ttft, agent_id, depth))
+                if text and callback is not None:
+                    try:
+                        callback(text)
+                    except Exception:
+                        pass  # Rendering problems must not abort the turn
+        finally:
+            close = getattr(stream, "close", None)
+            if callable(close):
+                close()
+
+        message = assembler.finish()
+        if assembler.usage is not None:
+            self._update_token_usage(assembler.usage)
+        else:
+            # No usage chunk (e.g. stream_options unsupported): fall back to
+            # the chunk-count estimate for completion tokens.
+            self._update_token_usage({"completion_tokens": assembler.completion_tokens})
+        self._notify_status(
+            ToolStatus.llm_completed(assembler.ttft, assembler.tokens_per_second, agent_id, depth)
+        )
+        if assembler.ttft is not None:
+            self.log(
+                f"LLM stream: TTFT {assembler.ttft:.2f}s, "
+                f"{assembler.tokens_per_second or 0:.1f} tok/s"
+            )
+        return message
+
     def _assistant_message_to_dict(self, message: Any) -> dict[str, Any]:
         """Normalize assistant message to API-safe chat message dict."""
         msg: dict[str, Any] = {
@@ -640,22 +760,84 @@ class BaseAgent(ABC):
             f"--- Start ---\n{head}\n--- ... ---\n{tail}\n--- End ---"
         )
 
+    def _tool_call_workers(self) -> int:
+        """Number of side-effect-free tool calls that may run at once."""
+        try:
+            return max(1, int(getattr(getattr(self, "settings", None), "tool_call_workers", 1)))
+        except (TypeError, ValueError):
+            return 1
+
+    def _run_tool_calls(
+        self,
+        calls: list[tuple[str, dict[str, Any]]],
+        on_start: Optional[Callable[[str, dict[str, Any]], None]] = None,
+        on_result: Optional[Callable[[int, str], None]] = None,
+    ) -> list[str]:
+        """Execute parsed ``(name, args)`` tool calls; raw results in call order.
+
+        Runs of consecutive calls to ``concurrency_safe`` tools execute on a
+        thread pool. Every other call (writes with confirmation prompts,
+        spawns, compaction) runs serially at its position, so a read issued
+        after a write in the same response still observes the write.
+        ``on_result(index, result)`` is called in call order as soon as each
+        result is available, before later calls run.
+        """
+        results: list[str] = []
+        workers = self._tool_call_workers()
+        index = 0
+        while index < len(calls):
+            end = index + 1
+            if workers > 1 and registry.is_concurrency_safe(calls[index][0]):
+                while end < len(calls) and registry.is_concurrency_safe(calls[end][0]):
+                    end += 1
+            batch = calls[index:end]
+            for name, args in batch:
+                if on_start is not None:
+                    on_start(name, args)
+            if len(batch) == 1:
+                results.append(self._execute_tool(*batch[0]))
+            else:
+                results.extend(self._run_tool_batch(batch, min(workers, len(batch))))
+            if on_result is not None:
+                for position in range(index, end):
+                    on_result(position, results[position])
+            index = end
+        return results
+
+    def _run_tool_batch(self, batch: list[tuple[str, dict[str, Any]]], workers: int) -> list[str]:
+        """Run side-effect-free tool calls concurrently; results in batch order."""
+        executor = _DaemonThreadPoolExecutor(max_workers=workers, thread_name_prefix="flavia-tool")
+        interrupted = False
+        try:
+            futures = [executor.submit(self._execute_tool, name, args) for name, args in batch]
+            return [future.result() for future in futures]
+        except KeyboardInterrupt:
+            interrupted = True
+            raise
+        finally:
+            executor.shutdown(wait=not interrupted, cancel_futures=interrupted)
+
     def _process_tool_calls(self, tool_calls: list[Any]) -> list[dict[str, Any]]:
         """Process tool calls from LLM response."""
         results = []
         consumed_tokens = 0
 
+        calls = []
         for tool_call in tool_calls:
-            name = tool_call.function.name
             try:
                 args = json.loads(tool_call.function.arguments)
             except json.JSONDecodeError:
                 args = {}
+            calls.append((tool_call.function.name, args))
 
+        def _on_start(name: str, args: dict[str, Any]) -> None:
             if self.settings.verbose:
                 print(f"[{self.context.agent_id}] Tool: {name}({args})")
 
-            result = self._execute_tool(name, args)
+        raw_results = self._run_tool_calls(calls, on_start=_on_start)
+
+        # Post-processing stays sequential so guard budgeting is deterministic.
+        for tool_call, (name, args), result in zip(tool_calls, calls, raw_results):
             result = self._handle_spawn_result(result, name, args)
             result = self._guard_tool_result(result, consumed_tokens=consumed_tokens)
             consumed_tokens += self._estimate_guard_tokens(result)
@@ -47,6 +47,8 @@ class AgentContext:
     converted_access_mode: str = "hybrid"
     allow_converted_read: bool = False
     pending_actions: list[SendFileAction] = field(default_factory=list)
+    # Warm search_chunks state (RetrievalSession); not shared with child contexts.
+    retrieval_session: Optional[Any] = field(default=None, repr=False, compare=False)
 
     @classmethod
     def from_profile(
@@ -109,10 +111,9 @@ class AgentContext:
 def _load_catalog_context(base_dir: Path, max_length: int = 2000) -> str:
     """Load content catalog summary if available."""
     try:
-        from flavia.content.catalog import ContentCatalog
+        from flavia.content.catalog_cache import load_catalog_snapshot
 
-        config_dir = base_dir / ".flavia"
-        catalog = ContentCatalog.load(config_dir)
+        catalog = load_catalog_snapshot(base_dir / ".flavia")
         if catalog is not None:
             return catalog.generate_context_summary(max_length=max_length)
     except Exception:
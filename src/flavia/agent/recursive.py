@@ -4,57 +4,74 @@ import json
 from pathlib import Path
 import re
 import threading
-import weakref
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from concurrent.futures.thread import _threads_queues, _worker
-from typing import Any, Optional
+from concurrent.futures import Future, as_completed
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
 
 from flavia.config import Settings
 from flavia.tools.compact.compact_context import COMPACT_SENTINEL
 
-from .base import BaseAgent
+from .base import BaseAgent, _DaemonThreadPoolExecutor
 from .profile import AgentProfile
 from .status import ToolStatus
 
 
-class _DaemonThreadPoolExecutor(ThreadPoolExecutor):
-    """Thread pool executor that uses daemon threads.
+class _SpawnSlots:
+    """Cap on sub-agents running at once across a whole agent tree.
 
-    Daemon workers ensure the CLI can exit cleanly even if sub-agent tasks
-    are still running after an interruption.
+    One instance is shared by the root agent and all its descendants. A
+    sub-agent holds a slot while it runs, but returns it while it waits for
+    its own children, so nested fan-out cannot deadlock the tree.
     """
 
-    def _adjust_thread_count(self) -> None:
-        # Mirrors ThreadPoolExecutor internals, but marks workers as daemon.
-        if self._idle_semaphore.acquire(timeout=0):
+    def __init__(self, limit: int):
+        self.limit = max(1, limit)
+        self.running = 0
+        self.peak = 0
+        self._semaphore = threading.BoundedSemaphore(self.limit)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _acquire(self) -> None:
+        self._semaphore.acquire()
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+
+    def _release(self) -> None:
+        with self._lock:
+            self.running -= 1
+        self._semaphore.release()
+
+    @contextmanager
+    def hold(self) -> Iterator[None]:
+        """Run the block (a sub-agent) within one of the tree's slots."""
+        self._acquire()
+        self._local.held = getattr(self._local, "held", 0) + 1
+        try:
+            yield
+        finally:
+            self._local.held -= 1
+            self._release()
+
+    @contextmanager
+    def released(self) -> Iterator[None]:
+        """Give back the calling sub-agent's slot while it waits for children."""
+        if not getattr(self._local, "held", 0):
+            yield
             return
-
-        def weakref_cb(_, q=self._work_queue):
-            q.put(None)
-
-        num_threads = len(self._threads)
-        if num_threads < self._max_workers:
-            thread_name = f"{self._thread_name_prefix or self}_{num_threads}"
-            t = threading.Thread(
-                name=thread_name,
-                target=_worker,
-                args=(
-                    weakref.ref(self, weakref_cb),
-                    self._work_queue,
-                    self._initializer,
-                    self._initargs,
-                ),
-            )
-            t.daemon = True
-            t.start()
-            self._threads.add(t)
-            _threads_queues[t] = self._work_queue
+        self._release()
+        try:
+            yield
+        finally:
+            self._acquire()
 
 
 class RecursiveAgent(BaseAgent):
     """Agent capable of spawning and managing sub-agents."""
 
     MAX_ITERATIONS = 20  # Fallback; prefer settings.max_iterations
+    CANCELLED_MESSAGE = "[Cancelled: the parent agent stopped waiting for this sub-agent]"
     MAX_ITERATIONS_MESSAGE_RE = re.compile(r"^Maximum iterations reached \((\d+)\)\.")
     DOC_MENTION_RE = re.compile(r'(?<![A-Za-z0-9])@(?:"[^"]+"|\'[^\']+\'|[^\s@"\']+)')
     MENTION_TRAILING_PUNCT = ".,;:!?)]}"
@@ -121,11 +138,29 @@ class RecursiveAgent(BaseAgent):
         agent_id: str = "main",
         depth: int = 0,
         parent_id: Optional[str] = None,
+        client: Optional[Any] = None,
+        schema_cache: Optional[dict[tuple, list[dict[str, Any]]]] = None,
+        spawn_slots: Optional[_SpawnSlots] = None,
+        cancel_event: Optional[threading.Event] = None,
     ):
-        super().__init__(settings, profile, agent_id, depth, parent_id)
+        super().__init__(
+            settings,
+            profile,
+            agent_id,
+            depth,
+            parent_id,
+            client=client,
+            schema_cache=schema_cache if schema_cache is not None else {},
+        )
         self._child_counter = 0
         self._child_counter_lock = threading.Lock()
         self._active_children: dict[str, "RecursiveAgent"] = {}
+        self._spawn_slots = spawn_slots
+        self._spawn_executor: Optional[_DaemonThreadPoolExecutor] = None
+        # Dispatched spawns not yet collected (see _abandon_spawns).
+        self._inflight_spawns: list[dict[str, Any]] = []
+        # Set by the parent when it stops waiting for this sub-agent.
+        self._cancel_event = cancel_event
 
     @classmethod
     def format_max_iterations_message(cls, limit: int) -> str:
@@ -155,7 +190,31 @@ class RecursiveAgent(BaseAgent):
         max_iterations: Optional[int] = None,
         continue_from_current: bool = False,
     ) -> str:
-        """Run the agent with a user message."""
+        """Run the agent with a user message.
+
+        Sub-agents started during the turn never outlive it: on every exit
+        path (early return, error or interrupt) the ones still running are
+        told to stop and are waited for (see ``_abandon_spawns``).
+        """
+        try:
+            return self._run_turn(
+                user_message,
+                max_iterations=max_iterations,
+                continue_from_current=continue_from_current,
+            )
+        except KeyboardInterrupt:
+            self._abandon_spawns(wait=False)
+            raise
+        finally:
+            self._abandon_spawns()
+
+    def _run_turn(
+        self,
+        user_message: str,
+        *,
+        max_iterations: Optional[int],
+        continue_from_current: bool,
+    ) -> str:
         self.compaction_warning_pending = False
         self.compaction_warning_prompt_tokens = 0
         self._compaction_warning_injected = False
@@ -207,6 +266,10 @@ class RecursiveAgent(BaseAgent):
 
         while iterations < iteration_limit:
             iterations += 1
+            cancel_event = getattr(self, "_cancel_event", None)
+            if cancel_event is not None and cancel_event.is_set():
+                self.log("Cancelled by parent agent")
+                return self.CANCELLED_MESSAGE
 
             self._notify_status(
                 ToolStatus.waiting_llm(self.context.agent_id, self.context.current_depth)
@@ -300,6 +363,7 @@ class RecursiveAgent(BaseAgent):
                 response.tool_calls,
                 force_search_mode="exhaustive" if force_exhaustive_retrieval else None,
                 required_mentions=required_mentions,
+                dispatch_spawns=True,
             )
 
             # Inject context-window warning for the LLM to see on next iteration.
@@ -377,7 +441,7 @@ class RecursiveAgent(BaseAgent):
                 )
 
             if pending_spawns:
-                spawn_results = self._execute_spawns_parallel(pending_spawns)
+                spawn_results = self._collect_spawn_results(pending_spawns)
 
                 for spawn_result in spawn_results:
                     tool_call_id = spawn_result["tool_call_id"]
@@ -529,12 +593,22 @@ class RecursiveAgent(BaseAgent):
         *,
         force_search_mode: Optional[str] = None,
         required_mentions: Optional[set[str]] = None,
+        dispatch_spawns: bool = False,
     ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-        """Process tool calls and identify spawn requests."""
+        """Process tool calls and identify spawn requests.
+
+        Side-effect-free calls may execute concurrently (see
+        ``_run_tool_calls``); results are post-processed in call order.
+        With ``dispatch_spawns``, each sub-agent starts as soon as its spawn
+        call returns (its future is stored under ``"future"``), overlapping
+        with the remaining tool calls; see ``_collect_spawn_results``.
+        """
         results = []
         spawns = []
         consumed_tokens = 0
+        spawn_requests: dict[int, dict[str, Any]] = {}
 
+        calls = []
         for tool_call in tool_calls:
             name = tool_call.function.name
             try:
@@ -556,20 +630,35 @@ class RecursiveAgent(BaseAgent):
                         query_value,
                         required_mentions=required_mentions,
                     )
+            calls.append((name, args))
 
+        def _on_start(name: str, args: dict[str, Any]) -> None:
             self.log(f"Tool: {name}({args})")
-
             self._notify_status(
                 ToolStatus.executing_tool(
                     name, args, self.context.agent_id, self.context.current_depth
                 )
             )
-            result = self._execute_tool(name, args)
 
+        def _on_result(index: int, result: str) -> None:
+            name, args = calls[index]
             if name == "spawn_agent" and result.startswith("__SPAWN_AGENT__:"):
                 spawn_info = self._parse_spawn_agent(result, args)
-                spawn_info["tool_call_id"] = tool_call.id
-                spawns.append(spawn_info)
+            elif name == "spawn_predefined_agent" and result.startswith("__SPAWN_PREDEFINED__:"):
+                spawn_info = self._parse_spawn_predefined(result, args)
+            else:
+                return
+            spawn_info["tool_call_id"] = tool_calls[index].id
+            if dispatch_spawns:
+                spawn_info["future"] = self._dispatch_spawn(spawn_info)
+            spawn_requests[index] = spawn_info
+
+        raw_results = self._run_tool_calls(calls, on_start=_on_start, on_result=_on_result)
+
+        for index, ((name, args), result) in enumerate(zip(calls, raw_results)):
+            tool_call = tool_calls[index]
+            if index in spawn_requests and spawn_requests[index]["type"] == "dynamic":
+                spawns.append(spawn_requests[index])
                 # Note: we intentionally do NOT emit a second SPAWNING_AGENT
                 # status here.  The EXECUTING_TOOL notification above already
                 # contains "Spawning agent: ..." which the UI uses to detect
@@ -578,10 +667,8 @@ class RecursiveAgent(BaseAgent):
                 # spawn, breaking the hierarchy.
                 result = "[Spawning sub-agent...]"
 
-            elif name == "spawn_predefined_agent" and result.startswith("__SPAWN_PREDEFINED__:"):
-                spawn_info = self._parse_spawn_predefined(result, args)
-                spawn_info["tool_call_id"] = tool_call.id
-                spawns.append(spawn_info)
+            elif index in spawn_requests:
+                spawns.append(spawn_requests[index])
                 # Same rationale as above – avoid duplicate spawn notification.
                 result = "[Spawning predefined agent...]"
 
@@ -732,17 +819,124 @@ class RecursiveAgent(BaseAgent):
             return None
         return payload if isinstance(payload, dict) else None
 
+    def _parallel_workers(self) -> int:
+        try:
+            return max(1, int(self.settings.parallel_workers))
+        except (AttributeError, TypeError, ValueError):
+            return 1
+
+    def _tree_spawn_slots(self) -> _SpawnSlots:
+        """Fan-out cap shared with every agent in this tree (created by the root)."""
+        if getattr(self, "_spawn_slots", None) is None:
+            self._spawn_slots = _SpawnSlots(self._parallel_workers())
+        return self._spawn_slots
+
+    def _tree_schema_cache(self) -> dict[tuple, list[dict[str, Any]]]:
+        if getattr(self, "_schema_cache", None) is None:
+            self._schema_cache = {}
+        return self._schema_cache
+
+    def _client_for_child(self, profile: AgentProfile) -> Optional[Any]:
+        """Return this agent's client if the child resolves to the same provider."""
+        client = getattr(self, "client", None)
+        if client is None:
+            return None
+        provider, _ = self.settings.resolve_model_with_provider(profile.model)
+        own = getattr(self, "provider", None)
+        if provider is own:
+            return client
+        if provider is None or own is None:
+            return None
+        same_endpoint = (provider.id, provider.api_key, provider.api_base_url) == (
+            own.id,
+            own.api_key,
+            own.api_base_url,
+        )
+        return client if same_endpoint else None
+
+    def _run_spawn_in_slot(self, spawn: dict[str, Any]) -> str:
+        with self._tree_spawn_slots().hold():
+            cancel_event = spawn.get("cancel")
+            if cancel_event is not None and cancel_event.is_set():
+                return self.CANCELLED_MESSAGE
+            return self._execute_single_spawn(spawn)
+
+    def _dispatch_spawn(self, spawn: dict[str, Any]) -> Future:
+        """Start a sub-agent in the background as soon as its spawn call is parsed."""
+        if getattr(self, "_spawn_executor", None) is None:
+            # Threads are cheap and mostly idle; the tree-wide slots bound real work.
+            self._spawn_executor = _DaemonThreadPoolExecutor(
+                max_workers=self._parallel_workers(), thread_name_prefix="flavia-spawn"
+            )
+        spawn["cancel"] = threading.Event()
+        future = self._spawn_executor.submit(self._run_spawn_in_slot, spawn)
+        self._inflight_spawns = [*getattr(self, "_inflight_spawns", []), spawn]
+        return future
+
+    def _cancel_spawns(self, spawns: list[dict[str, Any]]) -> None:
+        """Tell dispatched spawns to stop; queued ones never start."""
+        for spawn in spawns:
+            if "cancel" in spawn:
+                spawn["cancel"].set()
+            if "future" in spawn:
+                spawn["future"].cancel()
+
+    def _abandon_spawns(self, wait: bool = True) -> None:
+        """Stop dispatched spawns whose results will not be collected.
+
+        Running sub-agents finish their current LLM call or tool, then
+        return at their next iteration (and abandon their own children).
+        With ``wait`` they are waited for, so none keeps spending API calls
+        or holding a fan-out slot after this agent's turn has ended.
+        """
+        spawns = getattr(self, "_inflight_spawns", [])
+        if not spawns:
+            return
+        self._inflight_spawns = []
+        self._cancel_spawns(spawns)
+        if not wait:
+            return
+        with self._tree_spawn_slots().released():
+            for spawn in spawns:
+                try:
+                    spawn["future"].result()
+                except Exception as e:
+                    self.log(f"Abandoned sub-agent ended with: {e!r}")
+
+    def _collect_spawn_results(self, spawns: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Wait for spawn requests, dispatched eagerly or not, in call order."""
+        pending = [spawn for spawn in spawns if "future" not in spawn]
+        results = {
+            item["tool_call_id"]: item["content"] for item in self._execute_spawns_parallel(pending)
+        }
+        dispatched = [spawn for spawn in spawns if "future" in spawn]
+        try:
+            with self._tree_spawn_slots().released():
+                for spawn in dispatched:
+                    try:
+                        results[spawn["tool_call_id"]] = spawn["future"].result()
+                    except Exception as e:
+                        results[spawn["tool_call_id"]] = f"Error in sub-agent: {e}"
+        except KeyboardInterrupt:
+            self._cancel_spawns(dispatched)
+            raise
+        collected = {id(spawn) for spawn in dispatched}
+        self._inflight_spawns = [
+            spawn for spawn in getattr(self, "_inflight_spawns", []) if id(spawn) not in collected
+        ]
+        return [
+            {"tool_call_id": spawn["tool_call_id"], "content": results[spawn["tool_call_id"]]}
+            for spawn in spawns
+        ]
+
     def _execute_spawns_parallel(self, spawns: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Execute spawn requests in parallel."""
         if not spawns:
             return []
 
         results = []
-        try:
-            configured_workers = int(self.settings.parallel_workers)
-        except (TypeError, ValueError):
-            configured_workers = 1
-        workers = max(1, min(len(spawns), configured_workers))
+        workers = max(1, min(len(spawns), self._parallel_workers()))
+        slots = self._tree_spawn_slots()
 
         executor = _DaemonThreadPoolExecutor(max_workers=workers, thread_name_prefix="flavia-spawn")
         futures = {}
@@ -750,10 +944,12 @@ class RecursiveAgent(BaseAgent):
 
         try:
             for spawn in spawns:
-                future = executor.submit(self._execute_single_spawn, spawn)
+                future = executor.submit(self._run_spawn_in_slot, spawn)
                 futures[future] = spawn["tool_call_id"]
 
-            for future in as_completed(futures):
+            with slots.released():
+                completed = list(as_completed(futures))
+            for future in completed:
                 tool_call_id = futures[future]
                 try:
                     result = future.result()
@@ -779,16 +975,21 @@ class RecursiveAgent(BaseAgent):
     def _execute_single_spawn(self, spawn: dict[str, Any]) -> str:
         """Execute a single spawn request."""
         if spawn["type"] == "predefined":
-            return self._spawn_predefined(spawn["agent_name"], spawn["task"])
+            return self._spawn_predefined(
+                spawn["agent_name"], spawn["task"], cancel_event=spawn.get("cancel")
+            )
         else:
             return self._spawn_dynamic(
                 spawn["task"],
                 spawn["context"],
                 spawn.get("model"),
                 spawn.get("tools"),
+                cancel_event=spawn.get("cancel"),
             )
 
-    def _spawn_predefined(self, agent_name: str, task: str) -> str:
+    def _spawn_predefined(
+        self, agent_name: str, task: str, cancel_event: Optional[threading.Event] = None
+    ) -> str:
         """Spawn a predefined sub-agent."""
         subagent_profile = self.profile.create_subagent_profile(agent_name)
         if not subagent_profile:
@@ -806,6 +1007,10 @@ class RecursiveAgent(BaseAgent):
             agent_id=child_id,
             depth=self.context.current_depth + 1,
             parent_id=self.context.agent_id,
+            client=self._client_for_child(subagent_profile),
+            schema_cache=self._tree_schema_cache(),
+            spawn_slots=self._tree_spawn_slots(),
+            cancel_event=cancel_event,
         )
         child.status_callback = self.status_callback
         if hasattr(child, "context") and hasattr(self, "context"):
@@ -832,6 +1037,7 @@ class RecursiveAgent(BaseAgent):
         context: str,
         model: Optional[str] = None,
         tools: Optional[list[str]] = None,
+        cancel_event: Optional[threading.Event] = None,
     ) -> str:
         """Spawn a dynamic sub-agent."""
         with self._child_counter_lock:
@@ -862,6 +1068,10 @@ class RecursiveAgent(BaseAgent):
             agent_id=child_id,
             depth=self.context.current_depth + 1,
             parent_id=self.context.agent_id,
+            client=self._client_for_child(profile),
+            schema_cache=self._tree_schema_cache(),
+            spawn_slots=self._tree_spawn_slots(),
+            cancel_event=cancel_event,
         )
         child.status_callback = self.status_callback
         if hasattr(child, "context") and hasattr(self, "context"):
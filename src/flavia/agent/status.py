@@ -10,6 +10,8 @@ class StatusPhase(Enum):
     """Phase of agent execution."""
 
     WAITING_LLM = "waiting_llm"
+    STREAMING_LLM = "streaming_llm"
+    LLM_COMPLETED = "llm_completed"
     EXECUTING_TOOL = "executing_tool"
     SPAWNING_AGENT = "spawning_agent"
     AGENT_COMPLETED = "agent_completed"
@@ -25,6 +27,8 @@ class ToolStatus:
     args: Optional[dict[str, Any]] = None
     agent_id: str = "main"
     depth: int = 0
+    ttft: Optional[float] = None  # Seconds to first streamed token
+    tokens_per_second: Optional[float] = None
 
     @classmethod
     def waiting_llm(cls, agent_id: str = "main", depth: int = 0) -> "ToolStatus":
@@ -35,6 +39,38 @@ class ToolStatus:
             depth=depth,
         )
 
+    @classmethod
+    def streaming_llm(
+        cls,
+        ttft: Optional[float],
+        agent_id: str = "main",
+        depth: int = 0,
+    ) -> "ToolStatus":
+        """Create a status for the first token of a streamed response."""
+        return cls(
+            phase=StatusPhase.STREAMING_LLM,
+            agent_id=agent_id,
+            depth=depth,
+            ttft=ttft,
+        )
+
+    @classmethod
+    def llm_completed(
+        cls,
+        ttft: Optional[float],
+        tokens_per_second: Optional[float],
+        agent_id: str = "main",
+        depth: int = 0,
+    ) -> "ToolStatus":
+        """Create a status with the timing metrics of a finished streamed response."""
+        return cls(
+            phase=StatusPhase.LLM_COMPLETED,
+            agent_id=agent_id,
+            depth=depth,
+            ttft=ttft,
+            tokens_per_second=tokens_per_second,
+        )
+
     @classmethod
     def executing_tool(
         cls,
@@ -91,6 +127,16 @@ class ToolStatus:
 StatusCallback = Callable[[ToolStatus], None]
 
 
+def format_llm_metrics(status: ToolStatus) -> str:
+    """Format TTFT and tokens/sec of a streaming status ("" if unknown)."""
+    parts = []
+    if status.ttft is not None:
+        parts.append(f"TTFT {status.ttft:.1f}s")
+    if status.tokens_per_second is not None:
+        parts.append(f"{status.tokens_per_second:.0f} tok/s")
+    return " · ".join(parts)
+
+
 _CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
 
 
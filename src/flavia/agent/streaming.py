@@ -0,0 +1,160 @@
+"""Streaming chat-completion assembly for flavIA agents.
+
+With ``STREAM_RESPONSES`` enabled, ``BaseAgent._call_llm`` requests a
+streamed completion and feeds each chunk to a ``StreamAssembler``. Text
+deltas are forwarded to the agent's ``stream_callback`` as they arrive
+(the CLI and bot interfaces render them progressively); tool-call deltas
+are concatenated per index. The assembled ``StreamedMessage`` has the same
+shape as a non-streamed ``response.choices[0].message``, so the agent loop
+does not need to know which mode produced it.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+StreamCallback = Callable[[str], None]
+
+
+@dataclass
+class StreamedFunction:
+    """Function part of an assembled tool call."""
+
+    name: str = ""
+    arguments: str = ""
+
+
+@dataclass
+class StreamedToolCall:
+    """Tool call assembled from streamed deltas."""
+
+    id: str = ""
+    type: str = "function"
+    function: StreamedFunction = field(default_factory=StreamedFunction)
+
+
+@dataclass
+class StreamedMessage:
+    """Assistant message assembled from a streamed completion."""
+
+    content: Optional[str] = None
+    tool_calls: Optional[list[StreamedToolCall]] = None
+    role: str = "assistant"
+
+
+class StreamAssembler:
+    """Accumulate chat-completion chunks into a single assistant message.
+
+    Also measures time-to-first-token and the generation rate. When the
+    provider omits ``usage`` from the stream, completion tokens are
+    estimated as the number of chunks that carried content or tool-call
+    deltas (providers send roughly one token per chunk).
+
+    Args:
+        clock: Monotonic time source (injectable for tests).
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self.started_at = clock()
+        self.first_token_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.usage: Any = None
+        self.finish_reason: Optional[str] = None
+        self._content: list[str] = []
+        self._tool_calls: dict[int, StreamedToolCall] = {}
+        self._delta_chunks = 0
+
+    def add(self, chunk: Any) -> str:
+        """Consume one chunk; returns its text delta ("" if none)."""
+        usage = _get(chunk, "usage")
+        if usage is not None:
+            self.usage = usage
+
+        choices = _get(chunk, "choices") or []
+        if not choices:
+            return ""
+        choice = choices[0]
+        finish_reason = _get(choice, "finish_reason")
+        if finish_reason:
+            self.finish_reason = finish_reason
+
+        delta = _get(choice, "delta")
+        if delta is None:
+            return ""
+
+        text = _get(delta, "content") or ""
+        tool_deltas = _get(delta, "tool_calls") or []
+        if text or tool_deltas:
+            self._delta_chunks += 1
+            if self.first_token_at is None:
+                self.first_token_at = self._clock()
+        if text:
+            self._content.append(text)
+        for position, tool_delta in enumerate(tool_deltas):
+            self._add_tool_delta(tool_delta, position)
+        return text
+
+    def _add_tool_delta(self, tool_delta: Any, position: int) -> None:
+        index = _get(tool_delta, "index")
+        if not isinstance(index, int):
+            index = position
+        call = self._tool_calls.setdefault(index, StreamedToolCall())
+        call_id = _get(tool_delta, "id")
+        if call_id:
+            call.id = call_id
+        function = _get(tool_delta, "function")
+        if function is None:
+            return
+        name = _get(function, "name")
+        if name:
+            # Most providers send the name once; some split it like arguments.
+            call.function.name = name if not call.function.name else call.function.name + name
+        arguments = _get(function, "arguments")
+        if arguments:
+            call.function.arguments += arguments
+
+    def finish(self) -> StreamedMessage:
+        """Mark the stream complete and return the assembled message."""
+        self.finished_at = self._clock()
+        tool_calls = [self._tool_calls[index] for index in sorted(self._tool_calls)]
+        for call in tool_calls:
+            if not call.function.arguments:
+                call.function.arguments = "{}"
+        return StreamedMessage(
+            content="".join(self._content) if self._content else None,
+            tool_calls=tool_calls or None,
+        )
+
+    @property
+    def ttft(self) -> Optional[float]:
+        """Seconds from request to the first content/tool-call delta."""
+        if self.first_token_at is None:
+            return None
+        return self.first_token_at - self.started_at
+
+    @property
+    def completion_tokens(self) -> int:
+        """Completion tokens reported by the provider (or estimated)."""
+        reported = _get(self.usage, "completion_tokens") if self.usage is not None else None
+        if isinstance(reported, int) and reported > 0:
+            return reported
+        return self._delta_chunks
+
+    @property
+    def tokens_per_second(self) -> Optional[float]:
+        """Generation rate after the first token."""
+        if self.first_token_at is None:
+            return None
+        end = self.finished_at if self.finished_at is not None else self._clock()
+        elapsed = end - self.first_token_at
+        if elapsed <= 0:
+            return None
+        return self.completion_tokens / elapsed
+
+
+def _get(obj: Any, name: str) -> Any:
+    """Read ``name`` from an SDK object or a plain dict."""
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
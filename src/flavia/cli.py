@@ -12,7 +12,9 @@ Usage:
 """
 
 import argparse
+import sqlite3
 import sys
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -62,6 +64,28 @@ def parse_args() -> argparse.Namespace:
         help="Full catalog rebuild (rescan everything from scratch)",
     )
 
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="With --update*, re-hash every file instead of trusting unchanged size/mtime",
+    )
+
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help=(
+            "Watch the vault and keep catalog, conversions and index current "
+            "(alone, or alongside --telegram)"
+        ),
+    )
+
+    parser.add_argument(
+        "--catalog-storage",
+        choices=["json", "sqlite"],
+        metavar="FORMAT",
+        help="Convert the content catalog to 'sqlite' (content_catalog.db) or back to 'json'",
+    )
+
     # Mode selection
     parser.add_argument(
         "--telegram",
@@ -470,10 +494,15 @@ def run_catalog_update(
     summarize: bool = False,
     full_rebuild: bool = False,
     base_dir: Path | None = None,
+    verify: bool = False,
 ) -> int:
-    """Update the content catalog."""
+    """Update the content catalog.
+
+    Unchanged files (same size, mtime and inode) keep their stored checksum;
+    ``verify=True`` re-hashes every file.
+    """
     from flavia.content.catalog import ContentCatalog
-    from flavia.content.converters import converter_registry
+    from flavia.content.converters import ConversionScheduler
 
     base_dir = base_dir.resolve() if base_dir else Path.cwd()
     config_dir = base_dir / ".flavia"
@@ -482,24 +511,31 @@ def run_catalog_update(
         print("Error: No .flavia/ directory found. Run 'flavia --init' first.")
         return 1
 
+    scan_workers = load_settings().scan_workers
+
     if full_rebuild:
         print("Rebuilding content catalog from scratch...")
         catalog = ContentCatalog(base_dir)
-        catalog.build()
+        catalog.build(workers=scan_workers)
     else:
         catalog = ContentCatalog.load(config_dir)
         if catalog is None:
             print("No existing catalog found. Building from scratch...")
             catalog = ContentCatalog(base_dir)
-            catalog.build()
+            catalog.build(workers=scan_workers)
         else:
-            print("Updating content catalog...")
-            result = catalog.update()
+            print("Verifying content catalog..." if verify else "Updating content catalog...")
+            result = catalog.update(verify=verify, workers=scan_workers)
             counts = result["counts"]
             print(f"  New files:      {counts['new']}")
             print(f"  Modified files: {counts['modified']}")
             print(f"  Missing files:  {counts['missing']}")
             print(f"  Unchanged:      {counts['unchanged']}")
+            checksums = result["checksums"]
+            print(
+                f"  Checksums:      {checksums['computed']} computed, "
+                f"{checksums['reused']} reused"
+            )
 
             if result["new"]:
                 print("\nNew files:")
@@ -523,45 +559,40 @@ def run_catalog_update(
     if convert:
         needs_conversion = catalog.get_files_needing_conversion()
         if needs_conversion:
+            settings = load_settings()
             print(f"\nConverting {len(needs_conversion)} file(s)...")
-            converted_dir = base_dir / ".converted"
-            converted_count = 0
-            failed_count = 0
-            skipped_count = 0
-            for entry in needs_conversion:
-                source = base_dir / entry.path
-                converter = converter_registry.get_for_file(source)
-                if not converter:
-                    skipped_count += 1
-                    continue
-
-                deps_ok, missing = converter.check_dependencies()
-                if not deps_ok:
-                    skipped_count += 1
-                    print(f"  Skipping {entry.path}: missing dependencies ({', '.join(missing)})")
-                    continue
-
-                try:
-                    result_path = converter.convert(source, converted_dir)
-                except Exception as exc:
-                    failed_count += 1
-                    print(f"  Failed: {entry.path} ({exc})")
-                    continue
-
-                if result_path:
-                    try:
-                        entry.converted_to = str(result_path.relative_to(base_dir))
-                    except ValueError:
-                        entry.converted_to = str(result_path)
-                    converted_count += 1
-                    print(f"  Converted: {entry.path}")
-                else:
-                    failed_count += 1
-            print(f"  {converted_count} file(s) converted")
-            if failed_count:
-                print(f"  {failed_count} file(s) failed conversion")
-            if skipped_count:
-                print(f"  {skipped_count} file(s) skipped")
+
+            def _report(result) -> None:
+                if result.status == "converted":
+                    print(f"  Converted: {result.path}")
+                elif result.status == "resumed":
+                    print(f"  Resumed: {result.path}")
+                elif result.status == "failed" and result.error:
+                    print(f"  Failed: {result.path} ({result.error})")
+                elif result.status == "skipped" and result.error:
+                    print(f"  Skipping {result.path}: {result.error}")
+
+            scheduler = ConversionScheduler(
+                base_dir,
+                process_workers=settings.convert_workers,
+                thread_workers=settings.convert_api_concurrency,
+            )
+            summary = scheduler.run(needs_conversion, on_result=_report)
+            print(f"  {summary['converted'] + summary['resumed']} file(s) converted")
+            if summary["failed"]:
+                print(f"  {summary['failed']} file(s) failed conversion")
+            if summary["skipped"]:
+                print(f"  {summary['skipped']} file(s) skipped")
+            print(
+                f"  Throughput: {summary['files_per_minute']:.1f} files/min "
+                f"({summary['duration_seconds']:.1f}s)"
+            )
+            for name, stats in sorted(summary["by_converter"].items()):
+                done = stats["converted"] + stats["failed"]
+                print(
+                    f"    {name}: {stats['converted']}/{done} converted, "
+                    f"{stats['seconds'] / done:.1f}s avg"
+                )
         else:
             print("\nNo files need conversion.")
 
@@ -575,28 +606,34 @@ def run_catalog_update(
         )
         provider, model_id = settings.resolve_model_with_provider(summary_model_ref)
         if provider and provider.api_key:
-            from flavia.content.summarizer import summarize_file_with_quality
+            from flavia.content.summary_engine import SummarizationEngine
 
             needs_summary = catalog.get_files_needing_summary()
             if needs_summary:
                 print(f"\nGenerating summaries for {len(needs_summary)} file(s)...")
-                summarized = 0
-                for entry in needs_summary:
-                    summary, quality = summarize_file_with_quality(
-                        entry,
-                        base_dir,
-                        api_key=provider.api_key,
-                        api_base_url=provider.api_base_url,
-                        model=model_id,
-                        headers=provider.headers if provider.headers else None,
-                    )
-                    if summary:
-                        entry.summary = summary
-                        summarized += 1
-                        print(f"  Summarized: {entry.path}")
-                    if quality:
-                        entry.extraction_quality = quality
-                print(f"  {summarized} file(s) summarized")
+
+                def _report_summary(result) -> None:
+                    if result.summary:
+                        print(f"  Summarized: {result.path}")
+
+                engine = SummarizationEngine.from_provider(
+                    base_dir,
+                    provider,
+                    model_id,
+                    concurrency=settings.summary_concurrency,
+                )
+                stats = engine.run(
+                    needs_summary,
+                    on_result=_report_summary,
+                    checkpoint=lambda: catalog.save(config_dir),
+                )
+                print(f"  {stats['summarized']} file(s) summarized")
+                if stats["failed"]:
+                    print(f"  {stats['failed']} file(s) could not be summarized")
+                print(
+                    f"  Throughput: {stats['files_per_minute']:.1f} files/min "
+                    f"({stats['duration_seconds']:.1f}s, {engine.concurrency} concurrent)"
+                )
             else:
                 print("\nNo files need summaries.")
         else:
@@ -614,6 +651,66 @@ def run_catalog_update(
     return 0
 
 
+def run_catalog_watch(base_dir: Path | None = None) -> int:
+    """Watch the vault and incrementally update catalog, conversions and index."""
+    from rich.console import Console
+
+    from flavia.content.catalog import catalog_exists
+    from flavia.content.watcher import VaultWatcher
+
+    base_dir = base_dir.resolve() if base_dir else Path.cwd()
+    config_dir = base_dir / ".flavia"
+
+    if not catalog_exists(config_dir):
+        print("Error: No content catalog found. Run 'flavia --init' or 'flavia --update' first.")
+        return 1
+
+    settings = load_settings()
+    watcher = VaultWatcher(base_dir, settings, console=Console())
+    print(
+        f"Watching {base_dir} (poll every {watcher.interval:g}s, "
+        f"debounce {watcher.queue.debounce:g}s). Press Ctrl+C to stop."
+    )
+    try:
+        while True:
+            try:
+                summary = watcher.run_once()
+            except Exception as exc:
+                print(f"  Watch update failed: {exc}")
+                summary = None
+            if summary:
+                print(
+                    f"  {summary['new']} new, {summary['modified']} modified, "
+                    f"{summary['missing']} removed, {summary['converted']} converted, "
+                    f"{summary['indexed']} indexed"
+                )
+            time.sleep(watcher.interval)
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+    return 0
+
+
+def run_catalog_storage_conversion(storage: str, base_dir: Path | None = None) -> int:
+    """Convert the content catalog between JSON and SQLite storage."""
+    from flavia.content.catalog import ContentCatalog
+
+    base_dir = base_dir.resolve() if base_dir else Path.cwd()
+    config_dir = base_dir / ".flavia"
+
+    try:
+        catalog_path = ContentCatalog.convert_storage(config_dir, storage)
+    except (OSError, sqlite3.Error) as e:
+        print(f"Error: Failed to convert catalog: {e}")
+        return 1
+
+    if catalog_path is None:
+        print("Error: No content catalog found. Run 'flavia --init' or 'flavia --update' first.")
+        return 1
+
+    print(f"Catalog stored as {storage}: {catalog_path}")
+    return 0
+
+
 def main() -> int:
     """Main entry point."""
     ensure_project_venv_and_reexec(sys.argv[1:])
@@ -639,6 +736,18 @@ def main() -> int:
             summarize=args.update_summarize,
             full_rebuild=args.update_full,
             base_dir=Path(args.path).resolve() if args.path else None,
+            verify=args.verify,
+        )
+
+    watch = getattr(args, "watch", False)
+    if watch and not args.telegram:
+        return run_catalog_watch(base_dir=Path(args.path).resolve() if args.path else None)
+
+    catalog_storage = getattr(args, "catalog_storage", None)
+    if catalog_storage:
+        return run_catalog_storage_conversion(
+            catalog_storage,
+            base_dir=Path(args.path).resolve() if args.path else None,
         )
 
     # Setup provider wizard
@@ -732,8 +841,18 @@ def main() -> int:
 
         # Parse bot_name: "all" or None means run all bots
         bot_name = args.telegram if args.telegram != "all" else None
-        if not run_telegram_bots(settings, bot_name=bot_name):
-            return 1
+        watcher = None
+        if watch:
+            from flavia.content.watcher import VaultWatcher
+
+            watcher = VaultWatcher(settings.base_dir, settings)
+            watcher.start()
+        try:
+            if not run_telegram_bots(settings, bot_name=bot_name):
+                return 1
+        finally:
+            if watcher is not None:
+                watcher.stop()
     else:
         _ensure_default_connection_checked_once(settings)
         from flavia.interfaces import run_cli
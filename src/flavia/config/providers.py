@@ -33,6 +33,8 @@ class ProviderConfig:
     headers: dict[str, str] = field(default_factory=dict)
     models: list[ModelConfig] = field(default_factory=list)
     compact_threshold: Optional[float] = None
+    requests_per_minute: Optional[int] = None  # Provider rate limit (None = unlimited)
+    tokens_per_minute: Optional[int] = None  # Provider token rate limit (None = unlimited)
 
     def get_model_by_id(self, model_id: str) -> Optional[ModelConfig]:
         """Get a model by its ID."""
@@ -203,9 +205,22 @@ def load_provider_config(data: dict[str, Any], provider_id: str) -> ProviderConf
         headers=headers,
         models=models,
         compact_threshold=provider_compact_threshold,
+        requests_per_minute=_parse_rate_limit(data.get("requests_per_minute")),
+        tokens_per_minute=_parse_rate_limit(data.get("tokens_per_minute")),
     )
 
 
+def _parse_rate_limit(value: Any) -> Optional[int]:
+    """Parse an optional per-minute rate limit; ``None`` for missing/invalid values."""
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        return None
+    return limit if limit > 0 else None
+
+
 def _parse_compact_threshold(value: Any) -> Optional[float]:
     """Parse optional compact threshold from provider config.
 
@@ -55,6 +55,8 @@ class Settings:
     compact_threshold: float = 0.9
     compact_threshold_configured: bool = False
     parallel_workers: int = 4
+    # Side-effect-free tool calls of one response run at once (1 = serial)
+    tool_call_workers: int = 4
     subagents_enabled: bool = True
     active_agent: Optional[str] = None  # None means "main"; can be a subagent name
 
@@ -63,6 +65,9 @@ class Settings:
     telegram_allowed_users: list[int] = field(default_factory=list)
     telegram_allow_all_users: bool = False
     telegram_whitelist_configured: bool = False
+    bot_max_concurrent_turns: int = 4  # Agent turns running at once across bots and users
+    bot_max_resident_sessions: int = 32  # Bot agents kept in memory (0 = unbounded)
+    bot_session_idle_ttl: int = 1800  # Seconds before an idle bot agent is hibernated (0 = never)
 
     # Runtime
     verbose: bool = False
@@ -74,11 +79,17 @@ class Settings:
     rag_vector_k: int = 15
     rag_fts_k: int = 15
     rag_rrf_k: int = 60
+    rag_fusion_strategy: str = "rrf"  # rrf, weighted_rrf, combsum
+    rag_fusion_vector_weight: float = 1.0  # Vector weight for weighted_rrf/combsum
+    rag_fusion_fts_weight: float = 1.0  # FTS weight for weighted_rrf/combsum
     rag_max_chunks_per_doc: int = 3
     rag_chunk_min_tokens: int = 300
     rag_chunk_max_tokens: int = 800
     rag_video_window_seconds: int = 60
     rag_expand_video_temporal: bool = True
+    rag_query_cache_size: int = 256  # In-memory query embeddings (0 = disabled)
+    rag_query_cache_ttl: int = 86400  # Query embedding lifetime in seconds (0 = no expiry)
+    rag_query_cache_persist: bool = True  # Back the query cache with .index/embedding_cache.db
 
     # Status display settings (-1 = unlimited)
     status_max_tasks_main: int = -1
@@ -93,6 +104,7 @@ class Settings:
 
     # Display settings
     show_token_usage: bool = True  # Show token usage after responses
+    stream_responses: bool = False  # Stream LLM responses to the CLI/bots as they are generated
     color_theme: str = "default"  # Color theme: default, light, minimal
     timestamp_format: str = "iso"  # Timestamp format: iso, relative, local
     log_level: str = "warning"  # Log level: debug, info, warning, error
@@ -111,8 +123,17 @@ class Settings:
 
     # Content processing settings
     ocr_min_chars_per_page: int = 50  # Minimum characters per page for OCR
+    pdf_page_workers: int = 1  # Processes extracting page ranges of long PDFs (1 = in-process)
     transcription_timeout: int = 600  # Timeout for transcription in seconds
     embedder_batch_size: int = 64  # Batch size for embedding
+    embedder_concurrency: int = 4  # Max in-flight embedding requests during indexing
+    index_workers: int = 4  # Worker threads for chunking documents during indexing
+    scan_workers: int = 4  # Worker threads for walk/stat/hash during catalog scans
+    convert_workers: int = 4  # Processes for local (CPU-bound) document conversion
+    convert_api_concurrency: int = 4  # Threads for API-based conversion (audio, OCR, images)
+    summary_concurrency: int = 4  # Concurrent LLM requests for batch summarization
+    watch_interval: float = 30.0  # Seconds between vault polls in watch mode without watchdog
+    watch_debounce: float = 1.5  # Quiet seconds before a batch of changes is processed
     latex_timeout: int = 120  # Timeout for LaTeX compilation in seconds
 
     # Loaded configs
@@ -384,10 +405,22 @@ def load_settings() -> Settings:
         compact_threshold=compact_threshold,
         compact_threshold_configured=compact_threshold_configured,
         parallel_workers=int(os.getenv("AGENT_PARALLEL_WORKERS", "4")),
+        tool_call_workers=_load_int_env(
+            "AGENT_TOOL_CALL_WORKERS", default=4, minimum=1, maximum=32
+        ),
         telegram_token=tg_token_env,
         telegram_allowed_users=allowed_users,
         telegram_allow_all_users=allow_all_users,
         telegram_whitelist_configured=whitelist_configured,
+        bot_max_concurrent_turns=_load_int_env(
+            "BOT_MAX_CONCURRENT_TURNS", default=4, minimum=1, maximum=64
+        ),
+        bot_max_resident_sessions=_load_int_env(
+            "BOT_MAX_RESIDENT_SESSIONS", default=32, minimum=0, maximum=10000
+        ),
+        bot_session_idle_ttl=_load_int_env(
+            "BOT_SESSION_IDLE_TTL", default=1800, minimum=0, maximum=604800
+        ),
         providers=providers,
         bot_registry=bot_registry,
         status_max_tasks_main=int(os.getenv("STATUS_MAX_TASKS_MAIN", "-1")),
@@ -399,6 +432,13 @@ def load_settings() -> Settings:
         rag_vector_k=_load_int_env("RAG_VECTOR_K", default=15, minimum=0, maximum=500),
         rag_fts_k=_load_int_env("RAG_FTS_K", default=15, minimum=0, maximum=500),
         rag_rrf_k=_load_int_env("RAG_RRF_K", default=60, minimum=1, maximum=1000),
+        rag_fusion_strategy=os.getenv("RAG_FUSION_STRATEGY", "rrf").strip().lower() or "rrf",
+        rag_fusion_vector_weight=_load_float_env(
+            "RAG_FUSION_VECTOR_WEIGHT", default=1.0, minimum=0.0, maximum=10.0
+        ),
+        rag_fusion_fts_weight=_load_float_env(
+            "RAG_FUSION_FTS_WEIGHT", default=1.0, minimum=0.0, maximum=10.0
+        ),
         rag_max_chunks_per_doc=_load_int_env(
             "RAG_MAX_CHUNKS_PER_DOC", default=3, minimum=1, maximum=50
         ),
@@ -412,6 +452,13 @@ def load_settings() -> Settings:
             "RAG_VIDEO_WINDOW_SECONDS", default=60, minimum=5, maximum=600
         ),
         rag_expand_video_temporal=_load_bool_env("RAG_EXPAND_VIDEO_TEMPORAL", default=True),
+        rag_query_cache_size=_load_int_env(
+            "RAG_QUERY_CACHE_SIZE", default=256, minimum=0, maximum=100000
+        ),
+        rag_query_cache_ttl=_load_int_env(
+            "RAG_QUERY_CACHE_TTL", default=86400, minimum=0, maximum=31536000
+        ),
+        rag_query_cache_persist=_load_bool_env("RAG_QUERY_CACHE_PERSIST", default=True),
         # Timeouts and limits
         max_iterations=_load_int_env("MAX_ITERATIONS", default=20, minimum=1, maximum=100),
         llm_request_timeout=_load_int_env(
@@ -426,6 +473,7 @@ def load_settings() -> Settings:
         ),
         # Display settings
         show_token_usage=_load_bool_env("SHOW_TOKEN_USAGE", default=True),
+        stream_responses=_load_bool_env("STREAM_RESPONSES", default=False),
         color_theme=os.getenv("COLOR_THEME", "default"),
         timestamp_format=os.getenv("TIMESTAMP_FORMAT", "iso"),
         log_level=os.getenv("LOG_LEVEL", "warning"),
@@ -443,12 +491,25 @@ def load_settings() -> Settings:
         ocr_min_chars_per_page=_load_int_env(
             "OCR_MIN_CHARS_PER_PAGE", default=50, minimum=1, maximum=1000
         ),
+        pdf_page_workers=_load_int_env("PDF_PAGE_WORKERS", default=1, minimum=1, maximum=32),
         transcription_timeout=_load_int_env(
             "TRANSCRIPTION_TIMEOUT", default=600, minimum=60, maximum=3600
         ),
         embedder_batch_size=_load_int_env(
             "EMBEDDER_BATCH_SIZE", default=64, minimum=1, maximum=256
         ),
+        embedder_concurrency=_load_int_env(
+            "EMBEDDER_CONCURRENCY", default=4, minimum=1, maximum=32
+        ),
+        index_workers=_load_int_env("INDEX_WORKERS", default=4, minimum=1, maximum=32),
+        scan_workers=_load_int_env("SCAN_WORKERS", default=4, minimum=1, maximum=64),
+        convert_workers=_load_int_env("CONVERT_WORKERS", default=4, minimum=0, maximum=64),
+        convert_api_concurrency=_load_int_env(
+            "CONVERT_API_CONCURRENCY", default=4, minimum=1, maximum=32
+        ),
+        summary_concurrency=_load_int_env("SUMMARY_CONCURRENCY", default=4, minimum=1, maximum=32),
+        watch_interval=_load_float_env("WATCH_INTERVAL", default=30.0, minimum=0.1, maximum=3600.0),
+        watch_debounce=_load_float_env("WATCH_DEBOUNCE", default=1.5, minimum=0.0, maximum=600.0),
         latex_timeout=_load_int_env("LATEX_TIMEOUT", default=120, minimum=30, maximum=600),
     )
 
@@ -514,6 +575,20 @@ def _load_int_env(name: str, default: int, minimum: int, maximum: int) -> int:
     return value
 
 
+def _load_float_env(name: str, default: float, minimum: float, maximum: float) -> float:
+    """Parse bounded float env var with fallback to default."""
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        return default
+    if value < minimum or value > maximum:
+        return default
+    return value
+
+
 # Global settings instance
 _settings: Optional[Settings] = None
 
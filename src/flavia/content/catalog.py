@@ -2,16 +2,68 @@
 
 import hashlib
 import json
+import os
+import sqlite3
 from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
-
+from typing import TYPE_CHECKING, Optional
+
+from .catalog_store import (
+    CATALOG_DB_FILENAME,
+    CatalogStore,
+    LazyEntryMap,
+    catalog_doc_id,
+    serialize_entry,
+)
 from .scanner import DirectoryNode, FileEntry, FileScanner
 
+if TYPE_CHECKING:
+    from .catalog_search import CatalogSearchIndex
+
 
 CATALOG_VERSION = "1.0"
 CATALOG_FILENAME = "content_catalog.json"
+CATALOG_STORAGE_FORMATS = ("json", "sqlite")
+
+
+def resolve_catalog_path(config_dir: Path) -> Optional[Path]:
+    """Return the catalog file in use under ``config_dir``, or None.
+
+    A migrated ``content_catalog.db`` takes precedence over
+    ``content_catalog.json``.
+    """
+    for filename in (CATALOG_DB_FILENAME, CATALOG_FILENAME):
+        path = config_dir / filename
+        if path.exists():
+            return path
+    return None
+
+
+def catalog_exists(config_dir: Path) -> bool:
+    """Return True if ``config_dir`` holds a catalog in either storage format."""
+    return resolve_catalog_path(config_dir) is not None
+
+
+def catalog_file_signature(path: Path) -> Optional[tuple[int, int, int, int]]:
+    """Return (inode, mtime_ns, size, change_counter) for a catalog file, or None.
+
+    JSON catalogs are replaced atomically on save, so the inode changes with
+    every write. For SQLite catalogs the header's file change counter
+    (bytes 24-27, bumped on every committed write) is read as well, since
+    an in-place update can keep the same size within one mtime tick.
+    """
+    try:
+        stat = path.stat()
+        change_counter = 0
+        if path.name == CATALOG_DB_FILENAME:
+            with open(path, "rb") as f:
+                header = f.read(28)
+            if len(header) == 28:
+                change_counter = int.from_bytes(header[24:28], "big")
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size, change_counter)
 
 
 class ContentCatalog:
@@ -22,7 +74,7 @@ class ContentCatalog:
     - Full scan (during --init)
     - Incremental update (--update or refresh_catalog tool)
     - Query by name, type, category, tags, or free text in summaries
-    - Serialization to/from JSON in .flavia/
+    - Serialization to/from JSON or SQLite (see ``catalog_store``) in .flavia/
     """
 
     def __init__(self, base_dir: Path):
@@ -37,6 +89,19 @@ class ContentCatalog:
             "auto_summarize": False,
             "ignored_patterns": [],
         }
+        # doc_id -> entry, keyed by the base_dir string the doc_ids derive from.
+        self._doc_indexes: dict[str, dict[str, FileEntry]] = {}
+        self._doc_index_key: Optional[tuple[int, int]] = None
+        # Set on instances shared through CatalogCache; those must not be saved.
+        self._shared_snapshot = False
+        # What the SQLite store held at load/save time, so saves only write
+        # the entries and metadata that changed since.
+        self._stored_db: Optional[Path] = None
+        self._stored_entries: dict[str, str] = {}
+        self._stored_meta: dict[str, str] = {}
+        # Catalog file signature at that point; indexes synced to it can skip
+        # entries that were never materialized since.
+        self._stored_signature: Optional[tuple[int, int, int, int]] = None
 
     # ------------------------------------------------------------------
     # Build / Full Scan
@@ -45,11 +110,18 @@ class ContentCatalog:
     def build(
         self,
         ignore_patterns: Optional[list[str]] = None,
+        workers: Optional[int] = None,
     ) -> "ContentCatalog":
-        """Perform a full scan and build the catalog from scratch."""
+        """Perform a full scan and build the catalog from scratch.
+
+        Args:
+            ignore_patterns: Extra fnmatch patterns to skip.
+            workers: Scanner threads for stat/hash (None = scanner default).
+        """
         scanner = FileScanner(
             self.base_dir,
             ignore_patterns=ignore_patterns or self.settings.get("ignored_patterns", []),
+            workers=workers,
         )
         file_entries, dir_tree = scanner.scan()
 
@@ -60,7 +132,9 @@ class ContentCatalog:
 
         self.files.clear()
         for entry in file_entries:
+            self._assign_doc_id(entry)
             self.files[entry.path] = entry
+        self._doc_indexes = {}
 
         if ignore_patterns:
             self.settings["ignored_patterns"] = ignore_patterns
@@ -71,25 +145,37 @@ class ContentCatalog:
     # Incremental Update
     # ------------------------------------------------------------------
 
-    def update(self) -> dict:
+    def update(self, verify: bool = False, workers: Optional[int] = None) -> dict:
         """
         Incremental update: detect new, modified, and missing files.
 
+        Files whose size, mtime and inode match the catalog keep their stored
+        checksum without being re-read.
+
+        Args:
+            verify: Re-hash every file instead of trusting unchanged stat
+                signatures.
+            workers: Scanner threads for stat/hash (None = scanner default).
+
         Returns:
             Summary dict with keys: new, modified, missing, unchanged counts
-            and lists of paths.
+            and lists of paths, plus ``checksums`` (computed/reused counts).
         """
+        previous_local = {
+            path: entry for path, entry in self.files.items() if entry.source_type == "local"
+        }
         scanner = FileScanner(
             self.base_dir,
             ignore_patterns=self.settings.get("ignored_patterns", []),
+            previous_entries=previous_local,
+            verify=verify,
+            workers=workers,
         )
         current_entries, dir_tree = scanner.scan()
 
         # Build set of currently scanned paths (scanner only returns local files)
         current_paths = {e.path for e in current_entries}
-        existing_local_paths = {
-            path for path, entry in self.files.items() if entry.source_type == "local"
-        }
+        existing_local_paths = set(previous_local)
 
         new_paths: list[str] = []
         modified_paths: list[str] = []
@@ -98,34 +184,13 @@ class ContentCatalog:
 
         # Detect new and modified files
         for entry in current_entries:
-            if entry.path not in existing_local_paths:
-                # New file
-                entry.status = "new"
-                self.files[entry.path] = entry
+            change = self._apply_scanned_entry(entry, existing_local_paths)
+            if change == "new":
                 new_paths.append(entry.path)
+            elif change == "modified":
+                modified_paths.append(entry.path)
             else:
-                old_entry = self.files[entry.path]
-                # Quick check: modified_at changed?
-                if entry.modified_at != old_entry.modified_at:
-                    # Confirm with checksum
-                    if entry.checksum_sha256 != old_entry.checksum_sha256:
-                        # Truly modified
-                        entry.status = "modified"
-                        # Preserve existing summary/tags/converted_to
-                        entry.summary = None  # invalidate — needs re-summarization
-                        entry.converted_to = old_entry.converted_to
-                        entry.tags = old_entry.tags
-                        self.files[entry.path] = entry
-                        modified_paths.append(entry.path)
-                    else:
-                        # Timestamp changed but content didn't (e.g. touch)
-                        old_entry.modified_at = entry.modified_at
-                        old_entry.indexed_at = entry.indexed_at
-                        old_entry.status = "current"
-                        unchanged_paths.append(entry.path)
-                else:
-                    old_entry.status = "current"
-                    unchanged_paths.append(entry.path)
+                unchanged_paths.append(entry.path)
 
         # Detect missing files
         for path in existing_local_paths - current_paths:
@@ -135,6 +200,139 @@ class ContentCatalog:
         # Update tree and timestamp
         self.directory_tree = dir_tree
         self.catalog_updated_at = datetime.now(timezone.utc).isoformat()
+        self._doc_indexes = {}
+
+        return {
+            "new": new_paths,
+            "modified": modified_paths,
+            "missing": missing_paths,
+            "unchanged": unchanged_paths,
+            "counts": {
+                "new": len(new_paths),
+                "modified": len(modified_paths),
+                "missing": len(missing_paths),
+                "unchanged": len(unchanged_paths),
+            },
+            "checksums": {
+                "computed": scanner.checksums_computed,
+                "reused": scanner.checksums_reused,
+            },
+        }
+
+    def _apply_scanned_entry(self, entry: FileEntry, existing_local_paths: set[str]) -> str:
+        """Merge a freshly scanned entry into the catalog.
+
+        Returns:
+            "new", "modified" or "unchanged".
+        """
+        self._assign_doc_id(entry)
+        if entry.path not in existing_local_paths:
+            entry.status = "new"
+            self.files[entry.path] = entry
+            return "new"
+
+        old_entry = self.files[entry.path]
+        # The scanner only reuses a checksum when size, mtime and inode
+        # are unchanged, so comparing checksums is cheap and exact.
+        if entry.checksum_sha256 != old_entry.checksum_sha256:
+            # Truly modified
+            entry.status = "modified"
+            # Preserve existing summary/tags/converted_to
+            entry.summary = None  # invalidate — needs re-summarization
+            entry.converted_to = old_entry.converted_to
+            entry.tags = old_entry.tags
+            self.files[entry.path] = entry
+            return "modified"
+
+        if entry.modified_at != old_entry.modified_at:
+            # Timestamp changed but content didn't (e.g. touch)
+            old_entry.modified_at = entry.modified_at
+            old_entry.indexed_at = entry.indexed_at
+        # Remember the stat signature so the next scan can skip hashing.
+        old_entry.mtime_ns = entry.mtime_ns
+        old_entry.inode = entry.inode
+        old_entry.doc_id = entry.doc_id
+        old_entry.status = "current"
+        return "unchanged"
+
+    def update_paths(
+        self,
+        paths: list[str],
+        verify: bool = False,
+    ) -> dict:
+        """
+        Incremental update restricted to the given paths.
+
+        Used by the vault watcher: only the listed files (or, for directory
+        paths, the files below them) are stat'ed and, when changed, hashed;
+        the rest of the catalog is left untouched and, when lazily loaded,
+        never decoded. Paths that no longer exist mark their entries (and
+        entries below them) as missing.
+
+        Args:
+            paths: Paths relative to base_dir.
+            verify: Re-hash files instead of trusting unchanged stat signatures.
+
+        Returns:
+            Summary dict with the same keys as :meth:`update`.
+        """
+        targets = [str(Path(p)) for p in paths if str(Path(p)) not in ("", ".")]
+        previous_local = self._local_entries_under(targets)
+        scanner = FileScanner(
+            self.base_dir,
+            ignore_patterns=self.settings.get("ignored_patterns", []),
+            previous_entries=previous_local,
+            verify=verify,
+            workers=1,
+        )
+        existing_local_paths = set(previous_local)
+
+        scanned: dict[str, FileEntry] = {}
+        gone: set[str] = set()
+        for rel_path in targets:
+            if scanner.is_ignored(rel_path):
+                continue
+            full_path = self.base_dir / rel_path
+            prefix = rel_path + os.sep
+            if full_path.is_dir():
+                found = scanner.scan_directory(full_path)
+                scanned.update((entry.path, entry) for entry in found)
+                gone.update(
+                    p for p in existing_local_paths if p.startswith(prefix) and p not in scanned
+                )
+            elif full_path.is_file():
+                entry = scanner.scan_file(full_path)
+                if entry is not None:
+                    scanned[entry.path] = entry
+            else:
+                gone.update(
+                    p for p in existing_local_paths if p == rel_path or p.startswith(prefix)
+                )
+
+        new_paths: list[str] = []
+        modified_paths: list[str] = []
+        unchanged_paths: list[str] = []
+        missing_paths: list[str] = []
+
+        for entry in scanned.values():
+            change = self._apply_scanned_entry(entry, existing_local_paths)
+            if change == "new":
+                new_paths.append(entry.path)
+            elif change == "modified":
+                modified_paths.append(entry.path)
+            else:
+                unchanged_paths.append(entry.path)
+
+        for path in sorted(gone - set(scanned)):
+            if self.files[path].status != "missing":
+                self.files[path].status = "missing"
+                missing_paths.append(path)
+
+        if new_paths or missing_paths:
+            self._patch_directory_tree(new_paths, missing_paths)
+        if new_paths or modified_paths or missing_paths:
+            self.catalog_updated_at = datetime.now(timezone.utc).isoformat()
+        self._doc_indexes = {}
 
         return {
             "new": new_paths,
@@ -147,13 +345,74 @@ class ContentCatalog:
                 "missing": len(missing_paths),
                 "unchanged": len(unchanged_paths),
             },
+            "checksums": {
+                "computed": scanner.checksums_computed,
+                "reused": scanner.checksums_reused,
+            },
         }
 
+    def _local_entries_under(self, rel_paths: list[str]) -> dict[str, FileEntry]:
+        """Return the local entries at, or for directories below, the given paths.
+
+        Exact paths are looked up directly; the key list is only scanned for
+        paths that are directories now or no longer exist (possibly removed
+        directories), and only matching entries are decoded.
+        """
+        found: dict[str, FileEntry] = {}
+        prefixes: list[str] = []
+        for rel_path in rel_paths:
+            if rel_path in self.files:
+                found[rel_path] = self.files[rel_path]
+            full_path = self.base_dir / rel_path
+            if full_path.is_dir() or not full_path.exists():
+                prefixes.append(rel_path + os.sep)
+        if prefixes:
+            prefix_tuple = tuple(prefixes)
+            for path in self.files:
+                if path.startswith(prefix_tuple) and path not in found:
+                    found[path] = self.files[path]
+        return {path: entry for path, entry in found.items() if entry.source_type == "local"}
+
+    def _patch_directory_tree(self, added: list[str], removed: list[str]) -> None:
+        """Adjust directory nodes and file counts for added and removed files."""
+        if self.directory_tree is None:
+            return
+        root = self.directory_tree
+
+        def _descend(file_path: str, create: bool) -> list[DirectoryNode]:
+            nodes = [root]
+            parts = Path(file_path).parts[:-1]
+            for depth in range(len(parts)):
+                node_path = str(Path(*parts[: depth + 1]))
+                child = next((c for c in nodes[-1].children if c.path == node_path), None)
+                if child is None:
+                    if not create:
+                        break
+                    child = DirectoryNode(path=node_path, name=parts[depth])
+                    nodes[-1].children.append(child)
+                    nodes[-1].children.sort(key=lambda c: c.name.lower())
+                nodes.append(child)
+            return nodes
+
+        for file_path in added:
+            for node in _descend(file_path, create=True):
+                node.file_count += 1
+        for file_path in removed:
+            nodes = _descend(file_path, create=False)
+            for node in nodes:
+                node.file_count = max(0, node.file_count - 1)
+            # Drop directories that were deleted along with their files.
+            for parent, child in zip(nodes, nodes[1:]):
+                if not (self.base_dir / child.path).is_dir():
+                    parent.children.remove(child)
+                    break
+
     def remove_missing(self) -> list[str]:
         """Remove entries with status 'missing' from the catalog."""
         to_remove = [p for p, e in self.files.items() if e.status == "missing"]
         for p in to_remove:
             del self.files[p]
+        self._doc_indexes = {}
         return to_remove
 
     def mark_all_current(self) -> None:
@@ -162,6 +421,59 @@ class ContentCatalog:
             if entry.status in ("new", "modified"):
                 entry.status = "current"
 
+    # ------------------------------------------------------------------
+    # Document IDs
+    # ------------------------------------------------------------------
+
+    def _assign_doc_id(self, entry: FileEntry) -> None:
+        """Store the retrieval doc_id derived from the entry's path and checksum."""
+        entry.doc_id = catalog_doc_id(self.base_dir, entry.path, entry.checksum_sha256)
+
+    def doc_id_for(self, entry: FileEntry, base_dir: Optional[Path] = None) -> str:
+        """
+        Return the retrieval doc_id of ``entry``.
+
+        The stored doc_id is used when ``base_dir`` is the catalog's own base
+        directory (the usual case); entries saved before doc_ids were
+        persisted get it computed and stored on first use.
+
+        Args:
+            entry: Catalog entry.
+            base_dir: Base directory the doc_id derives from (default: catalog's).
+        """
+        if base_dir is not None and str(base_dir) != str(self.base_dir):
+            return catalog_doc_id(base_dir, entry.path, entry.checksum_sha256)
+        if not entry.doc_id:
+            self._assign_doc_id(entry)
+        return entry.doc_id
+
+    def doc_index(self, base_dir: Optional[Path] = None) -> dict[str, FileEntry]:
+        """
+        Return a doc_id -> entry map, built once and reused until files change.
+
+        The map is shared between callers; treat it as read-only.
+
+        Args:
+            base_dir: Base directory the doc_ids derive from (default: catalog's).
+        """
+        key = str(base_dir) if base_dir is not None else str(self.base_dir)
+        # Callers that replace or resize ``files`` directly also invalidate.
+        files_key = (id(self.files), len(self.files))
+        if files_key != self._doc_index_key:
+            self._doc_indexes = {}
+            self._doc_index_key = files_key
+        index = self._doc_indexes.get(key)
+        if index is None:
+            index = {self.doc_id_for(entry, base_dir): entry for entry in self.files.values()}
+            self._doc_indexes[key] = index
+        return index
+
+    def get_entry_by_doc_id(
+        self, doc_id: str, base_dir: Optional[Path] = None
+    ) -> Optional[FileEntry]:
+        """Return the entry whose retrieval doc_id is ``doc_id``, or None."""
+        return self.doc_index(base_dir).get(doc_id)
+
     # ------------------------------------------------------------------
     # Query
     # ------------------------------------------------------------------
@@ -245,6 +557,8 @@ class ContentCatalog:
         text_search: Optional[str] = None,
         search_converted_content: bool = True,
         limit: int = 50,
+        offset: int = 0,
+        search_index: Optional["CatalogSearchIndex"] = None,
     ) -> list[FileEntry]:
         """
         Query the catalog with multiple filters.
@@ -261,6 +575,11 @@ class ContentCatalog:
             search_converted_content: If True, also search within converted file content
                 (default: True). This enables finding information inside converted PDFs.
             limit: Max results to return
+            offset: Number of matching entries to skip (for pagination)
+            search_index: Optional up-to-date CatalogSearchIndex. When given,
+                text_search of three or more characters is answered from the
+                index and results are ranked by relevance instead of being
+                returned in catalog order.
 
         Returns:
             List of matching FileEntry objects
@@ -268,9 +587,25 @@ class ContentCatalog:
         if limit <= 0:
             return []
 
+        from .catalog_search import MIN_INDEXED_QUERY_LENGTH
+
+        candidates = self.files.values()
+        scan_text = True
+        if (
+            text_search
+            and search_index is not None
+            and len(text_search) >= MIN_INDEXED_QUERY_LENGTH
+        ):
+            ranked_paths = search_index.search(
+                text_search, include_content=search_converted_content
+            )
+            candidates = (self.files[p] for p in ranked_paths if p in self.files)
+            scan_text = False
+
         results: list[FileEntry] = []
+        skipped = 0
 
-        for entry in self.files.values():
+        for entry in candidates:
             if name and name.lower() not in entry.name.lower():
                 continue
             if extension and entry.extension != extension.lower():
@@ -291,7 +626,7 @@ class ContentCatalog:
                     continue
             if status and entry.status != status:
                 continue
-            if text_search:
+            if text_search and scan_text:
                 search_lower = text_search.lower()
                 searchable = entry.path.lower()
                 if entry.summary:
@@ -311,18 +646,29 @@ class ContentCatalog:
                 if search_lower not in searchable:
                     continue
 
+            if skipped < offset:
+                skipped += 1
+                continue
             results.append(entry)
             if len(results) >= limit:
                 break
 
         return results
 
-    def get_files_needing_conversion(self) -> list[FileEntry]:
-        """Get files that should be (re)converted to text."""
+    def get_files_needing_conversion(self, paths: Optional[list[str]] = None) -> list[FileEntry]:
+        """Get files that should be (re)converted to text.
+
+        Args:
+            paths: Only consider these catalog paths (default: every entry).
+        """
         convertible_types = {"binary_document", "audio", "video"}
+        if paths is None:
+            candidates = self.files.values()
+        else:
+            candidates = [self.files[p] for p in paths if p in self.files]
         return [
             e
-            for e in self.files.values()
+            for e in candidates
             if e.file_type in convertible_types
             and e.status != "missing"
             and (not e.converted_to or e.status in ("new", "modified"))
@@ -426,7 +772,9 @@ class ContentCatalog:
             fetch_status=fetch_status,
         )
 
+        self._assign_doc_id(entry)
         self.files[entry.path] = entry
+        self._doc_indexes = {}
         self.catalog_updated_at = now
         return entry
 
@@ -573,54 +921,156 @@ class ContentCatalog:
             self._render_tree(child, lines, indent + 1, max_depth)
 
     # ------------------------------------------------------------------
-    # Persistence (JSON)
+    # Persistence (JSON / SQLite)
     # ------------------------------------------------------------------
 
+    def to_json_dict(self) -> dict:
+        """Return the full catalog as the content_catalog.json document."""
+        return {
+            "version": self.version,
+            "catalog_created_at": self.catalog_created_at,
+            "catalog_updated_at": self.catalog_updated_at,
+            "base_dir": str(self.base_dir),
+            "settings": self.settings,
+            "stats": self.get_stats(),
+            "directory_tree": self.directory_tree.to_dict() if self.directory_tree else None,
+            "files": [
+                entry.to_dict() for entry in sorted(self.files.values(), key=lambda e: e.path)
+            ],
+        }
+
+    def export_json(self, path: Path) -> Path:
+        """Write the full catalog as JSON to ``path`` (any storage format).
+
+        The file is written next to ``path`` and renamed into place, so
+        concurrent readers never see a partial catalog.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_json_dict(), f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        return path
+
     def save(self, config_dir: Optional[Path] = None) -> Path:
         """
-        Save catalog to .flavia/content_catalog.json.
+        Save catalog to .flavia/.
+
+        Writes content_catalog.db when the catalog has been migrated to
+        SQLite (only changed entries are written), otherwise rewrites
+        content_catalog.json.
 
         Args:
             config_dir: Directory to save into (default: base_dir/.flavia/)
 
         Returns:
             Path to the saved file.
+
+        Raises:
+            RuntimeError: If this is a shared snapshot from ``CatalogCache``.
         """
+        if self._shared_snapshot:
+            raise RuntimeError(
+                "Cannot save a shared catalog snapshot; use ContentCatalog.load() "
+                "for a private copy to modify."
+            )
         if config_dir is None:
             config_dir = self.base_dir / ".flavia"
 
         config_dir.mkdir(parents=True, exist_ok=True)
-        catalog_path = config_dir / CATALOG_FILENAME
+        baseline = None
+        if (config_dir / CATALOG_DB_FILENAME).exists():
+            if self._stored_db == config_dir / CATALOG_DB_FILENAME:
+                baseline = self._stored_signature
+            catalog_path = self._save_sqlite(config_dir / CATALOG_DB_FILENAME)
+        else:
+            catalog_path = self.export_json(config_dir / CATALOG_FILENAME)
+
+        if config_dir == self.base_dir / ".flavia":
+            # Keep the retrieval router corpus (.index/index.db) and the text
+            # search index (.index/catalog_search.db) in step with the catalog.
+            # Imported lazily: both modules import this one.
+            from .catalog_search import sync_catalog_search
+            from .indexer.catalog_router import sync_catalog_router
+
+            sync_catalog_router(self, catalog_path, baseline)
+            sync_catalog_search(self, catalog_path, baseline)
 
-        data = {
+        return catalog_path
+
+    def _meta_rows(self) -> dict[str, str]:
+        """Serialize catalog-level fields as catalog_meta rows."""
+        values = {
             "version": self.version,
             "catalog_created_at": self.catalog_created_at,
             "catalog_updated_at": self.catalog_updated_at,
             "base_dir": str(self.base_dir),
             "settings": self.settings,
-            "stats": self.get_stats(),
             "directory_tree": self.directory_tree.to_dict() if self.directory_tree else None,
-            "files": [
-                entry.to_dict() for entry in sorted(self.files.values(), key=lambda e: e.path)
-            ],
+        }
+        return {
+            key: json.dumps(value, ensure_ascii=False, sort_keys=True)
+            for key, value in values.items()
         }
 
-        with open(catalog_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    def _save_sqlite(self, db_path: Path) -> Path:
+        """Upsert changed entries and metadata into the SQLite store."""
+        incremental = self._stored_db == db_path
+        stored = self._stored_entries if incremental else {}
+        lazy = self.files if isinstance(self.files, LazyEntryMap) else None
+
+        upserts: list[tuple[FileEntry, str]] = []
+        for path in self.files:
+            if incremental and lazy is not None and not lazy.is_materialized(path):
+                continue  # never read since load, so unchanged
+            entry = self.files[path]
+            data = serialize_entry(entry)
+            if stored.get(entry.path) != data:
+                upserts.append((entry, data))
+        deletes = [path for path in stored if path not in self.files]
+
+        meta = self._meta_rows()
+        changed_meta = {
+            key: value
+            for key, value in meta.items()
+            if not incremental or self._stored_meta.get(key) != value
+        }
 
-        return catalog_path
+        with CatalogStore(db_path) as store:
+            store.write(
+                self.base_dir,
+                changed_meta,
+                upserts,
+                deletes=deletes,
+                replace_all=not incremental,
+            )
+
+        if not incremental:
+            self._stored_entries = {}
+        for entry, data in upserts:
+            self._stored_entries[entry.path] = data
+        for path in deletes:
+            self._stored_entries.pop(path, None)
+        self._stored_meta = meta
+        self._stored_db = db_path
+        self._stored_signature = catalog_file_signature(db_path)
+        return db_path
 
     @classmethod
     def load(cls, config_dir: Path) -> Optional["ContentCatalog"]:
         """
-        Load catalog from .flavia/content_catalog.json.
+        Load catalog from .flavia/ (content_catalog.db or content_catalog.json).
 
         Args:
             config_dir: The .flavia/ directory to load from.
 
         Returns:
-            ContentCatalog instance, or None if file doesn't exist.
+            ContentCatalog instance, or None if no catalog exists.
         """
+        db_path = config_dir / CATALOG_DB_FILENAME
+        if db_path.exists():
+            return cls._load_sqlite(config_dir, db_path)
+
         catalog_path = config_dir / CATALOG_FILENAME
         if not catalog_path.exists():
             return None
@@ -650,6 +1100,70 @@ class ContentCatalog:
 
         return catalog
 
+    @classmethod
+    def _load_sqlite(cls, config_dir: Path, db_path: Path) -> Optional["ContentCatalog"]:
+        """Load catalog metadata from SQLite; entries are materialized on access."""
+        try:
+            with CatalogStore(db_path) as store:
+                meta_raw = store.read_meta_raw()
+                raw_entries = store.load_raw_entries()
+            meta = {key: json.loads(value) for key, value in meta_raw.items()}
+        except (sqlite3.Error, json.JSONDecodeError):
+            return None
+
+        catalog = cls(Path(meta.get("base_dir") or config_dir.parent))
+        catalog.version = meta.get("version", CATALOG_VERSION)
+        catalog.catalog_created_at = meta.get("catalog_created_at", "")
+        catalog.catalog_updated_at = meta.get("catalog_updated_at", "")
+        catalog.settings = meta.get("settings") or catalog.settings
+
+        tree_data = meta.get("directory_tree")
+        if tree_data:
+            catalog.directory_tree = DirectoryNode.from_dict(tree_data)
+
+        catalog.files = LazyEntryMap(raw_entries)
+        catalog._stored_db = db_path
+        catalog._stored_entries = raw_entries
+        catalog._stored_meta = meta_raw
+        catalog._stored_signature = catalog_file_signature(db_path)
+        return catalog
+
+    @classmethod
+    def convert_storage(cls, config_dir: Path, storage: str) -> Optional[Path]:
+        """
+        Move the catalog in ``config_dir`` to another storage format.
+
+        The new file is fully written before the old one is removed.
+
+        Args:
+            config_dir: The .flavia/ directory holding the catalog.
+            storage: Target format, "sqlite" or "json".
+
+        Returns:
+            Path to the converted catalog, or None if no catalog exists.
+        """
+        if storage not in CATALOG_STORAGE_FORMATS:
+            raise ValueError(f"Unknown catalog storage format: {storage!r}")
+
+        catalog = cls.load(config_dir)
+        if catalog is None:
+            return None
+
+        db_path = config_dir / CATALOG_DB_FILENAME
+        json_path = config_dir / CATALOG_FILENAME
+        if storage == "sqlite":
+            tmp_path = db_path.with_name(db_path.name + ".tmp")
+            tmp_path.unlink(missing_ok=True)
+            catalog._stored_db = None
+            catalog._save_sqlite(tmp_path)
+            tmp_path.replace(db_path)
+            json_path.unlink(missing_ok=True)
+            return db_path
+
+        catalog.export_json(json_path)
+        db_path.unlink(missing_ok=True)
+        return json_path
+
     @classmethod
     def load_or_build(
         cls,
@@ -0,0 +1,116 @@
+"""Process-wide cache of loaded content catalogs.
+
+The system prompt builder, search_chunks, the retrieval router, video
+temporal expansion and the read-only content tools all need the catalog,
+often several times within one agent turn. ``CatalogCache`` loads it once
+per change of the catalog file (see ``catalog_file_signature``) and hands
+every caller the same instance.
+
+Cached catalogs are shared snapshots: treat them as read-only. ``save()``
+refuses to run on them; code that modifies the catalog must take a private
+copy with ``ContentCatalog.load()``, and its save invalidates the cache
+through the file signature.
+"""
+
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from .catalog import ContentCatalog, catalog_file_signature, resolve_catalog_path
+
+
+class CatalogCache:
+    """Thread-safe cache of loaded catalogs keyed by .flavia/ directory.
+
+    Usage:
+        catalog = get_catalog_cache().get(base_dir / ".flavia")
+        if catalog is not None:
+            results = catalog.query(file_type="text")
+    """
+
+    def __init__(self):
+        # config_dir -> (catalog file, signature, catalog)
+        self._entries: dict[str, tuple[Path, tuple[int, int, int, int], ContentCatalog]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.loads = 0
+        self.invalidations = 0
+
+    def get(self, config_dir: Path) -> Optional[ContentCatalog]:
+        """Return the shared catalog for ``config_dir``, loading it if it changed.
+
+        Returns:
+            The cached ContentCatalog snapshot, or None if no readable
+            catalog exists.
+        """
+        config_dir = Path(config_dir).resolve()
+        key = str(config_dir)
+        with self._lock:
+            catalog_path = resolve_catalog_path(config_dir)
+            signature = catalog_file_signature(catalog_path) if catalog_path else None
+            cached = self._entries.get(key)
+            if signature is None:
+                if cached is not None:
+                    del self._entries[key]
+                    self.invalidations += 1
+                return None
+            if cached is not None and cached[0] == catalog_path and cached[1] == signature:
+                self.hits += 1
+                return cached[2]
+
+            # Loading under the lock makes concurrent callers share one load.
+            catalog = ContentCatalog.load(config_dir)
+            self.loads += 1
+            if cached is not None:
+                self.invalidations += 1
+            if catalog is None:
+                self._entries.pop(key, None)
+                return None
+            catalog._shared_snapshot = True
+            self._entries[key] = (catalog_path, signature, catalog)
+            return catalog
+
+    def invalidate(self, config_dir: Optional[Path] = None) -> None:
+        """Drop the cached catalog for ``config_dir`` (or every cached catalog)."""
+        with self._lock:
+            if config_dir is None:
+                self.invalidations += len(self._entries)
+                self._entries.clear()
+            elif self._entries.pop(str(Path(config_dir).resolve()), None) is not None:
+                self.invalidations += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dict with keys: hits, loads, invalidations, hit_rate, entries.
+        """
+        with self._lock:
+            lookups = self.hits + self.loads
+            return {
+                "hits": self.hits,
+                "loads": self.loads,
+                "invalidations": self.invalidations,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+            }
+
+    def reset_stats(self) -> None:
+        """Zero the hit/load/invalidation counters."""
+        with self._lock:
+            self.hits = 0
+            self.loads = 0
+            self.invalidations = 0
+
+
+_catalog_cache = CatalogCache()
+
+
+def get_catalog_cache() -> CatalogCache:
+    """Return the process-wide catalog cache."""
+    return _catalog_cache
+
+
+def load_catalog_snapshot(config_dir: Path) -> Optional[ContentCatalog]:
+    """Return the shared, read-only catalog for ``config_dir`` (None if missing)."""
+    return _catalog_cache.get(config_dir)
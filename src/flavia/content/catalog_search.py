@@ -0,0 +1,390 @@
+"""Persistent full-text index for catalog text search.
+
+``ContentCatalog.query(text_search=...)`` used to read the converted
+content and frame descriptions of every entry from disk and substring-test
+them on every call. ``CatalogSearchIndex`` keeps the same searchable text in
+an FTS5 table (base_dir/.index/catalog_search.db) using the trigram
+tokenizer, so substring semantics are preserved while lookups are a single
+indexed MATCH query ranked by BM25.
+
+The index is maintained incrementally: each row stores a signature of the
+entry's metadata and of its converted/frame files (mtime + size), and only
+entries whose signature changed have their content re-read. Like the
+retrieval router corpus, the index records the catalog file signature it
+reflects and is re-synced after every catalog save. Saves of a SQLite
+catalog only check the entries touched since it was loaded, so edits made
+directly to converted files are picked up when their entry is next touched
+or the index is next fully synced.
+"""
+
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Optional
+
+from .catalog import ContentCatalog, catalog_file_signature, resolve_catalog_path
+from .catalog_store import LazyEntryMap
+from .scanner import FileEntry
+
+CATALOG_SEARCH_DB_FILENAME = "catalog_search.db"
+
+# Trigram matching needs at least three characters; shorter queries fall back
+# to scanning the catalog.
+MIN_INDEXED_QUERY_LENGTH = 3
+
+
+def catalog_search_metadata(entry: FileEntry) -> str:
+    """Return the metadata text searched for an entry (path, summary, tags)."""
+    parts = [entry.path]
+    if entry.summary:
+        parts.append(entry.summary)
+    if entry.tags:
+        parts.append(" ".join(entry.tags))
+    return " ".join(parts)
+
+
+def _file_state(path: Path) -> str:
+    try:
+        stat = path.stat()
+    except OSError:
+        return "-"
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _entry_signature(catalog: ContentCatalog, entry: FileEntry, metadata: str) -> str:
+    """Return a change signature for the indexed text of an entry, without reading content."""
+    parts = [metadata, entry.converted_to or ""]
+    if entry.converted_to:
+        parts.append(_file_state(catalog.base_dir / entry.converted_to))
+    for frame_rel in entry.frame_descriptions:
+        parts.append(frame_rel)
+        parts.append(_file_state(catalog.base_dir / frame_rel))
+    return hashlib.sha1("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def _join_signature(signature: Optional[tuple[int, ...]]) -> str:
+    return ":".join(str(part) for part in signature) if signature else ""
+
+
+def _format_signature(catalog_path: Path) -> str:
+    return _join_signature(catalog_file_signature(catalog_path))
+
+
+def _phrase(text: str) -> str:
+    """Quote text as an FTS5 phrase (a substring match under the trigram tokenizer)."""
+    return '"' + text.replace('"', '""') + '"'
+
+
+class CatalogSearchIndex:
+    """Trigram FTS5 index over catalog metadata and converted content.
+
+    The index maintains three tables in catalog_search.db:
+    - catalog_search_fts: FTS5 virtual table (path, metadata, content)
+    - catalog_search_docs: path -> (signature, FTS rowid), used for
+      incremental sync; rows are deleted from the FTS table by rowid since
+      ``path`` is an unindexed FTS column
+    - catalog_search_state: key/value record of the catalog file the index
+      reflects
+
+    Usage:
+        with CatalogSearchIndex(vault_dir) as index:
+            if not index.is_current(catalog_path, vault_dir):
+                index.sync(catalog, catalog_path)
+            paths = index.search("kalman filter")
+    """
+
+    def __init__(
+        self,
+        base_dir: Path,
+        db_path: Optional[Path] = None,
+    ):
+        """Initialize the catalog search index.
+
+        Args:
+            base_dir: Vault base directory. The index will be stored in
+                      base_dir/.index/catalog_search.db
+            db_path: Optional explicit path to the database file.
+                     If None, uses base_dir/.index/catalog_search.db
+        """
+        self.base_dir = Path(base_dir)
+        if db_path:
+            self.db_path = Path(db_path)
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        else:
+            self.index_dir = self.base_dir / ".index"
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            self.db_path = self.index_dir / CATALOG_SEARCH_DB_FILENAME
+
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get or create the database connection."""
+        if self._conn is None:
+            # Autocommit mode: sync() opens its own write transaction.
+            self._conn = sqlite3.connect(str(self.db_path), isolation_level=None)
+            self._conn.row_factory = sqlite3.Row
+            self._ensure_schema()
+        return self._conn
+
+    def _ensure_schema(self) -> None:
+        """Create the search tables if they don't exist."""
+        conn = self._conn
+        if conn is None:
+            return
+
+        conn.execute(
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS catalog_search_fts USING fts5(
+                path UNINDEXED,
+                metadata,
+                content,
+                tokenize = 'trigram'
+            )
+            """
+        )
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(catalog_search_docs)")}
+        if columns and "fts_rowid" not in columns:
+            # Pre-rowid layout: the index is derived data, so rebuild it from scratch.
+            conn.execute("DROP TABLE catalog_search_docs")
+            conn.execute("DELETE FROM catalog_search_fts")
+            conn.execute("DROP TABLE IF EXISTS catalog_search_state")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS catalog_search_docs (
+                path      TEXT PRIMARY KEY,
+                signature TEXT NOT NULL,
+                fts_rowid INTEGER NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS catalog_search_state (
+                key   TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            )
+            """
+        )
+
+    def _get_state(self) -> dict[str, str]:
+        conn = self._get_connection()
+        cursor = conn.execute("SELECT key, value FROM catalog_search_state")
+        return {row["key"]: row["value"] for row in cursor}
+
+    def is_current(self, catalog_path: Path, base_dir: Path) -> bool:
+        """Check whether the index reflects the catalog file on disk.
+
+        Only stats the catalog file; the catalog is not parsed.
+
+        Args:
+            catalog_path: Path to the catalog file (JSON or SQLite).
+            base_dir: Vault base directory.
+
+        Returns:
+            True if the stored file signature and base_dir both match.
+        """
+        state = self._get_state()
+        signature = _format_signature(catalog_path)
+        return (
+            bool(signature)
+            and state.get("catalog_signature") == signature
+            and state.get("base_dir") == str(base_dir)
+        )
+
+    def sync(
+        self,
+        catalog: ContentCatalog,
+        catalog_path: Optional[Path] = None,
+        baseline_signature: Optional[tuple[int, int, int, int]] = None,
+    ) -> dict[str, int]:
+        """Bring the index in line with a catalog, re-reading only changed entries.
+
+        Args:
+            catalog: Loaded content catalog.
+            catalog_path: Optional path to the catalog file, whose signature
+                          is recorded for :meth:`is_current`.
+            baseline_signature: Signature of the catalog file the catalog was
+                          loaded from or last saved to. When the index was
+                          synced to it, entries of a ``LazyEntryMap`` that were
+                          never materialized since are skipped.
+
+        Returns:
+            Dict with keys: added, updated, removed.
+        """
+        conn = self._get_connection()
+        counts = {"added": 0, "updated": 0, "removed": 0}
+        new_state = {"base_dir": str(catalog.base_dir)}
+        if catalog_path is not None:
+            new_state["catalog_signature"] = _format_signature(catalog_path)
+
+        lazy = catalog.files if isinstance(catalog.files, LazyEntryMap) else None
+
+        # Take the write lock before diffing so concurrent syncs serialize.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            state = {
+                row["key"]: row["value"]
+                for row in conn.execute("SELECT key, value FROM catalog_search_state")
+            }
+            incremental = (
+                lazy is not None
+                and baseline_signature is not None
+                and state.get("catalog_signature") == _join_signature(baseline_signature)
+                and state.get("base_dir") == str(catalog.base_dir)
+            )
+            stored = {
+                row["path"]: (row["signature"], row["fts_rowid"])
+                for row in conn.execute(
+                    "SELECT path, signature, fts_rowid FROM catalog_search_docs"
+                )
+            }
+
+            changed: list[tuple[FileEntry, str, str]] = []
+            for path in lazy.materialized_paths() if incremental else list(catalog.files):
+                entry = catalog.files[path]
+                metadata = catalog_search_metadata(entry)
+                signature = _entry_signature(catalog, entry, metadata)
+                previous = stored.get(path)
+                if previous is None or previous[0] != signature:
+                    changed.append((entry, metadata, signature))
+            removed = [path for path in stored if path not in catalog.files]
+
+            counts["removed"] = len(removed)
+            counts["updated"] = sum(1 for entry, _, _ in changed if entry.path in stored)
+            counts["added"] = len(changed) - counts["updated"]
+
+            stale = list(removed)
+            stale.extend(entry.path for entry, _, _ in changed if entry.path in stored)
+            conn.executemany(
+                "DELETE FROM catalog_search_fts WHERE rowid = ?",
+                [(stored[path][1],) for path in stale],
+            )
+            conn.executemany(
+                "DELETE FROM catalog_search_docs WHERE path = ?", [(path,) for path in stale]
+            )
+
+            docs = []
+            for entry, metadata, signature in changed:
+                content_parts = [
+                    catalog._read_converted_content(entry),
+                    catalog._read_frame_descriptions_content(entry),
+                ]
+                content = " ".join(part for part in content_parts if part)
+                cursor = conn.execute(
+                    "INSERT INTO catalog_search_fts (path, metadata, content) VALUES (?, ?, ?)",
+                    (entry.path, metadata, content),
+                )
+                docs.append((entry.path, signature, cursor.lastrowid))
+            conn.executemany(
+                "INSERT INTO catalog_search_docs (path, signature, fts_rowid) VALUES (?, ?, ?)",
+                docs,
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO catalog_search_state (key, value) VALUES (?, ?)",
+                list(new_state.items()),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+        return counts
+
+    def doc_count(self) -> int:
+        """Return the number of indexed catalog entries."""
+        conn = self._get_connection()
+        return conn.execute("SELECT COUNT(*) AS cnt FROM catalog_search_docs").fetchone()["cnt"]
+
+    def search(self, text: str, include_content: bool = True) -> list[str]:
+        """Return the paths of entries containing ``text``, best match first.
+
+        Matching is case-insensitive substring matching, like the catalog
+        scan it replaces. Metadata matches weigh ten times more than
+        content matches in the BM25 ranking.
+
+        Args:
+            text: Text to search for (at least MIN_INDEXED_QUERY_LENGTH chars).
+            include_content: Also search converted content and frame descriptions.
+
+        Returns:
+            Matching catalog paths ordered by relevance.
+        """
+        if len(text) < MIN_INDEXED_QUERY_LENGTH:
+            raise ValueError(
+                f"Indexed search needs at least {MIN_INDEXED_QUERY_LENGTH} characters"
+            )
+
+        columns = "{metadata content}" if include_content else "metadata"
+        conn = self._get_connection()
+        cursor = conn.execute(
+            """
+            SELECT path, bm25(catalog_search_fts, 0.0, 10.0, 1.0) AS score
+            FROM catalog_search_fts
+            WHERE catalog_search_fts MATCH ?
+            ORDER BY score
+            """,
+            (f"{columns} : {_phrase(text)}",),
+        )
+        return [row["path"] for row in cursor]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> "CatalogSearchIndex":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
+
+
+def open_catalog_search_index(
+    catalog: ContentCatalog, config_dir: Path
+) -> Optional[CatalogSearchIndex]:
+    """Open the search index for a saved catalog, syncing it if it is stale.
+
+    Returns:
+        An open CatalogSearchIndex (the caller closes it), or None when the
+        index can't be used (catalog not saved, read-only vault, or a SQLite
+        build without FTS5 trigram support). Callers then fall back to
+        ``ContentCatalog.query``'s catalog scan.
+    """
+    catalog_path = resolve_catalog_path(config_dir)
+    if catalog_path is None:
+        return None
+    index: Optional[CatalogSearchIndex] = None
+    try:
+        index = CatalogSearchIndex(catalog.base_dir)
+        if not index.is_current(catalog_path, catalog.base_dir):
+            index.sync(catalog, catalog_path)
+        return index
+    except (OSError, sqlite3.Error):
+        if index is not None:
+            index.close()
+        return None
+
+
+def sync_catalog_search(
+    catalog: ContentCatalog,
+    catalog_path: Path,
+    baseline_signature: Optional[tuple[int, int, int, int]] = None,
+) -> None:
+    """Refresh the search index after a catalog save (best-effort).
+
+    Does nothing unless the index already exists, so saving a catalog never
+    creates it in vaults that don't use text search. ``baseline_signature``
+    is passed through to :meth:`CatalogSearchIndex.sync`.
+    """
+    index_db = catalog.base_dir / ".index" / CATALOG_SEARCH_DB_FILENAME
+    if not index_db.exists():
+        return
+    try:
+        with CatalogSearchIndex(catalog.base_dir) as index:
+            index.sync(catalog, catalog_path, baseline_signature)
+    except sqlite3.Error:
+        # The query path re-syncs lazily when the stored state is stale.
+        pass
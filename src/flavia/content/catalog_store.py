@@ -0,0 +1,292 @@
+"""SQLite storage backend for the content catalog.
+
+``content_catalog.json`` is rewritten in full on every save and parsed in
+full on every load. ``CatalogStore`` keeps the same data in
+``.flavia/content_catalog.db`` instead: one row per ``FileEntry`` with
+indexed path, doc_id, file_type, status and category columns, so saves only
+upsert the entries that changed and lookups by path or doc_id don't need to
+materialize the rest of the vault.
+
+Entries are stored as the same JSON objects ``FileEntry.to_dict`` produces,
+which keeps JSON export and migration lossless.
+"""
+
+import hashlib
+import json
+import sqlite3
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, Union
+
+from .scanner import FileEntry
+
+CATALOG_DB_FILENAME = "content_catalog.db"
+
+
+def catalog_doc_id(base_dir: Union[Path, str], path: str, checksum: str) -> str:
+    """Reproduce chunker doc_id derivation: sha1(f"{base_dir}:{path}:{checksum}")."""
+    raw = f"{base_dir}:{path}:{checksum}"
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def serialize_entry(entry: FileEntry) -> str:
+    """Serialize an entry deterministically, so equal entries compare equal as text."""
+    return json.dumps(entry.to_dict(), ensure_ascii=False, sort_keys=True)
+
+
+class LazyEntryMap(MutableMapping):
+    """Path -> FileEntry mapping that defers ``FileEntry.from_dict`` until access.
+
+    Values start out as the raw JSON text read from the store and are
+    replaced by ``FileEntry`` objects the first time they are read. Paths
+    that were never materialized are known to be unchanged since load.
+    """
+
+    def __init__(self, raw_entries: Optional[dict[str, str]] = None):
+        self._items: dict[str, Union[FileEntry, str]] = dict(raw_entries or {})
+
+    def __getitem__(self, path: str) -> FileEntry:
+        value = self._items[path]
+        if isinstance(value, str):
+            value = FileEntry.from_dict(json.loads(value))
+            self._items[path] = value
+        return value
+
+    def __setitem__(self, path: str, entry: FileEntry) -> None:
+        self._items[path] = entry
+
+    def __delitem__(self, path: str) -> None:
+        del self._items[path]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._items
+
+    def __repr__(self) -> str:
+        loaded = sum(1 for v in self._items.values() if not isinstance(v, str))
+        return f"LazyEntryMap({len(self._items)} entries, {loaded} materialized)"
+
+    def clear(self) -> None:
+        """Drop every entry without materializing it."""
+        self._items.clear()
+
+    def is_materialized(self, path: str) -> bool:
+        """Return True if the entry at ``path`` has been turned into a FileEntry."""
+        return not isinstance(self._items.get(path), str)
+
+    def materialized_paths(self) -> list[str]:
+        """Return the paths whose entries have been read or assigned since load."""
+        return [path for path, value in self._items.items() if not isinstance(value, str)]
+
+
+class CatalogStore:
+    """Store catalog entries and metadata in SQLite.
+
+    The database maintains:
+    - catalog_meta: key/value JSON for version, timestamps, base_dir,
+      settings and the directory tree
+    - catalog_files: one row per FileEntry (path primary key, indexed
+      doc_id/file_type/status/category columns, JSON body)
+
+    Usage:
+        with CatalogStore(config_dir / CATALOG_DB_FILENAME) as store:
+            entry = store.get_entry("papers/attention.pdf")
+            pdfs = store.find_entries(category="pdf", status="current")
+    """
+
+    def __init__(self, db_path: Path):
+        """Initialize the store.
+
+        Args:
+            db_path: Path to the catalog database file.
+        """
+        self.db_path = Path(db_path)
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get or create the database connection."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path))
+            self._conn.row_factory = sqlite3.Row
+            self._ensure_schema()
+        return self._conn
+
+    def _ensure_schema(self) -> None:
+        """Create the catalog tables and indexes if they don't exist."""
+        conn = self._conn
+        if conn is None:
+            return
+
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS catalog_meta (
+                key   TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS catalog_files (
+                path      TEXT PRIMARY KEY,
+                doc_id    TEXT NOT NULL,
+                file_type TEXT NOT NULL,
+                status    TEXT NOT NULL,
+                category  TEXT NOT NULL,
+                data      TEXT NOT NULL
+            )
+            """
+        )
+        for column in ("doc_id", "file_type", "status", "category"):
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_catalog_files_{column} "
+                f"ON catalog_files({column})"
+            )
+        conn.commit()
+
+    # ------------------------------------------------------------------
+    # Metadata
+    # ------------------------------------------------------------------
+
+    def read_meta(self) -> dict[str, Any]:
+        """Return all metadata values, JSON-decoded."""
+        conn = self._get_connection()
+        rows = conn.execute("SELECT key, value FROM catalog_meta").fetchall()
+        return {row["key"]: json.loads(row["value"]) for row in rows}
+
+    def read_meta_raw(self) -> dict[str, str]:
+        """Return all metadata values as stored JSON text."""
+        conn = self._get_connection()
+        rows = conn.execute("SELECT key, value FROM catalog_meta").fetchall()
+        return {row["key"]: row["value"] for row in rows}
+
+    # ------------------------------------------------------------------
+    # Entries
+    # ------------------------------------------------------------------
+
+    def count(self) -> int:
+        """Return the number of stored entries."""
+        conn = self._get_connection()
+        return conn.execute("SELECT COUNT(*) FROM catalog_files").fetchone()[0]
+
+    def paths(self) -> list[str]:
+        """Return all stored paths, sorted."""
+        conn = self._get_connection()
+        rows = conn.execute("SELECT path FROM catalog_files ORDER BY path").fetchall()
+        return [row["path"] for row in rows]
+
+    def load_raw_entries(self) -> dict[str, str]:
+        """Return path -> serialized entry for every stored entry, sorted by path."""
+        conn = self._get_connection()
+        rows = conn.execute("SELECT path, data FROM catalog_files ORDER BY path").fetchall()
+        return {row["path"]: row["data"] for row in rows}
+
+    def get_entry(self, path: str) -> Optional[FileEntry]:
+        """Return the entry stored at ``path``, or None."""
+        conn = self._get_connection()
+        row = conn.execute("SELECT data FROM catalog_files WHERE path = ?", (path,)).fetchone()
+        return FileEntry.from_dict(json.loads(row["data"])) if row else None
+
+    def get_entry_by_doc_id(self, doc_id: str) -> Optional[FileEntry]:
+        """Return the entry whose derived doc_id is ``doc_id``, or None."""
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT data FROM catalog_files WHERE doc_id = ? LIMIT 1", (doc_id,)
+        ).fetchone()
+        return FileEntry.from_dict(json.loads(row["data"])) if row else None
+
+    def find_entries(
+        self,
+        file_type: Optional[str] = None,
+        status: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> list[FileEntry]:
+        """Return entries matching every given column filter, sorted by path."""
+        clauses: list[str] = []
+        params: list[str] = []
+        for column, value in (("file_type", file_type), ("status", status), ("category", category)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        sql = "SELECT data FROM catalog_files"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY path"
+
+        conn = self._get_connection()
+        rows = conn.execute(sql, params).fetchall()
+        return [FileEntry.from_dict(json.loads(row["data"])) for row in rows]
+
+    def write(
+        self,
+        base_dir: Union[Path, str],
+        meta: dict[str, str],
+        upserts: Iterable[tuple[FileEntry, str]],
+        deletes: Iterable[str] = (),
+        replace_all: bool = False,
+    ) -> int:
+        """Apply one catalog save in a single transaction.
+
+        Args:
+            base_dir: Catalog base directory (part of the derived doc_id).
+            meta: Metadata key -> JSON text to upsert.
+            upserts: (entry, serialized entry) pairs to insert or replace.
+            deletes: Paths to remove.
+            replace_all: Drop every stored entry first (full rewrite).
+
+        Returns:
+            Number of entries upserted.
+        """
+        conn = self._get_connection()
+        written = 0
+        try:
+            if replace_all:
+                conn.execute("DELETE FROM catalog_files")
+            conn.executemany(
+                "INSERT OR REPLACE INTO catalog_meta (key, value) VALUES (?, ?)",
+                list(meta.items()),
+            )
+            rows = []
+            for entry, data in upserts:
+                doc_id = entry.doc_id or catalog_doc_id(
+                    base_dir, entry.path, entry.checksum_sha256
+                )
+                rows.append(
+                    (entry.path, doc_id, entry.file_type, entry.status, entry.category, data)
+                )
+            if rows:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO catalog_files "
+                    "(path, doc_id, file_type, status, category, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                written = len(rows)
+            delete_rows = [(path,) for path in deletes]
+            if delete_rows:
+                conn.executemany("DELETE FROM catalog_files WHERE path = ?", delete_rows)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        return written
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> "CatalogStore":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
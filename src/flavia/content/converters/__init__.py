@@ -13,6 +13,7 @@ from .registry import (
     register_converter,
     register_source_converter,
 )
+from .scheduler import ConversionResult, ConversionScheduler
 from .text_reader import TextReader
 from .video_converter import VideoConverter
 
@@ -33,6 +34,8 @@ __all__ = [
     "get_mistral_api_key",
     "register_converter",
     "register_source_converter",
+    "ConversionScheduler",
+    "ConversionResult",
     "OnlineSourceConverter",
     "YouTubeConverter",
     "WebPageConverter",
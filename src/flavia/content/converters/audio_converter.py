@@ -29,6 +29,7 @@ class AudioConverter(BaseConverter):
 
     supported_extensions = AUDIO_EXTENSIONS
     requires_dependencies = ["mistralai"]
+    max_concurrency = 2  # Mistral API rate limits
 
     def convert(
         self,
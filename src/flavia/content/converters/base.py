@@ -21,6 +21,13 @@ class BaseConverter(ABC):
     # Optional mapping of package names to import module names
     dependency_import_map: dict[str, str] = {}
 
+    # Pool used by ConversionScheduler: "process" for CPU-bound local
+    # extraction, "thread" for network/API-bound converters
+    conversion_pool: str = "thread"
+
+    # Max concurrent conversions with this converter (None = pool size)
+    max_concurrency: Optional[int] = None
+
     @abstractmethod
     def convert(
         self,
@@ -14,6 +14,7 @@ class MistralOcrConverter(BaseConverter):
 
     supported_extensions = {".pdf"}
     requires_dependencies = ["mistralai"]
+    max_concurrency = 2  # Mistral API rate limits
 
     MIN_CHARS_PER_PAGE = 50
 
@@ -42,39 +43,56 @@ class MistralOcrConverter(BaseConverter):
         if md_text is None:
             return None
 
-        stem = source_path.stem
-
         # Determine output path, preserving directory structure when possible
         try:
             relative_source = source_path.resolve().relative_to(output_dir.resolve().parent)
             output_file = output_dir / relative_source.with_suffix(f".{output_format}")
         except ValueError:
-            output_file = output_dir / (stem + f".{output_format}")
-
-        # Save extracted images
-        if images:
-            # Keep image assets next to the markdown file to preserve relative links.
-            images_dir = output_file.parent / f"{stem}_images"
-            images_dir.mkdir(parents=True, exist_ok=True)
-            img_name_map: dict[str, str] = {}
-            for idx, (img_id, img_bytes) in enumerate(images, start=1):
-                img_filename = f"img-{idx:04d}.png"
-                (images_dir / img_filename).write_bytes(img_bytes)
-                img_name_map[img_id] = f"{stem}_images/{img_filename}"
-
-            # Replace image references in markdown
-            def _replace_img(match: re.Match) -> str:
-                alt = match.group(1)
-                ref = match.group(2)
-                new_ref = img_name_map.get(ref, ref)
-                return f"![{alt}]({new_ref})"
-
-            md_text = re.sub(r"!\[([^\]]*)\]\(([^)]+)\)", _replace_img, md_text)
+            output_file = output_dir / (source_path.stem + f".{output_format}")
+
+        name_map = self.save_images(images, output_file, source_path.stem)
+        md_text = self.relink_images(md_text, name_map)
 
         output_file.parent.mkdir(parents=True, exist_ok=True)
         output_file.write_text(md_text, encoding="utf-8")
         return output_file
 
+    @staticmethod
+    def save_images(
+        images: list[tuple[str, bytes]], output_file: Path, stem: str
+    ) -> dict[str, str]:
+        """Write OCR images next to ``output_file``.
+
+        Returns:
+            Map of OCR image id to the relative path of the saved image.
+        """
+        if not images:
+            return {}
+
+        # Keep image assets next to the markdown file to preserve relative links.
+        images_dir = output_file.parent / f"{stem}_images"
+        images_dir.mkdir(parents=True, exist_ok=True)
+        img_name_map: dict[str, str] = {}
+        for idx, (img_id, img_bytes) in enumerate(images, start=1):
+            img_filename = f"img-{idx:04d}.png"
+            (images_dir / img_filename).write_bytes(img_bytes)
+            img_name_map[img_id] = f"{stem}_images/{img_filename}"
+        return img_name_map
+
+    @staticmethod
+    def relink_images(md_text: str, img_name_map: dict[str, str]) -> str:
+        """Replace image references in markdown with the saved image paths."""
+        if not img_name_map:
+            return md_text
+
+        def _replace_img(match: re.Match) -> str:
+            alt = match.group(1)
+            ref = match.group(2)
+            new_ref = img_name_map.get(ref, ref)
+            return f"![{alt}]({new_ref})"
+
+        return re.sub(r"!\[([^\]]*)\]\(([^)]+)\)", _replace_img, md_text)
+
     def extract_text(self, source_path: Path) -> Optional[str]:
         """Return OCR'd markdown text without writing any files."""
         md_text, _ = self._run_mistral_ocr(source_path)
@@ -87,6 +105,20 @@ class MistralOcrConverter(BaseConverter):
             (markdown_text, [(img_id, img_bytes), ...])
             On failure returns (None, []).
         """
+        pages, images = self.ocr_pages(pdf_path)
+        if pages is None:
+            return None, []
+        return "\n\n".join(pages[index] for index in sorted(pages)), images
+
+    def ocr_pages(
+        self, pdf_path: Path, pages: Optional[list[int]] = None
+    ) -> tuple[Optional[dict[int, str]], list[tuple[str, bytes]]]:
+        """Run Mistral OCR on selected pages (0-based) or the whole PDF.
+
+        Returns:
+            ({page_index: markdown}, [(img_id, img_bytes), ...])
+            On failure returns (None, []).
+        """
         from .mistral_key_manager import get_mistral_api_key
 
         api_key = get_mistral_api_key(interactive=False)
@@ -110,20 +142,22 @@ class MistralOcrConverter(BaseConverter):
 
             signed = client.files.get_signed_url(file_id=upload.id, expiry=1)
 
+            ocr_kwargs = {"pages": pages} if pages is not None else {}
             resp = client.ocr.process(
                 model="mistral-ocr-2512",
                 document=DocumentURLChunk(document_url=signed.url),
                 include_image_base64=True,
+                **ocr_kwargs,
             )
 
             data = json.loads(resp.model_dump_json())
 
-            pages = data.get("pages", [])
-            md_parts: list[str] = []
+            md_pages: dict[int, str] = {}
             images: list[tuple[str, bytes]] = []
 
-            for page in pages:
-                md_parts.append(page.get("markdown", ""))
+            for position, page in enumerate(data.get("pages", [])):
+                index = page.get("index", position)
+                md_pages[index] = page.get("markdown", "")
                 for img in page.get("images", []):
                     img_id = img.get("id", "")
                     b64_data = img.get("image_base64", "")
@@ -134,7 +168,7 @@ class MistralOcrConverter(BaseConverter):
                         img_bytes = base64.b64decode(b64_data)
                         images.append((img_id, img_bytes))
 
-            return "\n\n".join(md_parts), images
+            return md_pages, images
 
         except Exception:
             return None, []
@@ -38,6 +38,7 @@ class OfficeConverter(BaseConverter):
         "openpyxl": "openpyxl",
         "python-pptx": "pptx",
     }
+    conversion_pool = "process"
 
     # Extensions that require conversion to modern format first
     _legacy_extensions = {".doc", ".xls", ".ppt"}
@@ -1,19 +1,143 @@
 """PDF to text/markdown converter.
 
 Migrated and refactored from tools/setup/convert_pdfs.py.
+
+Pages are extracted in a single pass and streamed to disk as they are
+formatted, so large PDFs never sit fully in memory. While extracting, pages
+with less text than ``OCR_MIN_CHARS_PER_PAGE`` are classified as scanned;
+with ``allow_ocr`` only those pages are sent to Mistral OCR and merged back
+in page order. Long PDFs can be split into page ranges extracted in a
+process pool (``PDF_PAGE_WORKERS``).
 """
 
+import multiprocessing
+import os
 import re
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, BinaryIO, Iterator, Optional
 
 from .base import BaseConverter
 
+# Written after every page chunk (per output format).
+_PAGE_SEPARATORS = {"md": "\n", "txt": "\n\n"}
+
+# PDFs with fewer pages are always extracted in-process.
+PARALLEL_MIN_PAGES = 64
+
+
+def _iter_pages(
+    pdf_path: Path, start: int = 0, stop: Optional[int] = None
+) -> Iterator[tuple[int, str]]:
+    """Yield ``(page_index, text)`` for pages ``[start, stop)``.
+
+    Uses pdfplumber (with pypdf fallback). Each pdfplumber page is closed
+    after extraction so its parsed objects are released.
+
+    Raises:
+        ImportError: If neither pdfplumber nor pypdf is installed.
+    """
+    try:
+        import pdfplumber
+    except ImportError:
+        pdfplumber = None
+
+    if pdfplumber is not None:
+        with pdfplumber.open(pdf_path) as pdf:
+            for index, page in enumerate(pdf.pages[start:stop], start=start):
+                try:
+                    yield index, page.extract_text() or ""
+                finally:
+                    page.close()
+        return
+
+    from pypdf import PdfReader
+
+    try:
+        reader = PdfReader(str(pdf_path))
+        total = len(reader.pages)
+    except Exception:
+        return
+    for index in range(start, total if stop is None else min(stop, total)):
+        try:
+            text = reader.pages[index].extract_text() or ""
+        except Exception:
+            text = ""
+        yield index, text
+
+
+def _copy_bytes(src: BinaryIO, dst: BinaryIO, size: int, chunk_size: int = 1 << 20) -> None:
+    """Copy exactly ``size`` bytes (or until EOF) from ``src`` to ``dst``."""
+    while size > 0:
+        data = src.read(min(chunk_size, size))
+        if not data:
+            break
+        dst.write(data)
+        size -= len(data)
+
+
+def _page_count(pdf_path: Path) -> int:
+    """Return the number of pages without extracting any text."""
+    try:
+        import pdfplumber
+
+        with pdfplumber.open(pdf_path) as pdf:
+            return len(pdf.pages)
+    except ImportError:
+        from pypdf import PdfReader
+
+        return len(PdfReader(str(pdf_path)).pages)
+
+
+def _extract_range_to_file(
+    pdf_path: Path,
+    start: int,
+    stop: Optional[int],
+    part_path: Path,
+    output_format: str,
+    min_chars: Optional[int],
+) -> dict[str, Any]:
+    """Extract pages ``[start, stop)`` into ``part_path`` (module-level for process pools).
+
+    Pages with fewer than ``min_chars`` characters are not written; they
+    are returned as OCR slots ``(page_index, byte_offset, text)`` so the
+    caller can insert OCR output (or the original text) at that offset.
+
+    Returns:
+        Dict with ``slots`` and ``chars`` (characters written).
+    """
+    separator = _PAGE_SEPARATORS[output_format].encode("utf-8")
+    slots: list[tuple[int, int, str]] = []
+    chars = 0
+    with open(part_path, "wb") as out:
+        for index, text in _iter_pages(pdf_path, start, stop):
+            if min_chars is not None and len(text.strip()) < min_chars:
+                slots.append((index, out.tell(), text))
+                continue
+            chunk = PdfConverter._format_page(text, output_format)
+            if chunk:
+                out.write(chunk.encode("utf-8") + separator)
+                chars += len(text)
+    return {"slots": slots, "chars": chars}
+
 
 class PdfConverter(BaseConverter):
     """Converts PDF files to text or markdown format."""
 
     supported_extensions = {".pdf"}
+    conversion_pool = "process"
+
+    @classmethod
+    def get_page_workers(cls) -> int:
+        """Get the number of page-range extraction processes from settings."""
+        try:
+            from flavia.config import get_settings
+
+            return get_settings().pdf_page_workers
+        except Exception:
+            return 1
 
     def convert(
         self,
@@ -28,23 +152,8 @@ class PdfConverter(BaseConverter):
             source_path: Source PDF path.
             output_dir: Output directory.
             output_format: "md" or "txt".
-            allow_ocr: If True, scanned PDFs may be routed to Mistral OCR.
+            allow_ocr: If True, scanned pages may be routed to Mistral OCR.
         """
-        if allow_ocr and self._is_scanned_pdf(source_path):
-            from .mistral_ocr_converter import MistralOcrConverter
-
-            return MistralOcrConverter().convert(source_path, output_dir, output_format)
-
-        # OCR routing (if enabled) was already evaluated above.
-        text = self.extract_text(source_path)
-        if not text or not text.strip():
-            return None
-
-        if output_format == "md":
-            content = self._format_as_markdown(text, source_path.stem)
-        else:
-            content = text
-
         # Preserve directory structure when source lives under output_dir.parent.
         # Fallback to flat output if source is outside that tree.
         try:
@@ -53,7 +162,34 @@ class PdfConverter(BaseConverter):
         except ValueError:
             output_file = output_dir / (source_path.stem + f".{output_format}")
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        output_file.write_text(content, encoding="utf-8")
+
+        min_chars = self._min_chars_per_page() if allow_ocr else None
+        with tempfile.TemporaryDirectory(prefix=".pdf-", dir=output_file.parent) as tmp:
+            parts = self._extract_parts(source_path, Path(tmp), output_format, min_chars)
+            if parts is None:
+                return None
+            slots = [slot for _part, info in parts for slot in info["slots"]]
+            chars = sum(info["chars"] for _part, info in parts)
+
+            if slots and chars == 0:
+                # Every page is scanned: OCR the whole document in one request.
+                from .mistral_ocr_converter import MistralOcrConverter
+
+                result = MistralOcrConverter().convert(source_path, output_dir, output_format)
+                if result is not None:
+                    return result
+
+            ocr_pages: dict[int, str] = {}
+            if slots and chars > 0:
+                ocr_pages = self._ocr_scanned_pages(
+                    source_path, [index for index, _offset, _text in slots], output_file
+                )
+
+            tmp_file = Path(tmp) / output_file.name
+            written = self._merge_parts(tmp_file, parts, ocr_pages, output_format, source_path.stem)
+            if not written:
+                return None
+            os.replace(tmp_file, output_file)
         return output_file
 
     def extract_text(self, source_path: Path, allow_ocr: bool = False) -> Optional[str]:
@@ -61,82 +197,147 @@ class PdfConverter(BaseConverter):
 
         Args:
             source_path: Source PDF path.
-            allow_ocr: If True, scanned PDFs may be routed to Mistral OCR.
+            allow_ocr: If True, scanned pages may be routed to Mistral OCR.
         """
-        if allow_ocr and self._is_scanned_pdf(source_path):
-            from .mistral_ocr_converter import MistralOcrConverter
-
-            return MistralOcrConverter().extract_text(source_path)
-
-        try:
-            return self._extract_with_pdfplumber(source_path)
-        except ImportError:
-            pass
-
+        min_chars = self._min_chars_per_page() if allow_ocr else None
+        pages: list[str] = []
+        scanned: dict[int, int] = {}
         try:
-            return self._extract_with_pypdf(source_path)
+            for index, text in _iter_pages(source_path):
+                if min_chars is not None and len(text.strip()) < min_chars:
+                    scanned[index] = len(pages)
+                if text or index in scanned:
+                    pages.append(text)
         except ImportError:
             return None
-        except Exception:
-            return None
 
-    @staticmethod
-    def _is_scanned_pdf(pdf_path: Path) -> bool:
-        """Return True if the PDF appears to be scanned/image-based.
+        if scanned:
+            from .mistral_ocr_converter import MistralOcrConverter
 
-        Uses pdfplumber to sample text; if the average chars per page is below
-        the configured minimum chars per page, the PDF is treated as scanned.
-        """
+            ocr_text, _images = MistralOcrConverter().ocr_pages(source_path, sorted(scanned))
+            for index, position in scanned.items():
+                if ocr_text and ocr_text.get(index):
+                    pages[position] = ocr_text[index]
+
+        return "\n\n".join(page for page in pages if page)
+
+    @staticmethod
+    def _min_chars_per_page() -> int:
         from .mistral_ocr_converter import MistralOcrConverter
 
+        return MistralOcrConverter.get_min_chars_per_page()
+
+    def _extract_parts(
+        self,
+        source_path: Path,
+        tmp_dir: Path,
+        output_format: str,
+        min_chars: Optional[int],
+    ) -> Optional[list[tuple[Path, dict[str, Any]]]]:
+        """Extract all pages into part files, one per page range.
+
+        Returns:
+            ``[(part_path, {"slots", "chars"}), ...]`` in page order, or None
+            when no PDF library is installed.
+        """
         try:
-            import pdfplumber
-
-            with pdfplumber.open(pdf_path) as pdf:
-                if not pdf.pages:
-                    return False
-                total_chars = sum(len(page.extract_text() or "") for page in pdf.pages)
-                avg = total_chars / len(pdf.pages)
-                return avg < MistralOcrConverter.get_min_chars_per_page()
-        except Exception:
-            return False
+            workers = self.get_page_workers()
+            total = _page_count(source_path) if workers > 1 else 0
+            if total < max(PARALLEL_MIN_PAGES, workers):
+                part = tmp_dir / "part-0000"
+                info = _extract_range_to_file(source_path, 0, None, part, output_format, min_chars)
+                return [(part, info)]
+        except ImportError:
+            return None
 
-    @staticmethod
-    def _extract_with_pdfplumber(pdf_path: Path) -> str:
-        """Extract text using pdfplumber."""
-        import pdfplumber
+        step = -(-total // workers)  # ceil
+        ranges = [(start, min(start + step, total)) for start in range(0, total, step)]
+        parts = [tmp_dir / f"part-{i:04d}" for i in range(len(ranges))]
+        # spawn: forking a process that is already running threads is unsafe.
+        with ProcessPoolExecutor(
+            max_workers=len(ranges), mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            futures = [
+                pool.submit(
+                    _extract_range_to_file, source_path, start, stop, part, output_format, min_chars
+                )
+                for (start, stop), part in zip(ranges, parts)
+            ]
+            return [(part, future.result()) for part, future in zip(parts, futures)]
+
+    def _ocr_scanned_pages(
+        self, source_path: Path, pages: list[int], output_file: Path
+    ) -> dict[int, str]:
+        """OCR only the scanned pages; images are saved next to ``output_file``."""
+        from .mistral_ocr_converter import MistralOcrConverter
 
-        text_parts = []
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text()
-                if text:
-                    text_parts.append(text)
+        ocr = MistralOcrConverter()
+        ocr_text, images = ocr.ocr_pages(source_path, pages)
+        if not ocr_text:
+            return {}
+        name_map = ocr.save_images(images, output_file, source_path.stem)
+        return {index: ocr.relink_images(text, name_map) for index, text in ocr_text.items()}
 
-        return "\n\n".join(text_parts)
+    def _merge_parts(
+        self,
+        output_path: Path,
+        parts: list[tuple[Path, dict[str, Any]]],
+        ocr_pages: dict[int, str],
+        output_format: str,
+        title: str,
+    ) -> bool:
+        """Concatenate part files into ``output_path``, filling OCR slots.
+
+        Returns:
+            True if any text was written.
+        """
+        separator = _PAGE_SEPARATORS[output_format].encode("utf-8")
+        written = False
+        with open(output_path, "wb") as out:
+            if output_format == "md":
+                clean_title = title.replace("_", " ").replace("-", " ")
+                out.write(f"# {clean_title}\n".encode("utf-8") + separator)
+            for part, info in parts:
+                with open(part, "rb") as src:
+                    position = 0
+                    for index, offset, text in info["slots"]:
+                        _copy_bytes(src, out, offset - position)
+                        position = offset
+                        if index in ocr_pages and ocr_pages[index].strip():
+                            out.write(ocr_pages[index].strip().encode("utf-8") + b"\n\n")
+                            written = True
+                            continue
+                        chunk = self._format_page(text, output_format)
+                        if chunk:
+                            out.write(chunk.encode("utf-8") + separator)
+                            written = True
+                    shutil.copyfileobj(src, out)
+                written = written or info["chars"] > 0
+            # Drop the separator after the last chunk.
+            end = out.tell()
+            if written and end >= len(separator):
+                out.truncate(end - len(separator))
+        return written
 
     @staticmethod
-    def _extract_with_pypdf(pdf_path: Path) -> str:
-        """Fallback: extract text using pypdf."""
-        from pypdf import PdfReader
-
-        reader = PdfReader(str(pdf_path))
-        text_parts = []
-        for page in reader.pages:
-            text_parts.append(page.extract_text() or "")
-        return "\n\n".join(text_parts)
+    def _format_page(text: str, output_format: str) -> str:
+        """Format one page's text for the output format ("" if empty)."""
+        if output_format == "md":
+            return "\n".join(PdfConverter._markdown_lines(text))
+        return text
 
     @staticmethod
     def _format_as_markdown(text: str, title: str) -> str:
         """Format extracted text as markdown with basic structure."""
-        lines = []
-
-        # Add title
         clean_title = title.replace("_", " ").replace("-", " ")
-        lines.append(f"# {clean_title}")
-        lines.append("")
+        lines = [f"# {clean_title}", ""]
+        lines.extend(PdfConverter._markdown_lines(text))
+        return "\n".join(lines)
 
-        # Process text
+    @staticmethod
+    def _markdown_lines(text: str) -> list[str]:
+        """Markdown lines for the paragraphs of ``text``."""
+        lines = []
         paragraphs = text.split("\n\n")
 
         for para in paragraphs:
@@ -156,4 +357,4 @@ class PdfConverter(BaseConverter):
                 lines.append(cleaned)
                 lines.append("")
 
-        return "\n".join(lines)
+        return lines
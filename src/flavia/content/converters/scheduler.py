@@ -0,0 +1,356 @@
+"""Parallel conversion of catalog entries.
+
+``ConversionScheduler`` converts a batch of catalog entries concurrently:
+CPU-bound local converters (``conversion_pool = "process"``, e.g. PDF and
+Office) run in a process pool, API converters (audio, video, OCR, images)
+in a thread pool. Each converter's ``max_concurrency`` caps how many of its
+jobs are in flight at once.
+
+A converter that crashes its worker process only fails its own file; the
+pool is replaced and the other jobs continue. Completed conversions are
+checkpointed to ``.flavia/conversion_progress.json`` so an interrupted
+batch resumes without redoing finished files.
+"""
+
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from ..scanner import FileEntry
+from .base import BaseConverter
+from .registry import converter_registry
+
+PROGRESS_FILENAME = "conversion_progress.json"
+
+# Retries (run in isolation) for a job whose worker process died.
+MAX_CRASH_RETRIES = 1
+
+# Minimum seconds between progress checkpoints.
+CHECKPOINT_INTERVAL = 2.0
+
+
+@dataclass
+class ConversionResult:
+    """Outcome of converting one catalog entry."""
+
+    path: str
+    status: str  # "converted", "resumed", "failed", "skipped"
+    converter: str = ""
+    converted_to: Optional[str] = None
+    error: Optional[str] = None
+    duration_seconds: float = 0.0
+
+
+@dataclass
+class _Job:
+    entry: FileEntry
+    source: Path
+    converter: BaseConverter
+    name: str
+    use_process: bool
+    crashes: int = 0
+    started: float = 0.0
+    pool: Optional[ProcessPoolExecutor] = None
+
+
+def _run_conversion(converter: BaseConverter, source: Path, output_dir: Path) -> Optional[Path]:
+    """Worker entry point (module-level so process pools can pickle it)."""
+    return converter.convert(source, output_dir)
+
+
+class ConversionScheduler:
+    """Convert catalog entries concurrently with per-converter limits.
+
+    Usage:
+        scheduler = ConversionScheduler(base_dir, process_workers=4, thread_workers=4)
+        summary = scheduler.run(catalog.get_files_needing_conversion())
+
+    ``process_workers=0`` runs process-pool converters on the thread pool
+    instead (no crash isolation). Entries are updated in place
+    (``entry.converted_to``); saving the catalog is left to the caller.
+    """
+
+    def __init__(
+        self,
+        base_dir: Path,
+        process_workers: int = 4,
+        thread_workers: int = 4,
+        converted_dir: Optional[Path] = None,
+        progress_path: Optional[Path] = None,
+    ):
+        self.base_dir = Path(base_dir).resolve()
+        self.process_workers = max(0, process_workers)
+        self.thread_workers = max(1, thread_workers)
+        self.converted_dir = converted_dir or self.base_dir / ".converted"
+        self.progress_path = progress_path or self.base_dir / ".flavia" / PROGRESS_FILENAME
+        self._progress: dict[str, dict[str, str]] = {}
+        self._last_checkpoint = 0.0
+
+    # ------------------------------------------------------------------
+    # Progress checkpoints
+    # ------------------------------------------------------------------
+
+    def _load_progress(self) -> dict[str, dict[str, str]]:
+        try:
+            data = json.loads(self.progress_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _checkpoint(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self._last_checkpoint < CHECKPOINT_INTERVAL:
+            return
+        self._last_checkpoint = now
+        payload = json.dumps(self._progress, ensure_ascii=False)
+        try:
+            self.progress_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.progress_path.with_suffix(".json.tmp")
+            tmp_path.write_text(payload, encoding="utf-8")
+            os.replace(tmp_path, self.progress_path)
+        except OSError:
+            pass
+
+    def _resumed_result(self, entry: FileEntry) -> Optional[ConversionResult]:
+        """Reuse a conversion finished by an interrupted earlier run."""
+        record = self._progress.get(entry.path)
+        if not record or record.get("checksum") != entry.checksum_sha256:
+            return None
+        converted_to = record.get("converted_to")
+        if not converted_to or not (self.base_dir / converted_to).exists():
+            return None
+        entry.converted_to = converted_to
+        return ConversionResult(
+            path=entry.path,
+            status="resumed",
+            converter=record.get("converter", ""),
+            converted_to=converted_to,
+        )
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    def _plan(
+        self, entries: list[FileEntry], emit: Callable[[ConversionResult], None]
+    ) -> list[_Job]:
+        """Resolve converters, emitting skipped/resumed results directly."""
+        jobs: list[_Job] = []
+        for entry in entries:
+            resumed = self._resumed_result(entry)
+            if resumed is not None:
+                emit(resumed)
+                continue
+            source = self.base_dir / entry.path
+            converter = converter_registry.get_for_file(source)
+            if not converter:
+                emit(ConversionResult(path=entry.path, status="skipped"))
+                continue
+            name = type(converter).__name__
+            deps_ok, missing = converter.check_dependencies()
+            if not deps_ok:
+                emit(
+                    ConversionResult(
+                        path=entry.path,
+                        status="skipped",
+                        converter=name,
+                        error=f"missing dependencies ({', '.join(missing)})",
+                    )
+                )
+                continue
+            use_process = (
+                getattr(converter, "conversion_pool", "thread") == "process"
+                and self.process_workers > 0
+            )
+            jobs.append(_Job(entry, source, converter, name, use_process))
+        return jobs
+
+    def _limit(self, job: _Job) -> int:
+        pool_size = self.process_workers if job.use_process else self.thread_workers
+        limit = getattr(job.converter, "max_concurrency", None)
+        return max(1, min(limit, pool_size)) if limit else pool_size
+
+    def _new_process_pool(self) -> ProcessPoolExecutor:
+        # spawn: forking a process that is already running threads is unsafe.
+        return ProcessPoolExecutor(
+            max_workers=self.process_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def run(
+        self,
+        entries: list[FileEntry],
+        on_result: Optional[Callable[[ConversionResult], None]] = None,
+    ) -> dict[str, Any]:
+        """Convert ``entries`` and return a throughput summary.
+
+        Args:
+            entries: Catalog entries to convert (updated in place).
+            on_result: Called in the calling thread for every finished entry.
+
+        Returns:
+            Dict with ``converted``, ``resumed``, ``failed`` and ``skipped``
+            counts, ``results``, ``duration_seconds``, ``files_per_minute``
+            and per-converter ``by_converter`` stats.
+        """
+        started = time.perf_counter()
+        self._progress = self._load_progress()
+        results: list[ConversionResult] = []
+        checksums = {entry.path: entry.checksum_sha256 for entry in entries}
+
+        def emit(result: ConversionResult) -> None:
+            results.append(result)
+            if result.status == "converted":
+                self._progress[result.path] = {
+                    "checksum": checksums[result.path],
+                    "converted_to": result.converted_to or "",
+                    "converter": result.converter,
+                }
+                self._checkpoint()
+            if on_result is not None:
+                on_result(result)
+
+        pending = self._plan(entries, emit)
+        in_flight: dict[Future, _Job] = {}
+        running: dict[str, int] = {}
+        process_pool: Optional[ProcessPoolExecutor] = None
+        thread_pool = ThreadPoolExecutor(
+            max_workers=self.thread_workers, thread_name_prefix="flavia-convert"
+        )
+        interrupted = False
+
+        try:
+            while pending or in_flight:
+                # Submit every pending job whose converter is below its limit.
+                # A job retried after a crash runs alone in the process pool,
+                # so a second crash is attributed to it and nothing else.
+                process_jobs = [j for j in in_flight.values() if j.use_process]
+                isolating = any(j.crashes for j in process_jobs)
+                waiting: list[_Job] = []
+                for job in pending:
+                    blocked = job.use_process and (isolating or (job.crashes > 0 and process_jobs))
+                    if blocked or running.get(job.name, 0) >= self._limit(job):
+                        waiting.append(job)
+                        continue
+                    if job.use_process:
+                        process_jobs.append(job)
+                        isolating = job.crashes > 0
+                        if process_pool is None:
+                            process_pool = self._new_process_pool()
+                        pool = job.pool = process_pool
+                    else:
+                        pool = thread_pool
+                    job.started = time.perf_counter()
+                    future = pool.submit(
+                        _run_conversion, job.converter, job.source, self.converted_dir
+                    )
+                    in_flight[future] = job
+                    running[job.name] = running.get(job.name, 0) + 1
+                pending = waiting
+
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = in_flight.pop(future)
+                    running[job.name] -= 1
+                    try:
+                        result_path = future.result()
+                    except BrokenProcessPool:
+                        # A worker died (e.g. a native crash while parsing).
+                        # Replace the pool and retry; give up on repeat crashes.
+                        if job.pool is process_pool and process_pool is not None:
+                            process_pool.shutdown(wait=False, cancel_futures=True)
+                            process_pool = None
+                        job.crashes += 1
+                        if job.crashes <= MAX_CRASH_RETRIES:
+                            pending.append(job)
+                        else:
+                            emit(self._failure(job, "worker process crashed"))
+                        continue
+                    except Exception as exc:
+                        emit(self._failure(job, str(exc)))
+                        continue
+                    emit(self._success(job, result_path))
+        except BaseException:
+            # Ctrl+C or a crash of the caller: keep finished work for the next run.
+            interrupted = True
+            raise
+        finally:
+            for future in in_flight:
+                future.cancel()
+            thread_pool.shutdown(wait=not interrupted, cancel_futures=True)
+            if process_pool is not None:
+                process_pool.shutdown(wait=not interrupted, cancel_futures=True)
+            if interrupted:
+                self._checkpoint(force=True)
+
+        # The caller saves the catalog next; the checkpoint is no longer needed.
+        try:
+            self.progress_path.unlink()
+        except OSError:
+            pass
+
+        return self._summarize(results, time.perf_counter() - started)
+
+    def _success(self, job: _Job, result_path: Optional[Path]) -> ConversionResult:
+        duration = time.perf_counter() - job.started
+        if not result_path:
+            return ConversionResult(
+                path=job.entry.path,
+                status="failed",
+                converter=job.name,
+                duration_seconds=duration,
+            )
+        try:
+            converted_to = str(Path(result_path).relative_to(self.base_dir))
+        except ValueError:
+            converted_to = str(result_path)
+        job.entry.converted_to = converted_to
+        return ConversionResult(
+            path=job.entry.path,
+            status="converted",
+            converter=job.name,
+            converted_to=converted_to,
+            duration_seconds=duration,
+        )
+
+    def _failure(self, job: _Job, error: str) -> ConversionResult:
+        return ConversionResult(
+            path=job.entry.path,
+            status="failed",
+            converter=job.name,
+            error=error,
+            duration_seconds=time.perf_counter() - job.started,
+        )
+
+    @staticmethod
+    def _summarize(results: list[ConversionResult], duration: float) -> dict[str, Any]:
+        counts = {"converted": 0, "resumed": 0, "failed": 0, "skipped": 0}
+        by_converter: dict[str, dict[str, float]] = {}
+        for result in results:
+            counts[result.status] += 1
+            if result.status in ("converted", "failed") and result.converter:
+                stats = by_converter.setdefault(
+                    result.converter, {"converted": 0, "failed": 0, "seconds": 0.0}
+                )
+                stats[result.status] += 1
+                stats["seconds"] += result.duration_seconds
+        processed = counts["converted"] + counts["failed"]
+        return {
+            **counts,
+            "results": results,
+            "duration_seconds": duration,
+            "files_per_minute": processed / duration * 60 if duration > 0 else 0.0,
+            "by_converter": by_converter,
+        }
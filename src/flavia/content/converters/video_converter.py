@@ -45,6 +45,7 @@ class VideoConverter(BaseConverter):
 
     supported_extensions = VIDEO_EXTENSIONS
     requires_dependencies = ["mistralai"]
+    max_concurrency = 2  # Mistral API rate limits
 
     def __init__(self, settings: Optional["Settings"] = None) -> None:
         self._audio_converter = AudioConverter()
@@ -4,16 +4,23 @@ Public API (grows as tasks are completed):
   build_index(base_dir, settings)   — Task 11.7 ✓
   update_index(base_dir, settings)  — Task 11.7 ✓
   show_index_stats(base_dir)        — Task 11.7 ✓
+  index_catalog_changes(catalog, base_dir, settings, console) — index an updated catalog
   retrieve(question, base_dir, ...) — Task 11.4 ✓
+  RetrievalSession(base_dir, settings) — warm state reused across retrieve() calls
+  retrieve_doc_coverage(question, base_dir, settings, doc_ids) — batched per-doc backfill
 
 Currently implemented:
   chunker.chunk_document(entry, base_dir) — Task 11.1 ✓
   embedder.embed_chunks(...), embed_query(...) — Task 11.2 ✓
   vector_store.VectorStore — Task 11.2 ✓
+  embedding_cache.EmbeddingCache — content-addressed embedding reuse
+  catalog_router.CatalogRouterIndex — persistent Stage A routing corpus
   fts.FTSIndex — Task 11.3 ✓
+  fusion.get_fusion_strategy(name) — RRF, weighted RRF and CombSUM rank fusion
   video_retrieval.expand_video_chunks(...) — Task 11.5 ✓
 """
 
+from .catalog_router import CatalogRouterIndex
 from .chunker import chunk_document, chunk_text_document, chunk_video_document
 from .embedder import (
     EMBEDDING_DIMENSION,
@@ -22,9 +29,11 @@ from .embedder import (
     embed_query,
     get_embedding_client,
 )
+from .embedding_cache import EmbeddingCache
 from .fts import FTSIndex
-from .index_manager import build_index, show_index_stats, update_index
-from .retrieval import retrieve
+from .fusion import BaseFusionStrategy, get_fusion_strategy
+from .index_manager import build_index, index_catalog_changes, show_index_stats, update_index
+from .retrieval import RetrievalSession, retrieve, retrieve_doc_coverage
 from .vector_store import VectorStore
 from .video_retrieval import expand_video_chunks
 
@@ -39,6 +48,7 @@ __all__ = [
     "get_embedding_client",
     "EMBEDDING_MODEL",
     "EMBEDDING_DIMENSION",
+    "EmbeddingCache",
     # Vector Store (11.2)
     "VectorStore",
     # FTS Index (11.3)
@@ -46,9 +56,15 @@ __all__ = [
     # Index Management (11.7)
     "build_index",
     "update_index",
+    "index_catalog_changes",
     "show_index_stats",
     # Hybrid Retrieval (11.4)
     "retrieve",
+    "retrieve_doc_coverage",
+    "RetrievalSession",
+    "CatalogRouterIndex",
+    "BaseFusionStrategy",
+    "get_fusion_strategy",
     # Video Temporal Retrieval (11.5)
     "expand_video_chunks",
 ]
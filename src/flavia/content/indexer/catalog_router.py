@@ -0,0 +1,406 @@
+"""Persistent catalog-router index for Stage A document routing.
+
+This module provides the CatalogRouterIndex class, which keeps the catalog
+routing corpus (path, summary, tags and metadata of every converted source)
+in a persistent FTS5 table inside base_dir/.index/index.db. Retrieval used
+to rebuild this corpus in memory from content_catalog.json on every query;
+with the table kept in sync whenever the catalog is saved, Stage A routing
+is a single indexed MATCH query.
+
+The table is invalidated by the catalog file's signature (see
+``catalog_file_signature``) and the base_dir used to derive doc_ids, so the
+query path can confirm the table is current without loading the catalog.
+Summary and tag edits do not bump ``catalog_updated_at``, so every sync
+diffs the rows by content hash rather than trusting that timestamp.
+"""
+
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Any, Optional
+
+from ..catalog import ContentCatalog, catalog_file_signature
+from ..catalog_store import LazyEntryMap
+from ..scanner import FileEntry
+
+
+def _router_text(entry: FileEntry) -> str:
+    """Return the searchable text of a routable entry, or "" if it is not routable."""
+    if entry.status == "missing":
+        return ""
+    # Retrieval indexes only converted sources. Skip catalog entries that
+    # cannot produce chunks to avoid over-filtering Stage B to empty scopes.
+    if not getattr(entry, "converted_to", None):
+        return ""
+
+    content_parts = [
+        entry.path,
+        entry.name,
+        entry.file_type,
+        entry.category,
+        entry.source_type,
+        entry.summary or "",
+        entry.extraction_quality or "",
+        entry.source_url or "",
+    ]
+    if entry.tags:
+        content_parts.append(" ".join(entry.tags))
+    if entry.source_metadata:
+        content_parts.extend(str(v) for v in entry.source_metadata.values())
+
+    return " ".join(p for p in content_parts if p).strip()
+
+
+def catalog_router_rows(
+    catalog: ContentCatalog,
+    base_dir: Path,
+) -> dict[str, str]:
+    """Build the routing corpus for a catalog.
+
+    Args:
+        catalog: Loaded content catalog.
+        base_dir: Vault base directory used to derive doc_ids.
+
+    Returns:
+        Dict mapping doc_id -> searchable text for every routable entry.
+    """
+    rows: dict[str, str] = {}
+    for entry in catalog.files.values():
+        searchable = _router_text(entry)
+        if searchable:
+            rows[catalog.doc_id_for(entry, base_dir)] = searchable
+    return rows
+
+
+def _join_signature(signature: Optional[tuple[int, ...]]) -> str:
+    return ":".join(str(part) for part in signature) if signature else ""
+
+
+def _format_signature(catalog_path: Path) -> str:
+    return _join_signature(catalog_file_signature(catalog_path))
+
+
+def _content_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class CatalogRouterIndex:
+    """Persistent FTS5 routing corpus built from the content catalog.
+
+    The index maintains three tables in index.db:
+    - catalog_fts: FTS5 virtual table (doc_id, content) used for routing
+    - catalog_router_docs: doc_id -> catalog path, content hash and FTS rowid,
+      used for incremental sync
+    - catalog_router_state: key/value record of the catalog version the
+      corpus reflects
+
+    Usage:
+        with CatalogRouterIndex(vault_dir) as router:
+            if not router.is_current(catalog_path, vault_dir):
+                router.sync(ContentCatalog.load(config_dir), vault_dir, catalog_path)
+            doc_ids = router.search('"kalman" OR "filter"', k=20)
+    """
+
+    def __init__(
+        self,
+        base_dir: Path,
+        db_path: Optional[Path] = None,
+        check_same_thread: bool = True,
+    ):
+        """Initialize the catalog router index.
+
+        Args:
+            base_dir: Vault base directory. The index will be stored in
+                      base_dir/.index/index.db
+            db_path: Optional explicit path to the database file.
+                     If None, uses base_dir/.index/index.db
+            check_same_thread: Passed to sqlite3.connect(); False lets a
+                     caller that serializes access (e.g. RetrievalSession)
+                     use the connection from several threads.
+        """
+        self.base_dir = Path(base_dir)
+        self.check_same_thread = check_same_thread
+        if db_path:
+            self.db_path = Path(db_path)
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        else:
+            self.index_dir = self.base_dir / ".index"
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            self.db_path = self.index_dir / "index.db"
+
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get or create the database connection."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(
+                str(self.db_path), check_same_thread=self.check_same_thread
+            )
+            self._conn.row_factory = sqlite3.Row
+            self._ensure_schema()
+        return self._conn
+
+    def _ensure_schema(self) -> None:
+        """Create the router tables if they don't exist."""
+        conn = self._conn
+        if conn is None:
+            return
+
+        conn.execute(
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS catalog_fts USING fts5(
+                doc_id UNINDEXED,
+                content,
+                tokenize = 'porter unicode61'
+            )
+            """
+        )
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(catalog_router_docs)")}
+        if columns and not {"path", "fts_rowid"} <= columns:
+            # Older layout: the corpus is derived data, so rebuild it from scratch.
+            conn.execute("DROP TABLE catalog_router_docs")
+            conn.execute("DELETE FROM catalog_fts")
+            conn.execute("DROP TABLE IF EXISTS catalog_router_state")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS catalog_router_docs (
+                doc_id       TEXT PRIMARY KEY,
+                path         TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                fts_rowid    INTEGER NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS catalog_router_state (
+                key   TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            )
+            """
+        )
+        conn.commit()
+
+    def _get_state(self) -> dict[str, str]:
+        conn = self._get_connection()
+        cursor = conn.execute("SELECT key, value FROM catalog_router_state")
+        return {row["key"]: row["value"] for row in cursor}
+
+    def is_current(self, catalog_path: Path, base_dir: Path) -> bool:
+        """Check whether the corpus reflects the catalog file on disk.
+
+        Only stats the catalog file; the JSON is not parsed.
+
+        Args:
+            catalog_path: Path to the catalog file (JSON or SQLite).
+            base_dir: Vault base directory used to derive doc_ids.
+
+        Returns:
+            True if the stored file signature and base_dir both match.
+        """
+        state = self._get_state()
+        signature = _format_signature(catalog_path)
+        return (
+            bool(signature)
+            and state.get("catalog_signature") == signature
+            and state.get("base_dir") == str(base_dir)
+        )
+
+    def sync(
+        self,
+        catalog: ContentCatalog,
+        base_dir: Path,
+        catalog_path: Optional[Path] = None,
+        baseline_signature: Optional[tuple[int, int, int, int]] = None,
+    ) -> dict[str, int]:
+        """Bring the corpus in line with a catalog, touching only changed docs.
+
+        Rows are diffed by content hash so only added, changed and removed
+        documents hit the FTS table; an unchanged catalog writes nothing but
+        the state record. Stale FTS rows are deleted by the rowid recorded in
+        catalog_router_docs, since ``doc_id`` is an unindexed FTS column.
+
+        Args:
+            catalog: Loaded content catalog.
+            base_dir: Vault base directory used to derive doc_ids.
+            catalog_path: Optional path to the catalog file, whose signature
+                          is recorded for :meth:`is_current`.
+            baseline_signature: Signature of the catalog file the catalog was
+                          loaded from or last saved to. When the corpus was
+                          synced to it, entries of a ``LazyEntryMap`` that were
+                          never materialized since are skipped.
+
+        Returns:
+            Dict with keys: added, updated, removed.
+        """
+        conn = self._get_connection()
+        counts = {"added": 0, "updated": 0, "removed": 0}
+        new_state = {
+            "catalog_updated_at": catalog.catalog_updated_at or "",
+            "base_dir": str(base_dir),
+        }
+        if catalog_path is not None:
+            new_state["catalog_signature"] = _format_signature(catalog_path)
+
+        state = self._get_state()
+        lazy = catalog.files if isinstance(catalog.files, LazyEntryMap) else None
+        incremental = (
+            lazy is not None
+            and baseline_signature is not None
+            and state.get("catalog_signature") == _join_signature(baseline_signature)
+            and state.get("base_dir") == str(base_dir)
+        )
+        paths = lazy.materialized_paths() if incremental else list(catalog.files)
+
+        try:
+            rows: dict[str, tuple[str, str]] = {}
+            for path in paths:
+                entry = catalog.files[path]
+                searchable = _router_text(entry)
+                if searchable:
+                    rows[catalog.doc_id_for(entry, base_dir)] = (path, searchable)
+            hashes = {doc_id: _content_hash(text) for doc_id, (_, text) in rows.items()}
+            stored = {
+                row["doc_id"]: (row["content_hash"], row["fts_rowid"], row["path"])
+                for row in conn.execute(
+                    "SELECT doc_id, path, content_hash, fts_rowid FROM catalog_router_docs"
+                )
+            }
+            if incremental:
+                # Rows of untouched entries are still current; only rows of
+                # materialized or deleted paths can have gone stale.
+                dirty = set(paths)
+                candidates = [
+                    doc_id
+                    for doc_id, (_, _, path) in stored.items()
+                    if path in dirty or path not in catalog.files
+                ]
+            else:
+                candidates = list(stored)
+
+            removed = [doc_id for doc_id in candidates if doc_id not in hashes]
+            changed = [
+                doc_id
+                for doc_id, digest in hashes.items()
+                if doc_id not in stored or stored[doc_id][0] != digest
+            ]
+            counts["removed"] = len(removed)
+            counts["updated"] = sum(1 for doc_id in changed if doc_id in stored)
+            counts["added"] = len(changed) - counts["updated"]
+
+            stale_ids = [doc_id for doc_id in removed + changed if doc_id in stored]
+            conn.executemany(
+                "DELETE FROM catalog_fts WHERE rowid = ?",
+                [(stored[doc_id][1],) for doc_id in stale_ids],
+            )
+            conn.executemany(
+                "DELETE FROM catalog_router_docs WHERE doc_id = ?",
+                [(doc_id,) for doc_id in stale_ids],
+            )
+            docs = []
+            for doc_id in changed:
+                path, searchable = rows[doc_id]
+                cursor = conn.execute(
+                    "INSERT INTO catalog_fts (doc_id, content) VALUES (?, ?)",
+                    (doc_id, searchable),
+                )
+                docs.append((doc_id, path, hashes[doc_id], cursor.lastrowid))
+            conn.executemany(
+                "INSERT INTO catalog_router_docs (doc_id, path, content_hash, fts_rowid) "
+                "VALUES (?, ?, ?, ?)",
+                docs,
+            )
+
+            conn.executemany(
+                "INSERT OR REPLACE INTO catalog_router_state (key, value) VALUES (?, ?)",
+                list(new_state.items()),
+            )
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+
+        return counts
+
+    def doc_count(self) -> int:
+        """Return the number of routable documents in the corpus."""
+        conn = self._get_connection()
+        return conn.execute("SELECT COUNT(*) AS cnt FROM catalog_router_docs").fetchone()["cnt"]
+
+    def search(
+        self,
+        fts_query: str,
+        k: int,
+        scope_doc_ids: Optional[list[str]] = None,
+    ) -> list[str]:
+        """Shortlist doc_ids by BM25 over the routing corpus.
+
+        Args:
+            fts_query: FTS5 MATCH expression.
+            k: Maximum number of doc_ids to return.
+            scope_doc_ids: Optional doc_id allow-list.
+
+        Returns:
+            doc_ids ordered by relevance (best first).
+        """
+        if k <= 0 or (scope_doc_ids is not None and not scope_doc_ids):
+            return []
+
+        conn = self._get_connection()
+        sql = """
+            SELECT doc_id, bm25(catalog_fts) AS bm25_score
+            FROM catalog_fts
+            WHERE catalog_fts MATCH ?
+        """
+        params: list[Any] = [fts_query]
+        if scope_doc_ids is not None:
+            placeholders = ",".join("?" * len(scope_doc_ids))
+            sql += f" AND doc_id IN ({placeholders})"
+            params.extend(scope_doc_ids)
+        sql += " ORDER BY bm25_score LIMIT ?"
+        params.append(k)
+
+        shortlisted: list[str] = []
+        seen: set[str] = set()
+        for row in conn.execute(sql, params):
+            doc_id = row["doc_id"]
+            if doc_id not in seen:
+                seen.add(doc_id)
+                shortlisted.append(doc_id)
+        return shortlisted
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> "CatalogRouterIndex":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
+
+
+def sync_catalog_router(
+    catalog: ContentCatalog,
+    catalog_path: Path,
+    baseline_signature: Optional[tuple[int, int, int, int]] = None,
+) -> None:
+    """Refresh the router corpus after a catalog save (best-effort).
+
+    Does nothing unless the retrieval index already exists, so saving a
+    catalog never creates .index/ in vaults that don't use retrieval.
+    ``baseline_signature`` is passed through to :meth:`CatalogRouterIndex.sync`.
+    """
+    index_db = catalog.base_dir / ".index" / "index.db"
+    if not index_db.exists():
+        return
+    try:
+        with CatalogRouterIndex(catalog.base_dir) as router:
+            router.sync(catalog, catalog.base_dir, catalog_path, baseline_signature)
+    except sqlite3.Error:
+        # The query path re-syncs lazily when the stored state is stale.
+        pass
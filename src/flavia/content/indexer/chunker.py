@@ -12,6 +12,8 @@ import re
 from pathlib import Path
 from typing import Optional
 
+from ..catalog_store import catalog_doc_id
+
 
 # Approximate token count: 1 token ≈ 4 characters
 _CHARS_PER_TOKEN = 4
@@ -69,8 +71,7 @@ def _chunk_id(doc_id: str, modality: str, offset: int) -> str:
 
 def _doc_id(base_dir: Path, path: str, checksum: str) -> str:
     """Generate a stable doc ID from base_dir, path, and checksum."""
-    raw = f"{base_dir}:{path}:{checksum}"
-    return hashlib.sha1(raw.encode()).hexdigest()
+    return catalog_doc_id(base_dir, path, checksum)
 
 
 def _file_checksum(file_path: Path) -> str:
@@ -6,6 +6,7 @@ All vectors are L2-normalized before storage for cosine similarity via dot produ
 """
 
 import math
+import threading
 import time
 from typing import Callable, Iterator, Optional
 
@@ -57,6 +58,73 @@ def _create_openai_client(
         )
 
 
+class AdaptiveConcurrencyLimiter:
+    """Bound in-flight embedding requests with additive-increase/multiplicative-decrease.
+
+    Starts at ``max_concurrency``. Each rate-limit response (HTTP 429) halves
+    the limit (never below ``min_concurrency``); every ``increase_after``
+    consecutive successes raise it by one again. Callers hold a slot only
+    while a request is on the wire, so retry back-off sleeps do not count
+    against the limit.
+
+    Usage:
+        limiter = AdaptiveConcurrencyLimiter(4)
+        with limiter:
+            client.embeddings.create(...)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        min_concurrency: int = 1,
+        increase_after: int = 4,
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.increase_after = max(1, increase_after)
+        self.limit = self.max_concurrency
+        self.in_flight = 0
+        self.rate_limited_count = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        """Block until a request slot is free under the current limit."""
+        with self._cond:
+            while self.in_flight >= self.limit:
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self) -> None:
+        """Return a request slot."""
+        with self._cond:
+            self.in_flight = max(0, self.in_flight - 1)
+            self._cond.notify_all()
+
+    def record_success(self) -> None:
+        """Record a successful request, growing the limit when sustained."""
+        with self._cond:
+            self._successes += 1
+            if self._successes >= self.increase_after and self.limit < self.max_concurrency:
+                self.limit += 1
+                self._successes = 0
+                self._cond.notify_all()
+
+    def record_rate_limited(self) -> None:
+        """Record a 429 response and halve the limit."""
+        with self._cond:
+            self.rate_limited_count += 1
+            self._successes = 0
+            self.limit = max(self.min_concurrency, self.limit // 2)
+
+    def __enter__(self) -> "AdaptiveConcurrencyLimiter":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.release()
+
+
 def _l2_normalize(vector: list[float]) -> list[float]:
     """Normalize a vector to unit length (L2 norm).
 
@@ -110,6 +178,7 @@ def _embed_batch_with_retry(
     client: OpenAI,
     model: str,
     max_retries: int = MAX_RETRIES,
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None,
 ) -> list[tuple[str, Optional[list[float]], Optional[str]]]:
     """Embed a batch of texts with exponential backoff retry.
 
@@ -119,6 +188,8 @@ def _embed_batch_with_retry(
         client: OpenAI client configured for embeddings.
         model: Model ID to use for embeddings.
         max_retries: Maximum number of retry attempts.
+        limiter: Optional shared limiter. A slot is held only for the API
+            call itself; 429 responses shrink the shared limit.
 
     Returns:
         List of tuples (chunk_id, vector, error). Vector is None if embedding failed.
@@ -127,7 +198,11 @@ def _embed_batch_with_retry(
 
     for attempt in range(max_retries):
         try:
-            response = client.embeddings.create(model=model, input=texts)
+            if limiter is not None:
+                with limiter:
+                    response = client.embeddings.create(model=model, input=texts)
+            else:
+                response = client.embeddings.create(model=model, input=texts)
             if len(response.data) != len(chunk_ids):
                 raise RuntimeError(
                     f"Embedding API returned {len(response.data)} embeddings for "
@@ -143,11 +218,16 @@ def _embed_batch_with_retry(
                     )
                 vector = _l2_normalize(embedding_data.embedding)
                 results.append((chunk_ids[i], vector, None))
+            if limiter is not None:
+                limiter.record_success()
             return results
         except Exception as e:
             last_error = e
             error_str = str(e).lower()
 
+            if limiter is not None and "429" in error_str:
+                limiter.record_rate_limited()
+
             # Don't retry on auth/permission errors
             if any(code in error_str for code in ["401", "403", "400"]):
                 break
@@ -275,6 +355,31 @@ def embed_chunks(
             on_progress(processed, total)
 
 
+def embed_chunk_batch(
+    chunks: list[dict],
+    client: OpenAI,
+    model: str = EMBEDDING_MODEL,
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+) -> list[tuple[str, Optional[list[float]], Optional[str]]]:
+    """Embed one batch of chunks in a single API call (with retries).
+
+    Thread-safe building block for pipelined indexing: several batches may
+    run concurrently on worker threads sharing one client and ``limiter``.
+
+    Args:
+        chunks: Chunk dicts for one API call.
+        client: OpenAI client configured for embeddings.
+        model: Model ID to use for embeddings.
+        limiter: Optional shared concurrency limiter.
+
+    Returns:
+        List of (chunk_id, vector, error) tuples in input order.
+    """
+    texts = [_format_chunk_for_embedding(c) for c in chunks]
+    chunk_ids = [c["chunk_id"] for c in chunks]
+    return _embed_batch_with_retry(texts, chunk_ids, client, model, limiter=limiter)
+
+
 def embed_query(
     query: str,
     client: OpenAI,
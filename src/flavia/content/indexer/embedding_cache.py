@@ -0,0 +1,541 @@
+"""Content-addressed cache of chunk embeddings.
+
+This module provides the EmbeddingCache class, which stores embedding
+vectors keyed by a hash of the exact text sent to the embedding API plus
+the model id. Chunk IDs change whenever a document's checksum changes, but
+the text of most chunks does not, so re-indexing an edited document only
+needs to embed the chunks whose text actually changed.
+
+The cache lives in its own database (base_dir/.index/embedding_cache.db) so
+that clearing the retrieval index on ``/index build`` does not discard it.
+It records which chunk IDs use each vector, so entries no longer referenced
+by any indexed chunk can be pruned after indexing.
+
+QueryEmbeddingCache applies the same idea to search queries: an in-process
+LRU of normalized query text -> vector, optionally backed by a table in the
+same database so repeated questions survive restarts.
+"""
+
+import hashlib
+import sqlite3
+import struct
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from .embedder import _format_chunk_for_embedding
+
+
+class EmbeddingCache:
+    """Persist embedding vectors keyed by sha256(model + embedding input text).
+
+    Usage:
+        with EmbeddingCache(vault_dir) as cache:
+            cached = cache.lookup_chunks(chunks, model)
+            ...
+            cache.store_chunks(chunks_by_id, results, model)
+            ...
+            cache.prune(live_chunk_ids)
+    """
+
+    def __init__(
+        self,
+        base_dir: Path,
+        db_path: Optional[Path] = None,
+    ):
+        """Initialize the embedding cache.
+
+        Args:
+            base_dir: Vault base directory. The cache will be stored in
+                      base_dir/.index/embedding_cache.db
+            db_path: Optional explicit path to the database file.
+                     If None, uses base_dir/.index/embedding_cache.db
+        """
+        self.base_dir = Path(base_dir)
+        if db_path:
+            self.db_path = Path(db_path)
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        else:
+            self.index_dir = self.base_dir / ".index"
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            self.db_path = self.index_dir / "embedding_cache.db"
+
+        self._conn: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get or create the database connection."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.db_path))
+            self._conn.row_factory = sqlite3.Row
+            self._ensure_schema()
+        return self._conn
+
+    def _ensure_schema(self) -> None:
+        """Create the cache tables if they don't exist."""
+        conn = self._conn
+        if conn is None:
+            return
+
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                cache_key  TEXT PRIMARY KEY,
+                model      TEXT NOT NULL,
+                embedding  BLOB NOT NULL,
+                created_at TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embedding_cache_refs (
+                chunk_id  TEXT PRIMARY KEY,
+                cache_key TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_embedding_cache_refs_key "
+            "ON embedding_cache_refs(cache_key)"
+        )
+        conn.commit()
+
+    @staticmethod
+    def cache_key(text: str, model: str) -> str:
+        """Return the content-addressed key for one embedding input."""
+        return hashlib.sha256(f"{model}\x00{text}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _serialize_vector(vector: list[float]) -> bytes:
+        return struct.pack(f"{len(vector)}f", *vector)
+
+    @staticmethod
+    def _deserialize_vector(data: bytes) -> list[float]:
+        count = len(data) // 4  # 4 bytes per float
+        return list(struct.unpack(f"{count}f", data))
+
+    def lookup(self, texts: list[str], model: str) -> dict[str, list[float]]:
+        """Fetch cached vectors for embedding input texts.
+
+        Args:
+            texts: Exact strings that would be sent to the embedding API.
+            model: Embedding model id.
+
+        Returns:
+            Dict mapping cache_key -> vector for every text found in the cache.
+        """
+        keys = list(dict.fromkeys(self.cache_key(text, model) for text in texts))
+        if not keys:
+            return {}
+
+        conn = self._get_connection()
+        found: dict[str, list[float]] = {}
+        # Stay well below SQLite's default host-parameter limit.
+        for start in range(0, len(keys), 500):
+            batch = keys[start : start + 500]
+            placeholders = ",".join("?" * len(batch))
+            cursor = conn.execute(
+                f"SELECT cache_key, embedding FROM embedding_cache "
+                f"WHERE cache_key IN ({placeholders})",
+                batch,
+            )
+            for row in cursor:
+                found[row["cache_key"]] = self._deserialize_vector(row["embedding"])
+        return found
+
+    def store(self, items: list[tuple[str, list[float]]], model: str) -> int:
+        """Store vectors for embedding input texts.
+
+        Args:
+            items: List of (text, vector) pairs.
+            model: Embedding model id.
+
+        Returns:
+            Number of rows written.
+        """
+        if not items:
+            return 0
+
+        conn = self._get_connection()
+        now = datetime.now(timezone.utc).isoformat()
+        conn.executemany(
+            "INSERT OR REPLACE INTO embedding_cache (cache_key, model, embedding, created_at) "
+            "VALUES (?, ?, ?, ?)",
+            [
+                (self.cache_key(text, model), model, self._serialize_vector(vector), now)
+                for text, vector in items
+            ],
+        )
+        conn.commit()
+        return len(items)
+
+    def _record_refs(self, refs: list[tuple[str, str]]) -> None:
+        """Record that chunk IDs use the given cache keys (list of (chunk_id, key))."""
+        if not refs:
+            return
+        conn = self._get_connection()
+        conn.executemany(
+            "INSERT OR REPLACE INTO embedding_cache_refs (chunk_id, cache_key) VALUES (?, ?)",
+            refs,
+        )
+        conn.commit()
+
+    def lookup_chunks(self, chunks: list[dict], model: str) -> dict[str, list[float]]:
+        """Fetch cached vectors for chunks, updating hit/miss counters.
+
+        Every hit is recorded as a reference from the chunk to its entry.
+
+        Args:
+            chunks: Chunk dicts as produced by the chunker.
+            model: Embedding model id.
+
+        Returns:
+            Dict mapping chunk_id -> vector for chunks found in the cache.
+        """
+        texts = {chunk["chunk_id"]: _format_chunk_for_embedding(chunk) for chunk in chunks}
+        found = self.lookup(list(texts.values()), model)
+
+        vectors: dict[str, list[float]] = {}
+        refs: list[tuple[str, str]] = []
+        for chunk_id, text in texts.items():
+            key = self.cache_key(text, model)
+            vector = found.get(key)
+            if vector is not None:
+                vectors[chunk_id] = vector
+                refs.append((chunk_id, key))
+
+        self._record_refs(refs)
+        self.hits += len(vectors)
+        self.misses += len(texts) - len(vectors)
+        return vectors
+
+    def store_chunks(
+        self,
+        chunks_by_id: dict[str, dict],
+        results: list[tuple[str, Optional[list[float]], Optional[str]]],
+        model: str,
+    ) -> int:
+        """Store successful embedding results for chunks and reference them.
+
+        Args:
+            chunks_by_id: Chunk dicts keyed by chunk_id.
+            results: (chunk_id, vector, error) tuples from ``embed_chunks``.
+            model: Embedding model id.
+
+        Returns:
+            Number of rows written.
+        """
+        items = []
+        refs: list[tuple[str, str]] = []
+        for chunk_id, vector, error in results:
+            chunk = chunks_by_id.get(chunk_id)
+            if chunk is None or error or vector is None:
+                continue
+            text = _format_chunk_for_embedding(chunk)
+            items.append((text, vector))
+            refs.append((chunk_id, self.cache_key(text, model)))
+        written = self.store(items, model)
+        self._record_refs(refs)
+        return written
+
+    def prune(self, live_chunk_ids: set[str]) -> int:
+        """Drop references from chunks no longer indexed, then unreferenced entries.
+
+        Args:
+            live_chunk_ids: Chunk IDs currently in the retrieval index.
+
+        Returns:
+            Number of cache entries deleted.
+        """
+        conn = self._get_connection()
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS live_chunk_ids (chunk_id TEXT PRIMARY KEY)")
+        conn.execute("DELETE FROM live_chunk_ids")
+        conn.executemany(
+            "INSERT OR IGNORE INTO live_chunk_ids (chunk_id) VALUES (?)",
+            ((chunk_id,) for chunk_id in live_chunk_ids),
+        )
+        conn.execute(
+            "DELETE FROM embedding_cache_refs "
+            "WHERE chunk_id NOT IN (SELECT chunk_id FROM live_chunk_ids)"
+        )
+        cursor = conn.execute(
+            "DELETE FROM embedding_cache "
+            "WHERE cache_key NOT IN (SELECT cache_key FROM embedding_cache_refs)"
+        )
+        conn.execute("DELETE FROM live_chunk_ids")
+        conn.commit()
+        return cursor.rowcount
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get statistics about the cache.
+
+        Returns:
+            Dict with keys: entry_count, db_size_bytes, hits, misses.
+        """
+        conn = self._get_connection()
+        entry_count = conn.execute("SELECT COUNT(*) AS cnt FROM embedding_cache").fetchone()["cnt"]
+
+        db_size = 0
+        if self.db_path.exists():
+            db_size = self.db_path.stat().st_size
+
+        return {
+            "entry_count": entry_count,
+            "db_size_bytes": db_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> "EmbeddingCache":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
+
+
+QUERY_CACHE_MAX_DISK_ENTRIES = 10_000
+
+
+class QueryEmbeddingCache:
+    """LRU cache of query embeddings with optional SQLite backing.
+
+    Keys are sha256(model + normalized query), so switching embedding models
+    never returns a stale vector. Entries expire after ``ttl_seconds``
+    (0 = never); the in-memory LRU holds at most ``max_entries`` vectors and
+    the on-disk table at most ``QUERY_CACHE_MAX_DISK_ENTRIES`` rows.
+
+    Instances are shared between threads (see ``get_query_embedding_cache``)
+    and guard all state with a lock.
+
+    Usage:
+        cache = QueryEmbeddingCache(max_entries=256, db_path=vault / ".index/embedding_cache.db")
+        vector, source = cache.get_or_embed(question, model, embed_fn)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: int = 86400,
+        db_path: Optional[Path] = None,
+    ):
+        """Initialize the query cache.
+
+        Args:
+            max_entries: Maximum vectors kept in memory (0 disables the LRU).
+            ttl_seconds: Entry lifetime in seconds (0 = no expiry).
+            db_path: Optional SQLite file for persistent backing.
+        """
+        self.max_entries = max(0, max_entries)
+        self.ttl_seconds = max(0, ttl_seconds)
+        self.db_path = Path(db_path) if db_path else None
+
+        self._entries: OrderedDict[str, tuple[list[float], float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Normalize query text so trivially different spellings share an entry."""
+        return " ".join(unicodedata.normalize("NFC", query).split())
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get or create the database connection (caller holds the lock)."""
+        if self._conn is None:
+            assert self.db_path is not None
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS query_embedding_cache (
+                    cache_key    TEXT PRIMARY KEY,
+                    model        TEXT NOT NULL,
+                    embedding    BLOB NOT NULL,
+                    created_at   REAL NOT NULL,
+                    last_used_at REAL NOT NULL
+                )
+                """
+            )
+            if self.ttl_seconds:
+                self._conn.execute(
+                    "DELETE FROM query_embedding_cache WHERE created_at < ?",
+                    (time.time() - self.ttl_seconds,),
+                )
+            self._conn.commit()
+        return self._conn
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return bool(self.ttl_seconds) and created_at < now - self.ttl_seconds
+
+    def _remember(self, key: str, vector: list[float], created_at: float) -> None:
+        if not self.max_entries:
+            return
+        self._entries[key] = (vector, created_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def lookup(self, query: str, model: str) -> tuple[Optional[list[float]], Optional[str]]:
+        """Fetch a cached query vector.
+
+        Returns:
+            Tuple of (vector, source) where source is "memory" or "disk",
+            or (None, None) on a miss.
+        """
+        key = EmbeddingCache.cache_key(self.normalize_query(query), model)
+        now = time.time()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                vector, created_at = cached
+                if not self._expired(created_at, now):
+                    self._entries.move_to_end(key)
+                    self.memory_hits += 1
+                    return vector, "memory"
+                del self._entries[key]
+
+            if self.db_path is not None:
+                try:
+                    conn = self._get_connection()
+                    row = conn.execute(
+                        "SELECT embedding, created_at FROM query_embedding_cache "
+                        "WHERE cache_key = ?",
+                        (key,),
+                    ).fetchone()
+                    if row is not None and not self._expired(row[1], now):
+                        conn.execute(
+                            "UPDATE query_embedding_cache SET last_used_at = ? WHERE cache_key = ?",
+                            (now, key),
+                        )
+                        conn.commit()
+                        vector = EmbeddingCache._deserialize_vector(row[0])
+                        self._remember(key, vector, row[1])
+                        self.disk_hits += 1
+                        return vector, "disk"
+                except sqlite3.Error:
+                    pass
+
+            self.misses += 1
+            return None, None
+
+    def store(self, query: str, model: str, vector: list[float]) -> None:
+        """Cache a freshly computed query vector."""
+        key = EmbeddingCache.cache_key(self.normalize_query(query), model)
+        now = time.time()
+        with self._lock:
+            self._remember(key, vector, now)
+            if self.db_path is None:
+                return
+            try:
+                conn = self._get_connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO query_embedding_cache "
+                    "(cache_key, model, embedding, created_at, last_used_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, model, EmbeddingCache._serialize_vector(vector), now, now),
+                )
+                conn.execute(
+                    """
+                    DELETE FROM query_embedding_cache WHERE cache_key IN (
+                        SELECT cache_key FROM query_embedding_cache
+                        ORDER BY last_used_at DESC LIMIT -1 OFFSET ?
+                    )
+                    """,
+                    (QUERY_CACHE_MAX_DISK_ENTRIES,),
+                )
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+    def get_or_embed(
+        self,
+        query: str,
+        model: str,
+        embed_fn: Callable[[str], list[float]],
+    ) -> tuple[list[float], str]:
+        """Return the cached vector for a query, embedding it on a miss.
+
+        Args:
+            query: Search query text.
+            model: Embedding model id.
+            embed_fn: Called with the normalized query on a miss.
+
+        Returns:
+            Tuple of (vector, source) where source is "memory", "disk" or "api".
+        """
+        vector, source = self.lookup(query, model)
+        if vector is not None and source is not None:
+            return vector, source
+        vector = embed_fn(self.normalize_query(query))
+        self.store(query, model, vector)
+        return vector, "api"
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get hit/miss statistics.
+
+        Returns:
+            Dict with keys: memory_hits, disk_hits, misses, hit_rate, entries.
+        """
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+            }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_query_caches: dict[tuple[str, int, int, bool], QueryEmbeddingCache] = {}
+_query_caches_lock = threading.Lock()
+
+
+def get_query_embedding_cache(base_dir: Path, settings: Any) -> Optional[QueryEmbeddingCache]:
+    """Return the process-wide query cache for a vault, or None when disabled.
+
+    One instance is shared per vault and cache configuration, so every agent
+    session (e.g. each Telegram user) benefits from the same entries.
+    """
+    max_entries = int(getattr(settings, "rag_query_cache_size", 0) or 0)
+    ttl_seconds = int(getattr(settings, "rag_query_cache_ttl", 0) or 0)
+    persist = bool(getattr(settings, "rag_query_cache_persist", False))
+    if max_entries <= 0 and not persist:
+        return None
+
+    db_path = Path(base_dir).resolve() / ".index" / "embedding_cache.db"
+    registry_key = (str(db_path), max_entries, ttl_seconds, persist)
+    with _query_caches_lock:
+        cache = _query_caches.get(registry_key)
+        if cache is None:
+            cache = QueryEmbeddingCache(
+                max_entries=max_entries,
+                ttl_seconds=ttl_seconds,
+                db_path=db_path if persist else None,
+            )
+            _query_caches[registry_key] = cache
+        return cache
@@ -4,17 +4,45 @@ This module provides the FTSIndex class for exact-term full-text search
 using SQLite FTS5 with BM25 ranking. Shares the same index.db as VectorStore.
 """
 
-import sqlite3
+import logging
 import re
+import sqlite3
 from pathlib import Path
 from typing import Any, Optional
 
+logger = logging.getLogger(__name__)
+
+# "AS MATERIALIZED" CTEs need SQLite 3.35+; older versions get a plain CTE.
+CTE_AS = "AS MATERIALIZED" if sqlite3.sqlite_version_info >= (3, 35, 0) else "AS"
+
+
+def begin_bulk_transaction(conn: sqlite3.Connection) -> None:
+    """Tune a connection for bulk writes and open an explicit transaction.
+
+    WAL journaling lets readers proceed while a build is writing, and
+    ``synchronous=NORMAL`` avoids an fsync per commit (safe under WAL).
+    Both pragmas must run outside a transaction; failures are ignored so
+    read-only or in-memory databases still work. Shared by FTSIndex and
+    VectorStore since both write to the same index.db.
+    """
+    if conn.in_transaction:
+        conn.commit()
+    for pragma in ("PRAGMA journal_mode=WAL", "PRAGMA synchronous=NORMAL"):
+        try:
+            conn.execute(pragma)
+        except sqlite3.OperationalError:
+            pass
+    conn.execute("BEGIN")
+
 
 class FTSIndex:
     """Store and search text chunks using SQLite FTS5.
 
-    The index maintains a single FTS5 virtual table:
+    The index maintains:
     - chunks_fts: FTS5 virtual table with BM25 ranking
+    - video_frames: frame descriptions of video documents keyed by
+      (doc_id, time_seconds), used for temporal expansion range queries
+    - video_frame_docs: doc_ids whose frames have been recorded
 
     Designed for exact-term matching of codes, IDs, and acronyms (e.g.
     RFC-2616, ATP-123) while also supporting Porter stemming for natural
@@ -30,6 +58,7 @@ class FTSIndex:
         self,
         base_dir: Path,
         db_path: Optional[Path] = None,
+        check_same_thread: bool = True,
     ):
         """Initialize the FTS index.
 
@@ -38,8 +67,12 @@ class FTSIndex:
                       base_dir/.index/index.db
             db_path: Optional explicit path to the database file.
                      If None, uses base_dir/.index/index.db
+            check_same_thread: Passed to sqlite3.connect(); False lets a
+                     caller that serializes access (e.g. RetrievalSession)
+                     use the connection from several threads.
         """
         self.base_dir = Path(base_dir)
+        self.check_same_thread = check_same_thread
         if db_path:
             self.db_path = Path(db_path)
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -53,13 +86,15 @@ class FTSIndex:
     def _get_connection(self) -> sqlite3.Connection:
         """Get or create the database connection."""
         if self._conn is None:
-            self._conn = sqlite3.connect(str(self.db_path))
+            self._conn = sqlite3.connect(
+                str(self.db_path), check_same_thread=self.check_same_thread
+            )
             self._conn.row_factory = sqlite3.Row
             self._ensure_schema()
         return self._conn
 
     def _ensure_schema(self) -> None:
-        """Create the FTS5 virtual table if it doesn't exist."""
+        """Create the FTS5 virtual table and video frame tables if they don't exist."""
         conn = self._conn
         if conn is None:
             return
@@ -77,13 +112,35 @@ class FTSIndex:
             """
         )
 
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS video_frames (
+                doc_id       TEXT NOT NULL,
+                time_seconds REAL NOT NULL,
+                path         TEXT,
+                description  TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_video_frames_doc_time "
+            "ON video_frames(doc_id, time_seconds)"
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS video_frame_docs (
+                doc_id      TEXT PRIMARY KEY,
+                frame_count INTEGER NOT NULL
+            )
+            """
+        )
+
         conn.commit()
 
     def upsert(self, chunks: list[dict]) -> tuple[int, int]:
         """Insert or update chunks in the FTS index.
 
-        FTS5 does not support UPDATE, so existing chunks are deleted then
-        re-inserted.
+        Thin wrapper around :meth:`bulk_upsert`, kept for API compatibility.
 
         Args:
             chunks: List of chunk dicts with keys: chunk_id, doc_id, modality,
@@ -92,41 +149,86 @@ class FTSIndex:
         Returns:
             Tuple of (inserted_count, updated_count).
         """
-        conn = self._get_connection()
-        inserted = 0
-        updated = 0
+        return self.bulk_upsert(chunks)
+
+    def bulk_upsert(self, chunks: list[dict]) -> tuple[int, int]:
+        """Insert or update many chunks in a single transaction.
+
+        FTS5 does not support UPDATE, so existing chunks are deleted then
+        re-inserted. Rows are staged into a temporary table with
+        ``executemany``; one ``DELETE ... IN (SELECT ...)`` removes the
+        previous versions (its row count is the number of updates) and one
+        ``INSERT ... SELECT`` writes the new rows.
 
-        existing_ids = self.get_existing_chunk_ids()
+        Duplicate chunk_ids within ``chunks`` follow the per-row semantics: the
+        last occurrence wins and repeated occurrences count as updates.
+
+        Args:
+            chunks: List of chunk dicts, as for :meth:`upsert`.
+
+        Returns:
+            Tuple of (inserted_count, updated_count).
+        """
+        if not chunks:
+            return 0, 0
+
+        staged: dict[str, tuple[str, str, str, str, str]] = {}
+        repeats = 0
 
         for chunk in chunks:
             chunk_id = chunk.get("chunk_id", "")
-            doc_id = chunk.get("doc_id", "")
-            modality = chunk.get("modality", "")
-            text = chunk.get("text", "")
             heading_path = chunk.get("heading_path", [])
-
+            if chunk_id in staged:
+                repeats += 1
             # Convert heading_path list to " > "-delimited string for FTS
-            heading_str = " > ".join(heading_path) if heading_path else ""
+            staged[chunk_id] = (
+                chunk_id,
+                chunk.get("doc_id", ""),
+                chunk.get("modality", ""),
+                chunk.get("text", ""),
+                " > ".join(heading_path) if heading_path else "",
+            )
 
-            if chunk_id in existing_ids:
-                # FTS5 doesn't support UPDATE: delete then insert
-                conn.execute("DELETE FROM chunks_fts WHERE chunk_id = ?", (chunk_id,))
-                conn.execute(
-                    "INSERT INTO chunks_fts (chunk_id, doc_id, modality, text, heading_path) "
-                    "VALUES (?, ?, ?, ?, ?)",
-                    (chunk_id, doc_id, modality, text, heading_str),
-                )
-                updated += 1
-            else:
-                conn.execute(
-                    "INSERT INTO chunks_fts (chunk_id, doc_id, modality, text, heading_path) "
-                    "VALUES (?, ?, ?, ?, ?)",
-                    (chunk_id, doc_id, modality, text, heading_str),
+        conn = self._get_connection()
+        begin_bulk_transaction(conn)
+        try:
+            conn.execute(
+                """
+                CREATE TEMP TABLE IF NOT EXISTS chunks_fts_stage (
+                    chunk_id     TEXT PRIMARY KEY,
+                    doc_id       TEXT,
+                    modality     TEXT,
+                    text         TEXT,
+                    heading_path TEXT
                 )
-                inserted += 1
-                existing_ids.add(chunk_id)
+                """
+            )
+            conn.execute("DELETE FROM chunks_fts_stage")
+            conn.executemany(
+                "INSERT INTO chunks_fts_stage VALUES (?, ?, ?, ?, ?)",
+                staged.values(),
+            )
 
-        conn.commit()
+            cursor = conn.execute(
+                "DELETE FROM chunks_fts WHERE chunk_id IN (SELECT chunk_id FROM chunks_fts_stage)"
+            )
+            existing = max(cursor.rowcount, 0)
+
+            conn.execute(
+                """
+                INSERT INTO chunks_fts (chunk_id, doc_id, modality, text, heading_path)
+                SELECT chunk_id, doc_id, modality, text, heading_path FROM chunks_fts_stage
+                """
+            )
+
+            conn.execute("DELETE FROM chunks_fts_stage")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+        inserted = len(staged) - existing
+        updated = existing + repeats
         return inserted, updated
 
     @staticmethod
@@ -269,6 +371,80 @@ class FTSIndex:
                 return results
         return []
 
+    def search_per_doc(
+        self,
+        query: str,
+        doc_ids: list[str],
+        k_per_doc: int = 5,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Return the top BM25 matches for each of several documents in one query.
+
+        Ranks hits within each doc_id using a window function, so covering N
+        documents costs one FTS query instead of N calls to :meth:`search`.
+        Uses the broadest query variant (token OR); stricter variants can only
+        match a subset of its hits.
+
+        Args:
+            query: Search query string.
+            doc_ids: Documents to cover.
+            k_per_doc: Maximum results per document.
+
+        Returns:
+            Dict mapping doc_id -> result list (same shape as :meth:`search`),
+            containing only documents with at least one hit.
+        """
+        if not query or not query.strip() or k_per_doc <= 0 or not doc_ids:
+            return {}
+
+        conn = self._get_connection()
+        placeholders = ",".join("?" * len(doc_ids))
+        for fts_query in self._build_query_variants(query):
+            try:
+                # bm25() is only valid in the MATCH query itself, so score in
+                # a materialized CTE and rank per document outside it.
+                cursor = conn.execute(
+                    f"""
+                    WITH hits {CTE_AS} (
+                        SELECT chunk_id, doc_id, modality, text, heading_path,
+                               bm25(chunks_fts) AS bm25_score
+                        FROM chunks_fts
+                        WHERE chunks_fts MATCH ?
+                          AND doc_id IN ({placeholders})
+                    )
+                    SELECT chunk_id, doc_id, modality, text, heading_path, bm25_score
+                    FROM (
+                        SELECT *, ROW_NUMBER() OVER (
+                            PARTITION BY doc_id ORDER BY bm25_score, chunk_id
+                        ) AS doc_rank
+                        FROM hits
+                    )
+                    WHERE doc_rank <= ?
+                    ORDER BY doc_id, doc_rank
+                    """,
+                    (fts_query, *doc_ids, k_per_doc),
+                )
+                rows = cursor.fetchall()
+            except sqlite3.Error as e:
+                logger.warning("Per-document FTS query %r failed: %s", fts_query, e)
+                continue
+
+            grouped: dict[str, list[dict[str, Any]]] = {}
+            for row in rows:
+                heading_str = row["heading_path"] or ""
+                heading_path = [h for h in heading_str.split(" > ") if h] if heading_str else []
+                grouped.setdefault(row["doc_id"], []).append(
+                    {
+                        "chunk_id": row["chunk_id"],
+                        "doc_id": row["doc_id"],
+                        "modality": row["modality"],
+                        "text": row["text"],
+                        "heading_path": heading_path,
+                        "bm25_score": row["bm25_score"],
+                    }
+                )
+            return grouped
+        return {}
+
     def get_existing_chunk_ids(self) -> set[str]:
         """Get all chunk IDs currently in the index.
 
@@ -298,9 +474,150 @@ class FTSIndex:
             cursor = conn.execute("DELETE FROM chunks_fts WHERE chunk_id = ?", (chunk_id,))
             deleted += cursor.rowcount
 
+        # Drop frames of documents that no longer have any indexed chunk.
+        if deleted:
+            for table in ("video_frames", "video_frame_docs"):
+                conn.execute(
+                    f"DELETE FROM {table} WHERE doc_id NOT IN (SELECT doc_id FROM chunks_fts)"
+                )
+
         conn.commit()
         return deleted
 
+    def replace_video_frames(self, doc_id: str, frames: list[dict[str, Any]]) -> int:
+        """Replace the recorded frame descriptions of a video document.
+
+        The document is marked as recorded even when ``frames`` is empty, so
+        temporal expansion can tell "no frames" apart from "not indexed yet".
+
+        Args:
+            doc_id: Document ID of the video.
+            frames: List of dicts with keys: time_seconds, path, description.
+
+        Returns:
+            Number of frames written.
+        """
+        conn = self._get_connection()
+        rows = [
+            (
+                doc_id,
+                float(frame.get("time_seconds", 0.0)),
+                frame.get("path", ""),
+                frame.get("description", ""),
+            )
+            for frame in frames
+            if frame.get("description")
+        ]
+
+        conn.execute("DELETE FROM video_frames WHERE doc_id = ?", (doc_id,))
+        conn.executemany(
+            """
+            INSERT INTO video_frames(doc_id, time_seconds, path, description)
+            VALUES (?, ?, ?, ?)
+            """,
+            rows,
+        )
+        conn.execute(
+            """
+            INSERT INTO video_frame_docs(doc_id, frame_count) VALUES (?, ?)
+            ON CONFLICT(doc_id) DO UPDATE SET frame_count = excluded.frame_count
+            """,
+            (doc_id, len(rows)),
+        )
+        conn.commit()
+        return len(rows)
+
+    def video_frames_recorded(self, doc_id: str) -> bool:
+        """Return True if frames of ``doc_id`` were recorded at index time."""
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT 1 FROM video_frame_docs WHERE doc_id = ?", (doc_id,)
+        ).fetchone()
+        return row is not None
+
+    @staticmethod
+    def _frame_from_row(row: sqlite3.Row) -> dict[str, Any]:
+        """Convert a video_frames row to the frame dict used by temporal expansion."""
+        time_seconds = row["time_seconds"]
+        return {
+            "time_start": time_seconds,
+            "time_end": time_seconds,
+            "text": row["description"],
+            "path": row["path"],
+        }
+
+    def get_video_frames(
+        self,
+        doc_id: str,
+        time_start: float,
+        time_end: float,
+    ) -> list[dict[str, Any]]:
+        """Get the recorded frames of a video within [time_start, time_end].
+
+        Args:
+            doc_id: Document ID of the video.
+            time_start: Range start in seconds (inclusive).
+            time_end: Range end in seconds (inclusive).
+
+        Returns:
+            List of frame dicts with keys: time_start, time_end, text, path,
+            sorted by time.
+        """
+        conn = self._get_connection()
+        cursor = conn.execute(
+            """
+            SELECT time_seconds, path, description
+            FROM video_frames
+            WHERE doc_id = ? AND time_seconds BETWEEN ? AND ?
+            ORDER BY time_seconds
+            """,
+            (doc_id, time_start, time_end),
+        )
+        return [self._frame_from_row(row) for row in cursor]
+
+    def get_nearest_video_frames(
+        self,
+        doc_id: str,
+        center_time: float,
+        max_distance: float = 30.0,
+    ) -> tuple[Optional[dict[str, Any]], Optional[dict[str, Any]]]:
+        """Get the nearest recorded frames at-or-before and after ``center_time``.
+
+        Args:
+            doc_id: Document ID of the video.
+            center_time: Target time in seconds.
+            max_distance: Maximum distance in seconds from ``center_time``.
+
+        Returns:
+            Tuple of (nearest_before, nearest_after) frame dicts; either is None
+            when no frame lies within ``max_distance`` on that side.
+        """
+        conn = self._get_connection()
+        before = conn.execute(
+            """
+            SELECT time_seconds, path, description
+            FROM video_frames
+            WHERE doc_id = ? AND time_seconds BETWEEN ? AND ?
+            ORDER BY time_seconds DESC
+            LIMIT 1
+            """,
+            (doc_id, center_time - max_distance, center_time),
+        ).fetchone()
+        after = conn.execute(
+            """
+            SELECT time_seconds, path, description
+            FROM video_frames
+            WHERE doc_id = ? AND time_seconds > ? AND time_seconds <= ?
+            ORDER BY time_seconds
+            LIMIT 1
+            """,
+            (doc_id, center_time, center_time + max_distance),
+        ).fetchone()
+        return (
+            self._frame_from_row(before) if before is not None else None,
+            self._frame_from_row(after) if after is not None else None,
+        )
+
     def get_chunks_by_doc_id(
         self,
         doc_id: str,
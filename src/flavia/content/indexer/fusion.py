@@ -0,0 +1,230 @@
+"""Rank fusion strategies for hybrid retrieval.
+
+A fusion strategy turns the vector (kNN) and FTS (BM25) result lists of one
+query into a single fused score per chunk_id. ``fuse_rankings`` applies a
+strategy and returns candidates sorted with deterministic tie-breaking.
+
+Available strategies:
+- ``rrf``: Reciprocal Rank Fusion, score(d) = Σ 1/(k + rank_i(d))
+- ``weighted_rrf``: RRF with a per-source weight on each term
+- ``combsum``: sum of per-source min-max normalized raw scores
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+# (chunk_id, fused_score, vector_rank, fts_rank)
+FusedCandidate = tuple[str, float, Optional[int], Optional[int]]
+
+
+def _rrf_score(ranks: list[Optional[int]], k: int = 60) -> float:
+    """Calculate RRF score from multiple ranking positions.
+
+    Reciprocal Rank Fusion formula: score(d) = Σ 1/(k + rank_i(d))
+
+    This combines rankings from multiple sources (vector and FTS) into a
+    single score. Documents ranked higher in either source get higher scores.
+
+    Args:
+        ranks: List of rank positions (1-indexed). None means not ranked
+               (not found in that source).
+        k: RRF constant (default 60). Higher k gives more uniform scores
+           across different rank positions.
+
+    Returns:
+        RRF score (higher = better). Score of 0 means document not ranked
+        in any source.
+    """
+    score = 0.0
+    for rank in ranks:
+        if rank is not None:
+            score += 1.0 / (k + rank)
+    return score
+
+
+def rank_map(results: list[dict[str, Any]]) -> dict[str, int]:
+    """Map chunk_id to its 1-indexed rank; the first occurrence wins."""
+    ranks: dict[str, int] = {}
+    for position, result in enumerate(results, start=1):
+        ranks.setdefault(result["chunk_id"], position)
+    return ranks
+
+
+class BaseFusionStrategy(ABC):
+    """Abstract base class for rank fusion strategies."""
+
+    name: str = ""
+
+    @abstractmethod
+    def score(
+        self,
+        vector_results: list[dict[str, Any]],
+        fts_results: list[dict[str, Any]],
+        vector_ranks: dict[str, int],
+        fts_ranks: dict[str, int],
+    ) -> dict[str, float]:
+        """Compute the fused score of every candidate.
+
+        Args:
+            vector_results: Vector search results, best first.
+            fts_results: FTS search results, best first.
+            vector_ranks: chunk_id -> 1-indexed rank in ``vector_results``.
+            fts_ranks: chunk_id -> 1-indexed rank in ``fts_results``.
+
+        Returns:
+            Dict mapping every chunk_id in either ranking to its score
+            (higher = better).
+        """
+        pass
+
+
+class RRFFusion(BaseFusionStrategy):
+    """Reciprocal Rank Fusion over the vector and FTS rankings."""
+
+    name = "rrf"
+
+    def __init__(self, k: int = 60):
+        self.k = k
+
+    def score(self, vector_results, fts_results, vector_ranks, fts_ranks) -> dict[str, float]:
+        scores: dict[str, float] = {}
+        for chunk_id in vector_ranks.keys() | fts_ranks.keys():
+            scores[chunk_id] = _rrf_score(
+                [vector_ranks.get(chunk_id), fts_ranks.get(chunk_id)], k=self.k
+            )
+        return scores
+
+
+class WeightedRRFFusion(BaseFusionStrategy):
+    """RRF with a weight applied to each source's reciprocal-rank term."""
+
+    name = "weighted_rrf"
+
+    def __init__(self, k: int = 60, vector_weight: float = 1.0, fts_weight: float = 1.0):
+        self.k = k
+        self.vector_weight = vector_weight
+        self.fts_weight = fts_weight
+
+    def score(self, vector_results, fts_results, vector_ranks, fts_ranks) -> dict[str, float]:
+        scores: dict[str, float] = {}
+        for chunk_id in vector_ranks.keys() | fts_ranks.keys():
+            v_rank = vector_ranks.get(chunk_id)
+            f_rank = fts_ranks.get(chunk_id)
+            score = 0.0
+            if v_rank is not None:
+                score += self.vector_weight / (self.k + v_rank)
+            if f_rank is not None:
+                score += self.fts_weight / (self.k + f_rank)
+            scores[chunk_id] = score
+        return scores
+
+
+def _normalized_scores(
+    results: list[dict[str, Any]],
+    ranks: dict[str, int],
+    key: str,
+) -> dict[str, float]:
+    """Min-max normalize a lower-is-better raw score into [0, 1] (1 = best).
+
+    Results missing ``key`` fall back to their rank position so mixed or
+    synthetic result lists still normalize consistently.
+    """
+    raw: dict[str, float] = {}
+    for result in results:
+        chunk_id = result["chunk_id"]
+        if chunk_id in raw:
+            continue
+        value = result.get(key)
+        raw[chunk_id] = float(value) if value is not None else float(ranks[chunk_id])
+    if not raw:
+        return {}
+    best = min(raw.values())
+    worst = max(raw.values())
+    if worst == best:
+        return {chunk_id: 1.0 for chunk_id in raw}
+    span = worst - best
+    return {chunk_id: (worst - value) / span for chunk_id, value in raw.items()}
+
+
+class CombSUMFusion(BaseFusionStrategy):
+    """CombSUM over min-max normalized vector distances and BM25 scores."""
+
+    name = "combsum"
+
+    def __init__(self, vector_weight: float = 1.0, fts_weight: float = 1.0):
+        self.vector_weight = vector_weight
+        self.fts_weight = fts_weight
+
+    def score(self, vector_results, fts_results, vector_ranks, fts_ranks) -> dict[str, float]:
+        # Both sqlite-vec distances and FTS5 bm25() values are lower-is-better.
+        vector_norm = _normalized_scores(vector_results, vector_ranks, "distance")
+        fts_norm = _normalized_scores(fts_results, fts_ranks, "bm25_score")
+        scores: dict[str, float] = {}
+        for chunk_id in vector_ranks.keys() | fts_ranks.keys():
+            vector_part = self.vector_weight * vector_norm.get(chunk_id, 0.0)
+            fts_part = self.fts_weight * fts_norm.get(chunk_id, 0.0)
+            scores[chunk_id] = vector_part + fts_part
+        return scores
+
+
+FUSION_STRATEGIES: dict[str, type[BaseFusionStrategy]] = {
+    "rrf": RRFFusion,
+    "weighted_rrf": WeightedRRFFusion,
+    "combsum": CombSUMFusion,
+}
+
+
+def get_fusion_strategy(
+    name: str,
+    rrf_k: int = 60,
+    vector_weight: float = 1.0,
+    fts_weight: float = 1.0,
+) -> Optional[BaseFusionStrategy]:
+    """Get a fusion strategy instance by name.
+
+    Args:
+        name: Strategy name (rrf, weighted_rrf, combsum).
+        rrf_k: RRF constant for the rank-based strategies.
+        vector_weight: Weight of the vector source (weighted_rrf, combsum).
+        fts_weight: Weight of the FTS source (weighted_rrf, combsum).
+
+    Returns:
+        Strategy instance, or None if name is unknown.
+    """
+    name = (name or "").strip().lower()
+    if name == "rrf":
+        return RRFFusion(k=rrf_k)
+    if name == "weighted_rrf":
+        return WeightedRRFFusion(k=rrf_k, vector_weight=vector_weight, fts_weight=fts_weight)
+    if name == "combsum":
+        return CombSUMFusion(vector_weight=vector_weight, fts_weight=fts_weight)
+    return None
+
+
+def fuse_rankings(
+    vector_results: list[dict[str, Any]],
+    fts_results: list[dict[str, Any]],
+    strategy: BaseFusionStrategy,
+) -> list[FusedCandidate]:
+    """Fuse vector and FTS rankings with ``strategy``.
+
+    Returns:
+        (chunk_id, score, vector_rank, fts_rank) tuples sorted by score
+        (descending), then best available rank, then chunk_id.
+    """
+    vector_ranks = rank_map(vector_results)
+    fts_ranks = rank_map(fts_results)
+    scores = strategy.score(vector_results, fts_results, vector_ranks, fts_ranks)
+
+    fused: list[FusedCandidate] = [
+        (chunk_id, score, vector_ranks.get(chunk_id), fts_ranks.get(chunk_id))
+        for chunk_id, score in scores.items()
+    ]
+    fused.sort(
+        key=lambda x: (
+            -x[1],
+            min((r for r in (x[2], x[3]) if r is not None), default=10**9),
+            x[0],
+        )
+    )
+    return fused
@@ -5,10 +5,12 @@ that combines chunking, embedding, and both vector and full-text search
 indexes.
 """
 
-import time
+import queue
 import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Optional
 
 from rich.console import Console
 from rich.panel import Panel
@@ -23,9 +25,9 @@ from rich.progress import (
 )
 from rich.table import Table
 
-from ..indexer import chunker, embedder, fts, vector_store
+from ..indexer import chunker, embedder, embedding_cache, fts, vector_store
 from flavia.config import Settings
-from flavia.content.catalog import ContentCatalog
+from flavia.content.catalog import ContentCatalog, catalog_exists
 
 
 def _safe_resolve(base_dir: Path, path_value: str | Path) -> Path | None:
@@ -42,7 +44,7 @@ def _safe_resolve(base_dir: Path, path_value: str | Path) -> Path | None:
 
 
 def load_catalog(base_dir: Path) -> ContentCatalog:
-    """Load catalog from base_dir/.flavia/content_catalog.json.
+    """Load catalog from base_dir/.flavia/ (JSON or SQLite storage).
 
     Args:
         base_dir: Vault base directory.
@@ -50,8 +52,7 @@ def load_catalog(base_dir: Path) -> ContentCatalog:
     Returns:
         Loaded ContentCatalog, or empty catalog if not found.
     """
-    catalog_path = base_dir / ".flavia" / "content_catalog.json"
-    if not catalog_path.exists():
+    if not catalog_exists(base_dir / ".flavia"):
         return ContentCatalog(base_dir)
 
     catalog = ContentCatalog.load(base_dir / ".flavia")
@@ -157,48 +158,62 @@ def clear_index(base_dir: Path, console: Console) -> tuple[int, int]:
     return total_vector_deleted, total_fts_deleted
 
 
-def process_document(
-    entry,
-    base_dir: Path,
-    settings: Settings,
-    vector_store: vector_store.VectorStore,
-    fts_index: fts.FTSIndex,
-    existing_chunk_ids: set[str],
-    console: Console,
-    show_progress: bool = True,
-) -> dict[str, int]:
-    """Chunk, embed, and index a single document.
-
-    Args:
-        entry: Catalog entry for the document.
-        base_dir: Vault base directory.
-        settings: Application settings for embedding client.
-        vector_store: VectorStore instance.
-        fts_index: FTSIndex instance.
-        existing_chunk_ids: Set of chunk IDs already in the index.
-        console: Rich console for output.
-        show_progress: Whether to show progress per document.
+def _new_document_stats() -> dict[str, int]:
+    """Return the per-document counters reported by indexing."""
+    return {
+        "added": 0,
+        "updated": 0,
+        "skipped": 0,
+        "chunked": 0,
+        "embed_failed": 0,
+        "cache_hits": 0,
+        "cache_misses": 0,
+    }
 
-    Returns:
-        Dict with counts: chunks_added, chunks_updated, chunks_skipped.
-    """
-    doc_started = time.perf_counter()
-    stats = {"added": 0, "updated": 0, "skipped": 0, "chunked": 0, "embed_failed": 0}
 
-    chunks = chunker.chunk_document(
+def _chunk_entry(entry, base_dir: Path, settings: Settings) -> list[dict[str, Any]]:
+    """Chunk one catalog entry using the configured chunking parameters."""
+    return chunker.chunk_document(
         entry,
         base_dir,
         chunk_min_tokens=settings.rag_chunk_min_tokens,
         chunk_max_tokens=settings.rag_chunk_max_tokens,
         video_window_seconds=settings.rag_video_window_seconds,
     )
-    stats["chunked"] = len(chunks)
-    if not chunks:
-        stats["duration_ms"] = int((time.perf_counter() - doc_started) * 1000)
-        return stats
 
-    client, model = embedder.get_embedding_client(settings)
 
+def _write_video_frames(chunks: list[dict[str, Any]], fts_index: fts.FTSIndex) -> None:
+    """Record the frame descriptions of a video document for temporal expansion."""
+    doc_ids = {c.get("doc_id", "") for c in chunks if c.get("modality", "").startswith("video_")}
+    doc_ids.discard("")
+    for doc_id in doc_ids:
+        frames = []
+        for chunk in chunks:
+            if chunk.get("doc_id") != doc_id or chunk.get("modality") != "video_frame":
+                continue
+            source = chunk.get("source", {})
+            time_seconds = chunker._parse_timecode(source.get("locator", {}).get("time_start", ""))
+            frames.append(
+                {
+                    "time_seconds": time_seconds if time_seconds is not None else 0.0,
+                    "path": source.get("converted_path", ""),
+                    "description": chunk.get("text", ""),
+                }
+            )
+        fts_index.replace_video_frames(doc_id, frames)
+
+
+def _select_new_chunks(
+    chunks: list[dict[str, Any]],
+    existing_chunk_ids: set[str],
+    stats: dict[str, int],
+    reserved_chunk_ids: Optional[set[str]] = None,
+) -> list[dict[str, Any]]:
+    """Drop chunks without IDs or already indexed, counting them as skipped.
+
+    ``reserved_chunk_ids`` tracks IDs claimed by documents that are still in
+    flight in the pipelined indexer; selected IDs are added to it.
+    """
     new_chunks: list[dict[str, Any]] = []
     seen_new_chunk_ids: set[str] = set()
 
@@ -208,21 +223,32 @@ def process_document(
         if not chunk_id:
             stats["skipped"] += 1
             continue
-        if chunk_id in existing_chunk_ids or chunk_id in seen_new_chunk_ids:
+        if (
+            chunk_id in existing_chunk_ids
+            or chunk_id in seen_new_chunk_ids
+            or (reserved_chunk_ids is not None and chunk_id in reserved_chunk_ids)
+        ):
             stats["skipped"] += 1
         else:
             new_chunks.append(chunk)
             seen_new_chunk_ids.add(chunk_id)
 
-    if not new_chunks:
-        return stats
+    if reserved_chunk_ids is not None:
+        reserved_chunk_ids.update(seen_new_chunk_ids)
+    return new_chunks
 
-    if show_progress:
-        console.print(f"  [dim]Embedding {len(new_chunks)} chunks...[/dim]")
-
-    embeddings = embedder.embed_chunks(new_chunks, client, model)
-    chunks_by_id = {chunk["chunk_id"]: chunk for chunk in new_chunks}
 
+def _write_document_chunks(
+    entry,
+    chunks_by_id: dict[str, dict[str, Any]],
+    embeddings: list[tuple[str, Optional[list[float]], Optional[str]]],
+    vector_store: vector_store.VectorStore,
+    fts_index: fts.FTSIndex,
+    existing_chunk_ids: set[str],
+    console: Console,
+    stats: dict[str, int],
+) -> None:
+    """Upsert successfully embedded chunks of one document into both stores."""
     vector_items = []
     fts_chunks = []
     failed_chunk_ids: list[str] = []
@@ -278,8 +304,7 @@ def process_document(
         )
 
     if not vector_items:
-        stats["duration_ms"] = int((time.perf_counter() - doc_started) * 1000)
-        return stats
+        return
 
     vector_inserted, vector_updated = vector_store.upsert(vector_items)
     fts_inserted, fts_updated = fts_index.upsert(fts_chunks)
@@ -294,11 +319,362 @@ def process_document(
 
     stats["added"] = vector_inserted
     stats["updated"] = vector_updated
+
+
+def process_document(
+    entry,
+    base_dir: Path,
+    settings: Settings,
+    vector_store: vector_store.VectorStore,
+    fts_index: fts.FTSIndex,
+    existing_chunk_ids: set[str],
+    console: Console,
+    show_progress: bool = True,
+    emb_cache: Optional[embedding_cache.EmbeddingCache] = None,
+) -> dict[str, int]:
+    """Chunk, embed, and index a single document.
+
+    Args:
+        entry: Catalog entry for the document.
+        base_dir: Vault base directory.
+        settings: Application settings for embedding client.
+        vector_store: VectorStore instance.
+        fts_index: FTSIndex instance.
+        existing_chunk_ids: Set of chunk IDs already in the index.
+        console: Rich console for output.
+        show_progress: Whether to show progress per document.
+        emb_cache: Optional content-addressed cache consulted before
+            calling the embedding API; newly embedded vectors are stored in it.
+
+    Returns:
+        Dict with counts: chunks_added, chunks_updated, chunks_skipped,
+        cache_hits, cache_misses.
+    """
+    doc_started = time.perf_counter()
+    stats = _new_document_stats()
+
+    chunks = _chunk_entry(entry, base_dir, settings)
+    stats["chunked"] = len(chunks)
+    if not chunks:
+        stats["duration_ms"] = int((time.perf_counter() - doc_started) * 1000)
+        return stats
+    _write_video_frames(chunks, fts_index)
+
+    client, model = embedder.get_embedding_client(settings)
+
+    new_chunks = _select_new_chunks(chunks, existing_chunk_ids, stats)
+    if not new_chunks:
+        return stats
+
+    chunks_by_id = {chunk["chunk_id"]: chunk for chunk in new_chunks}
+
+    cached_vectors: dict[str, list[float]] = {}
+    if emb_cache is not None:
+        cached_vectors = emb_cache.lookup_chunks(new_chunks, model)
+        stats["cache_hits"] = len(cached_vectors)
+        stats["cache_misses"] = len(new_chunks) - len(cached_vectors)
+
+    embeddings: list[tuple[str, Optional[list[float]], Optional[str]]] = [
+        (chunk_id, vector, None) for chunk_id, vector in cached_vectors.items()
+    ]
+    chunks_to_embed = [c for c in new_chunks if c["chunk_id"] not in cached_vectors]
+
+    if chunks_to_embed:
+        if show_progress:
+            console.print(f"  [dim]Embedding {len(chunks_to_embed)} chunks...[/dim]")
+
+        fresh_embeddings = list(embedder.embed_chunks(chunks_to_embed, client, model))
+        if emb_cache is not None:
+            emb_cache.store_chunks(chunks_by_id, fresh_embeddings, model)
+        embeddings.extend(fresh_embeddings)
+
+    _write_document_chunks(
+        entry,
+        chunks_by_id,
+        embeddings,
+        vector_store,
+        fts_index,
+        existing_chunk_ids,
+        console,
+        stats,
+    )
     stats["duration_ms"] = int((time.perf_counter() - doc_started) * 1000)
 
     return stats
 
 
+def process_documents_pipelined(
+    entries: list[Any],
+    base_dir: Path,
+    settings: Settings,
+    vector_store: vector_store.VectorStore,
+    fts_index: fts.FTSIndex,
+    existing_chunk_ids: set[str],
+    console: Console,
+    emb_cache: Optional[embedding_cache.EmbeddingCache] = None,
+    on_document_done: Optional[Callable[[Any, dict[str, int]], None]] = None,
+    on_status: Optional[Callable[[int, int], None]] = None,
+) -> None:
+    """Chunk, embed, and index documents with overlapping stages.
+
+    - Documents are chunked on a pool of ``settings.index_workers`` threads,
+      with a bounded number of documents in flight to cap memory use.
+    - Embedding batches of ``settings.embedder_batch_size`` chunks run on a
+      separate pool; an ``AdaptiveConcurrencyLimiter`` keeps at most
+      ``settings.embedder_concurrency`` requests on the wire and halves that
+      limit on HTTP 429 responses.
+    - The calling thread is the single writer: it owns the SQLite
+      connections (vector store, FTS index, embedding cache) and writes each
+      document as soon as all of its batches have finished.
+
+    Args:
+        entries: Catalog entries to index.
+        base_dir: Vault base directory.
+        settings: Application settings.
+        vector_store: VectorStore instance (used only from the calling thread).
+        fts_index: FTSIndex instance (used only from the calling thread).
+        existing_chunk_ids: Set of chunk IDs already in the index.
+        console: Rich console for output.
+        emb_cache: Optional content-addressed embedding cache.
+        on_document_done: Optional callback(entry, stats) after each document
+            is written. Documents complete in arbitrary order.
+        on_status: Optional callback(chunks_embedded, requests_in_flight)
+            invoked whenever pipeline state changes.
+    """
+    if not entries:
+        return
+
+    client, model = embedder.get_embedding_client(settings)
+    batch_size = max(1, settings.embedder_batch_size)
+    concurrency = max(1, settings.embedder_concurrency)
+    workers = max(1, settings.index_workers)
+    max_active_docs = workers * 2
+    limiter = embedder.AdaptiveConcurrencyLimiter(concurrency)
+
+    events: queue.Queue = queue.Queue()
+    docs: dict[int, dict[str, Any]] = {}
+    reserved_chunk_ids: set[str] = set()
+    next_index = 0
+    remaining = len(entries)
+    chunks_embedded = 0
+
+    def _chunk_job(index: int, entry) -> None:
+        try:
+            events.put(("chunked", index, _chunk_entry(entry, base_dir, settings)))
+        except BaseException as e:  # surfaced in the writer thread
+            events.put(("failed", index, e))
+
+    def _embed_job(index: int, batch: list[dict[str, Any]]) -> None:
+        try:
+            results = embedder.embed_chunk_batch(batch, client, model, limiter=limiter)
+        except Exception as e:
+            results = [(chunk["chunk_id"], None, str(e)) for chunk in batch]
+        events.put(("embedded", index, results))
+
+    chunk_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="flavia-chunk")
+    embed_pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="flavia-embed")
+
+    def _fill() -> None:
+        nonlocal next_index
+        while next_index < len(entries) and len(docs) < max_active_docs:
+            entry = entries[next_index]
+            docs[next_index] = {
+                "entry": entry,
+                "stats": _new_document_stats(),
+                "started": time.perf_counter(),
+                "chunks_by_id": {},
+                "embeddings": [],
+                "fresh": [],
+                "pending": 0,
+            }
+            chunk_pool.submit(_chunk_job, next_index, entry)
+            next_index += 1
+
+    def _finish(index: int) -> None:
+        nonlocal remaining
+        doc = docs.pop(index)
+        stats = doc["stats"]
+        if emb_cache is not None and doc["fresh"]:
+            emb_cache.store_chunks(doc["chunks_by_id"], doc["fresh"], model)
+        if doc["embeddings"]:
+            _write_document_chunks(
+                doc["entry"],
+                doc["chunks_by_id"],
+                doc["embeddings"],
+                vector_store,
+                fts_index,
+                existing_chunk_ids,
+                console,
+                stats,
+            )
+        reserved_chunk_ids.difference_update(doc["chunks_by_id"])
+        stats["duration_ms"] = int((time.perf_counter() - doc["started"]) * 1000)
+        remaining -= 1
+        if on_document_done:
+            on_document_done(doc["entry"], stats)
+        _fill()
+
+    try:
+        _fill()
+        while remaining:
+            kind, index, payload = events.get()
+            doc = docs[index]
+            stats = doc["stats"]
+
+            if kind == "failed":
+                raise payload
+
+            if kind == "chunked":
+                stats["chunked"] = len(payload)
+                _write_video_frames(payload, fts_index)
+                new_chunks = _select_new_chunks(
+                    payload, existing_chunk_ids, stats, reserved_chunk_ids
+                )
+                doc["chunks_by_id"] = {chunk["chunk_id"]: chunk for chunk in new_chunks}
+
+                cached_vectors: dict[str, list[float]] = {}
+                if emb_cache is not None and new_chunks:
+                    cached_vectors = emb_cache.lookup_chunks(new_chunks, model)
+                    stats["cache_hits"] = len(cached_vectors)
+                    stats["cache_misses"] = len(new_chunks) - len(cached_vectors)
+                doc["embeddings"].extend(
+                    (chunk_id, vector, None) for chunk_id, vector in cached_vectors.items()
+                )
+                chunks_embedded += len(cached_vectors)
+
+                to_embed = [c for c in new_chunks if c["chunk_id"] not in cached_vectors]
+                for start in range(0, len(to_embed), batch_size):
+                    doc["pending"] += 1
+                    embed_pool.submit(_embed_job, index, to_embed[start : start + batch_size])
+
+            elif kind == "embedded":
+                doc["pending"] -= 1
+                doc["embeddings"].extend(payload)
+                doc["fresh"].extend(payload)
+                chunks_embedded += len(payload)
+
+            if doc["pending"] == 0:
+                _finish(index)
+
+            if on_status:
+                on_status(chunks_embedded, limiter.in_flight)
+    finally:
+        chunk_pool.shutdown(wait=True, cancel_futures=True)
+        embed_pool.shutdown(wait=True, cancel_futures=True)
+
+    if limiter.rate_limited_count and settings.rag_debug:
+        console.print(
+            f"[dim]RAG debug: embedding API rate-limited {limiter.rate_limited_count} time(s); "
+            f"final concurrency={limiter.limit}/{limiter.max_concurrency}[/dim]"
+        )
+
+
+def _index_progress(console: Console) -> Progress:
+    """Create the progress display used by index build/update."""
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        TimeElapsedColumn(),
+        MofNCompleteColumn(),
+        TextColumn(
+            "[dim]{task.fields[chunks_per_sec]:.1f} chunks/s · "
+            "{task.fields[in_flight]} in flight[/dim]"
+        ),
+        console=console,
+    )
+
+
+def _index_entries(
+    entries: list[Any],
+    base_dir: Path,
+    settings: Settings,
+    vs: vector_store.VectorStore,
+    fts_idx: fts.FTSIndex,
+    emb_cache: embedding_cache.EmbeddingCache,
+    existing_chunk_ids: set[str],
+    console: Console,
+) -> dict[str, int]:
+    """Index entries with a progress bar and return aggregated counters.
+
+    Uses the pipelined indexer when ``embedder_concurrency`` or
+    ``index_workers`` is greater than 1, otherwise processes documents one
+    at a time with ``process_document``.
+    """
+    totals = {
+        "chunks": 0,
+        "added": 0,
+        "updated": 0,
+        "cache_hits": 0,
+        "cache_misses": 0,
+    }
+    started = time.perf_counter()
+    pipelined = settings.embedder_concurrency > 1 or settings.index_workers > 1
+
+    with _index_progress(console) as progress:
+        task = progress.add_task(
+            "[cyan]Processing documents...",
+            total=len(entries),
+            chunks_per_sec=0.0,
+            in_flight=0,
+        )
+
+        def _on_status(chunks_done: int, in_flight: int) -> None:
+            elapsed = max(time.perf_counter() - started, 1e-6)
+            progress.update(task, chunks_per_sec=chunks_done / elapsed, in_flight=in_flight)
+
+        def _on_document_done(entry, stats: dict[str, int]) -> None:
+            totals["chunks"] += stats["added"] + stats["updated"] + stats["skipped"]
+            totals["added"] += stats["added"]
+            totals["updated"] += stats["updated"]
+            totals["cache_hits"] += stats.get("cache_hits", 0)
+            totals["cache_misses"] += stats.get("cache_misses", 0)
+            if settings.rag_debug:
+                console.print(
+                    "[dim]  "
+                    f"{entry.name}: chunked={stats.get('chunked', 0)}, "
+                    f"added={stats['added']}, updated={stats['updated']}, "
+                    f"skipped={stats['skipped']}, embed_failed={stats.get('embed_failed', 0)}, "
+                    f"cache_hits={stats.get('cache_hits', 0)}, "
+                    f"duration={stats.get('duration_ms', 0)}ms[/dim]"
+                )
+            progress.update(task, advance=1, description=f"[cyan]Indexed: {entry.name}")
+
+        if pipelined:
+            process_documents_pipelined(
+                entries,
+                base_dir,
+                settings,
+                vs,
+                fts_idx,
+                existing_chunk_ids,
+                console,
+                emb_cache=emb_cache,
+                on_document_done=_on_document_done,
+                on_status=_on_status,
+            )
+        else:
+            for entry in entries:
+                progress.update(task, description=f"[cyan]Processing: {entry.name}", in_flight=1)
+
+                stats = process_document(
+                    entry,
+                    base_dir,
+                    settings,
+                    vs,
+                    fts_idx,
+                    existing_chunk_ids,
+                    console,
+                    show_progress=False,
+                    emb_cache=emb_cache,
+                )
+                _on_document_done(entry, stats)
+                _on_status(totals["chunks"], 0)
+
+    return totals
+
+
 def build_index(
     base_dir: Path, settings: Settings, console: Console, force: bool = False
 ) -> dict[str, Any]:
@@ -366,71 +742,46 @@ def build_index(
 
     console.print("[cyan]Building index...[/cyan]")
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        TimeElapsedColumn(),
-        MofNCompleteColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task("[cyan]Processing documents...", total=len(entries))
-
-        total_chunks = 0
-        total_added = 0
-        total_updated = 0
-
-        with vector_store.VectorStore(base_dir) as vs, fts.FTSIndex(base_dir) as fts_idx:
-            existing_chunk_ids = set()
-
-            for entry in entries:
-                progress.update(task, description=f"[cyan]Processing: {entry.name}")
-
-                stats = process_document(
-                    entry,
-                    base_dir,
-                    settings,
-                    vs,
-                    fts_idx,
-                    existing_chunk_ids,
-                    console,
-                    show_progress=False,
-                )
-
-                total_chunks += stats["added"] + stats["updated"] + stats["skipped"]
-                total_added += stats["added"]
-                total_updated += stats["updated"]
-                if settings.rag_debug:
-                    console.print(
-                        "[dim]  "
-                        f"{entry.name}: chunked={stats.get('chunked', 0)}, "
-                        f"added={stats['added']}, updated={stats['updated']}, "
-                        f"skipped={stats['skipped']}, embed_failed={stats.get('embed_failed', 0)}, "
-                        f"duration={stats.get('duration_ms', 0)}ms[/dim]"
-                    )
-
-                progress.update(task, advance=1)
+    with (
+        vector_store.VectorStore(base_dir) as vs,
+        fts.FTSIndex(base_dir) as fts_idx,
+        embedding_cache.EmbeddingCache(base_dir) as emb_cache,
+    ):
+        indexed_chunk_ids: set[str] = set()
+        totals = _index_entries(
+            entries, base_dir, settings, vs, fts_idx, emb_cache, indexed_chunk_ids, console
+        )
+        cache_pruned = emb_cache.prune(indexed_chunk_ids)
 
     duration = time.time() - start_time
 
     return {
         "documents_processed": len(entries),
-        "chunks_indexed": total_chunks,
-        "chunks_added": total_added,
-        "chunks_updated": total_updated,
+        "chunks_indexed": totals["chunks"],
+        "chunks_added": totals["added"],
+        "chunks_updated": totals["updated"],
+        "embedding_cache_hits": totals["cache_hits"],
+        "embedding_cache_misses": totals["cache_misses"],
+        "embedding_cache_pruned": cache_pruned,
         "duration_seconds": duration,
         "cancelled": False,
     }
 
 
-def update_index(base_dir: Path, settings: Settings, console: Console) -> dict[str, Any]:
+def update_index(
+    base_dir: Path,
+    settings: Settings,
+    console: Console,
+    verify: bool = False,
+) -> dict[str, Any]:
     """Incremental update: only new/modified docs detected by checksum.
 
     Args:
         base_dir: Vault base directory.
         settings: Application settings.
         console: Rich console for output.
+        verify: Re-hash every file during the catalog scan instead of reusing
+            checksums of files whose size/mtime/inode are unchanged.
 
     Returns:
         Dict with update statistics.
@@ -451,7 +802,7 @@ def update_index(base_dir: Path, settings: Settings, console: Console) -> dict[s
         }
 
     console.print("[cyan]Checking for new or modified files...[/cyan]")
-    update_summary = catalog.update()
+    update_summary = catalog.update(verify=verify, workers=settings.scan_workers)
 
     new_count = update_summary["counts"]["new"]
     modified_count = update_summary["counts"]["modified"]
@@ -464,11 +815,44 @@ def update_index(base_dir: Path, settings: Settings, console: Console) -> dict[s
     if missing_count > 0:
         console.print(f"[red]Missing documents: {missing_count}[/red]")
 
+    return index_catalog_changes(catalog, base_dir, settings, console, start_time=start_time)
+
+
+def index_catalog_changes(
+    catalog: ContentCatalog,
+    base_dir: Path,
+    settings: Settings,
+    console: Console,
+    start_time: Optional[float] = None,
+) -> dict[str, Any]:
+    """Index the new/modified entries of an already-updated catalog.
+
+    Purges chunks of modified and missing entries, indexes entries with
+    status 'new' or 'modified', then marks them current and saves the
+    catalog. Used by :func:`update_index` and the vault watcher.
+
+    Args:
+        catalog: Catalog whose statuses reflect the latest scan.
+        base_dir: Vault base directory.
+        settings: Application settings.
+        console: Rich console for output.
+        start_time: ``time.time()`` at which the update started.
+
+    Returns:
+        Dict with update statistics.
+    """
+    if start_time is None:
+        start_time = time.time()
+
     entries = get_entries_to_index(catalog, base_dir, incremental=True)
 
     chunks_removed = 0
 
-    with vector_store.VectorStore(base_dir) as vs, fts.FTSIndex(base_dir) as fts_idx:
+    with (
+        vector_store.VectorStore(base_dir) as vs,
+        fts.FTSIndex(base_dir) as fts_idx,
+        embedding_cache.EmbeddingCache(base_dir) as emb_cache,
+    ):
         existing_chunk_ids = vs.get_existing_chunk_ids()
 
         stale_paths = _stale_converted_paths(catalog, base_dir)
@@ -486,6 +870,7 @@ def update_index(base_dir: Path, settings: Settings, console: Console) -> dict[s
 
         if not entries:
             console.print("[green]No new or modified documents to index.[/green]")
+            cache_pruned = emb_cache.prune(existing_chunk_ids) if chunks_removed else 0
             vs_stats = vs.get_stats()
             _save_catalog_after_update(catalog, base_dir, console)
             return {
@@ -493,6 +878,7 @@ def update_index(base_dir: Path, settings: Settings, console: Console) -> dict[s
                 "chunks_added": 0,
                 "chunks_updated": 0,
                 "chunks_removed": chunks_removed,
+                "embedding_cache_pruned": cache_pruned,
                 "chunk_count": vs_stats["chunk_count"],
                 "duration_seconds": time.time() - start_time,
             }
@@ -507,54 +893,21 @@ def update_index(base_dir: Path, settings: Settings, console: Console) -> dict[s
             )
         console.print("[cyan]Updating index...[/cyan]")
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            TimeElapsedColumn(),
-            MofNCompleteColumn(),
-            console=console,
-        ) as progress:
-            task = progress.add_task("[cyan]Processing documents...", total=len(entries))
-
-            total_added = 0
-            total_updated = 0
-
-            for entry in entries:
-                progress.update(task, description=f"[cyan]Processing: {entry.name}")
-
-                stats = process_document(
-                    entry,
-                    base_dir,
-                    settings,
-                    vs,
-                    fts_idx,
-                    existing_chunk_ids,
-                    console,
-                    show_progress=False,
-                )
-
-                total_added += stats["added"]
-                total_updated += stats["updated"]
-                if settings.rag_debug:
-                    console.print(
-                        "[dim]  "
-                        f"{entry.name}: chunked={stats.get('chunked', 0)}, "
-                        f"added={stats['added']}, updated={stats['updated']}, "
-                        f"skipped={stats['skipped']}, embed_failed={stats.get('embed_failed', 0)}, "
-                        f"duration={stats.get('duration_ms', 0)}ms[/dim]"
-                    )
-
-                progress.update(task, advance=1)
+        totals = _index_entries(
+            entries, base_dir, settings, vs, fts_idx, emb_cache, existing_chunk_ids, console
+        )
+        cache_pruned = emb_cache.prune(existing_chunk_ids)
 
     _save_catalog_after_update(catalog, base_dir, console)
 
     return {
         "documents_processed": len(entries),
-        "chunks_added": total_added,
-        "chunks_updated": total_updated,
+        "chunks_added": totals["added"],
+        "chunks_updated": totals["updated"],
         "chunks_removed": chunks_removed,
+        "embedding_cache_hits": totals["cache_hits"],
+        "embedding_cache_misses": totals["cache_misses"],
+        "embedding_cache_pruned": cache_pruned,
         "duration_seconds": time.time() - start_time,
     }
 
@@ -806,6 +1159,17 @@ def display_build_results(results: dict[str, Any], console: Console) -> None:
             f"Duration: [cyan]{duration_str}[/cyan]",
         ]
 
+    cache_hits = results.get("embedding_cache_hits", 0)
+    cache_misses = results.get("embedding_cache_misses", 0)
+    cache_pruned = results.get("embedding_cache_pruned", 0)
+    if cache_hits or cache_misses or cache_pruned:
+        content.insert(
+            -1,
+            f"Embedding cache: [cyan]{cache_hits:,}[/cyan] hits, "
+            f"[cyan]{cache_misses:,}[/cyan] misses, "
+            f"[cyan]{cache_pruned:,}[/cyan] pruned",
+        )
+
     panel_title = (
         "[bold]Index Build[/bold]" if "chunks_indexed" in results else "[bold]Index Update[/bold]"
     )
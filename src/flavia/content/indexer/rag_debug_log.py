@@ -83,6 +83,8 @@ def format_rag_debug_trace(trace: dict[str, Any]) -> str:
     timings = trace.get("timings_ms", {})
     filters = trace.get("filters", {})
     mention_scope = trace.get("mention_scope", {})
+    query_cache = trace.get("query_cache", {})
+    catalog_cache = trace.get("catalog_cache", {})
 
     lines = ["[RAG DEBUG]"]
     lines.append(
@@ -119,6 +121,24 @@ def format_rag_debug_trace(trace: dict[str, Any]) -> str:
         f"total={timings.get('total', 0)}"
     )
 
+    if query_cache:
+        lines.append(
+            "query_cache: "
+            f"source={query_cache.get('source')} "
+            f"hit_rate={query_cache.get('hit_rate', 0.0):.0%} "
+            f"memory_hits={query_cache.get('memory_hits', 0)} "
+            f"disk_hits={query_cache.get('disk_hits', 0)} "
+            f"misses={query_cache.get('misses', 0)}"
+        )
+
+    if catalog_cache:
+        lines.append(
+            "catalog_cache: "
+            f"loads={catalog_cache.get('loads', 0)} "
+            f"hits={catalog_cache.get('hits', 0)} "
+            f"invalidations={catalog_cache.get('invalidations', 0)}"
+        )
+
     modalities = counts.get("final_modalities") or {}
     if modalities:
         modal_str = ", ".join(f"{k}={v}" for k, v in sorted(modalities.items()))
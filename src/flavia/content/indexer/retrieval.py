@@ -1,12 +1,14 @@
 """Hybrid retrieval combining vector and FTS search with RRF fusion.
 
-This module implements Reciprocal Rank Fusion (RRF) to combine results from
-semantic (vector) search and full-text search into a unified ranking.
+This module combines results from semantic (vector) search and full-text
+search into a unified ranking. Reciprocal Rank Fusion (RRF) is the default;
+other strategies live in ``fusion``.
 """
 
-import hashlib
+import logging
 import re
 import sqlite3
+import threading
 import time
 from contextlib import ExitStack
 from pathlib import Path
@@ -14,17 +16,33 @@ from typing import Any, Optional
 
 from flavia.config import Settings
 
-from ..catalog import ContentCatalog
+from ..catalog import ContentCatalog, resolve_catalog_path
+from ..catalog_cache import get_catalog_cache, load_catalog_snapshot
+from ..catalog_store import catalog_doc_id
+from .catalog_router import CatalogRouterIndex, catalog_router_rows
 from .embedder import embed_query, get_embedding_client
+from .embedding_cache import get_query_embedding_cache
 from .fts import FTSIndex
+from .fusion import (  # noqa: F401 - _rrf_score re-exported for existing callers
+    FUSION_STRATEGIES,
+    BaseFusionStrategy,
+    RRFFusion,
+    _rrf_score,
+    fuse_rankings,
+    get_fusion_strategy,
+)
 from .vector_store import VectorStore
 from .video_retrieval import expand_video_chunks
 
+logger = logging.getLogger(__name__)
+
+# Unknown fusion strategy names already warned about (warn once, not per query).
+_warned_fusion_strategies: set[str] = set()
+
 
 def _catalog_doc_id(base_dir: Path, path: str, checksum: str) -> str:
     """Reproduce chunker doc_id derivation for catalog routing."""
-    raw = f"{base_dir}:{path}:{checksum}"
-    return hashlib.sha1(raw.encode()).hexdigest()
+    return catalog_doc_id(base_dir, path, checksum)
 
 
 def _catalog_router_tokens(question: str) -> list[str]:
@@ -34,14 +52,176 @@ def _catalog_router_tokens(question: str) -> list[str]:
     return list(dict.fromkeys(tokens))
 
 
+def _file_signature(path: Path) -> Optional[tuple[int, int, int]]:
+    """Return (inode, mtime_ns, size) for a file, or None when it is missing."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+class RetrievalSession:
+    """Warm retrieval state reused across ``retrieve()`` calls.
+
+    Holds open FTSIndex, VectorStore and CatalogRouterIndex connections, the
+    shared catalog snapshot (see ``catalog_cache``) with a doc_id -> entry
+    map, and the embedding client, so repeated searches in one agent turn
+    only pay for query work.
+
+    Connections are dropped by ``refresh()`` when index.db is replaced or
+    modified on disk, and the catalog is reloaded when its file (JSON or
+    SQLite) changes. Connections are opened with ``check_same_thread=False``
+    so a session can follow an agent across worker threads (bot turns run on
+    a pool); ``retrieve()`` holds ``lock`` while it uses the session, so two
+    threads never share a connection at the same time.
+
+    Usage:
+        with RetrievalSession(vault_dir, settings) as session:
+            retrieve("first question", vault_dir, settings, session=session)
+            retrieve("follow-up", vault_dir, settings, session=session)
+    """
+
+    def __init__(self, base_dir: Path, settings: Optional[Settings] = None):
+        """Initialize a retrieval session. Nothing is opened until first use.
+
+        Args:
+            base_dir: Vault base directory.
+            settings: Application settings (for the embedding client).
+        """
+        self.base_dir = Path(base_dir)
+        self.settings = settings
+        self.lock = threading.RLock()
+        self.index_db_path = self.base_dir / ".index" / "index.db"
+        self.config_dir = self.base_dir / ".flavia"
+
+        self._fts: Optional[FTSIndex] = None
+        self._vector_store: Optional[VectorStore] = None
+        self._router: Optional[CatalogRouterIndex] = None
+        self._index_signature: Optional[tuple[int, int, int]] = None
+
+        self._catalog: Optional[ContentCatalog] = None
+        self._doc_entries: dict[str, Any] = {}
+
+        self._embedding_client: Optional[tuple[Any, str]] = None
+        self._embedding_settings: Optional[Settings] = None
+
+    def refresh(self) -> None:
+        """Drop open connections if index.db changed on disk since the last refresh.
+
+        Called once at the start of every ``retrieve()``; the catalog is
+        checked separately on each ``catalog()`` call.
+        """
+        signature = _file_signature(self.index_db_path)
+        if signature != self._index_signature:
+            self._close_connections()
+            self._index_signature = signature
+
+    def fts_index(self) -> FTSIndex:
+        """Return the session's FTS index connection."""
+        if self._fts is None:
+            self._fts = FTSIndex(self.base_dir, check_same_thread=False)
+        return self._fts
+
+    def vector_store(self) -> VectorStore:
+        """Return the session's vector store connection."""
+        if self._vector_store is None:
+            self._vector_store = VectorStore(self.base_dir, check_same_thread=False)
+        return self._vector_store
+
+    def catalog_router(self) -> CatalogRouterIndex:
+        """Return the session's catalog router connection."""
+        if self._router is None:
+            self._router = CatalogRouterIndex(self.base_dir, check_same_thread=False)
+        return self._router
+
+    def catalog(self) -> Optional[ContentCatalog]:
+        """Return the shared catalog snapshot, following changes to the catalog file."""
+        catalog = load_catalog_snapshot(self.config_dir)
+        if catalog is not self._catalog:
+            self._catalog = catalog
+            self._doc_entries = {}
+            if catalog is not None:
+                self._doc_entries = catalog.doc_index(self.base_dir)
+        return self._catalog
+
+    def doc_entries(self) -> dict[str, Any]:
+        """Return a doc_id -> catalog FileEntry map for the current catalog."""
+        self.catalog()
+        return self._doc_entries
+
+    def embedding_client(self, settings: Optional[Settings] = None) -> tuple[Any, str]:
+        """Return (client, model) for query embedding, created once per settings object.
+
+        Args:
+            settings: Settings to use; defaults to the session's settings.
+        """
+        settings = settings if settings is not None else self.settings
+        if settings is None:
+            raise ValueError("RetrievalSession needs settings to embed queries.")
+        if self._embedding_client is None or self._embedding_settings is not settings:
+            self._embedding_client = get_embedding_client(settings)
+            self._embedding_settings = settings
+        return self._embedding_client
+
+    def _close_connections(self) -> None:
+        for handle in (self._fts, self._vector_store, self._router):
+            if handle is not None:
+                handle.close()
+        self._fts = None
+        self._vector_store = None
+        self._router = None
+
+    def close(self) -> None:
+        """Close all open connections and drop cached state."""
+        with self.lock:
+            self._close_connections()
+            self._index_signature = None
+            self._catalog = None
+            self._doc_entries = {}
+            self._embedding_client = None
+            self._embedding_settings = None
+
+    def __enter__(self) -> "RetrievalSession":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
+
+
+def _route_doc_ids_by_overlap(
+    tokens: list[str],
+    rows: dict[str, str],
+    shortlist_k: int,
+) -> list[str]:
+    """Fallback Stage A routing by token overlap when FTS5 is unavailable."""
+    token_set = set(tokens)
+    scored: list[tuple[int, str]] = []
+    for doc_id, searchable in rows.items():
+        doc_terms = set(re.findall(r"[A-Za-z0-9_-]{2,}", searchable.lower()))
+        overlap = len(token_set & doc_terms)
+        if overlap > 0:
+            scored.append((overlap, doc_id))
+    scored.sort(key=lambda x: (-x[0], x[1]))
+    return [doc_id for _, doc_id in scored[:shortlist_k]]
+
+
 def _route_doc_ids_from_catalog(
     question: str,
     base_dir: Path,
     shortlist_k: int = 20,
     scope_doc_ids: Optional[list[str]] = None,
+    session: Optional[RetrievalSession] = None,
 ) -> Optional[list[str]]:
     """Stage A router: shortlist doc_ids using catalog summaries + metadata.
 
+    Queries the persistent ``catalog_fts`` table in index.db. The catalog
+    JSON is only parsed when that table is stale (see CatalogRouterIndex).
+    When a session is given, its router connection and parsed catalog are
+    reused.
+
     Returns:
         - None: routing unavailable (e.g. catalog missing/unreadable)
         - []: routing ran but found no candidates
@@ -50,153 +230,84 @@ def _route_doc_ids_from_catalog(
     if shortlist_k <= 0:
         return []
 
-    catalog = ContentCatalog.load(base_dir / ".flavia")
-    if catalog is None:
+    config_dir = base_dir / ".flavia"
+    catalog_path = resolve_catalog_path(config_dir)
+    if catalog_path is None:
         return None
 
-    scope = set(scope_doc_ids) if scope_doc_ids is not None else None
-    rows: list[tuple[str, str]] = []
-    for entry in catalog.files.values():
-        if entry.status == "missing":
-            continue
-        # Retrieval indexes only converted sources. Skip catalog entries that
-        # cannot produce chunks to avoid over-filtering Stage B to empty scopes.
-        if not getattr(entry, "converted_to", None):
-            continue
-
-        doc_id = _catalog_doc_id(base_dir, entry.path, entry.checksum_sha256)
-        if scope is not None and doc_id not in scope:
-            continue
-
-        content_parts = [
-            entry.path,
-            entry.name,
-            entry.file_type,
-            entry.category,
-            entry.source_type,
-            entry.summary or "",
-            entry.extraction_quality or "",
-            entry.source_url or "",
-        ]
-        if entry.tags:
-            content_parts.append(" ".join(entry.tags))
-        if entry.source_metadata:
-            content_parts.extend(str(v) for v in entry.source_metadata.values())
-
-        searchable = " ".join(p for p in content_parts if p).strip()
-        if searchable:
-            rows.append((doc_id, searchable))
-
-    if not rows:
-        return []
-
     tokens = _catalog_router_tokens(question)
-    if not tokens:
-        return []
-
     # Query terms are quoted and OR-ed to avoid FTS syntax edge cases.
     fts_query = " OR ".join(f'"{t}"' for t in tokens[:16])
 
-    try:
-        with sqlite3.connect(":memory:") as conn:
-            conn.row_factory = sqlite3.Row
-            conn.execute(
-                """
-                CREATE VIRTUAL TABLE catalog_fts USING fts5(
-                    doc_id UNINDEXED,
-                    content,
-                    tokenize = 'porter unicode61'
-                )
-                """
-            )
-            conn.executemany(
-                "INSERT INTO catalog_fts (doc_id, content) VALUES (?, ?)",
-                rows,
-            )
-            cursor = conn.execute(
-                """
-                SELECT doc_id, bm25(catalog_fts) AS bm25_score
-                FROM catalog_fts
-                WHERE catalog_fts MATCH ?
-                ORDER BY bm25_score
-                LIMIT ?
-                """,
-                (fts_query, shortlist_k),
-            )
+    def _load_catalog() -> Optional[ContentCatalog]:
+        if session is not None:
+            return session.catalog()
+        return load_catalog_snapshot(config_dir)
 
-            shortlisted: list[str] = []
-            seen: set[str] = set()
-            for row in cursor:
-                doc_id = row["doc_id"]
-                if doc_id not in seen:
-                    seen.add(doc_id)
-                    shortlisted.append(doc_id)
-            return shortlisted
+    catalog: Optional[ContentCatalog] = None
+    try:
+        with ExitStack() as stack:
+            if session is not None:
+                router = session.catalog_router()
+            else:
+                router = stack.enter_context(CatalogRouterIndex(base_dir))
+            if not router.is_current(catalog_path, base_dir):
+                catalog = _load_catalog()
+                if catalog is None:
+                    return None
+                router.sync(catalog, base_dir, catalog_path)
+            if not tokens:
+                return []
+            return router.search(fts_query, shortlist_k, scope_doc_ids)
     except sqlite3.Error:
         # Graceful fallback: if FTS5 is unavailable, do simple token-overlap routing.
-        token_set = set(tokens)
-        scored: list[tuple[int, str]] = []
-        for doc_id, searchable in rows:
-            doc_terms = set(re.findall(r"[A-Za-z0-9_-]{2,}", searchable.lower()))
-            overlap = len(token_set & doc_terms)
-            if overlap > 0:
-                scored.append((overlap, doc_id))
-        scored.sort(key=lambda x: (-x[0], x[1]))
-        return [doc_id for _, doc_id in scored[:shortlist_k]]
-
-
-def _rrf_score(ranks: list[Optional[int]], k: int = 60) -> float:
-    """Calculate RRF score from multiple ranking positions.
-
-    Reciprocal Rank Fusion formula: score(d) = Σ 1/(k + rank_i(d))
-
-    This combines rankings from multiple sources (vector and FTS) into a
-    single score. Documents ranked higher in either source get higher scores.
-
-    Args:
-        ranks: List of rank positions (1-indexed). None means not ranked
-               (not found in that source).
-        k: RRF constant (default 60). Higher k gives more uniform scores
-           across different rank positions.
-
-    Returns:
-        RRF score (higher = better). Score of 0 means document not ranked
-        in any source.
-    """
-    score = 0.0
-    for rank in ranks:
-        if rank is not None:
-            score += 1.0 / (k + rank)
-    return score
-
-
-def _get_doc_id(chunk_id: str, vector_results: list, fts_results: list) -> str:
-    """Get doc_id for a chunk from either result set.
+        if catalog is None:
+            catalog = _load_catalog()
+            if catalog is None:
+                return None
+        if not tokens:
+            return []
+        rows = catalog_router_rows(catalog, base_dir)
+        if scope_doc_ids is not None:
+            scope = set(scope_doc_ids)
+            rows = {doc_id: text for doc_id, text in rows.items() if doc_id in scope}
+        return _route_doc_ids_by_overlap(tokens, rows, shortlist_k)
+
+
+def _index_results(results: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Map chunk_id to its result dict; the first occurrence wins."""
+    indexed: dict[str, dict[str, Any]] = {}
+    for result in results:
+        indexed.setdefault(result["chunk_id"], result)
+    return indexed
+
+
+def _get_doc_id(
+    chunk_id: str,
+    vector_by_id: dict[str, dict[str, Any]],
+    fts_by_id: dict[str, dict[str, Any]],
+) -> str:
+    """Get doc_id for a chunk from either indexed result set.
 
     Args:
         chunk_id: The chunk identifier to look up.
-        vector_results: Results from vector search.
-        fts_results: Results from FTS search.
+        vector_by_id: Vector search results indexed by chunk_id.
+        fts_by_id: FTS search results indexed by chunk_id.
 
     Returns:
         The doc_id string, or empty string if not found (should never happen).
     """
-    for r in vector_results:
-        if r["chunk_id"] == chunk_id:
-            return r["doc_id"]
-    for r in fts_results:
-        if r["chunk_id"] == chunk_id:
-            return r["doc_id"]
-    return ""
+    data = vector_by_id.get(chunk_id) or fts_by_id.get(chunk_id)
+    return data["doc_id"] if data else ""
 
 
 def _merge_chunk_data(
     chunk_id: str,
-    rrf_score: float,
+    fused_score: float,
     vector_rank: Optional[int],
     fts_rank: Optional[int],
-    vector_results: list,
-    fts_results: list,
+    vector_by_id: dict[str, dict[str, Any]],
+    fts_by_id: dict[str, dict[str, Any]],
 ) -> dict[str, Any]:
     """Merge data from vector and FTS results into unified format.
 
@@ -206,26 +317,26 @@ def _merge_chunk_data(
 
     Args:
         chunk_id: The chunk identifier.
-        rrf_score: The RRF fusion score.
+        fused_score: The fusion score.
         vector_rank: Rank from vector search (1-indexed) or None.
         fts_rank: Rank from FTS search (1-indexed) or None.
-        vector_results: Results from vector search.
-        fts_results: Results from FTS search.
+        vector_by_id: Vector search results indexed by chunk_id.
+        fts_by_id: FTS search results indexed by chunk_id.
 
     Returns:
         Unified result dict with keys: chunk_id, doc_id, text, score,
         vector_rank, fts_rank, and metadata fields.
     """
     # Prefer vector result for metadata (has more fields)
-    v_data = next((r for r in vector_results if r["chunk_id"] == chunk_id), None)
-    f_data = next((r for r in fts_results if r["chunk_id"] == chunk_id), None)
+    v_data = vector_by_id.get(chunk_id)
+    f_data = fts_by_id.get(chunk_id)
 
     # Always return a stable schema, even for FTS-only or vector-only hits.
     result: dict[str, Any] = {
         "chunk_id": chunk_id,
         "doc_id": "",
         "text": "",
-        "score": rrf_score,
+        "score": fused_score,
         "vector_rank": vector_rank,
         "fts_rank": fts_rank,
         "modality": "",
@@ -262,6 +373,56 @@ def _merge_chunk_data(
     return result
 
 
+def _embed_question(
+    question: str,
+    base_dir: Path,
+    settings: Settings,
+    session: RetrievalSession,
+    trace: dict[str, Any],
+) -> list[float]:
+    """Embed a query through the session client and the query embedding cache."""
+    client, model = session.embedding_client(settings)
+    trace["embedding_model"] = model
+    query_cache = get_query_embedding_cache(base_dir, settings)
+    if query_cache is None:
+        return embed_query(question, client, model)
+    query_vec, query_source = query_cache.get_or_embed(
+        question, model, lambda text: embed_query(text, client, model)
+    )
+    trace["query_cache"] = {"source": query_source, **query_cache.get_stats()}
+    return query_vec
+
+
+def _resolve_fusion(
+    fusion: Optional[BaseFusionStrategy],
+    settings: Settings,
+    rrf_k: int,
+) -> BaseFusionStrategy:
+    """Return ``fusion`` or the strategy configured in settings (RRF by default).
+
+    An unknown strategy name falls back to RRF with a warning.
+    """
+    if fusion is not None:
+        return fusion
+    name = getattr(settings, "rag_fusion_strategy", "rrf")
+    strategy = get_fusion_strategy(
+        name,
+        rrf_k=rrf_k,
+        vector_weight=getattr(settings, "rag_fusion_vector_weight", 1.0),
+        fts_weight=getattr(settings, "rag_fusion_fts_weight", 1.0),
+    )
+    if strategy is not None:
+        return strategy
+    if name not in _warned_fusion_strategies:
+        _warned_fusion_strategies.add(name)
+        logger.warning(
+            "Unknown RAG_FUSION_STRATEGY %r; using rrf. Valid options: %s",
+            name,
+            ", ".join(FUSION_STRATEGIES),
+        )
+    return RRFFusion(k=rrf_k)
+
+
 def retrieve(
     question: str,
     base_dir: Path,
@@ -277,6 +438,8 @@ def retrieve(
     retrieval_mode: str = "balanced",
     preserve_doc_scope: bool = False,
     debug_info: Optional[dict[str, Any]] = None,
+    session: Optional[RetrievalSession] = None,
+    fusion: Optional[BaseFusionStrategy] = None,
 ) -> list[dict[str, Any]]:
     """Hybrid retrieval combining vector and FTS search with RRF fusion.
 
@@ -306,13 +469,18 @@ def retrieve(
             - "exhaustive": maximize coverage for checklist extraction
         preserve_doc_scope: When True and `doc_ids_filter` is provided, Stage-A
             router hints do not narrow caller-provided document scope.
+        session: Optional RetrievalSession whose warm connections, catalog
+            and embedding client are reused. When None, a temporary session
+            is opened and closed for this call.
+        fusion: Optional fusion strategy. When None, the strategy named by
+            ``settings.rag_fusion_strategy`` is used (RRF by default).
 
     Returns:
         List of result dicts with keys:
             - chunk_id: Unique chunk identifier
             - doc_id: Parent document ID
             - text: Chunk text content
-            - score: RRF fusion score (higher = better)
+            - score: Fusion score (higher = better)
             - vector_rank: Rank from vector search (None if not found)
             - fts_rank: Rank from FTS search (None if not found)
             - modality: Content modality
@@ -330,6 +498,7 @@ def retrieve(
         ValueError: If embedding client cannot be initialized.
     """
     started_at = time.perf_counter()
+    fusion = _resolve_fusion(fusion, settings, rrf_k)
     trace: dict[str, Any] = {
         "question": question,
         "params": {
@@ -338,6 +507,7 @@ def retrieve(
             "vector_k": vector_k,
             "fts_k": fts_k,
             "rrf_k": rrf_k,
+            "fusion": fusion.name,
             "max_chunks_per_doc": max_chunks_per_doc,
             "expand_video_temporal": expand_video_temporal,
             "retrieval_mode": retrieval_mode,
@@ -372,49 +542,55 @@ def retrieve(
             debug_info.update(trace)
         return []
 
-    # Stage A — Catalog router (best-effort):
-    # use catalog metadata/summaries to shortlist candidate docs.
-    # If it yields no candidates, keep the original filter to preserve recall.
-    effective_doc_ids_filter = doc_ids_filter
-    router_started = time.perf_counter()
-    routed_doc_ids = _route_doc_ids_from_catalog(
-        question=question,
-        base_dir=base_dir,
-        shortlist_k=catalog_router_k,
-        scope_doc_ids=doc_ids_filter,
-    )
-    trace["timings_ms"]["router"] = round((time.perf_counter() - router_started) * 1000, 2)
-    trace["counts"]["routed_doc_ids"] = len(routed_doc_ids) if routed_doc_ids is not None else None
-    if routed_doc_ids:
-        # Keep explicit caller scope intact when requested (e.g., user @mentions).
-        if doc_ids_filter is not None and preserve_doc_scope:
-            pass
-        else:
-            effective_doc_ids_filter = routed_doc_ids
-    trace["filters"]["effective_doc_ids_filter_count"] = (
-        len(effective_doc_ids_filter) if effective_doc_ids_filter is not None else None
-    )
-    effective_max_chunks_per_doc = max_chunks_per_doc
-    if effective_doc_ids_filter is not None and len(effective_doc_ids_filter) == 1:
-        # Single-document scope should prioritize coverage over cross-doc diversity.
-        effective_max_chunks_per_doc = max(effective_max_chunks_per_doc, top_k)
-    if retrieval_mode == "exhaustive":
-        effective_max_chunks_per_doc = max(effective_max_chunks_per_doc, top_k)
-    trace["params"]["effective_max_chunks_per_doc"] = effective_max_chunks_per_doc
+    with ExitStack() as stack:
+        if session is None:
+            session = stack.enter_context(RetrievalSession(base_dir, settings))
+        stack.enter_context(session.lock)
+        session.refresh()
+
+        # Stage A — Catalog router (best-effort):
+        # use catalog metadata/summaries to shortlist candidate docs.
+        # If it yields no candidates, keep the original filter to preserve recall.
+        effective_doc_ids_filter = doc_ids_filter
+        router_started = time.perf_counter()
+        routed_doc_ids = _route_doc_ids_from_catalog(
+            question=question,
+            base_dir=base_dir,
+            shortlist_k=catalog_router_k,
+            scope_doc_ids=doc_ids_filter,
+            session=session,
+        )
+        trace["timings_ms"]["router"] = round((time.perf_counter() - router_started) * 1000, 2)
+        trace["counts"]["routed_doc_ids"] = (
+            len(routed_doc_ids) if routed_doc_ids is not None else None
+        )
+        if routed_doc_ids:
+            # Keep explicit caller scope intact when requested (e.g., user @mentions).
+            if doc_ids_filter is not None and preserve_doc_scope:
+                pass
+            else:
+                effective_doc_ids_filter = routed_doc_ids
+        trace["filters"]["effective_doc_ids_filter_count"] = (
+            len(effective_doc_ids_filter) if effective_doc_ids_filter is not None else None
+        )
+        effective_max_chunks_per_doc = max_chunks_per_doc
+        if effective_doc_ids_filter is not None and len(effective_doc_ids_filter) == 1:
+            # Single-document scope should prioritize coverage over cross-doc diversity.
+            effective_max_chunks_per_doc = max(effective_max_chunks_per_doc, top_k)
+        if retrieval_mode == "exhaustive":
+            effective_max_chunks_per_doc = max(effective_max_chunks_per_doc, top_k)
+        trace["params"]["effective_max_chunks_per_doc"] = effective_max_chunks_per_doc
 
-    vector_results: list[dict[str, Any]] = []
-    fts_results: list[dict[str, Any]] = []
+        vector_results: list[dict[str, Any]] = []
+        fts_results: list[dict[str, Any]] = []
 
-    with ExitStack() as stack:
-        fts = stack.enter_context(FTSIndex(base_dir))
-        vs = stack.enter_context(VectorStore(base_dir)) if vector_k > 0 else None
+        fts = session.fts_index()
+        vs = session.vector_store() if vector_k > 0 else None
 
         # Run vector search only when requested
         if vector_k > 0 and vs is not None:
             vector_started = time.perf_counter()
-            client, model = get_embedding_client(settings)
-            trace["embedding_model"] = model
-            query_vec = embed_query(question, client, model)
+            query_vec = _embed_question(question, base_dir, settings, session, trace)
             vector_results = vs.knn_search(
                 query_vec,
                 k=vector_k,
@@ -437,39 +613,18 @@ def retrieve(
             trace["timings_ms"]["fts"] = 0.0
 
         fusion_started = time.perf_counter()
-        # Build rank maps (1-indexed positions)
-        vector_ranks = {r["chunk_id"]: i + 1 for i, r in enumerate(vector_results)}
-        fts_ranks = {r["chunk_id"]: i + 1 for i, r in enumerate(fts_results)}
-
-        # Collect all unique chunk_ids from both searches
-        all_chunk_ids = set(vector_ranks.keys()) | set(fts_ranks.keys())
-
-        # Calculate RRF scores and collect results
-        scored_chunks: list[tuple[str, float, Optional[int], Optional[int]]] = []
-        for chunk_id in all_chunk_ids:
-            v_rank = vector_ranks.get(chunk_id)
-            f_rank = fts_ranks.get(chunk_id)
-            rrf = _rrf_score([v_rank, f_rank], k=rrf_k)
-            scored_chunks.append((chunk_id, rrf, v_rank, f_rank))
-
-        # Sort by RRF score (descending) with deterministic tie-breaking.
-        # Tie-break by best available rank, then chunk_id for stable output.
-        scored_chunks.sort(
-            key=lambda x: (
-                -x[1],
-                min((r for r in (x[2], x[3]) if r is not None), default=10**9),
-                x[0],
-            )
-        )
+        scored_chunks = fuse_rankings(vector_results, fts_results, fusion)
+        vector_by_id = _index_results(vector_results)
+        fts_by_id = _index_results(fts_results)
 
         # Apply diversity filter (max chunks per doc) and build final results
         doc_counts: dict[str, int] = {}
         results: list[dict[str, Any]] = []
         skipped_diversity = 0
 
-        for chunk_id, rrf, v_rank, f_rank in scored_chunks:
+        for chunk_id, score, v_rank, f_rank in scored_chunks:
             # Get doc_id to apply diversity filter
-            doc_id = _get_doc_id(chunk_id, vector_results, fts_results)
+            doc_id = _get_doc_id(chunk_id, vector_by_id, fts_by_id)
             if not doc_id:
                 # Defensive fallback: avoid collapsing unrelated chunks into same bucket.
                 doc_id = f"__unknown__:{chunk_id}"
@@ -479,9 +634,7 @@ def retrieve(
                 doc_counts[doc_id] = doc_counts.get(doc_id, 0) + 1
 
                 # Build result with merged metadata
-                result = _merge_chunk_data(
-                    chunk_id, rrf, v_rank, f_rank, vector_results, fts_results
-                )
+                result = _merge_chunk_data(chunk_id, score, v_rank, f_rank, vector_by_id, fts_by_id)
                 results.append(result)
             else:
                 skipped_diversity += 1
@@ -493,7 +646,7 @@ def retrieve(
         trace["timings_ms"]["fusion"] = round((time.perf_counter() - fusion_started) * 1000, 2)
         trace["counts"]["vector_hits"] = len(vector_results)
         trace["counts"]["fts_hits"] = len(fts_results)
-        trace["counts"]["unique_candidates"] = len(all_chunk_ids)
+        trace["counts"]["unique_candidates"] = len(scored_chunks)
         trace["counts"]["results_before_temporal"] = len(results)
         trace["counts"]["skipped_by_doc_diversity"] = skipped_diversity
 
@@ -502,11 +655,7 @@ def retrieve(
         if expand_video_temporal and any(
             r.get("modality") in ("video_transcript", "video_frame") for r in results
         ):
-            if vs is not None:
-                results = expand_video_chunks(results, base_dir, vs, fts)
-            else:
-                with VectorStore(base_dir) as temp_vs:
-                    results = expand_video_chunks(results, base_dir, temp_vs, fts)
+            results = expand_video_chunks(results, base_dir, session.vector_store(), fts)
         trace["timings_ms"]["temporal"] = round((time.perf_counter() - temporal_started) * 1000, 2)
         trace["counts"]["final_results"] = len(results)
         modality_counts: dict[str, int] = {}
@@ -514,8 +663,108 @@ def retrieve(
             modality = result.get("modality") or "unknown"
             modality_counts[modality] = modality_counts.get(modality, 0) + 1
         trace["counts"]["final_modalities"] = modality_counts
+        trace["catalog_cache"] = get_catalog_cache().get_stats()
         trace["timings_ms"]["total"] = round((time.perf_counter() - started_at) * 1000, 2)
         if debug_info is not None:
             debug_info.update(trace)
 
         return results
+
+
+def retrieve_doc_coverage(
+    question: str,
+    base_dir: Path,
+    settings: Settings,
+    doc_ids: list[str],
+    per_doc_k: int = 4,
+    vector_k: int = 15,
+    fts_k: int = 15,
+    rrf_k: int = 60,
+    expand_video_temporal: bool = True,
+    session: Optional[RetrievalSession] = None,
+    debug_info: Optional[dict[str, Any]] = None,
+    fusion: Optional[BaseFusionStrategy] = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Retrieve the best chunks for each of several documents in one pass.
+
+    Used for exhaustive-mode coverage backfill: instead of one ``retrieve()``
+    per document, the query is embedded once and each of the vector and FTS
+    indexes is queried once, with per-document ranking done in SQL. Results
+    are fused per document (no catalog routing or diversity cap).
+
+    Args:
+        question: User query string.
+        base_dir: Vault base directory.
+        settings: Application settings (for embedding client).
+        doc_ids: Documents to cover.
+        per_doc_k: Number of fused results to return per document.
+        vector_k: Vector candidates per document before fusion (0 disables).
+        fts_k: FTS candidates per document before fusion (0 disables).
+        rrf_k: RRF constant k (default 60).
+        expand_video_temporal: Whether to expand video chunks with temporal
+                               evidence bundles (default True).
+        session: Optional RetrievalSession to reuse warm state.
+        debug_info: Optional dict updated with counts and timings.
+        fusion: Optional fusion strategy, resolved as in ``retrieve()``.
+
+    Returns:
+        Dict mapping doc_id -> result list (same schema as ``retrieve()``),
+        in ``doc_ids`` order, containing only documents with results.
+
+    Raises:
+        RuntimeError: If query embedding fails.
+        ValueError: If embedding client cannot be initialized.
+    """
+    started_at = time.perf_counter()
+    fusion = _resolve_fusion(fusion, settings, rrf_k)
+    trace: dict[str, Any] = {"counts": {"doc_ids": len(doc_ids)}, "timings_ms": {}}
+    doc_ids = list(dict.fromkeys(doc_ids))
+    if not doc_ids or per_doc_k <= 0 or not question or not question.strip():
+        if debug_info is not None:
+            debug_info.update(trace)
+        return {}
+
+    with ExitStack() as stack:
+        if session is None:
+            session = stack.enter_context(RetrievalSession(base_dir, settings))
+        stack.enter_context(session.lock)
+        session.refresh()
+        fts = session.fts_index()
+
+        vector_by_doc: dict[str, list[dict[str, Any]]] = {}
+        fts_by_doc: dict[str, list[dict[str, Any]]] = {}
+        if vector_k > 0:
+            vector_started = time.perf_counter()
+            query_vec = _embed_question(question, base_dir, settings, session, trace)
+            vector_by_doc = session.vector_store().knn_search_per_doc(
+                query_vec, doc_ids, k_per_doc=vector_k
+            )
+            trace["timings_ms"]["vector"] = round((time.perf_counter() - vector_started) * 1000, 2)
+        if fts_k > 0:
+            fts_started = time.perf_counter()
+            fts_by_doc = fts.search_per_doc(question, doc_ids, k_per_doc=fts_k)
+            trace["timings_ms"]["fts"] = round((time.perf_counter() - fts_started) * 1000, 2)
+
+        coverage: dict[str, list[dict[str, Any]]] = {}
+        for doc_id in doc_ids:
+            vector_results = vector_by_doc.get(doc_id, [])
+            fts_results = fts_by_doc.get(doc_id, [])
+            scored_chunks = fuse_rankings(vector_results, fts_results, fusion)
+            vector_by_id = _index_results(vector_results)
+            fts_by_id = _index_results(fts_results)
+            results = [
+                _merge_chunk_data(chunk_id, score, v_rank, f_rank, vector_by_id, fts_by_id)
+                for chunk_id, score, v_rank, f_rank in scored_chunks[:per_doc_k]
+            ]
+            if expand_video_temporal and any(
+                r.get("modality") in ("video_transcript", "video_frame") for r in results
+            ):
+                results = expand_video_chunks(results, base_dir, session.vector_store(), fts)
+            if results:
+                coverage[doc_id] = results
+
+        trace["counts"]["covered_doc_ids"] = len(coverage)
+        trace["timings_ms"]["total"] = round((time.perf_counter() - started_at) * 1000, 2)
+        if debug_info is not None:
+            debug_info.update(trace)
+        return coverage
@@ -11,6 +11,16 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
+from .fts import CTE_AS, begin_bulk_transaction
+
+# Scoped searches score chunks one by one while the scope holds at most this
+# many chunks. Measured at ~0.25 ms per scoped chunk against ~25 ms for a vec0
+# kNN over 20k vectors, so wider scopes are cheaper through vec0 + filter.
+SCOPED_SEARCH_MAX_CHUNKS = 100
+
+# Largest k sqlite-vec's vec0 accepts in a KNN query.
+VEC0_MAX_K = 4096
+
 
 class VectorStore:
     """Store and search embedding vectors using sqlite-vec.
@@ -29,6 +39,7 @@ class VectorStore:
         self,
         base_dir: Path,
         db_path: Optional[Path] = None,
+        check_same_thread: bool = True,
     ):
         """Initialize the vector store.
 
@@ -37,8 +48,12 @@ class VectorStore:
                       base_dir/.index/index.db
             db_path: Optional explicit path to the database file.
                      If None, uses base_dir/.index/index.db
+            check_same_thread: Passed to sqlite3.connect(); False lets a
+                     caller that serializes access (e.g. RetrievalSession)
+                     use the connection from several threads.
         """
         self.base_dir = Path(base_dir)
+        self.check_same_thread = check_same_thread
         if db_path:
             self.db_path = Path(db_path)
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -53,7 +68,9 @@ class VectorStore:
     def _get_connection(self) -> sqlite3.Connection:
         """Get or create the database connection."""
         if self._conn is None:
-            self._conn = sqlite3.connect(str(self.db_path))
+            self._conn = sqlite3.connect(
+                str(self.db_path), check_same_thread=self.check_same_thread
+            )
             self._conn.row_factory = sqlite3.Row
             self._load_sqlite_vec(self._conn)
             self._ensure_schema()
@@ -137,6 +154,8 @@ class VectorStore:
     ) -> tuple[int, int]:
         """Insert or update chunks with their vectors and metadata.
 
+        Thin wrapper around :meth:`bulk_upsert`, kept for API compatibility.
+
         Args:
             items: List of tuples (chunk_id, vector, metadata) where:
                 - chunk_id: Unique identifier for the chunk
@@ -147,91 +166,128 @@ class VectorStore:
         Returns:
             Tuple of (inserted_count, updated_count).
         """
-        conn = self._get_connection()
-        inserted = 0
-        updated = 0
+        return self.bulk_upsert(items)
 
-        for chunk_id, vector, metadata in items:
-            # Check if exists
-            cursor = conn.execute("SELECT 1 FROM chunks_meta WHERE chunk_id = ?", (chunk_id,))
-            exists = cursor.fetchone() is not None
+    def bulk_upsert(
+        self,
+        items: list[tuple[str, list[float], dict]],
+    ) -> tuple[int, int]:
+        """Insert or update many chunks in a single transaction.
 
-            now = datetime.now(timezone.utc).isoformat()
+        Rows are staged into a temporary table with ``executemany``, a single
+        join against ``chunks_meta`` determines which chunk_ids already exist,
+        and metadata is written with one ``INSERT ... ON CONFLICT`` statement.
+        Vectors are written with two ``executemany`` calls (insert new, update
+        existing) because vec0 virtual tables do not support UPSERT.
+
+        Duplicate chunk_ids within ``items`` follow the per-row semantics: the
+        last occurrence wins and repeated occurrences count as updates.
+
+        Args:
+            items: List of (chunk_id, vector, metadata) tuples, as for :meth:`upsert`.
 
-            # Prepare metadata values
-            doc_id = metadata.get("doc_id", "")
-            modality = metadata.get("modality", "")
-            converted_path = metadata.get("converted_path", "")
+        Returns:
+            Tuple of (inserted_count, updated_count).
+        """
+        if not items:
+            return 0, 0
+
+        now = datetime.now(timezone.utc).isoformat()
+        staged: dict[str, tuple] = {}
+        repeats = 0
+
+        for chunk_id, vector, metadata in items:
             locator = metadata.get("locator", {})
             heading_path = metadata.get("heading_path", [])
-            doc_name = metadata.get("doc_name", "")
-            file_type = metadata.get("file_type", "")
-
-            locator_json = json.dumps(locator) if locator else ""
-            heading_json = json.dumps(heading_path) if heading_path else ""
+            if chunk_id in staged:
+                repeats += 1
+            staged[chunk_id] = (
+                chunk_id,
+                metadata.get("doc_id", ""),
+                metadata.get("modality", ""),
+                metadata.get("converted_path", ""),
+                json.dumps(locator) if locator else "",
+                json.dumps(heading_path) if heading_path else "",
+                metadata.get("doc_name", ""),
+                metadata.get("file_type", ""),
+                now,
+                self._serialize_vector(vector),
+            )
 
-            if exists:
-                # Update vector
-                conn.execute(
-                    "UPDATE chunks_vec SET embedding = ? WHERE chunk_id = ?",
-                    (self._serialize_vector(vector), chunk_id),
+        conn = self._get_connection()
+        begin_bulk_transaction(conn)
+        try:
+            conn.execute(
+                """
+                CREATE TEMP TABLE IF NOT EXISTS chunks_stage (
+                    chunk_id       TEXT PRIMARY KEY,
+                    doc_id         TEXT NOT NULL,
+                    modality       TEXT NOT NULL,
+                    converted_path TEXT,
+                    locator_json   TEXT,
+                    heading_json   TEXT,
+                    doc_name       TEXT,
+                    file_type      TEXT,
+                    indexed_at     TEXT NOT NULL,
+                    embedding      BLOB NOT NULL
                 )
-                # Update metadata
-                conn.execute(
+                """
+            )
+            conn.execute("DELETE FROM chunks_stage")
+            conn.executemany(
+                "INSERT INTO chunks_stage VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                staged.values(),
+            )
+
+            existing_ids = {
+                row["chunk_id"]
+                for row in conn.execute(
                     """
-                    UPDATE chunks_meta SET
-                        doc_id = ?,
-                        modality = ?,
-                        converted_path = ?,
-                        locator_json = ?,
-                        heading_json = ?,
-                        doc_name = ?,
-                        file_type = ?,
-                        indexed_at = ?
-                    WHERE chunk_id = ?
-                    """,
-                    (
-                        doc_id,
-                        modality,
-                        converted_path,
-                        locator_json,
-                        heading_json,
-                        doc_name,
-                        file_type,
-                        now,
-                        chunk_id,
-                    ),
-                )
-                updated += 1
-            else:
-                # Insert vector
-                conn.execute(
-                    "INSERT INTO chunks_vec (chunk_id, embedding) VALUES (?, ?)",
-                    (chunk_id, self._serialize_vector(vector)),
-                )
-                # Insert metadata
-                conn.execute(
+                    SELECT s.chunk_id
+                    FROM chunks_stage s
+                    JOIN chunks_meta m ON m.chunk_id = s.chunk_id
                     """
-                    INSERT INTO chunks_meta (
-                        chunk_id, doc_id, modality, converted_path,
-                        locator_json, heading_json, doc_name, file_type, indexed_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        chunk_id,
-                        doc_id,
-                        modality,
-                        converted_path,
-                        locator_json,
-                        heading_json,
-                        doc_name,
-                        file_type,
-                        now,
-                    ),
                 )
-                inserted += 1
+            }
 
-        conn.commit()
+            conn.execute(
+                """
+                INSERT INTO chunks_meta (
+                    chunk_id, doc_id, modality, converted_path,
+                    locator_json, heading_json, doc_name, file_type, indexed_at
+                )
+                SELECT chunk_id, doc_id, modality, converted_path,
+                       locator_json, heading_json, doc_name, file_type, indexed_at
+                FROM chunks_stage WHERE true
+                ON CONFLICT(chunk_id) DO UPDATE SET
+                    doc_id = excluded.doc_id,
+                    modality = excluded.modality,
+                    converted_path = excluded.converted_path,
+                    locator_json = excluded.locator_json,
+                    heading_json = excluded.heading_json,
+                    doc_name = excluded.doc_name,
+                    file_type = excluded.file_type,
+                    indexed_at = excluded.indexed_at
+                """
+            )
+
+            conn.executemany(
+                "UPDATE chunks_vec SET embedding = ? WHERE chunk_id = ?",
+                ((row[9], row[0]) for cid, row in staged.items() if cid in existing_ids),
+            )
+            conn.executemany(
+                "INSERT INTO chunks_vec (chunk_id, embedding) VALUES (?, ?)",
+                ((row[0], row[9]) for cid, row in staged.items() if cid not in existing_ids),
+            )
+
+            conn.execute("DELETE FROM chunks_stage")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+        updated = len(existing_ids) + repeats
+        inserted = len(staged) - len(existing_ids)
         return inserted, updated
 
     def _serialize_vector(self, vector: list[float]) -> bytes:
@@ -252,6 +308,7 @@ class VectorStore:
         query_vec: list[float],
         k: int = 10,
         doc_ids_filter: Optional[list[str]] = None,
+        scoped_search: Optional[bool] = None,
     ) -> list[dict[str, Any]]:
         """Search for the k nearest neighbors to a query vector.
 
@@ -262,6 +319,14 @@ class VectorStore:
                 - None: Search all documents
                 - []: Return empty results (explicit empty scope)
                 - ["id1", "id2"]: Search only specified documents
+            scoped_search: How to search when doc_ids_filter is set.
+                - None: Scoped when the scope holds at most
+                  SCOPED_SEARCH_MAX_CHUNKS chunks, vec0 otherwise
+                - True: Score only the scoped chunks (cost ~ scope size)
+                - False: vec0 kNN, then filter (cost ~ vault size)
+                The vec0 path over-fetches up to VEC0_MAX_K neighbours before
+                filtering, so on stores larger than that it may return fewer
+                than k hits for scopes far from the query.
 
         Returns:
             List of dicts with keys: chunk_id, distance, doc_id, modality,
@@ -277,28 +342,58 @@ class VectorStore:
 
         # Build the query with optional doc_id filter
         if doc_ids_filter:
-            # sqlite-vec applies post-filtering with JOIN predicates. To preserve
-            # correctness for doc_id-restricted searches, request full-kNN and then
-            # apply SQL filter + LIMIT.
-            total_chunks = conn.execute("SELECT COUNT(*) AS cnt FROM chunks_meta").fetchone()["cnt"]
-            if total_chunks == 0:
+            placeholders = ",".join("?" * len(doc_ids_filter))
+            scoped_chunks = conn.execute(
+                f"SELECT COUNT(*) AS cnt FROM chunks_meta WHERE doc_id IN ({placeholders})",
+                tuple(doc_ids_filter),
+            ).fetchone()["cnt"]
+            if scoped_chunks == 0:
                 return []
 
-            placeholders = ",".join("?" * len(doc_ids_filter))
-            cursor = conn.execute(
-                f"""
-                SELECT v.chunk_id, v.distance, m.doc_id, m.modality,
-                       m.converted_path, m.locator_json, m.heading_json,
-                       m.doc_name, m.file_type
-                FROM chunks_vec v
-                JOIN chunks_meta m ON v.chunk_id = m.chunk_id
-                WHERE v.embedding MATCH ? AND k = ?
-                  AND m.doc_id IN ({placeholders})
-                ORDER BY v.distance
-                LIMIT ?
-                """,
-                (self._serialize_vector(query_vec), total_chunks, *doc_ids_filter, k),
-            )
+            if scoped_search is None:
+                scoped_search = scoped_chunks <= SCOPED_SEARCH_MAX_CHUNKS
+
+            if scoped_search:
+                # Walk idx_chunks_meta_doc_id, fetch each scoped vector by
+                # primary key and score it with the same L2 metric vec0 uses.
+                # CROSS JOIN pins chunks_meta as the outer loop.
+                cursor = conn.execute(
+                    f"""
+                    SELECT m.chunk_id, vec_distance_l2(v.embedding, ?) AS distance,
+                           m.doc_id, m.modality, m.converted_path, m.locator_json,
+                           m.heading_json, m.doc_name, m.file_type
+                    FROM chunks_meta m
+                    CROSS JOIN chunks_vec v ON v.chunk_id = m.chunk_id
+                    WHERE m.doc_id IN ({placeholders})
+                    ORDER BY distance
+                    LIMIT ?
+                    """,
+                    (self._serialize_vector(query_vec), *doc_ids_filter, k),
+                )
+            else:
+                # sqlite-vec applies post-filtering with JOIN predicates, so
+                # over-fetch as many neighbours as vec0 allows (the full kNN
+                # on stores up to VEC0_MAX_K) and then apply filter + LIMIT.
+                total_chunks = conn.execute("SELECT COUNT(*) FROM chunks_meta").fetchone()[0]
+                cursor = conn.execute(
+                    f"""
+                    SELECT v.chunk_id, v.distance, m.doc_id, m.modality,
+                           m.converted_path, m.locator_json, m.heading_json,
+                           m.doc_name, m.file_type
+                    FROM chunks_vec v
+                    JOIN chunks_meta m ON v.chunk_id = m.chunk_id
+                    WHERE v.embedding MATCH ? AND k = ?
+                      AND m.doc_id IN ({placeholders})
+                    ORDER BY v.distance
+                    LIMIT ?
+                    """,
+                    (
+                        self._serialize_vector(query_vec),
+                        min(total_chunks, VEC0_MAX_K),
+                        *doc_ids_filter,
+                        k,
+                    ),
+                )
         else:
             cursor = conn.execute(
                 """
@@ -311,7 +406,7 @@ class VectorStore:
                 ORDER BY v.distance
                 LIMIT ?
                 """,
-                (self._serialize_vector(query_vec), k, k),
+                (self._serialize_vector(query_vec), min(k, VEC0_MAX_K), k),
             )
 
         results = []
@@ -335,6 +430,76 @@ class VectorStore:
 
         return results
 
+    def knn_search_per_doc(
+        self,
+        query_vec: list[float],
+        doc_ids: list[str],
+        k_per_doc: int = 5,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Return the nearest chunks for each of several documents in one query.
+
+        Scores only the chunks of ``doc_ids`` (like the scoped path of
+        :meth:`knn_search`) and ranks them within each document using a
+        window function, so covering N documents costs one query instead of N.
+
+        Args:
+            query_vec: Query embedding vector (L2-normalized, 768 dims).
+            doc_ids: Documents to cover.
+            k_per_doc: Maximum results per document.
+
+        Returns:
+            Dict mapping doc_id -> result list (same shape as :meth:`knn_search`),
+            containing only documents with at least one chunk.
+        """
+        if k_per_doc <= 0 or not doc_ids:
+            return {}
+
+        conn = self._get_connection()
+        placeholders = ",".join("?" * len(doc_ids))
+        # Score each scoped vector once, then rank within each document.
+        cursor = conn.execute(
+            f"""
+            WITH scored {CTE_AS} (
+                SELECT m.chunk_id, vec_distance_l2(v.embedding, ?) AS distance,
+                       m.doc_id, m.modality, m.converted_path, m.locator_json,
+                       m.heading_json, m.doc_name, m.file_type
+                FROM chunks_meta m
+                CROSS JOIN chunks_vec v ON v.chunk_id = m.chunk_id
+                WHERE m.doc_id IN ({placeholders})
+            )
+            SELECT chunk_id, distance, doc_id, modality, converted_path,
+                   locator_json, heading_json, doc_name, file_type
+            FROM (
+                SELECT *, ROW_NUMBER() OVER (
+                    PARTITION BY doc_id ORDER BY distance, chunk_id
+                ) AS doc_rank
+                FROM scored
+            )
+            WHERE doc_rank <= ?
+            ORDER BY doc_id, doc_rank
+            """,
+            (self._serialize_vector(query_vec), *doc_ids, k_per_doc),
+        )
+
+        grouped: dict[str, list[dict[str, Any]]] = {}
+        for row in cursor:
+            locator = json.loads(row["locator_json"]) if row["locator_json"] else {}
+            heading_path = json.loads(row["heading_json"]) if row["heading_json"] else []
+            grouped.setdefault(row["doc_id"], []).append(
+                {
+                    "chunk_id": row["chunk_id"],
+                    "distance": row["distance"],
+                    "doc_id": row["doc_id"],
+                    "modality": row["modality"],
+                    "converted_path": row["converted_path"],
+                    "locator": locator,
+                    "heading_path": heading_path,
+                    "doc_name": row["doc_name"],
+                    "file_type": row["file_type"],
+                }
+            )
+        return grouped
+
     def get_existing_chunk_ids(self) -> set[str]:
         """Get all chunk IDs currently in the store.
 
@@ -5,12 +5,14 @@ This module provides functionality to expand retrieved video chunks
 evidence bundle with transcript and frame descriptions.
 """
 
-import hashlib
 import re
+import sqlite3
 from pathlib import Path
 from typing import Any, Optional
 
-from ..catalog import ContentCatalog
+from ..catalog_cache import load_catalog_snapshot
+from ..catalog_store import CATALOG_DB_FILENAME, CatalogStore
+from ..scanner import FileEntry
 from .fts import FTSIndex
 from .vector_store import VectorStore
 
@@ -106,6 +108,37 @@ def _safe_resolve(base_dir: Path, path_value: str | Path) -> Optional[Path]:
     return resolved
 
 
+def _lookup_entry_in_store(doc_id: str, config_dir: Path) -> Optional[FileEntry]:
+    """Find a catalog entry by doc_id (or path) via the SQLite catalog's indexes."""
+    db_path = config_dir / CATALOG_DB_FILENAME
+    if not db_path.exists():
+        return None
+    try:
+        with CatalogStore(db_path) as store:
+            return store.get_entry_by_doc_id(doc_id) or store.get_entry(doc_id)
+    except sqlite3.Error:
+        return None
+
+
+def _find_catalog_entry(doc_id: str, base_dir: Path) -> Optional[FileEntry]:
+    """Find a catalog entry by doc_id through the catalog's doc_id index."""
+    catalog = load_catalog_snapshot(base_dir / ".flavia")
+    if catalog is None:
+        return None
+
+    # Same doc_id derivation used by chunker/retrieval:
+    # sha1(f"{base_dir}:{path}:{checksum_sha256}")
+    entry = catalog.get_entry_by_doc_id(doc_id, base_dir)
+    if entry is not None:
+        return entry
+    if doc_id in catalog.files:  # defensive legacy fallback
+        return catalog.files[doc_id]
+    for file_entry in catalog.files.values():
+        if file_entry.checksum_sha256 == doc_id:  # defensive legacy fallback
+            return file_entry
+    return None
+
+
 def _get_all_frames_for_doc(
     doc_id: str,
     base_dir: Path,
@@ -119,23 +152,9 @@ def _get_all_frames_for_doc(
     Returns:
         List of tuples (time_seconds, frame_path) sorted by time.
     """
-    catalog = ContentCatalog.load(base_dir / ".flavia")
-    if catalog is None:
-        return []
-
-    entry = None
-    for file_entry in catalog.files.values():
-        # Match the same doc_id derivation used by chunker/retrieval:
-        # sha1(f"{base_dir}:{path}:{checksum_sha256}")
-        raw = f"{base_dir}:{file_entry.path}:{file_entry.checksum_sha256}"
-        catalog_doc_id = hashlib.sha1(raw.encode()).hexdigest()
-        if (
-            catalog_doc_id == doc_id
-            or file_entry.path == doc_id  # defensive legacy fallback
-            or file_entry.checksum_sha256 == doc_id  # defensive legacy fallback
-        ):
-            entry = file_entry
-            break
+    entry = _lookup_entry_in_store(doc_id, base_dir / ".flavia")
+    if entry is None:
+        entry = _find_catalog_entry(doc_id, base_dir)
 
     if entry is None or not hasattr(entry, "frame_descriptions") or not entry.frame_descriptions:
         return []
@@ -173,8 +192,8 @@ def _get_nearest_frames(
         Tuple of (nearest_before_frame, nearest_after_frame) as dicts,
         or (None, None) if not found within max_distance.
     """
-    nearest_before = None
-    nearest_after = None
+    before_path: Optional[Path] = None
+    after_path: Optional[Path] = None
     min_before_dist = max_distance
     min_after_dist = max_distance
 
@@ -183,15 +202,15 @@ def _get_nearest_frames(
 
         if dist <= 0 and -dist <= min_before_dist:
             min_before_dist = -dist
-            frame_data = _read_frame_from_file(frame_path)
-            if frame_data:
-                nearest_before = frame_data
+            before_path = frame_path
 
         if dist > 0 and dist <= min_after_dist:
             min_after_dist = dist
-            frame_data = _read_frame_from_file(frame_path)
-            if frame_data:
-                nearest_after = frame_data
+            after_path = frame_path
+
+    # Only the two winning frames are read from disk.
+    nearest_before = _read_frame_from_file(before_path) if before_path else None
+    nearest_after = _read_frame_from_file(after_path) if after_path else None
 
     return nearest_before, nearest_after
 
@@ -288,19 +307,69 @@ def _format_evidence_bundle(
     return [item for _, _, item in sortable_items]
 
 
+def _get_frames_from_files(
+    doc_id: str,
+    base_dir: Path,
+    anchor_time: float,
+    window_size: float,
+) -> list[dict[str, Any]]:
+    """Collect frames around ``anchor_time`` by reading frame files from disk.
+
+    Fallback for indexes built before frames were recorded in ``video_frames``.
+    """
+    all_frames = _get_all_frames_for_doc(doc_id, base_dir)
+    frames_in_range = _get_frames_in_range(anchor_time, window_size, all_frames)
+
+    if not frames_in_range:
+        nearest_before, nearest_after = _get_nearest_frames(
+            anchor_time, all_frames, max_distance=30.0
+        )
+        if nearest_before:
+            frames_in_range.append(nearest_before)
+        if nearest_after:
+            frames_in_range.append(nearest_after)
+        frames_in_range.sort(key=lambda f: f["time_start"])
+
+    return frames_in_range
+
+
+def _get_frames_from_index(
+    doc_id: str,
+    fts_index: FTSIndex,
+    anchor_time: float,
+    window_size: float,
+) -> list[dict[str, Any]]:
+    """Collect frames around ``anchor_time`` with range queries on ``video_frames``."""
+    frames_in_range = fts_index.get_video_frames(
+        doc_id, anchor_time - window_size, anchor_time + window_size
+    )
+
+    if not frames_in_range:
+        nearest_before, nearest_after = fts_index.get_nearest_video_frames(
+            doc_id, anchor_time, max_distance=30.0
+        )
+        frames_in_range = [f for f in (nearest_before, nearest_after) if f]
+
+    return frames_in_range
+
+
 def expand_temporal_window(
     anchor_chunk: dict[str, Any],
     base_dir: Path,
     vector_store: VectorStore,
-    _fts_index: FTSIndex,
+    fts_index: FTSIndex,
 ) -> Optional[list[dict[str, Any]]]:
     """Expand a video chunk into a chronological evidence bundle.
 
+    Frames come from the ``video_frames`` table written at index time; the
+    frame files listed in the catalog are only read for documents indexed
+    before that table existed.
+
     Args:
         anchor_chunk: The retrieved video chunk with locator containing timecode.
         base_dir: Vault base directory.
         vector_store: VectorStore instance for retrieving transcript chunks.
-        _fts_index: Reserved for future cross-index expansion strategies.
+        fts_index: FTSIndex instance holding the recorded video frames.
 
     Returns:
         List of formatted bundle items sorted chronologically,
@@ -325,18 +394,10 @@ def expand_temporal_window(
     range_start = anchor_time - window_size
     range_end = anchor_time + window_size
 
-    all_frames = _get_all_frames_for_doc(doc_id, base_dir)
-    frames_in_range = _get_frames_in_range(anchor_time, window_size, all_frames)
-
-    if not frames_in_range:
-        nearest_before, nearest_after = _get_nearest_frames(
-            anchor_time, all_frames, max_distance=30.0
-        )
-        if nearest_before:
-            frames_in_range.append(nearest_before)
-        if nearest_after:
-            frames_in_range.append(nearest_after)
-        frames_in_range.sort(key=lambda f: f["time_start"])
+    if fts_index.video_frames_recorded(doc_id):
+        frames_in_range = _get_frames_from_index(doc_id, fts_index, anchor_time, window_size)
+    else:
+        frames_in_range = _get_frames_from_files(doc_id, base_dir, anchor_time, window_size)
 
     transcript_chunks = vector_store.get_chunks_by_doc_id(doc_id, modalities=["video_transcript"])
 
@@ -377,7 +438,7 @@ def expand_video_chunks(
     results: list[dict[str, Any]],
     base_dir: Path,
     vector_store: VectorStore,
-    _fts_index: FTSIndex,
+    fts_index: FTSIndex,
 ) -> list[dict[str, Any]]:
     """Expand all video temporal chunks in results with evidence bundles.
 
@@ -385,7 +446,7 @@ def expand_video_chunks(
         results: List of retrieved chunks from hybrid retrieval.
         base_dir: Vault base directory.
         vector_store: VectorStore instance (must already be opened as context manager).
-        _fts_index: FTSIndex instance (must already be opened as context manager).
+        fts_index: FTSIndex instance (must already be opened as context manager).
 
     Returns:
         Modified results with temporal_bundle field added to video chunks.
@@ -393,7 +454,7 @@ def expand_video_chunks(
     for result in results:
         modality = result.get("modality", "")
         if modality in ("video_transcript", "video_frame"):
-            bundle = expand_temporal_window(result, base_dir, vector_store, _fts_index)
+            bundle = expand_temporal_window(result, base_dir, vector_store, fts_index)
             if bundle:
                 result["temporal_bundle"] = bundle
 
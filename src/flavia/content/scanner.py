@@ -1,6 +1,9 @@
 """File scanner for content cataloging."""
 
 import hashlib
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -198,6 +201,9 @@ class FileEntry:
     indexed_at: str  # ISO 8601 — when this entry was cataloged
     checksum_sha256: str  # SHA-256 hash of file content
     status: str = "current"  # "current", "new", "modified", "missing"
+    mtime_ns: Optional[int] = None  # st_mtime_ns when the checksum was taken
+    inode: Optional[int] = None  # st_ino when the checksum was taken
+    doc_id: Optional[str] = None  # Retrieval doc_id, set by ContentCatalog
     converted_to: Optional[str] = None  # Path to converted text version
     frame_descriptions: list[str] = field(default_factory=list)
     summary: Optional[str] = None
@@ -225,6 +231,12 @@ class FileEntry:
             "checksum_sha256": self.checksum_sha256,
             "status": self.status,
         }
+        if self.mtime_ns is not None:
+            d["mtime_ns"] = self.mtime_ns
+        if self.inode is not None:
+            d["inode"] = self.inode
+        if self.doc_id:
+            d["doc_id"] = self.doc_id
         if self.converted_to:
             d["converted_to"] = self.converted_to
         if self.frame_descriptions:
@@ -261,6 +273,9 @@ class FileEntry:
             indexed_at=data["indexed_at"],
             checksum_sha256=data["checksum_sha256"],
             status=data.get("status", "current"),
+            mtime_ns=data.get("mtime_ns"),
+            inode=data.get("inode"),
+            doc_id=data.get("doc_id"),
             converted_to=data.get("converted_to"),
             frame_descriptions=data.get("frame_descriptions", []),
             summary=data.get("summary"),
@@ -309,8 +324,27 @@ class DirectoryNode:
         )
 
 
+# Threads used to walk, stat and hash files during a scan (os.scandir and
+# hashlib release the GIL).
+DEFAULT_SCAN_WORKERS = 4
+
+# The parallel walk expands at most this many directory levels on the calling
+# thread while looking for enough subtrees to hand to the pool.
+_MAX_SPLIT_DEPTH = 3
+
+
 class FileScanner:
-    """Scans a directory tree and collects file metadata."""
+    """Scans a directory tree and collects file metadata.
+
+    The tree is walked with ``os.scandir``, one subtree per task on a pool of
+    ``workers`` threads, and files are then stat'ed and hashed on the same
+    pool; the resulting tree and file order do not depend on the worker count.
+
+    When ``previous_entries`` (keyed by relative path) is given, a file whose
+    size, ``st_mtime_ns`` and inode all match its previous entry reuses that
+    entry's checksum instead of re-reading the file. ``verify=True`` disables
+    this fast path and hashes every file.
+    """
 
     def __init__(
         self,
@@ -318,11 +352,20 @@ class FileScanner:
         ignore_dirs: Optional[set[str]] = None,
         ignore_files: Optional[set[str]] = None,
         ignore_patterns: Optional[list[str]] = None,
+        previous_entries: Optional[dict[str, FileEntry]] = None,
+        verify: bool = False,
+        workers: Optional[int] = None,
     ):
         self.base_dir = base_dir.resolve()
         self.ignore_dirs = ignore_dirs or DEFAULT_IGNORE_DIRS
         self.ignore_files = ignore_files or DEFAULT_IGNORE_FILES
         self.ignore_patterns = ignore_patterns or []
+        self.previous_entries = previous_entries or {}
+        self.verify = verify
+        self.workers = max(1, workers if workers is not None else DEFAULT_SCAN_WORKERS)
+        self.checksums_computed = 0
+        self.checksums_reused = 0
+        self._stats_lock = threading.Lock()
 
     def scan(self) -> tuple[list[FileEntry], DirectoryNode]:
         """
@@ -331,8 +374,24 @@ class FileScanner:
         Returns:
             Tuple of (list of FileEntry, root DirectoryNode)
         """
+        if self.workers > 1:
+            with ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="flavia-scan"
+            ) as pool:
+                root_node, pending = self._walk(pool)
+                paths = [path for _, path in pending]
+                results = list(pool.map(self._create_file_entry, paths))
+        else:
+            root_node, pending = self._walk()
+            results = [self._create_file_entry(path) for _, path in pending]
+
         files: list[FileEntry] = []
-        root_node = self._build_directory_tree(self.base_dir, files)
+        own_counts: dict[int, int] = {}
+        for (node, _), file_entry in zip(pending, results):
+            if file_entry:
+                files.append(file_entry)
+                own_counts[id(node)] = own_counts.get(id(node), 0) + 1
+        self._assign_file_counts(root_node, own_counts)
         return files, root_node
 
     def scan_file(self, file_path: Path) -> Optional[FileEntry]:
@@ -341,12 +400,133 @@ class FileScanner:
             return None
         return self._create_file_entry(file_path)
 
+    def scan_directory(self, directory: Path) -> list[FileEntry]:
+        """Scan the files of one subdirectory of the base directory, like :meth:`scan`."""
+        pending: list[tuple[DirectoryNode, Path]] = []
+        self._build_directory_tree(directory, pending)
+        entries = [self._create_file_entry(path) for _, path in pending]
+        return [entry for entry in entries if entry]
+
+    def snapshot(self) -> dict[str, tuple[int, int, int]]:
+        """
+        Return the stat signature of every file without hashing anything.
+
+        Returns:
+            Dict mapping relative path -> (st_mtime_ns, st_size, st_ino).
+        """
+        if self.workers > 1:
+            with ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="flavia-scan"
+            ) as pool:
+                _, pending = self._walk(pool)
+        else:
+            _, pending = self._walk()
+        signatures: dict[str, tuple[int, int, int]] = {}
+        for _, path in pending:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            rel_path = str(path.relative_to(self.base_dir))
+            signatures[rel_path] = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        return signatures
+
+    def is_ignored(self, rel_path: str) -> bool:
+        """Return True if a path relative to the base directory is excluded from scans."""
+        parts = Path(rel_path).parts
+        if not parts:
+            return False
+        for directory in parts[:-1]:
+            if directory in self.ignore_dirs or self._matches_ignore_pattern(directory):
+                return True
+        name = parts[-1]
+        if name in self.ignore_files or name in self.ignore_dirs:
+            return True
+        return self._matches_ignore_pattern(name)
+
+    def _walk(
+        self, pool: Optional[ThreadPoolExecutor] = None
+    ) -> tuple[DirectoryNode, list[tuple[DirectoryNode, Path]]]:
+        """Walk the base directory, splitting it into subtrees walked on ``pool``.
+
+        The calling thread lists the top levels until there are a few
+        subtrees per worker (or ``_MAX_SPLIT_DEPTH`` is reached); each
+        subtree is then walked serially by one pool thread and the results
+        are spliced back in walk order. Pool threads never wait on each
+        other, so the pool cannot deadlock.
+        """
+        pending: list[tuple[DirectoryNode, Path]] = []
+        subtrees: dict[Path, Future] = {}
+        if pool is not None:
+            frontier = [self.base_dir]
+            for _ in range(_MAX_SPLIT_DEPTH):
+                children = [
+                    directory / name
+                    for directory in frontier
+                    for name in (self._list_directory(directory) or ([], []))[0]
+                ]
+                if not children:
+                    break
+                frontier = children
+                if len(frontier) >= self.workers * 4:
+                    break
+            if frontier != [self.base_dir]:
+                subtrees = {
+                    directory: pool.submit(self._walk_subtree, directory) for directory in frontier
+                }
+        root_node = self._build_directory_tree(self.base_dir, pending, subtrees)
+        return root_node, pending
+
+    def _walk_subtree(
+        self, directory: Path
+    ) -> tuple[DirectoryNode, list[tuple[DirectoryNode, Path]]]:
+        pending: list[tuple[DirectoryNode, Path]] = []
+        return self._build_directory_tree(directory, pending), pending
+
+    def _list_directory(self, directory: Path) -> Optional[tuple[list[str], list[str]]]:
+        """Return the (subdirectory, file) names to scan in ``directory``, sorted by name.
+
+        Returns None when the directory cannot be listed.
+        """
+        try:
+            with os.scandir(directory) as it:
+                # DirEntry caches the file type from the directory listing, so
+                # classifying entries needs no extra stat on most filesystems.
+                listed = [(entry.name, self._entry_is_dir(entry), entry) for entry in it]
+        except (PermissionError, OSError):
+            return None
+
+        listed.sort(key=lambda item: (not item[1], item[0].lower()))
+        dirs: list[str] = []
+        files: list[str] = []
+        for name, is_dir, entry in listed:
+            if is_dir:
+                if name in self.ignore_dirs:
+                    continue
+                if self._matches_ignore_pattern(name):
+                    continue
+                dirs.append(name)
+            elif self._entry_is_file(entry):
+                if name in self.ignore_files:
+                    continue
+                if self._matches_ignore_pattern(name):
+                    continue
+                files.append(name)
+        return dirs, files
+
     def _build_directory_tree(
         self,
         directory: Path,
-        files: list[FileEntry],
+        pending: list[tuple[DirectoryNode, Path]],
+        subtrees: Optional[dict[Path, Future]] = None,
     ) -> DirectoryNode:
-        """Recursively build directory tree and collect file entries."""
+        """Recursively build the directory tree and queue files for entry creation.
+
+        Files are appended to ``pending`` in the same order the entries are
+        returned by :meth:`scan` (subdirectories first, then files, by name).
+        Subdirectories found in ``subtrees`` were walked on the pool; their
+        results are spliced in instead of recursing.
+        """
         rel_path = str(directory.relative_to(self.base_dir))
         if rel_path == ".":
             rel_path = "."
@@ -356,34 +536,50 @@ class FileScanner:
             name=directory.name or str(self.base_dir),
         )
 
-        try:
-            entries = sorted(directory.iterdir(), key=lambda e: (not e.is_dir(), e.name.lower()))
-        except PermissionError:
+        listing = self._list_directory(directory)
+        if listing is None:
             return node
 
-        file_count = 0
-        for entry in entries:
-            if entry.is_dir():
-                if entry.name in self.ignore_dirs:
-                    continue
-                if self._matches_ignore_pattern(entry.name):
-                    continue
-                child_node = self._build_directory_tree(entry, files)
-                node.children.append(child_node)
-                file_count += child_node.file_count
-            elif entry.is_file():
-                if entry.name in self.ignore_files:
-                    continue
-                if self._matches_ignore_pattern(entry.name):
-                    continue
-                file_entry = self._create_file_entry(entry)
-                if file_entry:
-                    files.append(file_entry)
-                    file_count += 1
+        dirs, files = listing
+        for name in dirs:
+            child = directory / name
+            future = subtrees.get(child) if subtrees else None
+            if future is not None:
+                child_node, child_pending = future.result()
+                pending.extend(child_pending)
+            else:
+                child_node = self._build_directory_tree(child, pending, subtrees)
+            node.children.append(child_node)
+        for name in files:
+            pending.append((node, directory / name))
 
-        node.file_count = file_count
         return node
 
+    @staticmethod
+    def _entry_is_dir(entry: os.DirEntry) -> bool:
+        """Return True for directories (following symlinks), False on errors."""
+        try:
+            return entry.is_dir()
+        except OSError:
+            return False
+
+    @staticmethod
+    def _entry_is_file(entry: os.DirEntry) -> bool:
+        """Return True for regular files (following symlinks), False on errors."""
+        try:
+            return entry.is_file()
+        except OSError:
+            return False
+
+    @classmethod
+    def _assign_file_counts(cls, node: DirectoryNode, own_counts: dict[int, int]) -> int:
+        """Set ``file_count`` on every node (own files plus descendants)."""
+        total = own_counts.get(id(node), 0)
+        for child in node.children:
+            total += cls._assign_file_counts(child, own_counts)
+        node.file_count = total
+        return total
+
     def _create_file_entry(self, file_path: Path) -> Optional[FileEntry]:
         """Create a FileEntry for a single file."""
         try:
@@ -400,8 +596,15 @@ class FileScanner:
             ).isoformat()
             modified_at = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc).isoformat()
 
-            # Compute checksum
-            checksum = self._compute_checksum(file_path)
+            checksum = self._reusable_checksum(rel_path, stat)
+            reused = checksum is not None
+            if checksum is None:
+                checksum = self._compute_checksum(file_path)
+            with self._stats_lock:
+                if reused:
+                    self.checksums_reused += 1
+                else:
+                    self.checksums_computed += 1
 
             return FileEntry(
                 path=rel_path,
@@ -415,10 +618,32 @@ class FileScanner:
                 indexed_at=now,
                 checksum_sha256=checksum,
                 status="current",
+                mtime_ns=stat.st_mtime_ns,
+                inode=stat.st_ino,
             )
         except (PermissionError, OSError):
             return None
 
+    def _reusable_checksum(self, rel_path: str, stat: os.stat_result) -> Optional[str]:
+        """Return the previous checksum if the file's stat signature is unchanged."""
+        if self.verify:
+            return None
+        previous = self.previous_entries.get(rel_path)
+        if (
+            previous is None
+            or not previous.checksum_sha256
+            or previous.mtime_ns is None
+            or previous.inode is None
+        ):
+            return None
+        if (
+            previous.size_bytes != stat.st_size
+            or previous.mtime_ns != stat.st_mtime_ns
+            or previous.inode != stat.st_ino
+        ):
+            return None
+        return previous.checksum_sha256
+
     @staticmethod
     def _classify_file(ext: str) -> tuple[str, str]:
         """Classify a file by its extension. Returns (file_type, category)."""
@@ -491,7 +716,7 @@ class FileScanner:
         return "other", ext.lstrip(".") if ext else "unknown"
 
     @staticmethod
-    def _compute_checksum(file_path: Path, chunk_size: int = 8192) -> str:
+    def _compute_checksum(file_path: Path, chunk_size: int = 1024 * 1024) -> str:
         """Compute SHA-256 checksum of a file."""
         sha256 = hashlib.sha256()
         try:
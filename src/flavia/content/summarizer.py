@@ -2,24 +2,25 @@
 
 import logging
 import re
+import threading
 from pathlib import Path
 from typing import Any, Optional
 
 from .scanner import FileEntry
 
 logger = logging.getLogger(__name__)
-_LAST_LLM_CALL_INFO: dict[str, Any] = {}
+# Per-thread, so concurrent summarization workers don't overwrite each other.
+_LAST_LLM_CALL_INFO = threading.local()
 
 
 def get_last_llm_call_info() -> dict[str, Any]:
-    """Return metadata from the most recent LLM summarization call."""
-    return dict(_LAST_LLM_CALL_INFO)
+    """Return metadata from the most recent LLM summarization call in this thread."""
+    return dict(getattr(_LAST_LLM_CALL_INFO, "info", {}))
 
 
 def _set_last_llm_call_info(**kwargs: Any) -> None:
-    """Store metadata for the most recent LLM summarization call."""
-    _LAST_LLM_CALL_INFO.clear()
-    _LAST_LLM_CALL_INFO.update(kwargs)
+    """Store metadata for the most recent LLM summarization call in this thread."""
+    _LAST_LLM_CALL_INFO.info = dict(kwargs)
 
 
 SUMMARIZE_FILE_PROMPT = """Summarize the following document in 1-3 concise sentences.
@@ -67,6 +68,7 @@ def summarize_file(
     headers: Optional[dict[str, str]] = None,
     timeout: float = 30.0,
     connect_timeout: float = 10.0,
+    client: Any = None,
 ) -> Optional[str]:
     """
     Generate a summary for a single file using an LLM.
@@ -81,6 +83,7 @@ def summarize_file(
         headers: Optional additional HTTP headers.
         timeout: Request timeout in seconds (default: 30.0).
         connect_timeout: Connection timeout in seconds (default: 10.0).
+        client: Reusable client from ``create_llm_client`` (default: new client).
 
     Returns:
         Summary string, or None on failure.
@@ -118,7 +121,9 @@ def summarize_file(
         content=truncated,
     )
 
-    return _call_llm(prompt, api_key, api_base_url, model, headers, timeout, connect_timeout)
+    return _call_llm(
+        prompt, api_key, api_base_url, model, headers, timeout, connect_timeout, client
+    )
 
 
 def summarize_file_with_quality(
@@ -131,10 +136,13 @@ def summarize_file_with_quality(
     headers: Optional[dict[str, str]] = None,
     timeout: float = 30.0,
     connect_timeout: float = 10.0,
+    client: Any = None,
 ) -> tuple[Optional[str], Optional[str]]:
     """
     Generate a summary and extraction quality assessment for a single file.
 
+    Takes the same arguments as :func:`summarize_file`.
+
     Returns:
         Tuple of (summary, quality) where quality is "good", "partial", "poor", or None.
     """
@@ -167,7 +175,7 @@ def summarize_file_with_quality(
         content=truncated,
     )
 
-    raw = _call_llm(prompt, api_key, api_base_url, model, headers, timeout, connect_timeout)
+    raw = _call_llm(prompt, api_key, api_base_url, model, headers, timeout, connect_timeout, client)
     if not raw:
         return None, None
 
@@ -236,6 +244,53 @@ def summarize_directory(
     return _call_llm(prompt, api_key, api_base_url, model, headers, timeout, connect_timeout)
 
 
+def create_llm_client(
+    api_key: str,
+    api_base_url: str,
+    headers: Optional[dict[str, str]] = None,
+    timeout: float = 30.0,
+    connect_timeout: float = 10.0,
+) -> Any:
+    """
+    Create an OpenAI-compatible client for summarization calls.
+
+    The client (and its HTTP connection pool) is thread-safe and can be
+    passed as ``client=`` to many summarize calls.
+
+    Raises:
+        ImportError: If openai/httpx are not installed.
+    """
+    import httpx
+    from openai import OpenAI
+
+    timeout_config = httpx.Timeout(timeout, connect=connect_timeout)
+    client_kwargs: dict[str, Any] = {
+        "api_key": api_key,
+        "base_url": api_base_url,
+        "timeout": timeout_config,
+    }
+    if headers:
+        client_kwargs["default_headers"] = headers
+
+    try:
+        return OpenAI(**client_kwargs)
+    except TypeError as exc:
+        # Compatibility fallback for OpenAI SDK/httpx version mismatch.
+        # Some versions have incompatible kwargs (e.g., 'proxies' or 'default_headers').
+        exc_str = str(exc).lower()
+        if "proxies" in exc_str or "default_headers" in exc_str or "timeout" in exc_str:
+            logger.debug(f"Using OpenAI SDK compatibility fallback due to: {exc}")
+            openai_kwargs = {"api_key": api_key, "base_url": api_base_url}
+            return OpenAI(
+                **openai_kwargs,
+                http_client=httpx.Client(
+                    timeout=timeout_config,
+                    headers=headers if headers else None,
+                ),
+            )
+        raise
+
+
 def _call_llm(
     prompt: str,
     api_key: str,
@@ -244,6 +299,7 @@ def _call_llm(
     headers: Optional[dict[str, str]] = None,
     timeout: float = 30.0,
     connect_timeout: float = 10.0,
+    client: Any = None,
 ) -> Optional[str]:
     """
     Make a simple LLM call and return the response text.
@@ -256,10 +312,12 @@ def _call_llm(
         headers: Optional HTTP headers.
         timeout: Request timeout in seconds.
         connect_timeout: Connection timeout in seconds.
+        client: Reusable client from ``create_llm_client`` (default: new client).
 
     Returns:
         Response text, or None on failure.
     """
+
     def _extract_response_text(response: Any) -> Optional[str]:
         """Extract text from chat completion response across provider variants."""
         choices = getattr(response, "choices", None)
@@ -300,7 +358,6 @@ def _call_llm(
     try:
         import httpx
         import openai as openai_module
-        from openai import OpenAI
 
         api_connection_error = getattr(openai_module, "APIConnectionError", None)
         api_timeout_error = getattr(openai_module, "APITimeoutError", None)
@@ -309,33 +366,8 @@ def _call_llm(
             err for err in (api_timeout_error, api_connection_error) if isinstance(err, type)
         )
 
-        timeout_config = httpx.Timeout(timeout, connect=connect_timeout)
-        client_kwargs: dict[str, Any] = {
-            "api_key": api_key,
-            "base_url": api_base_url,
-            "timeout": timeout_config,
-        }
-        if headers:
-            client_kwargs["default_headers"] = headers
-
-        try:
-            client = OpenAI(**client_kwargs)
-        except TypeError as exc:
-            # Compatibility fallback for OpenAI SDK/httpx version mismatch.
-            # Some versions have incompatible kwargs (e.g., 'proxies' or 'default_headers').
-            exc_str = str(exc).lower()
-            if "proxies" in exc_str or "default_headers" in exc_str or "timeout" in exc_str:
-                logger.debug(f"Using OpenAI SDK compatibility fallback due to: {exc}")
-                openai_kwargs = {"api_key": api_key, "base_url": api_base_url}
-                client = OpenAI(
-                    **openai_kwargs,
-                    http_client=httpx.Client(
-                        timeout=timeout_config,
-                        headers=headers if headers else None,
-                    ),
-                )
-            else:
-                raise
+        if client is None:
+            client = create_llm_client(api_key, api_base_url, headers, timeout, connect_timeout)
 
         def _create_completion(request_prompt: str, max_tokens: int, temperature: float) -> Any:
             try:
@@ -388,8 +420,7 @@ def _call_llm(
         )
 
         retry_prompt = (
-            prompt
-            + "\n\nIMPORTANT: Return ONLY the final answer text. "
+            prompt + "\n\nIMPORTANT: Return ONLY the final answer text. "
             "Do not include reasoning/thinking."
         )
         retry_response = _create_completion(retry_prompt, max_tokens=800, temperature=0.0)
@@ -0,0 +1,301 @@
+"""Concurrent, rate-limited batch summarization of catalog entries.
+
+``SummarizationEngine`` summarizes many catalog entries with ``concurrency``
+parallel LLM requests over one shared client (and HTTP connection pool).
+Requests and estimated tokens are metered by token buckets derived from the
+provider's ``requests_per_minute`` / ``tokens_per_minute``; an HTTP 429
+pauses every worker before the request is retried. A ``checkpoint``
+callback (usually ``catalog.save``) runs periodically so a crash keeps the
+summaries generated so far.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from . import summarizer
+from .scanner import FileEntry
+
+logger = logging.getLogger(__name__)
+
+# Completion budget per summary request (see summarizer._call_llm).
+SUMMARY_COMPLETION_TOKENS = 200
+
+# Tolerance for float refill drift; without it a wait shorter than the
+# clock's resolution would never make progress.
+_EPSILON = 1e-9
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at ``rate_per_minute``.
+
+    ``acquire(n)`` blocks until ``n`` tokens are available; requests larger
+    than the bucket capacity are clamped to it so they cannot block forever.
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else float(rate_per_minute)
+        self._tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - max(self._updated, self._paused_until))
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = max(now, self._updated)
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """Take ``amount`` tokens, waiting if needed. Returns seconds waited."""
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if now >= self._paused_until and self._tokens >= amount - _EPSILON:
+                    self._tokens = max(0.0, self._tokens - amount)
+                    return waited
+                delay = max(
+                    self._paused_until - now,
+                    (amount - self._tokens) / self.rate if self.rate > 0 else 1.0,
+                )
+            self._sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for ``seconds`` (e.g. after an HTTP 429)."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens = 0.0
+            self._paused_until = max(self._paused_until, now + seconds)
+
+
+@dataclass
+class SummaryResult:
+    """Outcome of summarizing one catalog entry."""
+
+    path: str
+    summary: Optional[str] = None
+    quality: Optional[str] = None
+    error: Optional[str] = None
+    duration_seconds: float = 0.0
+
+
+class SummarizationEngine:
+    """Summarize catalog entries concurrently within provider rate limits.
+
+    Usage:
+        engine = SummarizationEngine.from_provider(base_dir, provider, model_id)
+        stats = engine.run(catalog.get_files_needing_summary(),
+                           checkpoint=lambda: catalog.save(config_dir))
+
+    Entries are updated in place (``summary``, ``extraction_quality``) from
+    the calling thread, so ``checkpoint`` and ``on_result`` never race with
+    the workers.
+    """
+
+    def __init__(
+        self,
+        base_dir: Path,
+        api_key: str,
+        api_base_url: str,
+        model: str,
+        headers: Optional[dict[str, str]] = None,
+        concurrency: int = 4,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_chars: int = 4000,
+        checkpoint_interval: float = 60.0,
+        max_rate_limit_retries: int = 3,
+        rate_limit_backoff: float = 10.0,
+    ):
+        self.base_dir = base_dir
+        self.api_key = api_key
+        self.api_base_url = api_base_url
+        self.model = model
+        self.headers = headers or None
+        self.concurrency = max(1, concurrency)
+        self.max_chars = max_chars
+        self.checkpoint_interval = checkpoint_interval
+        self.max_rate_limit_retries = max_rate_limit_retries
+        self.rate_limit_backoff = rate_limit_backoff
+        self.request_bucket = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.rate_limited = 0
+        self._client: Any = None
+        self._client_lock = threading.Lock()
+
+    @classmethod
+    def from_provider(
+        cls, base_dir: Path, provider: Any, model: str, concurrency: int = 4, **kwargs: Any
+    ) -> "SummarizationEngine":
+        """Build an engine using a ProviderConfig's credentials and rate limits."""
+        return cls(
+            base_dir,
+            api_key=provider.api_key,
+            api_base_url=provider.api_base_url,
+            model=model,
+            headers=provider.headers or None,
+            concurrency=concurrency,
+            requests_per_minute=getattr(provider, "requests_per_minute", None),
+            tokens_per_minute=getattr(provider, "tokens_per_minute", None),
+            **kwargs,
+        )
+
+    def _get_client(self) -> Any:
+        """Create the shared client once; None falls back to per-call clients."""
+        with self._client_lock:
+            if self._client is None:
+                try:
+                    self._client = summarizer.create_llm_client(
+                        self.api_key, self.api_base_url, self.headers
+                    )
+                except Exception as exc:
+                    logger.debug(f"Shared summarization client unavailable: {exc}")
+                    return None
+            return self._client
+
+    def _estimate_tokens(self, entry: FileEntry) -> float:
+        # ~4 characters per token for the (truncated) document plus prompt.
+        chars = min(entry.size_bytes or self.max_chars, self.max_chars) + 600
+        return chars / 4 + SUMMARY_COMPLETION_TOKENS
+
+    def _summarize_one(self, entry: FileEntry) -> SummaryResult:
+        started = time.perf_counter()
+        client = self._get_client()
+        attempt = 0
+        while True:
+            if self.request_bucket is not None:
+                self.request_bucket.acquire(1)
+            if self.token_bucket is not None:
+                self.token_bucket.acquire(self._estimate_tokens(entry))
+
+            summarizer._set_last_llm_call_info()
+            summary, quality = summarizer.summarize_file_with_quality(
+                entry,
+                self.base_dir,
+                api_key=self.api_key,
+                api_base_url=self.api_base_url,
+                model=self.model,
+                max_chars=self.max_chars,
+                headers=self.headers,
+                client=client,
+            )
+            if summary or quality:
+                return SummaryResult(
+                    entry.path, summary, quality, duration_seconds=time.perf_counter() - started
+                )
+
+            call_info = summarizer.get_last_llm_call_info()
+            if str(call_info.get("api_status")) != "429" or attempt == self.max_rate_limit_retries:
+                return SummaryResult(
+                    entry.path,
+                    error=call_info.get("status"),
+                    duration_seconds=time.perf_counter() - started,
+                )
+            # Rate limited: stop every worker for a while, then retry.
+            backoff = self.rate_limit_backoff * (2**attempt)
+            self.rate_limited += 1
+            logger.warning(f"Rate limited by provider; pausing summaries for {backoff:.0f}s")
+            for bucket in (self.request_bucket, self.token_bucket):
+                if bucket is not None:
+                    bucket.pause(backoff)
+            if self.request_bucket is None and self.token_bucket is None:
+                time.sleep(backoff)
+            attempt += 1
+
+    def run(
+        self,
+        entries: list[FileEntry],
+        on_result: Optional[Callable[[SummaryResult], None]] = None,
+        checkpoint: Optional[Callable[[], None]] = None,
+    ) -> dict[str, Any]:
+        """Summarize ``entries`` and return throughput statistics.
+
+        Args:
+            entries: Entries needing a summary (updated in place).
+            on_result: Called in the calling thread for every finished entry.
+            checkpoint: Called every ``checkpoint_interval`` seconds while
+                new summaries exist, and once at the end.
+
+        Returns:
+            Dict with ``summarized``, ``failed``, ``rate_limited``,
+            ``duration_seconds`` and ``files_per_minute``.
+        """
+        started = time.perf_counter()
+        last_checkpoint = started
+        unsaved = 0
+        summarized = 0
+        failed = 0
+        remaining = iter(entries)
+        exhausted = False
+        in_flight: dict[Future, FileEntry] = {}
+
+        with ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="flavia-summary"
+        ) as pool:
+            try:
+                while not exhausted or in_flight:
+                    while not exhausted and len(in_flight) < self.concurrency:
+                        entry = next(remaining, None)
+                        if entry is None:
+                            exhausted = True
+                            break
+                        in_flight[pool.submit(self._summarize_one, entry)] = entry
+                    if not in_flight:
+                        break
+                    done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                    for future in done:
+                        entry = in_flight.pop(future)
+                        try:
+                            result = future.result()
+                        except Exception as exc:
+                            result = SummaryResult(entry.path, error=str(exc))
+                        if result.summary:
+                            entry.summary = result.summary
+                            summarized += 1
+                            unsaved += 1
+                        else:
+                            failed += 1
+                        if result.quality:
+                            entry.extraction_quality = result.quality
+                        if on_result is not None:
+                            on_result(result)
+
+                    now = time.perf_counter()
+                    if checkpoint and unsaved and now - last_checkpoint >= self.checkpoint_interval:
+                        checkpoint()
+                        unsaved = 0
+                        last_checkpoint = now
+            except BaseException:
+                for future in in_flight:
+                    future.cancel()
+                raise
+            finally:
+                if checkpoint and unsaved:
+                    checkpoint()
+
+        duration = time.perf_counter() - started
+        processed = summarized + failed
+        return {
+            "summarized": summarized,
+            "failed": failed,
+            "rate_limited": self.rate_limited,
+            "duration_seconds": duration,
+            "files_per_minute": processed / duration * 60 if duration > 0 else 0.0,
+        }
@@ -0,0 +1,340 @@
+"""Vault watcher — keeps the catalog and retrieval index fresh continuously.
+
+``VaultWatcher`` feeds changed paths into a debounced ``ChangeQueue``. When
+the optional ``watchdog`` package is installed, paths come from filesystem
+events (inotify, FSEvents, ...); otherwise the vault's stat signatures
+(mtime, size, inode; no hashing) are polled every ``interval`` seconds.
+Either way the first poll diffs the vault against the catalog, so changes
+made while the watcher was stopped are picked up. Once the vault has been
+quiet for ``debounce`` seconds, the batch is applied with
+``ContentCatalog.update_paths()``: only those files are hashed, converted
+and (re)indexed, so a running bot never competes with a full rescan.
+"""
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from rich.console import Console
+
+from flavia.config import Settings
+
+from .catalog import ContentCatalog
+from .scanner import FileScanner
+
+logger = logging.getLogger(__name__)
+
+# Seconds between queue checks when changes arrive as filesystem events.
+EVENT_TICK = 0.5
+
+
+class ChangeQueue:
+    """Thread-safe set of changed paths, released after a quiet period.
+
+    A batch becomes ready ``debounce`` seconds after the last change, or
+    ``max_delay`` seconds after its first change when the vault never goes
+    quiet (e.g. a long copy).
+    """
+
+    def __init__(self, debounce: float = 1.5, max_delay: Optional[float] = None):
+        self.debounce = max(0.0, debounce)
+        self.max_delay = max_delay if max_delay is not None else max(30.0, self.debounce * 10)
+        self._paths: set[str] = set()
+        self._first_change: Optional[float] = None
+        self._last_change: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def add(self, paths: Iterable[str], now: Optional[float] = None) -> None:
+        """Queue changed paths (relative to the vault base directory)."""
+        paths = set(paths)
+        if not paths:
+            return
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._paths.update(paths)
+            if self._first_change is None:
+                self._first_change = now
+            self._last_change = now
+
+    def pop_ready(self, now: Optional[float] = None) -> list[str]:
+        """Return and clear the queued paths if the batch is ready, else []."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if not self._paths:
+                return []
+            quiet = now - self._last_change >= self.debounce
+            overdue = now - self._first_change >= self.max_delay
+            if not (quiet or overdue):
+                return []
+            paths = sorted(self._paths)
+            self._paths.clear()
+            self._first_change = None
+            self._last_change = None
+            return paths
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._paths)
+
+
+class VaultWatcher:
+    """Watch a vault and incrementally update its catalog and index.
+
+    Usage:
+        watcher = VaultWatcher(base_dir, settings)
+        watcher.start()  # background thread
+        ...
+        watcher.stop()
+
+    or ``watcher.run()`` to block in the foreground until interrupted.
+    """
+
+    def __init__(
+        self,
+        base_dir: Path,
+        settings: Settings,
+        convert: bool = True,
+        index: bool = True,
+        interval: Optional[float] = None,
+        debounce: Optional[float] = None,
+        console: Optional[Console] = None,
+    ):
+        self.base_dir = Path(base_dir).resolve()
+        self.config_dir = self.base_dir / ".flavia"
+        self.settings = settings
+        self.convert = convert
+        self.index = index
+        self.interval = interval if interval is not None else settings.watch_interval
+        self.queue = ChangeQueue(debounce if debounce is not None else settings.watch_debounce)
+        self.console = console or Console(quiet=True)
+        self.batches_processed = 0
+        self._snapshot: Optional[dict[str, tuple[int, int, int]]] = None
+        self._ignore_patterns: list[str] = []
+        self._observer: Optional[Any] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Change detection
+    # ------------------------------------------------------------------
+
+    def poll(self) -> list[str]:
+        """Diff the vault's stat signatures against the previous poll.
+
+        The first poll compares against the signatures stored in the
+        catalog, so changes made while the watcher was not running are
+        picked up too.
+
+        Returns:
+            Sorted relative paths that were added, changed or removed.
+        """
+        previous = self._snapshot
+        if previous is None:
+            previous = {}
+            catalog = ContentCatalog.load(self.config_dir)
+            if catalog is not None:
+                self._ignore_patterns = catalog.settings.get("ignored_patterns", [])
+                for path, entry in catalog.files.items():
+                    if entry.source_type != "local" or entry.status == "missing":
+                        continue
+                    previous[path] = (entry.mtime_ns, entry.size_bytes, entry.inode)
+
+        scanner = FileScanner(self.base_dir, ignore_patterns=self._ignore_patterns)
+        current = scanner.snapshot()
+        self._snapshot = current
+
+        changed = {path for path, sig in current.items() if previous.get(path) != sig}
+        changed.update(path for path in previous if path not in current)
+        return sorted(changed)
+
+    def on_fs_event(self, src_path: str, dest_path: Optional[str] = None) -> None:
+        """Queue the vault paths touched by one filesystem event.
+
+        Called from the ``watchdog`` observer thread. Paths outside the vault
+        or excluded from scans (``.flavia/``, ``.converted/``, ignored
+        patterns) are dropped.
+        """
+        scanner = FileScanner(self.base_dir, ignore_patterns=self._ignore_patterns)
+        changed = []
+        for raw in (src_path, dest_path):
+            if not raw:
+                continue
+            try:
+                rel_path = str(Path(raw).resolve().relative_to(self.base_dir))
+            except ValueError:
+                continue
+            if rel_path not in ("", ".") and not scanner.is_ignored(rel_path):
+                changed.append(rel_path)
+        self.queue.add(changed)
+
+    def _start_observer(self) -> bool:
+        """Start a ``watchdog`` observer feeding :meth:`on_fs_event`, if installed."""
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            return False
+
+        watcher = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event) -> None:
+                if event.event_type in ("opened", "closed_no_write"):
+                    return
+                # Directory "modified" events only echo changes to their children.
+                if event.is_directory and event.event_type == "modified":
+                    return
+                watcher.on_fs_event(event.src_path, getattr(event, "dest_path", None) or None)
+
+        try:
+            observer = Observer()
+            observer.schedule(_Handler(), str(self.base_dir), recursive=True)
+            observer.start()
+        except OSError as e:
+            logger.warning("Filesystem events unavailable (%s); polling the vault instead", e)
+            return False
+        self._observer = observer
+        return True
+
+    def _stop_observer(self) -> None:
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
+    # ------------------------------------------------------------------
+    # Processing
+    # ------------------------------------------------------------------
+
+    def process(self, paths: list[str]) -> dict[str, Any]:
+        """Apply one batch of changed paths to the catalog and index.
+
+        Returns:
+            Dict with the ``update_paths`` counts plus ``converted`` and
+            ``indexed`` document counts.
+        """
+        catalog = ContentCatalog.load(self.config_dir)
+        if catalog is None:
+            logger.warning("No content catalog in %s; run 'flavia --init' first", self.config_dir)
+            return {}
+
+        result = catalog.update_paths(paths)
+        counts = result["counts"]
+        changed = set(result["new"]) | set(result["modified"])
+
+        converted = self._convert_changed(catalog, changed) if self.convert else 0
+
+        indexed = 0
+        if self.index and (changed or result["missing"]) and self._index_exists():
+            from .indexer.index_manager import index_catalog_changes
+
+            stats = index_catalog_changes(catalog, self.base_dir, self.settings, self.console)
+            indexed = stats.get("documents_processed", 0)
+        else:
+            for path in changed:
+                catalog.files[path].status = "current"
+
+        # Only this batch's entries are touched, so a lazily loaded catalog
+        # decodes and re-saves just those.
+        for path in result["missing"]:
+            if path in catalog.files and catalog.files[path].status == "missing":
+                del catalog.files[path]
+        catalog.save(self.config_dir)
+        self.batches_processed += 1
+
+        summary = {**counts, "converted": converted, "indexed": indexed}
+        if changed or result["missing"]:
+            logger.info(
+                "Vault update: %d new, %d modified, %d missing, %d converted, %d indexed",
+                counts["new"],
+                counts["modified"],
+                counts["missing"],
+                converted,
+                indexed,
+            )
+        return summary
+
+    def _index_exists(self) -> bool:
+        return (self.base_dir / ".index" / "index.db").exists()
+
+    def _convert_changed(self, catalog: ContentCatalog, changed: set[str]) -> int:
+        """Convert the changed entries that need a text version."""
+        from .converters import ConversionScheduler
+
+        entries = catalog.get_files_needing_conversion(sorted(changed))
+        if not entries:
+            return 0
+
+        def _log(result) -> None:
+            if result.status in ("failed", "skipped") and result.error:
+                logger.warning("Could not convert %s: %s", result.path, result.error)
+
+        scheduler = ConversionScheduler(
+            self.base_dir,
+            process_workers=self.settings.convert_workers,
+            thread_workers=self.settings.convert_api_concurrency,
+        )
+        summary = scheduler.run(entries, on_result=_log)
+        return summary["converted"] + summary["resumed"]
+
+    # ------------------------------------------------------------------
+    # Loop
+    # ------------------------------------------------------------------
+
+    def run_once(self) -> Optional[dict[str, Any]]:
+        """Poll once and process the queued batch if it is ready.
+
+        A batch that fails (e.g. a transient conversion or index error) is
+        put back on the queue before the error propagates, so it is retried
+        after the next quiet period instead of being lost; the poll snapshot
+        has already moved past those changes. While a filesystem observer
+        is running, only the first call polls; events fill the queue after.
+
+        Returns:
+            The ``process()`` summary, or None when nothing was processed.
+        """
+        if self._observer is None or self._snapshot is None:
+            self.queue.add(self.poll())
+        paths = self.queue.pop_ready()
+        if not paths:
+            return None
+        try:
+            return self.process(paths)
+        except Exception:
+            self.queue.add(paths)
+            raise
+
+    def run(self) -> None:
+        """Watch in the foreground until :meth:`stop` is called.
+
+        Uses filesystem events when ``watchdog`` is installed (started before
+        the first poll, so nothing is missed in between) and falls back to
+        polling every ``interval`` seconds.
+        """
+        tick = EVENT_TICK if self._start_observer() else self.interval
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    self.run_once()
+                except Exception:
+                    logger.exception("Vault watcher iteration failed")
+                self._stop_event.wait(tick)
+        finally:
+            self._stop_observer()
+
+    def start(self) -> None:
+        """Start watching on a daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.run, name="flavia-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the watcher and wait for the current batch to finish."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
@@ -5,15 +5,28 @@ Platform-specific subclasses only need to implement API communication layer.
 """
 
 import logging
+import re
 from inspect import isawaitable
 from abc import ABC, abstractmethod
+from collections.abc import MutableMapping
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Any, Optional
-
-from flavia.agent import AgentProfile, RecursiveAgent, SendFileAction
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from flavia.agent import (
+    AgentProfile,
+    RecursiveAgent,
+    SendFileAction,
+    StatusCallback,
+    StreamCallback,
+)
 from flavia.config import Settings
 from flavia.config.bots import BotConfig
 
+from .session_pool import AgentSessionPool
+from .turn_queue import AgentTurnQueue, TurnSlots
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,7 +65,8 @@ class BaseMessagingBot(ABC):
 
     Defines common functionality:
     - Authentication and authorization (configurable per platform)
-    - Agent lifecycle management (get/create/reset per user)
+    - Agent lifecycle management (get/create/reset per user, bounded session pool)
+    - Agent turn queue (blocking turns off the event loop, ordered per user)
     - Message chunking for platform-specific size limits
     - Command routing (platform-agnostic command registry)
     - Structured logging
@@ -70,8 +84,16 @@ class BaseMessagingBot(ABC):
     def __init__(self, settings: Settings, bot_config: BotConfig):
         self.settings = settings
         self.bot_config = bot_config
-        self.agents: dict[Any, RecursiveAgent] = {}
+        self.agents: MutableMapping[Any, RecursiveAgent] = AgentSessionPool(
+            factory=self._create_agent,
+            sessions_dir=self._sessions_dir(),
+            max_resident=settings.bot_max_resident_sessions,
+            idle_ttl=settings.bot_session_idle_ttl,
+        )
         self._user_agents: dict[Any, str] = {}
+        self._turn_queue: Optional[AgentTurnQueue] = None
+        # Set by the runner so bots in one process share the concurrency cap.
+        self.turn_slots: Optional[TurnSlots] = None
         self.logger = logging.getLogger(f"bots.{bot_config.id}")
 
     @property
@@ -112,35 +134,82 @@ class BaseMessagingBot(ABC):
         """Agent ID prefix used for per-platform agent instances."""
         return self.platform_name
 
+    def _sessions_dir(self) -> Path:
+        """Directory where this bot's hibernated sessions are stored."""
+        bot_id = self.bot_config.id if self.bot_config else self.platform_name
+        safe_id = re.sub(r"[^A-Za-z0-9_.-]", "_", bot_id)
+        return Path(self.settings.base_dir) / ".flavia" / "sessions" / safe_id
+
+    def _create_agent(self, user_id: Any) -> RecursiveAgent:
+        """Build a fresh agent for a user (also used to rehydrate sessions)."""
+        agent_name = self._user_agents.get(user_id, self._default_agent_name)
+        all_configs = self._all_agent_configs()
+        config = all_configs.get(agent_name)
+
+        if config:
+            profile = AgentProfile.from_config(config)
+            if "path" not in config:
+                profile.base_dir = self.settings.base_dir
+        else:
+            profile = AgentProfile(
+                context="You are a helpful assistant that can read and analyze files.",
+                model=self.settings.default_model,
+                base_dir=self.settings.base_dir,
+                tools=["read_file", "list_files", "search_files", "get_file_info"],
+                subagents={},
+                name=agent_name,
+                max_depth=self.settings.max_depth,
+            )
+
+        return RecursiveAgent(
+            settings=self.settings,
+            profile=profile,
+            agent_id=f"{self._agent_id_prefix()}-{user_id}",
+        )
+
     def _get_or_create_agent(self, user_id: Any) -> RecursiveAgent:
-        """Get or create an agent for a user."""
+        """Get or create an agent for a user (rehydrating a hibernated session)."""
         if user_id not in self.agents:
-            agent_name = self._user_agents.get(user_id, self._default_agent_name)
-            all_configs = self._all_agent_configs()
-            config = all_configs.get(agent_name)
-
-            if config:
-                profile = AgentProfile.from_config(config)
-                if "path" not in config:
-                    profile.base_dir = self.settings.base_dir
-            else:
-                profile = AgentProfile(
-                    context="You are a helpful assistant that can read and analyze files.",
-                    model=self.settings.default_model,
-                    base_dir=self.settings.base_dir,
-                    tools=["read_file", "list_files", "search_files", "get_file_info"],
-                    subagents={},
-                    name=agent_name,
-                    max_depth=self.settings.max_depth,
-                )
+            self.agents[user_id] = self._create_agent(user_id)
+
+        return self.agents[user_id]
+
+    @contextmanager
+    def _session_in_use(self, user_id: Any) -> Iterator[None]:
+        """Keep the user's agent resident (not hibernated) inside the block."""
+        pinned = getattr(self.agents, "pinned", None)
+        if pinned is None:
+            yield
+            return
+        with pinned(user_id):
+            yield
+
+    def session_stats(self) -> dict[str, int]:
+        """Resident and hibernated agent session counts."""
+        stats = getattr(self.agents, "stats", None)
+        if stats is not None:
+            return stats()
+        return {"resident": len(self.agents), "hibernated": 0}
+
+    def evict_sessions(self) -> int:
+        """Hibernate idle sessions and those over the resident cap (blocking I/O)."""
+        evict = getattr(self.agents, "evict", None)
+        return evict() if evict is not None else 0
 
-            self.agents[user_id] = RecursiveAgent(
-                settings=self.settings,
-                profile=profile,
-                agent_id=f"{self._agent_id_prefix()}-{user_id}",
+    @property
+    def turn_queue(self) -> AgentTurnQueue:
+        """Queue that runs blocking agent turns off the event loop."""
+        queue = getattr(self, "_turn_queue", None)
+        if queue is None:
+            max_concurrent = getattr(self.settings, "bot_max_concurrent_turns", 4)
+            queue = self._turn_queue = AgentTurnQueue(
+                max_concurrent, slots=getattr(self, "turn_slots", None)
             )
+        return queue
 
-        return self.agents[user_id]
+    def _queued_message(self, position: int) -> str:
+        """Reply sent when a message has to wait for an agent turn."""
+        return f"Busy right now, your message is queued at position {position}."
 
     def _reset_agent(self, user_id: Any) -> None:
         """Reset the agent's conversation context for a user."""
@@ -361,18 +430,41 @@ class BaseMessagingBot(ABC):
                 actions = list(getattr(ctx, "pending_actions", []))
         return BotResponse(text=response_text, actions=actions)
 
-    def _handle_message_common(self, user_id: Any, message: str) -> BotResponse:
+    def _handle_message_common(
+        self,
+        user_id: Any,
+        message: str,
+        stream_callback: Optional[StreamCallback] = None,
+        status_callback: Optional[StatusCallback] = None,
+    ) -> BotResponse:
         """Common message processing flow used by all platforms.
 
+        Args:
+            user_id: Platform user id.
+            message: User message text.
+            stream_callback: Receives text deltas while the answer is generated
+                (only called when ``STREAM_RESPONSES`` is enabled).
+            status_callback: Optional receiver of agent status updates for
+                this turn (e.g. to reset a streamed preview per LLM call).
+
         Returns:
             BotResponse with text + actions to execute.
         """
         self._log_event(user_id, "message:received", f"len={len(message)}")
 
-        agent = self._get_or_create_agent(user_id)
-        raw_response = agent.run(message)
+        with self._session_in_use(user_id):
+            agent = self._get_or_create_agent(user_id)
+            agent.stream_callback = stream_callback
+            if status_callback is not None:
+                agent.status_callback = status_callback
+            try:
+                raw_response = agent.run(message)
+            finally:
+                agent.stream_callback = None
+                if status_callback is not None:
+                    agent.status_callback = None
 
-        response = self._process_agent_response(user_id, raw_response)
+            response = self._process_agent_response(user_id, raw_response)
 
         self._log_event(user_id, "message:processed", f"chars={len(response.text)}")
         return response
@@ -9,6 +9,7 @@ from flavia.config import Settings
 from flavia.config.bots import BotConfig
 
 from .telegram_interface import TelegramBot
+from .turn_queue import TurnSlots
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +62,10 @@ def _build_telegram_application(bot: TelegramBot, token: str):
         pool_timeout=5.0,
     )
 
-    builder = bot.Application.builder().token(token).request(httpx_request)
+    # Handlers run concurrently; agent turns are ordered per user by bot.turn_queue.
+    builder = (
+        bot.Application.builder().token(token).request(httpx_request).concurrent_updates(True)
+    )
 
     app = builder.build()
 
@@ -82,6 +86,7 @@ def _build_telegram_application(bot: TelegramBot, token: str):
 async def _run_single_telegram_bot_async(
     settings: Settings,
     bot_config: BotConfig,
+    turn_slots: Optional[TurnSlots] = None,
 ) -> None:
     """
     Run a single Telegram bot asynchronously.
@@ -91,8 +96,10 @@ async def _run_single_telegram_bot_async(
     Args:
         settings: Application settings
         bot_config: Configuration for this specific bot instance
+        turn_slots: Agent turn slots shared with the other bots in this process
     """
     bot = TelegramBot(settings, bot_config=bot_config)
+    bot.turn_slots = turn_slots
     logger.info(f"Starting Telegram bot '{bot_config.id}'...")
 
     if not bot.telegram_available:
@@ -141,8 +148,13 @@ async def _run_single_telegram_bot_async(
 
     # Run until the bot is stopped (Ctrl+C)
     try:
+        ticks = 0
         while True:
             await asyncio.sleep(1)
+            ticks += 1
+            if ticks % 60 == 0:
+                # Hibernation writes session files; keep it off the event loop.
+                await asyncio.get_running_loop().run_in_executor(None, bot.evict_sessions)
     except asyncio.CancelledError:
         logger.info(f"Bot '{bot_config.id}' received shutdown signal")
     finally:
@@ -153,6 +165,7 @@ async def _run_single_telegram_bot_async(
                 await app.stop()
             with suppress(Exception):
                 await app.shutdown()
+        bot.turn_queue.shutdown()
 
 
 def run_telegram_bots(
@@ -234,7 +247,15 @@ async def _run_multiple_bots_async(
         settings: Application settings
         bot_configs: List of bot configurations to run
     """
-    tasks = [_run_single_telegram_bot_async(settings, bot_config) for bot_config in bot_configs]
+    # BOT_MAX_CONCURRENT_TURNS caps agent turns across all bots, not per bot.
+    turn_slots = TurnSlots(getattr(settings, "bot_max_concurrent_turns", 4))
+    tasks = [
+        _run_single_telegram_bot_async(settings, bot_config, turn_slots)
+        for bot_config in bot_configs
+    ]
 
     # Run all tasks concurrently
-    await asyncio.gather(*tasks)
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        turn_slots.shutdown()
@@ -17,10 +17,11 @@ from rich.console import Console
 from rich.live import Live
 from rich.markdown import Markdown
 from rich.syntax import Syntax
+from rich.text import Text
 from rich.tree import Tree
 
 from flavia.agent import AgentProfile, RecursiveAgent, StatusPhase, ToolStatus
-from flavia.agent.status import sanitize_terminal_text
+from flavia.agent.status import format_llm_metrics, sanitize_terminal_text
 from flavia.config import ProviderConfig, Settings
 from flavia.display import get_console
 from flavia.display.theme import get_current_theme
@@ -54,6 +55,7 @@ LOADING_DOTS = (".", "..", "...", "..")
 # events when many sub-agents ran in parallel, causing their tasks to vanish
 # from the display.
 MAX_STATUS_EVENTS = None  # unlimited
+STREAM_PREVIEW_LINES = 8  # Tail of a streamed answer shown in the live status tree
 LOADING_MESSAGES = (
     "Skimming conference proceedings",
     "Checking references in the lab notebook",
@@ -1003,6 +1005,7 @@ def _run_status_animation(
     animation_state: Optional[_AnimationState] = None,
     max_tasks_main: int = 5,
     max_tasks_subagent: int = 3,
+    stream_buffer: Optional[list[str]] = None,
 ) -> None:
     """Render status animation with tool status updates using Rich Live display.
 
@@ -1020,8 +1023,11 @@ def _run_status_animation(
         animation_state: Optional shared state for interrupt handling.
         max_tasks_main: Max tasks to show for main agent (-1 = unlimited).
         max_tasks_subagent: Max tasks to show for subagents (-1 = unlimited).
+        stream_buffer: Optional text deltas streamed by the main agent (guarded
+            by ``status_lock``); the tail is shown as a live preview.
     """
     step = 0
+    llm_metrics = ""
     fallback_message = _choose_loading_message()
     next_message_step = random.randint(14, 24)
 
@@ -1096,12 +1102,13 @@ def _run_status_animation(
 
     def build_status_tree() -> Tree:
         """Build a Rich Tree representing current agent status."""
-        nonlocal step, fallback_message, next_message_step
+        nonlocal step, fallback_message, next_message_step, llm_metrics
 
         with status_lock:
             current_status = status_holder[0] if status_holder else None
             pending_events = list(status_events)
             status_events.clear()
+            streamed_text = "".join(stream_buffer) if stream_buffer else ""
 
         # Track current task for interrupt handling
         if current_status and current_status.phase in (
@@ -1118,6 +1125,9 @@ def _run_status_animation(
 
         # Process pending events
         for event in pending_events:
+            if event.phase in (StatusPhase.STREAMING_LLM, StatusPhase.LLM_COMPLETED):
+                llm_metrics = format_llm_metrics(event) or llm_metrics
+                continue
             if event.phase not in (
                 StatusPhase.EXECUTING_TOOL,
                 StatusPhase.SPAWNING_AGENT,
@@ -1171,8 +1181,12 @@ def _run_status_animation(
         dots = LOADING_DOTS[step % len(LOADING_DOTS)]
         if tool_active:
             footer_text = f"Working {dots}"
+        elif current_status and current_status.phase == StatusPhase.STREAMING_LLM:
+            footer_text = f"Responding {dots}"
         else:
             footer_text = f"{fallback_message} {dots}"
+        if llm_metrics:
+            footer_text = f"{footer_text}  {llm_metrics}"
 
         # Build the tree with hierarchical structure
         tree = Tree(f"[bold cyan]Agent [{model_ref}][/bold cyan]")
@@ -1187,6 +1201,10 @@ def _run_status_animation(
         for agent_id in root_agents:
             _render_agent_live(agent_id, tree)
 
+        if streamed_text.strip():
+            preview_lines = streamed_text.rstrip().splitlines()[-STREAM_PREVIEW_LINES:]
+            tree.add(Text("\n".join(preview_lines), style="dim"))
+
         # Add footer
         tree.add(f"[dim]{footer_text}[/dim]")
 
@@ -1281,6 +1299,7 @@ def _run_agent_with_feedback(
     status_holder: list[Optional[ToolStatus]] = [None]
     status_events: deque[ToolStatus] = deque()
     status_lock = threading.Lock()
+    stream_buffer: list[str] = []
 
     # Shared state for interrupt handling - allows us to show what was done
     animation_state = _AnimationState()
@@ -1299,8 +1318,17 @@ def _run_agent_with_feedback(
         with status_lock:
             status_holder[0] = status
             status_events.append(status)
+            if status.phase == StatusPhase.WAITING_LLM and status.depth == 0:
+                # A new main-agent LLM call: drop the previous call's preview.
+                stream_buffer.clear()
+
+    def update_stream(text: str) -> None:
+        with status_lock:
+            stream_buffer.append(text)
 
     agent.status_callback = update_status
+    if getattr(settings or getattr(agent, "settings", None), "stream_responses", False):
+        agent.stream_callback = update_stream
 
     animation_thread = threading.Thread(
         target=_run_status_animation,
@@ -1314,6 +1342,7 @@ def _run_agent_with_feedback(
             animation_state,
             max_tasks_main,
             max_tasks_subagent,
+            stream_buffer,
         ),
         daemon=True,
     )
@@ -1329,6 +1358,7 @@ def _run_agent_with_feedback(
     finally:
         global _latest_tool_status_line
         agent.status_callback = None
+        agent.stream_callback = None
         with _latest_tool_status_lock:
             _latest_tool_status_line = ""
         stop_event.set()
@@ -1227,10 +1227,17 @@ def cmd_rag_debug(ctx: CommandContext, args: str) -> bool:
     name="/index",
     category="Index",
     short_desc="Manage retrieval index",
-    long_desc="Index subcommands: build (full rebuild), update (incremental), "
-    "stats (current index statistics), diagnose (detailed tuning diagnostics).",
+    long_desc="Index subcommands: build (full rebuild), update (incremental; add --verify "
+    "to re-hash every file), stats (current index statistics), diagnose (detailed "
+    "tuning diagnostics).",
     usage="/index <build|update|stats|diagnose>",
-    examples=["/index build", "/index update", "/index stats", "/index diagnose"],
+    examples=[
+        "/index build",
+        "/index update",
+        "/index update --verify",
+        "/index stats",
+        "/index diagnose",
+    ],
     related=["/index-build", "/index-update", "/index-stats", "/index-diagnose", "/rag-debug"],
     accepts_args=True,
 )
@@ -1241,7 +1248,8 @@ def cmd_index(ctx: CommandContext, args: str) -> bool:
     if subcommand == "build":
         return cmd_index_build(ctx, "")
     if subcommand == "update":
-        return cmd_index_update(ctx, "")
+        rest = args.strip().split(maxsplit=1)
+        return cmd_index_update(ctx, rest[1] if len(rest) > 1 else "")
     if subcommand == "stats":
         return cmd_index_stats(ctx, "")
     if subcommand == "diagnose":
@@ -1276,15 +1284,18 @@ def cmd_index_build(ctx: CommandContext, args: str) -> bool:
     category="Index",
     short_desc="Update index incrementally (legacy alias)",
     long_desc="Incremental update: only process new/modified files detected by checksum. "
-    "Much faster than full rebuild for small changes.",
-    usage="/index-update",
+    "Much faster than full rebuild for small changes. Files with unchanged size and "
+    "mtime are not re-hashed unless --verify is given.",
+    usage="/index-update [--verify]",
     related=["/index", "/index-build", "/index-stats"],
+    accepts_args=True,
 )
 def cmd_index_update(ctx: CommandContext, args: str) -> bool:
     """Incremental: only new/modified docs (by checksum)."""
     from flavia.content.indexer.index_manager import update_index, display_build_results
 
-    results = update_index(ctx.settings.base_dir, ctx.settings, ctx.console)
+    verify = "--verify" in args.split()
+    results = update_index(ctx.settings.base_dir, ctx.settings, ctx.console, verify=verify)
     display_build_results(results, ctx.console)
 
     return True
@@ -0,0 +1,293 @@
+"""Bounded pool of per-user agent sessions for messaging bots.
+
+``AgentSessionPool`` is a mapping of user id -> ``RecursiveAgent`` that keeps
+at most ``max_resident`` agents in memory. The least recently used agent (or
+any agent idle for longer than ``idle_ttl`` seconds) is hibernated: its
+message history and token counters are written to
+``.flavia/sessions/<bot>/<user>.json`` and the live agent (client, tool
+schemas, history) is dropped. The next access rebuilds the agent with the
+pool's factory and restores the saved state.
+
+Accessing the mapping never evicts. Hibernation writes session files, so it
+runs in explicit :meth:`AgentSessionPool.evict` passes that the bot runner
+schedules off the event loop. Sessions in use by a running turn are pinned
+and never hibernated.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Agent attributes saved alongside the message history.
+_COUNTER_FIELDS = (
+    "last_prompt_tokens",
+    "last_completion_tokens",
+    "total_prompt_tokens",
+    "total_completion_tokens",
+    "compaction_warning_pending",
+    "compaction_warning_prompt_tokens",
+)
+
+
+class AgentSessionPool(MutableMapping):
+    """LRU/idle-TTL pool of agents with on-disk hibernation.
+
+    Args:
+        factory: Builds a fresh agent for a user id (used to rehydrate).
+        sessions_dir: Directory for hibernated sessions; None disables
+            hibernation (evicted sessions are then discarded).
+        max_resident: Agents kept in memory after an eviction pass
+            (0 = unbounded).
+        idle_ttl: Seconds of inactivity before an agent is hibernated
+            (0 = never).
+        clock: Monotonic time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[Any], Any],
+        sessions_dir: Optional[Path] = None,
+        max_resident: int = 32,
+        idle_ttl: float = 1800.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.factory = factory
+        self.sessions_dir = sessions_dir
+        self.max_resident = max(0, max_resident)
+        self.idle_ttl = max(0.0, idle_ttl)
+        self.hibernations = 0
+        self.rehydrations = 0
+        self._clock = clock
+        self._resident: "OrderedDict[Any, Any]" = OrderedDict()
+        self._last_used: dict[Any, float] = {}
+        self._pins: dict[Any, int] = {}
+        self._lock = threading.RLock()
+        # Session files on disk, tracked in memory so counts never glob the directory.
+        self._hibernated: set[str] = set()
+        if sessions_dir is not None and sessions_dir.is_dir():
+            self._hibernated = {path.stem for path in sessions_dir.glob("*.json")}
+
+    # ------------------------------------------------------------------
+    # Mapping interface
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, user_id: Any) -> Any:
+        with self._lock:
+            if user_id in self._resident:
+                self._touch(user_id)
+                agent = self._resident[user_id]
+            else:
+                agent = self._rehydrate(user_id)
+                if agent is None:
+                    raise KeyError(user_id)
+            return agent
+
+    def __setitem__(self, user_id: Any, agent: Any) -> None:
+        with self._lock:
+            self._resident[user_id] = agent
+            self._touch(user_id)
+
+    def __delitem__(self, user_id: Any) -> None:
+        with self._lock:
+            found = self._resident.pop(user_id, None) is not None
+            self._last_used.pop(user_id, None)
+            path = self._session_path(user_id)
+            if path is not None and path.exists():
+                path.unlink()
+                self._hibernated.discard(path.stem)
+                found = True
+            if not found:
+                raise KeyError(user_id)
+
+    def __contains__(self, user_id: object) -> bool:
+        with self._lock:
+            if user_id in self._resident:
+                return True
+            path = self._session_path(user_id)
+            return path is not None and path.exists()
+
+    def __iter__(self) -> Iterator[Any]:
+        with self._lock:
+            return iter(list(self._resident))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._resident)
+
+    # ------------------------------------------------------------------
+    # Pinning and eviction
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def pinned(self, user_id: Any) -> Iterator[None]:
+        """Keep ``user_id``'s agent resident for the duration of the block."""
+        with self._lock:
+            self._pins[user_id] = self._pins.get(user_id, 0) + 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                remaining = self._pins.get(user_id, 1) - 1
+                if remaining > 0:
+                    self._pins[user_id] = remaining
+                else:
+                    self._pins.pop(user_id, None)
+                    if user_id in self._resident:
+                        self._touch(user_id)
+
+    def evict(self) -> int:
+        """Hibernate idle agents, then the least recently used over ``max_resident``.
+
+        Writes session files; call it off the event loop.
+
+        Returns:
+            Number of agents dropped from memory.
+        """
+        with self._lock:
+            evicted = self.evict_idle()
+            if not self.max_resident:
+                return evicted
+            # Oldest first; pinned sessions stay.
+            for user_id in list(self._resident):
+                if len(self._resident) <= self.max_resident:
+                    break
+                if user_id in self._pins:
+                    continue
+                self.hibernate(user_id)
+                evicted += 1
+            return evicted
+
+    def evict_idle(self) -> int:
+        """Hibernate agents idle for longer than ``idle_ttl``. Returns the count."""
+        if not self.idle_ttl:
+            return 0
+        with self._lock:
+            cutoff = self._clock() - self.idle_ttl
+            idle = [
+                user_id
+                for user_id in self._resident
+                if self._last_used.get(user_id, 0.0) <= cutoff and user_id not in self._pins
+            ]
+            for user_id in idle:
+                self.hibernate(user_id)
+            return len(idle)
+
+    def hibernate(self, user_id: Any) -> bool:
+        """Save ``user_id``'s agent to disk and drop it from memory."""
+        with self._lock:
+            agent = self._resident.pop(user_id, None)
+            self._last_used.pop(user_id, None)
+            if agent is None:
+                return False
+            path = self._session_path(user_id)
+            if path is None:
+                return False
+            try:
+                self._write_session(path, user_id, agent)
+            except (OSError, TypeError, ValueError) as exc:
+                logger.warning("Could not hibernate session %s: %s", user_id, exc)
+                return False
+            self.hibernations += 1
+            self._hibernated.add(path.stem)
+            logger.info(
+                "session:hibernated | user=%s | resident=%d hibernated=%d",
+                user_id,
+                len(self._resident),
+                len(self._hibernated),
+            )
+            return True
+
+    def _touch(self, user_id: Any) -> None:
+        self._resident.move_to_end(user_id)
+        self._last_used[user_id] = self._clock()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _session_path(self, user_id: Any) -> Optional[Path]:
+        if self.sessions_dir is None:
+            return None
+        safe = re.sub(r"[^A-Za-z0-9_.-]", "_", str(user_id))
+        return self.sessions_dir / f"{safe}.json"
+
+    def _write_session(self, path: Path, user_id: Any, agent: Any) -> None:
+        profile = getattr(agent, "profile", None)
+        payload = {
+            "user_id": user_id,
+            "agent_name": getattr(profile, "name", None),
+            "messages": list(getattr(agent, "messages", [])),
+            "counters": {name: getattr(agent, name, 0) for name in _COUNTER_FIELDS},
+            "saved_at": time.time(),
+        }
+        data = json.dumps(payload, ensure_ascii=False, default=str)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_text(data, encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def _rehydrate(self, user_id: Any) -> Optional[Any]:
+        """Rebuild a hibernated agent; None if there is no saved session."""
+        path = self._session_path(user_id)
+        if path is None or not path.exists():
+            return None
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            payload = {}
+
+        agent = self.factory(user_id)
+        profile_name = getattr(getattr(agent, "profile", None), "name", None)
+        messages = payload.get("messages") if isinstance(payload, dict) else None
+        if payload.get("agent_name") == profile_name and isinstance(messages, list) and messages:
+            # Keep the fresh system prompt (tools may have changed); restore the rest.
+            agent.messages[1:] = messages[1:]
+            for name, value in (payload.get("counters") or {}).items():
+                if name in _COUNTER_FIELDS:
+                    setattr(agent, name, value)
+            self.rehydrations += 1
+            logger.info(
+                "session:rehydrated | user=%s | messages=%d",
+                user_id,
+                len(agent.messages),
+            )
+        try:
+            path.unlink()
+        except OSError:
+            pass
+        self._hibernated.discard(path.stem)
+
+        self._resident[user_id] = agent
+        self._touch(user_id)
+        return agent
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def hibernated_count(self) -> int:
+        """Number of sessions currently saved on disk."""
+        with self._lock:
+            return len(self._hibernated)
+
+    def stats(self) -> dict[str, int]:
+        """Resident/hibernated counts for logs and status commands."""
+        with self._lock:
+            return {
+                "resident": len(self._resident),
+                "hibernated": len(self._hibernated),
+                "pinned": len(self._pins),
+                "hibernations": self.hibernations,
+                "rehydrations": self.rehydrations,
+                "max_resident": self.max_resident,
+            }
@@ -1,10 +1,15 @@
 """Telegram bot interface for flavIA."""
 
+import asyncio
 import logging
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import suppress
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
-from flavia.agent import RecursiveAgent
+from flavia.agent import RecursiveAgent, StatusPhase, ToolStatus
 from flavia.config import Settings
 from flavia.config.bots import BotConfig
 
@@ -48,6 +53,88 @@ def _build_compaction_warning(agent: RecursiveAgent) -> str:
     )
 
 
+class _StreamPreview:
+    """Telegram message edited progressively while an answer is streamed.
+
+    ``feed`` is called with text deltas on the agent worker thread; edits are
+    scheduled on the event loop at most once per ``interval`` seconds because
+    Telegram rate-limits message edits. ``on_status`` drops the previous LLM
+    call's text when the main agent starts a new call within the same turn.
+    The preview is deleted by ``close`` once the final (chunked, formatted)
+    reply is ready to be sent.
+    """
+
+    MAX_CHARS = 4000  # Telegram messages are limited to 4096 characters
+    CURSOR = " \u258c"
+
+    def __init__(
+        self,
+        update,
+        loop: asyncio.AbstractEventLoop,
+        interval: float = 1.5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._update = update
+        self._loop = loop
+        self._interval = interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._parts: list[str] = []
+        self._last_flush = float("-inf")
+        self._pending: Optional[Future] = None
+        self.message = None
+        self.edits = 0
+
+    def feed(self, text: str) -> None:
+        """Append a delta and schedule an edit if the interval has elapsed."""
+        with self._lock:
+            self._parts.append(text)
+            now = self._clock()
+            if now - self._last_flush < self._interval:
+                return
+            if self._pending is not None and not self._pending.done():
+                return
+            self._last_flush = now
+            self._pending = asyncio.run_coroutine_threadsafe(self._flush(), self._loop)
+
+    def on_status(self, status: ToolStatus) -> None:
+        """Start a fresh preview when the main agent makes a new LLM call."""
+        if status.phase == StatusPhase.WAITING_LLM and status.depth == 0:
+            with self._lock:
+                self._parts.clear()
+
+    def _snapshot(self) -> str:
+        with self._lock:
+            text = "".join(self._parts).strip()
+        if len(text) > self.MAX_CHARS:
+            text = "\u2026" + text[-(self.MAX_CHARS - 1) :]
+        return text
+
+    async def _flush(self) -> None:
+        text = self._snapshot()
+        if not text:
+            return
+        try:
+            if self.message is None:
+                self.message = await self._update.message.reply_text(text + self.CURSOR)
+            else:
+                await self.message.edit_text(text + self.CURSOR)
+            self.edits += 1
+        except Exception as e:
+            logger.debug(f"Stream preview update failed: {e}")
+
+    async def close(self) -> None:
+        """Wait for an in-flight edit, then remove the preview message."""
+        pending = self._pending
+        if pending is not None:
+            with suppress(Exception):
+                await asyncio.wrap_future(pending)
+        if self.message is not None:
+            with suppress(Exception):
+                await self.message.delete()
+            self.message = None
+
+
 def _configure_logging() -> None:
     """Configure logging for Telegram bot runtime."""
     logging.basicConfig(
@@ -62,6 +149,9 @@ def _configure_logging() -> None:
 class TelegramBot(BaseMessagingBot):
     """Telegram bot wrapper for flavIA agent."""
 
+    # Minimum seconds between edits of a streamed answer preview.
+    STREAM_EDIT_INTERVAL = 1.5
+
     def __init__(self, settings: Settings, bot_config: Optional[BotConfig] = None):
         if bot_config is None:
             from flavia.config.bots import create_fallback_telegram_bot
@@ -198,6 +288,29 @@ class TelegramBot(BaseMessagingBot):
         except Exception as e:
             self._log_event_telegram(update, "typing:error", str(e)[:160])
 
+    async def _keep_typing(self, update, interval: float = 4.0) -> None:
+        """Repeat the typing indicator (it expires after ~5s) until cancelled."""
+        while True:
+            await self._safe_send_typing(update)
+            await asyncio.sleep(interval)
+
+    def _queued_notifier(self, update):
+        """Build the turn-queue callback that tells the user their position."""
+
+        async def _notify(position: int) -> None:
+            metrics = self.turn_queue.metrics()
+            self._log_event_telegram(
+                update,
+                "message:queued",
+                f"position={position} running={metrics['running']} waiting={metrics['waiting']}",
+            )
+            try:
+                await update.message.reply_text(self._queued_message(position))
+            except Exception as e:
+                self._log_event_telegram(update, "message:queued:reply_failed", str(e)[:160])
+
+        return _notify
+
     async def _error_handler(self, update, context) -> None:
         """Application-level fallback for unhandled Telegram callback errors."""
         err = getattr(context, "error", None)
@@ -248,7 +361,9 @@ class TelegramBot(BaseMessagingBot):
         if not self._is_authorized(user_id):
             return
 
-        self._reset_agent(user_id)
+        # Wait for the user's running turn so the reset is not applied mid-turn.
+        async with self.turn_queue.turn(user_id, on_queued=self._queued_notifier(update)):
+            self._reset_agent(user_id)
         await update.message.reply_text("Conversation reset!")
 
     async def _help_command(self, update, context) -> None:
@@ -273,14 +388,24 @@ class TelegramBot(BaseMessagingBot):
             await update.message.reply_text("No active conversation to compact.")
             return
 
-        agent = self.agents[user_id]
+        async with self.turn_queue.turn(user_id, on_queued=self._queued_notifier(update)) as turn:
+            with self._session_in_use(user_id):
+                await self._compact_agent(update, user_id, turn)
+
+    async def _compact_agent(self, update, user_id: int, turn) -> None:
+        """Compact the user's conversation within their turn."""
+        agent = self.agents.get(user_id)
+        if agent is None:
+            await update.message.reply_text("No active conversation to compact.")
+            return
+
         before_pct = agent.context_utilization * 100
         before_tokens = agent.last_prompt_tokens
         max_tokens = agent.max_context_tokens
 
         try:
             await self._safe_send_typing(update)
-            summary = agent.compact_conversation()
+            summary = await turn.run(agent.compact_conversation)
             if not summary:
                 await update.message.reply_text("Nothing to compact (conversation is empty).")
                 return
@@ -356,7 +481,8 @@ class TelegramBot(BaseMessagingBot):
             )
             return
 
-        success, message = self._switch_agent(user_id, args[0])
+        async with self.turn_queue.turn(user_id, on_queued=self._queued_notifier(update)):
+            success, message = self._switch_agent(user_id, args[0])
         await update.message.reply_text(message)
 
     async def _handle_message(self, update, context) -> None:
@@ -383,12 +509,36 @@ class TelegramBot(BaseMessagingBot):
 
         if not hasattr(self, "_current_updates"):
             self._current_updates = {}
-        self._current_updates[user_id] = update
 
-        try:
-            await self._safe_send_typing(update)
+        # The agent turn runs on the turn queue's worker pool, so the event loop
+        # keeps serving other users; this user's turns run one at a time.
+        async with self.turn_queue.turn(user_id, on_queued=self._queued_notifier(update)) as turn:
+            await self._answer_message(update, user_id, user_message, turn)
 
-            response = self._handle_message_common(user_id, user_message)
+    async def _answer_message(self, update, user_id: int, user_message: str, turn) -> None:
+        """Run one agent turn and send the reply (called with the user's turn held)."""
+        self._current_updates[user_id] = update
+        preview = None
+        if getattr(getattr(self, "settings", None), "stream_responses", False):
+            preview = _StreamPreview(
+                update, asyncio.get_running_loop(), interval=self.STREAM_EDIT_INTERVAL
+            )
+        typing_task = asyncio.create_task(self._keep_typing(update))
+        try:
+            try:
+                response = await turn.run(
+                    self._handle_message_common,
+                    user_id,
+                    user_message,
+                    preview.feed if preview else None,
+                    preview.on_status if preview else None,
+                )
+            finally:
+                typing_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await typing_task
+                if preview is not None:
+                    await preview.close()
             agent = self.agents.get(user_id)
             full_text = response.text
             if agent:
@@ -481,7 +631,8 @@ class TelegramBot(BaseMessagingBot):
 
         logger.info("Starting Telegram bot...")
 
-        app = self.Application.builder().token(token).build()
+        # Handlers run concurrently; agent turns are ordered per user by the turn queue.
+        app = self.Application.builder().token(token).concurrent_updates(True).build()
 
         app.add_handler(self.CommandHandler("start", self._start_command))
         app.add_handler(self.CommandHandler("reset", self._reset_command))
@@ -496,7 +647,10 @@ class TelegramBot(BaseMessagingBot):
         app.add_error_handler(self._error_handler)
 
         logger.info("Bot running. Press Ctrl+C to stop.")
-        app.run_polling(allowed_updates=["message"])
+        try:
+            app.run_polling(allowed_updates=["message"])
+        finally:
+            self.turn_queue.shutdown()
 
 
 def run_telegram_bot(settings: Settings, bot_config: Optional[BotConfig] = None) -> None:
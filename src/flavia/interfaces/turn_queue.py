@@ -0,0 +1,183 @@
+"""Per-user agent turn queue for messaging bots.
+
+Agent turns (``RecursiveAgent.run``, compaction) are blocking and can take
+minutes. ``AgentTurnQueue`` runs them on a bounded thread pool so the bot's
+event loop keeps serving other users, while each user's turns still run one
+at a time and in arrival order.
+
+Usage (inside an async handler):
+
+    async with queue.turn(user_id, on_queued=notify) as turn:
+        response = await turn.run(agent.run, message)
+        await send(response)
+
+The ``turn()`` block holds the user's lock (so replies are sent in order);
+``turn.run()`` additionally holds one of ``max_concurrent`` global slots
+only while the blocking call executes. Several bots running in one process
+share the slots by passing the same ``TurnSlots`` to their queues.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from inspect import isawaitable
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Union
+
+QueuedCallback = Callable[[int], Union[None, Awaitable[None]]]
+
+
+class TurnSlots:
+    """Worker pool and semaphore capping agent turns executing at once.
+
+    Args:
+        max_concurrent: Agent turns executing at once across every queue
+            (and so every bot) that shares this instance.
+    """
+
+    def __init__(self, max_concurrent: int = 4):
+        self.max_concurrent = max(1, max_concurrent)
+        self.running = 0
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrent, thread_name_prefix="flavia-agent"
+        )
+        self.semaphore = asyncio.Semaphore(self.max_concurrent)
+
+    @property
+    def saturated(self) -> bool:
+        return self.running >= self.max_concurrent
+
+    def shutdown(self) -> None:
+        """Stop accepting work; running turns finish in the background."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class AgentTurn:
+    """Handle for one user turn; see :meth:`AgentTurnQueue.turn`."""
+
+    def __init__(self, queue: "AgentTurnQueue", user_id: Any, waiting: bool):
+        self._queue = queue
+        self.user_id = user_id
+        self.waiting = waiting
+
+    def _started(self) -> None:
+        if self.waiting:
+            self.waiting = False
+            self._queue.waiting -= 1
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking callable on the worker pool within the global cap."""
+        queue = self._queue
+        slots = queue.slots
+        if slots.saturated and not self.waiting:
+            # Saturated when our user lock was free: count as waiting for a slot.
+            self.waiting = True
+            queue._note_waiting()
+        async with slots.semaphore:
+            self._started()
+            slots.running += 1
+            try:
+                loop = asyncio.get_running_loop()
+                call = functools.partial(func, *args, **kwargs)
+                return await loop.run_in_executor(slots.executor, call)
+            finally:
+                slots.running -= 1
+                queue.completed += 1
+
+
+class AgentTurnQueue:
+    """Bounded, per-user ordered execution of blocking agent turns.
+
+    Args:
+        max_concurrent: Agent turns executing at once across all users
+            (ignored when ``slots`` is given).
+        slots: Shared ``TurnSlots`` so several queues (one per bot) respect
+            one global cap; by default the queue owns its slots.
+    """
+
+    def __init__(self, max_concurrent: int = 4, slots: Optional[TurnSlots] = None):
+        self._owns_slots = slots is None
+        self.slots = slots if slots is not None else TurnSlots(max_concurrent)
+        self.waiting = 0
+        self.max_waiting = 0
+        self.completed = 0
+        self._user_locks: dict[Any, asyncio.Lock] = {}
+        self._user_depth: dict[Any, int] = {}
+
+    @property
+    def max_concurrent(self) -> int:
+        return self.slots.max_concurrent
+
+    @property
+    def running(self) -> int:
+        """Turns executing across every queue sharing the slots."""
+        return self.slots.running
+
+    def _note_waiting(self) -> None:
+        self.waiting += 1
+        self.max_waiting = max(self.max_waiting, self.waiting)
+
+    def is_busy(self, user_id: Any) -> bool:
+        """True if a new turn for ``user_id`` would have to wait."""
+        return self._user_depth.get(user_id, 0) > 0 or self.slots.saturated
+
+    def pending_for(self, user_id: Any) -> int:
+        """Turns of ``user_id`` that are queued or running."""
+        return self._user_depth.get(user_id, 0)
+
+    @asynccontextmanager
+    async def turn(
+        self, user_id: Any, on_queued: Optional[QueuedCallback] = None
+    ) -> AsyncIterator[AgentTurn]:
+        """Hold ``user_id``'s turn lock for the duration of the block.
+
+        Args:
+            user_id: Turns with the same id run one at a time, in order.
+            on_queued: Called with the turn's 1-based position among
+                ``user_id``'s own queued turns when it cannot start
+                immediately (user busy or all slots taken).
+        """
+        busy = self.is_busy(user_id)
+        ahead = self._user_depth.get(user_id, 0)
+        self._user_depth[user_id] = ahead + 1
+        lock = self._user_locks.setdefault(user_id, asyncio.Lock())
+        turn = AgentTurn(self, user_id, waiting=busy)
+        try:
+            if busy:
+                self._note_waiting()
+                if on_queued is not None:
+                    # Turns of this user already queued or running run first.
+                    maybe_awaitable = on_queued(max(1, ahead))
+                    if isawaitable(maybe_awaitable):
+                        await maybe_awaitable
+            async with lock:
+                # The turn keeps counting as waiting until it gets a slot in run().
+                yield turn
+        finally:
+            if turn.waiting:
+                turn._started()
+            remaining = self._user_depth.get(user_id, 1) - 1
+            if remaining > 0:
+                self._user_depth[user_id] = remaining
+            else:
+                self._user_depth.pop(user_id, None)
+                self._user_locks.pop(user_id, None)
+
+    def metrics(self) -> dict[str, int]:
+        """Queue-depth snapshot for logs and status commands."""
+        return {
+            "running": self.running,
+            "waiting": self.waiting,
+            "max_waiting": self.max_waiting,
+            "completed": self.completed,
+            "active_users": len(self._user_depth),
+            "max_concurrent": self.max_concurrent,
+        }
+
+    def shutdown(self) -> None:
+        """Stop accepting work; running turns finish in the background.
+
+        Shared slots are left to their owner, which shuts them down once.
+        """
+        if self._owns_slots:
+            self.slots.shutdown()
@@ -126,12 +126,21 @@ AGENT_PARAMETERS = SettingsCategory(
         SettingDefinition(
             env_var="AGENT_PARALLEL_WORKERS",
             display_name="Parallel Workers",
-            description="Maximum number of parallel sub-agents",
+            description="Maximum number of sub-agents running at once across the agent tree",
             setting_type="int",
             default=4,
             min_value=1,
             max_value=16,
         ),
+        SettingDefinition(
+            env_var="AGENT_TOOL_CALL_WORKERS",
+            display_name="Tool Call Workers",
+            description="Read-only tool calls of one response run at once (1 = serial)",
+            setting_type="int",
+            default=4,
+            min_value=1,
+            max_value=32,
+        ),
         SettingDefinition(
             env_var="AGENT_MAX_DEPTH",
             display_name="Max Depth",
@@ -150,6 +159,35 @@ AGENT_PARAMETERS = SettingsCategory(
             min_value=1,
             max_value=100,
         ),
+        SettingDefinition(
+            env_var="BOT_MAX_CONCURRENT_TURNS",
+            display_name="Bot Concurrent Turns",
+            description="Agent turns running at once across all users and bots",
+            setting_type="int",
+            default=4,
+            min_value=1,
+            max_value=64,
+        ),
+        SettingDefinition(
+            env_var="BOT_MAX_RESIDENT_SESSIONS",
+            display_name="Bot Resident Sessions",
+            description=(
+                "Bot agent sessions kept in memory; older ones are hibernated (0 = unbounded)"
+            ),
+            setting_type="int",
+            default=32,
+            min_value=0,
+            max_value=10000,
+        ),
+        SettingDefinition(
+            env_var="BOT_SESSION_IDLE_TTL",
+            display_name="Bot Session Idle TTL",
+            description="Seconds before an idle bot session is hibernated to disk (0 = never)",
+            setting_type="int",
+            default=1800,
+            min_value=0,
+            max_value=604800,
+        ),
     ],
 )
 
@@ -193,6 +231,32 @@ RAG_PARAMETERS = SettingsCategory(
             min_value=1,
             max_value=1000,
         ),
+        SettingDefinition(
+            env_var="RAG_FUSION_STRATEGY",
+            display_name="Fusion Strategy",
+            description="How vector and FTS rankings are combined",
+            setting_type="choice",
+            default="rrf",
+            choices=["rrf", "weighted_rrf", "combsum"],
+        ),
+        SettingDefinition(
+            env_var="RAG_FUSION_VECTOR_WEIGHT",
+            display_name="Fusion Vector Weight",
+            description="Vector search weight (weighted_rrf, combsum)",
+            setting_type="float",
+            default=1.0,
+            min_value=0.0,
+            max_value=10.0,
+        ),
+        SettingDefinition(
+            env_var="RAG_FUSION_FTS_WEIGHT",
+            display_name="Fusion FTS Weight",
+            description="Full-text search weight (weighted_rrf, combsum)",
+            setting_type="float",
+            default=1.0,
+            min_value=0.0,
+            max_value=10.0,
+        ),
         SettingDefinition(
             env_var="RAG_MAX_CHUNKS_PER_DOC",
             display_name="Max Chunks/Doc",
@@ -243,6 +307,31 @@ RAG_PARAMETERS = SettingsCategory(
             setting_type="bool",
             default=True,
         ),
+        SettingDefinition(
+            env_var="RAG_QUERY_CACHE_SIZE",
+            display_name="Query Cache Size",
+            description="Query embeddings kept in memory (0 = disabled)",
+            setting_type="int",
+            default=256,
+            min_value=0,
+            max_value=100000,
+        ),
+        SettingDefinition(
+            env_var="RAG_QUERY_CACHE_TTL",
+            display_name="Query Cache TTL (s)",
+            description="Lifetime of cached query embeddings in seconds (0 = no expiry)",
+            setting_type="int",
+            default=86400,
+            min_value=0,
+            max_value=31536000,
+        ),
+        SettingDefinition(
+            env_var="RAG_QUERY_CACHE_PERSIST",
+            display_name="Persist Query Cache",
+            description="Store query embeddings in .index/embedding_cache.db",
+            setting_type="bool",
+            default=True,
+        ),
     ],
 )
 
@@ -288,6 +377,13 @@ VISUAL_DISPLAY = SettingsCategory(
             setting_type="bool",
             default=True,
         ),
+        SettingDefinition(
+            env_var="STREAM_RESPONSES",
+            display_name="Stream Responses",
+            description="Show LLM answers progressively as they are generated",
+            setting_type="bool",
+            default=False,
+        ),
         SettingDefinition(
             env_var="STATUS_MAX_TASKS_MAIN",
             display_name="Status Max Tasks (Main)",
@@ -383,6 +479,15 @@ CONTENT_PROCESSING = SettingsCategory(
             min_value=1,
             max_value=1000,
         ),
+        SettingDefinition(
+            env_var="PDF_PAGE_WORKERS",
+            display_name="PDF Page Workers",
+            description="Processes extracting page ranges of long PDFs (1 = in-process)",
+            setting_type="int",
+            default=1,
+            min_value=1,
+            max_value=32,
+        ),
         SettingDefinition(
             env_var="EMBEDDER_BATCH_SIZE",
             display_name="Embedder Batch Size",
@@ -392,6 +497,78 @@ CONTENT_PROCESSING = SettingsCategory(
             min_value=1,
             max_value=256,
         ),
+        SettingDefinition(
+            env_var="EMBEDDER_CONCURRENCY",
+            display_name="Embedder Concurrency",
+            description="Max in-flight embedding requests while indexing (1 = sequential)",
+            setting_type="int",
+            default=4,
+            min_value=1,
+            max_value=32,
+        ),
+        SettingDefinition(
+            env_var="INDEX_WORKERS",
+            display_name="Index Workers",
+            description="Worker threads for chunking documents while indexing",
+            setting_type="int",
+            default=4,
+            min_value=1,
+            max_value=32,
+        ),
+        SettingDefinition(
+            env_var="SCAN_WORKERS",
+            display_name="Scan Workers",
+            description="Worker threads for hashing files during catalog scans (1 = sequential)",
+            setting_type="int",
+            default=4,
+            min_value=1,
+            max_value=64,
+        ),
+        SettingDefinition(
+            env_var="CONVERT_WORKERS",
+            display_name="Convert Workers",
+            description="Processes for PDF/Office conversion (0 = run in threads)",
+            setting_type="int",
+            default=4,
+            min_value=0,
+            max_value=64,
+        ),
+        SettingDefinition(
+            env_var="CONVERT_API_CONCURRENCY",
+            display_name="Convert API Concurrency",
+            description="Concurrent API conversions (audio, video, OCR, images)",
+            setting_type="int",
+            default=4,
+            min_value=1,
+            max_value=32,
+        ),
+        SettingDefinition(
+            env_var="SUMMARY_CONCURRENCY",
+            display_name="Summary Concurrency",
+            description="Concurrent LLM requests for --update-summarize",
+            setting_type="int",
+            default=4,
+            min_value=1,
+            max_value=32,
+        ),
+        SettingDefinition(
+            env_var="WATCH_INTERVAL",
+            display_name="Watch Interval",
+            description="Seconds between vault polls in watch mode (--watch) without watchdog",
+            setting_type="float",
+            default=30.0,
+            min_value=0.1,
+            max_value=3600.0,
+        ),
+        SettingDefinition(
+            env_var="WATCH_DEBOUNCE",
+            display_name="Watch Debounce",
+            description="Quiet seconds before watched changes are processed",
+            setting_type="float",
+            default=1.5,
+            min_value=0.0,
+            max_value=600.0,
+        ),
     ],
 )
 
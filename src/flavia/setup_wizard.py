@@ -1443,7 +1443,8 @@ main:
 
         # Create .gitignore
         (config_dir / ".gitignore").write_text(
-            f".env\n.connection_checks.yaml\ncontent_catalog.json\n{CONVERTED_DIR_NAME}/\n"
+            ".env\n.connection_checks.yaml\ncontent_catalog.json\ncontent_catalog.db\n"
+            f"{CONVERTED_DIR_NAME}/\n"
         )
 
         # Build content catalog only if not already done
@@ -1521,7 +1522,8 @@ def _run_ai_setup(
 
     # Create .gitignore
     (config_dir / ".gitignore").write_text(
-        f".env\n.connection_checks.yaml\ncontent_catalog.json\n{CONVERTED_DIR_NAME}/\n"
+        ".env\n.connection_checks.yaml\ncontent_catalog.json\ncontent_catalog.db\n"
+        f"{CONVERTED_DIR_NAME}/\n"
     )
 
     console.print("\n[bold]Analyzing content...[/bold]\n")
@@ -2022,8 +2024,9 @@ def _run_full_reconfiguration_inner(
     converted_dir = base_dir / CONVERTED_DIR_NAME
     has_pdfs = bool(pdf_files)
 
-    catalog_file = config_dir / "content_catalog.json"
-    has_catalog = catalog_file.exists()
+    from flavia.content.catalog import catalog_exists
+
+    has_catalog = catalog_exists(config_dir)
     catalog_file_count = 0
     catalog_summary_count = 0
     catalog_files_needing_summary = 0
@@ -2378,10 +2381,9 @@ def _run_agent_revision_inner(
 
     # Load catalog if available (for context)
     catalog = None
-    catalog_file = config_dir / "content_catalog.json"
-    if catalog_file.exists():
-        from flavia.content.catalog import ContentCatalog
+    from flavia.content.catalog import ContentCatalog, catalog_exists
 
+    if catalog_exists(config_dir):
         catalog = ContentCatalog.load(config_dir)
 
     # Create setup agent
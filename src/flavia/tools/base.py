@@ -88,6 +88,9 @@ class BaseTool(ABC):
     name: str = ""
     description: str = ""
     category: str = "general"  # 'read', 'write', 'spawn', etc.
+    # Side-effect-free and thread-safe: may run concurrently with other such
+    # calls from the same assistant response.
+    concurrency_safe: bool = False
 
     @abstractmethod
     def get_schema(self, **context) -> ToolSchema:
@@ -40,6 +40,7 @@ class AnalyzeImageTool(BaseTool):
         "Use this to understand the contents of images in the project."
     )
     category = "read"
+    concurrency_safe = True
 
     def get_schema(self, **context) -> ToolSchema:
         return ToolSchema(
@@ -134,5 +134,6 @@ class FetchOnlineSourceTool(BaseTool):
             return f"Error: Fetch failed. No content was retrieved from {source_url}"
 
     def is_available(self, agent_context: "AgentContext") -> bool:
-        config_dir = agent_context.base_dir / ".flavia"
-        return (config_dir / "content_catalog.json").exists()
+        from flavia.content.catalog import catalog_exists
+
+        return catalog_exists(agent_context.base_dir / ".flavia")
@@ -19,6 +19,7 @@ class GetSummaryTool(BaseTool):
         "what's available in the project before diving into specific files."
     )
     category = "content"
+    concurrency_safe = True
 
     def get_schema(self, **context) -> ToolSchema:
         return ToolSchema(
@@ -42,14 +43,14 @@ class GetSummaryTool(BaseTool):
 
     def execute(self, args: dict[str, Any], agent_context: "AgentContext") -> str:
         from flavia.config import get_settings
-        from flavia.content.catalog import ContentCatalog
+        from flavia.content.catalog_cache import load_catalog_snapshot
 
         config_dir = agent_context.base_dir / ".flavia"
         allowed, error_msg = check_read_permission(config_dir, agent_context)
         if not allowed:
             return f"Error: {error_msg}"
 
-        catalog = ContentCatalog.load(config_dir)
+        catalog = load_catalog_snapshot(config_dir)
         if catalog is None:
             return (
                 "Error: No content catalog found. "
@@ -87,5 +88,6 @@ class GetSummaryTool(BaseTool):
 
     def is_available(self, agent_context: "AgentContext") -> bool:
         """Available whenever a catalog exists."""
-        config_dir = agent_context.base_dir / ".flavia"
-        return (config_dir / "content_catalog.json").exists()
+        from flavia.content.catalog import catalog_exists
+
+        return catalog_exists(agent_context.base_dir / ".flavia")
@@ -20,6 +20,7 @@ class QueryCatalogTool(BaseTool):
         "searching the filesystem directly."
     )
     category = "content"
+    concurrency_safe = True
 
     def get_schema(self, **context) -> ToolSchema:
         return ToolSchema(
@@ -75,18 +76,28 @@ class QueryCatalogTool(BaseTool):
                     description="Maximum number of results (default: 30)",
                     required=False,
                 ),
+                ToolParameter(
+                    name="offset",
+                    type="integer",
+                    description=(
+                        "Number of matching files to skip, for paging through results "
+                        "(default: 0)"
+                    ),
+                    required=False,
+                ),
             ],
         )
 
     def execute(self, args: dict[str, Any], agent_context: "AgentContext") -> str:
-        from flavia.content.catalog import ContentCatalog
+        from flavia.content.catalog_cache import load_catalog_snapshot
+        from flavia.content.catalog_search import open_catalog_search_index
 
         config_dir = agent_context.base_dir / ".flavia"
         allowed, error_msg = check_read_permission(config_dir, agent_context)
         if not allowed:
             return f"Error: {error_msg}"
 
-        catalog = ContentCatalog.load(config_dir)
+        catalog = load_catalog_snapshot(config_dir)
         if catalog is None:
             return (
                 "Error: No content catalog found. "
@@ -95,9 +106,10 @@ class QueryCatalogTool(BaseTool):
 
         show_stats = args.get("show_stats", False)
         limit = args.get("limit", 30)
+        offset = max(0, args.get("offset", 0) or 0)
 
-        # Build query filters
-        query_kwargs: dict[str, Any] = {"limit": limit}
+        # Build query filters; one extra result tells whether another page exists.
+        query_kwargs: dict[str, Any] = {"limit": limit + 1 if limit > 0 else 0, "offset": offset}
         for key in ("name", "extension", "file_type", "category", "text_search"):
             if key in args and args[key]:
                 query_kwargs[key] = args[key]
@@ -105,7 +117,17 @@ class QueryCatalogTool(BaseTool):
         if "search_converted_content" in args:
             query_kwargs["search_converted_content"] = args["search_converted_content"]
 
-        results = catalog.query(**query_kwargs)
+        search_index = None
+        if query_kwargs.get("text_search"):
+            search_index = open_catalog_search_index(catalog, config_dir)
+        try:
+            results = catalog.query(**query_kwargs, search_index=search_index)
+        finally:
+            if search_index is not None:
+                search_index.close()
+
+        has_more = limit > 0 and len(results) > limit
+        results = results[: max(limit, 0)]
 
         # Build response
         parts: list[str] = []
@@ -127,7 +149,11 @@ class QueryCatalogTool(BaseTool):
             return "No files found matching the query."
 
         if results:
-            parts.append(f"Found {len(results)} file(s):\n")
+            if offset:
+                last = offset + len(results)
+                parts.append(f"Found {len(results)} file(s) (results {offset + 1}-{last}):\n")
+            else:
+                parts.append(f"Found {len(results)} file(s):\n")
             for entry in results:
                 line = f"  {entry.path}"
                 details = []
@@ -151,10 +177,15 @@ class QueryCatalogTool(BaseTool):
                         preview += f", ... (+{len(entry.frame_descriptions) - 3})"
                     line += f"\n    Frame descriptions: {preview}"
                 parts.append(line)
+            if has_more:
+                parts.append(
+                    f"\n(More results available: repeat the query with offset={offset + limit}.)"
+                )
 
         return "\n".join(parts)
 
     def is_available(self, agent_context: "AgentContext") -> bool:
         """Available whenever a catalog exists."""
-        config_dir = agent_context.base_dir / ".flavia"
-        return (config_dir / "content_catalog.json").exists()
+        from flavia.content.catalog import catalog_exists
+
+        return catalog_exists(agent_context.base_dir / ".flavia")
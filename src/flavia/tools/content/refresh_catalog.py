@@ -31,6 +31,15 @@ class RefreshCatalogTool(BaseTool):
                     description="Convert new/modified docs, audio, and video to text (default: false)",
                     required=False,
                 ),
+                ToolParameter(
+                    name="verify",
+                    type="boolean",
+                    description=(
+                        "Re-hash every file instead of trusting unchanged size/mtime "
+                        "(slow on large folders; default: false)"
+                    ),
+                    required=False,
+                ),
                 ToolParameter(
                     name="remove_missing",
                     type="boolean",
@@ -46,6 +55,7 @@ class RefreshCatalogTool(BaseTool):
 
         convert = args.get("convert", False)
         remove_missing = args.get("remove_missing", True)
+        verify = args.get("verify", False)
 
         config_dir = agent_context.base_dir / ".flavia"
 
@@ -62,7 +72,7 @@ class RefreshCatalogTool(BaseTool):
             return "Error: No content catalog found. Run 'flavia --init' to create one first."
 
         # Run incremental update
-        update_result = catalog.update()
+        update_result = catalog.update(verify=verify)
         counts = update_result["counts"]
 
         parts: list[str] = [
@@ -151,5 +161,6 @@ class RefreshCatalogTool(BaseTool):
 
     def is_available(self, agent_context: "AgentContext") -> bool:
         """Available whenever a catalog exists."""
-        config_dir = agent_context.base_dir / ".flavia"
-        return (config_dir / "content_catalog.json").exists()
+        from flavia.content.catalog import catalog_exists
+
+        return catalog_exists(agent_context.base_dir / ".flavia")
@@ -1,7 +1,8 @@
 """Tool for semantic search across document chunks using hybrid retrieval."""
 
-import hashlib
 import re
+import threading
+import weakref
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -48,12 +49,6 @@ _EXHAUSTIVE_QUERY_PATTERNS = (
 )
 
 
-def _catalog_doc_id(base_dir: Path, path: str, checksum: str) -> str:
-    """Derive doc_id from catalog entry fields."""
-    raw = f"{base_dir}:{path}:{checksum}"
-    return hashlib.sha1(raw.encode()).hexdigest()
-
-
 def _normalize_ref(value: str) -> str:
     """Normalize a user or catalog reference for robust matching."""
     normalized = value.strip().replace("\\", "/")
@@ -94,41 +89,70 @@ def _extract_doc_mentions(query: str) -> tuple[str, list[str]]:
     return stripped, mentions
 
 
-def _entry_matches_mention(entry: Any, normalized_mention: str) -> bool:
-    """Return True when a mention matches an original or converted reference."""
-    if not normalized_mention:
-        return False
+def _entry_mention_keys(entry: Any) -> set[str]:
+    """Return every normalized reference that mentions ``entry``.
 
+    A mention matches an entry when it equals the original path, name,
+    stem, converted path or a frame description path, or when one of those
+    paths ends with ``/<mention>`` -- i.e. the mention is a run of trailing
+    path segments, all of which are included here.
+    """
     path_value = _normalize_ref(getattr(entry, "path", ""))
     name_value = _normalize_ref(getattr(entry, "name", ""))
     converted_value = _normalize_ref(getattr(entry, "converted_to", "") or "")
 
-    candidates: set[str] = {path_value, name_value}
-    suffix_candidates: list[str] = [path_value]
+    keys: set[str] = {path_value, name_value}
+    suffix_sources: list[str] = [path_value]
 
     if converted_value:
-        candidates.add(converted_value)
-        suffix_candidates.append(converted_value)
+        keys.add(converted_value)
+        suffix_sources.append(converted_value)
 
     frame_descriptions = getattr(entry, "frame_descriptions", []) or []
     for frame_path in frame_descriptions:
         frame_norm = _normalize_ref(str(frame_path))
         if frame_norm:
-            candidates.add(frame_norm)
-            suffix_candidates.append(frame_norm)
+            keys.add(frame_norm)
+            suffix_sources.append(frame_norm)
 
     for raw_candidate in (getattr(entry, "path", ""), getattr(entry, "name", "")):
         stem = Path(str(raw_candidate)).stem
         if stem:
-            candidates.add(_normalize_ref(stem))
+            keys.add(_normalize_ref(stem))
+
+    for source in suffix_sources:
+        parts = source.split("/")
+        for i in range(1, len(parts)):
+            keys.add("/".join(parts[i:]))
+
+    keys.discard("")
+    return keys
+
 
-    if normalized_mention in candidates:
-        return True
+# catalog -> ((id(files), len(files)), normalized mention -> entries in catalog order)
+_MENTION_INDEXES: "weakref.WeakKeyDictionary[Any, tuple[tuple[int, int], dict[str, list[Any]]]]"
+_MENTION_INDEXES = weakref.WeakKeyDictionary()
+_MENTION_INDEXES_LOCK = threading.Lock()
 
-    for candidate in suffix_candidates:
-        if candidate.endswith(f"/{normalized_mention}"):
-            return True
-    return False
+
+def _mention_index(catalog) -> dict[str, list[Any]]:
+    """Return the mention -> entries index of a catalog, built once per catalog."""
+    files_key = (id(catalog.files), len(catalog.files))
+    with _MENTION_INDEXES_LOCK:
+        cached = _MENTION_INDEXES.get(catalog)
+        if cached is not None and cached[0] == files_key:
+            return cached[1]
+
+    index: dict[str, list[Any]] = {}
+    for entry in catalog.files.values():
+        if entry.status == "missing":
+            continue
+        for key in _entry_mention_keys(entry):
+            index.setdefault(key, []).append(entry)
+
+    with _MENTION_INDEXES_LOCK:
+        _MENTION_INDEXES[catalog] = (files_key, index)
+    return index
 
 
 def _resolve_doc_ids_from_mentions(
@@ -147,30 +171,24 @@ def _resolve_doc_ids_from_mentions(
     unresolved: list[str] = []
     unindexed: list[str] = []
 
-    entries = list(catalog.files.values())
+    index = _mention_index(catalog)
 
     for mention in mentions:
         normalized = _normalize_ref(mention)
-        matched_any = False
+        matches = index.get(normalized, []) if normalized else []
         matched_indexed = False
 
-        for entry in entries:
-            if entry.status == "missing":
-                continue
-            if not _entry_matches_mention(entry, normalized):
-                continue
-
-            matched_any = True
+        for entry in matches:
             if not getattr(entry, "converted_to", None):
                 continue
 
             matched_indexed = True
-            doc_id = _catalog_doc_id(base_dir, entry.path, entry.checksum_sha256)
+            doc_id = catalog.doc_id_for(entry, base_dir)
             if doc_id not in seen_doc_ids:
                 seen_doc_ids.add(doc_id)
                 resolved_doc_ids.append(doc_id)
 
-        if not matched_any:
+        if not matches:
             unresolved.append(mention)
         elif not matched_indexed:
             unindexed.append(mention)
@@ -178,6 +196,25 @@ def _resolve_doc_ids_from_mentions(
     return resolved_doc_ids, unresolved, unindexed
 
 
+def _get_retrieval_session(agent_context: "AgentContext", base_dir: Path, settings: Any):
+    """Return the agent context's warm RetrievalSession, creating it when needed.
+
+    The session is reused whichever thread runs the call (bot turns hop
+    between worker threads); a session for another base_dir is closed and
+    replaced.
+    """
+    from flavia.content.indexer import RetrievalSession
+
+    session = getattr(agent_context, "retrieval_session", None)
+    if session is None or session.base_dir != base_dir:
+        if session is not None:
+            session.close()
+        session = RetrievalSession(base_dir, settings)
+        agent_context.retrieval_session = session
+    session.settings = settings
+    return session
+
+
 def _looks_exhaustive_query(query: str) -> bool:
     """Heuristic for checklist-style extraction requests."""
     normalized = query.lower()
@@ -325,8 +362,7 @@ class SearchChunksTool(BaseTool):
 
     def execute(self, args: dict[str, Any], agent_context: "AgentContext") -> str:
         from flavia.config.settings import get_settings
-        from flavia.content.catalog import ContentCatalog
-        from flavia.content.indexer import retrieve
+        from flavia.content.indexer import retrieve, retrieve_doc_coverage
 
         base_dir = agent_context.base_dir
         config_dir = base_dir / ".flavia"
@@ -392,7 +428,9 @@ class SearchChunksTool(BaseTool):
         if not allowed_index:
             return f"Error: {index_error}"
 
-        catalog = ContentCatalog.load(config_dir)
+        settings = get_settings()
+        session = _get_retrieval_session(agent_context, base_dir, settings)
+        catalog = session.catalog()
         if catalog is None:
             return "Error: No content catalog found. Run 'flavia --init' to build the catalog."
 
@@ -408,7 +446,7 @@ class SearchChunksTool(BaseTool):
 
         if file_type_filter or doc_name_filter:
             doc_ids_filter = []
-            for entry in catalog.files.values():
+            for doc_id, entry in session.doc_entries().items():
                 if entry.status == "missing":
                     continue
 
@@ -428,7 +466,6 @@ class SearchChunksTool(BaseTool):
                         matches_filter = False
 
                 if matches_filter:
-                    doc_id = _catalog_doc_id(base_dir, entry.path, entry.checksum_sha256)
                     doc_ids_filter.append(doc_id)
 
             if not doc_ids_filter and (file_type_filter or doc_name_filter):
@@ -472,7 +509,6 @@ class SearchChunksTool(BaseTool):
                         "the provided filters."
                     )
 
-        settings = get_settings()
         effective_top_k = top_k
         effective_router_k = settings.rag_catalog_router_k
         effective_vector_k = settings.rag_vector_k
@@ -510,6 +546,7 @@ class SearchChunksTool(BaseTool):
                 retrieval_mode=retrieval_mode,
                 preserve_doc_scope=preserve_doc_scope,
                 debug_info=trace if debug_mode else None,
+                session=session,
             )
         except Exception as e:
             return f"Error during retrieval: {e}"
@@ -526,31 +563,31 @@ class SearchChunksTool(BaseTool):
             }
             missing_doc_ids = [doc_id for doc_id in doc_ids_filter if doc_id not in covered_initial]
             backfilled_docs: list[str] = []
-            backfill_attempted = 0
             per_doc_backfill_k = max(
                 4,
                 min(12, max(1, effective_top_k // max(len(doc_ids_filter), 1))),
             )
-            for doc_id in missing_doc_ids[:8]:
-                backfill_attempted += 1
-                try:
-                    supplemental = retrieve(
-                        question=effective_query,
-                        base_dir=base_dir,
-                        settings=settings,
-                        doc_ids_filter=[doc_id],
-                        top_k=per_doc_backfill_k,
-                        catalog_router_k=0,
-                        vector_k=max(effective_vector_k, per_doc_backfill_k),
-                        fts_k=max(effective_fts_k, per_doc_backfill_k),
-                        rrf_k=settings.rag_rrf_k,
-                        max_chunks_per_doc=max(effective_max_chunks_per_doc, per_doc_backfill_k),
-                        expand_video_temporal=settings.rag_expand_video_temporal,
-                        retrieval_mode="exhaustive",
-                        preserve_doc_scope=True,
-                    )
-                except Exception:
-                    continue
+            backfill_doc_ids = missing_doc_ids[:8]
+            backfill_attempted = len(backfill_doc_ids)
+            try:
+                # One embedding plus one vector and one FTS query for all
+                # uncovered documents, instead of a full retrieve() per doc.
+                coverage = retrieve_doc_coverage(
+                    question=effective_query,
+                    base_dir=base_dir,
+                    settings=settings,
+                    doc_ids=backfill_doc_ids,
+                    per_doc_k=per_doc_backfill_k,
+                    vector_k=max(effective_vector_k, per_doc_backfill_k),
+                    fts_k=max(effective_fts_k, per_doc_backfill_k),
+                    rrf_k=settings.rag_rrf_k,
+                    expand_video_temporal=settings.rag_expand_video_temporal,
+                    session=session,
+                )
+            except Exception:
+                coverage = {}
+            for doc_id in backfill_doc_ids:
+                supplemental = coverage.get(doc_id)
                 if supplemental:
                     backfilled_docs.append(doc_id)
                     results.extend(supplemental)
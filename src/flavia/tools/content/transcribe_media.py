@@ -160,5 +160,6 @@ class TranscribeMediaTool(BaseTool):
         return "\n".join(parts)
 
     def is_available(self, agent_context: "AgentContext") -> bool:
-        config_dir = agent_context.base_dir / ".flavia"
-        return (config_dir / "content_catalog.json").exists()
+        from flavia.content.catalog import catalog_exists
+
+        return catalog_exists(agent_context.base_dir / ".flavia")
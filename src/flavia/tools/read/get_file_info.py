@@ -18,6 +18,7 @@ class GetFileInfoTool(BaseTool):
     name = "get_file_info"
     description = "Get metadata about a file or directory (size, dates, permissions)"
     category = "read"
+    concurrency_safe = True
 
     def get_schema(self, **context) -> ToolSchema:
         return ToolSchema(
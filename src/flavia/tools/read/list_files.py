@@ -17,6 +17,7 @@ class ListFilesTool(BaseTool):
     name = "list_files"
     description = "List all files and subdirectories in a directory"
     category = "read"
+    concurrency_safe = True
 
     def get_schema(self, **context) -> ToolSchema:
         return ToolSchema(
@@ -156,6 +156,7 @@ class ReadFileTool(BaseTool):
         "Use start_line/end_line for partial reads."
     )
     category = "read"
+    concurrency_safe = True
 
     def get_schema(self, **context) -> ToolSchema:
         return ToolSchema(
@@ -18,6 +18,7 @@ class SearchFilesTool(BaseTool):
     name = "search_files"
     description = "Search for a pattern (text or regex) within files"
     category = "read"
+    concurrency_safe = True
 
     MAX_RESULTS = 50
     CONTEXT_LINES = 2
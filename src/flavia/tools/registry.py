@@ -88,6 +88,11 @@ class ToolRegistry:
 
         return tool.execute(args, agent_context)
 
+    def is_concurrency_safe(self, name: str) -> bool:
+        """Whether a tool may run concurrently with other safe tool calls."""
+        tool = self.get(name)
+        return bool(tool and tool.concurrency_safe)
+
     def list_tools(self) -> list[str]:
         """Get list of all tool names."""
         return list(self._tools.keys())
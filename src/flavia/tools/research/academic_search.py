@@ -272,6 +272,7 @@ class SearchPapersTool(BaseTool):
         "Returns titles, authors, year, venue, DOI, abstract, citation count, and open access status."
     )
     category = "research"
+    concurrency_safe = True
 
     def get_schema(self, **context) -> ToolSchema:
         return ToolSchema(
@@ -519,6 +520,7 @@ class GetPaperDetailsTool(BaseTool):
         "Returns full abstract, all authors with affiliations, citations, references, related works, and PDF URLs."
     )
     category = "research"
+    concurrency_safe = True
 
     def get_schema(self, **context) -> ToolSchema:
         return ToolSchema(
@@ -649,6 +651,7 @@ class GetCitationsTool(BaseTool):
         "Returns a list of citing papers with titles, authors, year, venue, and citation counts."
     )
     category = "research"
+    concurrency_safe = True
 
     def get_schema(self, **context) -> ToolSchema:
         return ToolSchema(
@@ -819,6 +822,7 @@ class GetReferencesTool(BaseTool):
         "Returns a list of referenced papers with titles, authors, year, venue, and citation counts."
     )
     category = "research"
+    concurrency_safe = True
 
     def get_schema(self, **context) -> ToolSchema:
         return ToolSchema(
@@ -975,6 +979,7 @@ class FindSimilarPapersTool(BaseTool):
         "Returns a list of similar papers with titles, authors, year, venue, and citation counts."
     )
     category = "research"
+    concurrency_safe = True
 
     def get_schema(self, **context) -> ToolSchema:
         return ToolSchema(
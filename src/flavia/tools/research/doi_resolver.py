@@ -532,6 +532,7 @@ class ResolveDOITool(BaseTool):
         "Uses CrossRef as primary source with DataCite as fallback."
     )
     category = "research"
+    concurrency_safe = True
 
     def get_schema(self, **context: Any) -> ToolSchema:
         return ToolSchema(
@@ -30,6 +30,7 @@ class WebSearchTool(BaseTool):
         "research papers, documentation, and general knowledge."
     )
     category = "research"
+    concurrency_safe = True
 
     def get_schema(self, **context) -> ToolSchema:
         """Get the tool schema."""
@@ -0,0 +1,149 @@
+"""Tests for the bounded agent session pool used by messaging bots."""
+
+from types import SimpleNamespace
+
+from flavia.interfaces.session_pool import AgentSessionPool
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FakeAgent:
+    def __init__(self, user_id, agent_name: str = "main"):
+        self.user_id = user_id
+        self.profile = SimpleNamespace(name=agent_name)
+        self.messages = [{"role": "system", "content": f"system prompt v2 for {user_id}"}]
+        self.last_prompt_tokens = 0
+        self.last_completion_tokens = 0
+        self.total_prompt_tokens = 0
+        self.total_completion_tokens = 0
+        self.compaction_warning_pending = False
+        self.compaction_warning_prompt_tokens = 0
+
+
+def _talk(agent: _FakeAgent, text: str) -> None:
+    agent.messages.append({"role": "user", "content": text})
+    agent.messages.append({"role": "assistant", "content": f"re: {text}"})
+    agent.last_prompt_tokens += 100
+    agent.total_prompt_tokens += 100
+
+
+def _pool(tmp_path, **kwargs) -> AgentSessionPool:
+    created: list = []
+
+    def _factory(user_id):
+        agent = _FakeAgent(user_id)
+        created.append(user_id)
+        return agent
+
+    pool = AgentSessionPool(_factory, sessions_dir=tmp_path / "sessions", **kwargs)
+    pool.created = created  # type: ignore[attr-defined]
+    return pool
+
+
+def test_lru_session_is_hibernated_and_rehydrated(tmp_path):
+    pool = _pool(tmp_path, max_resident=2, idle_ttl=0)
+    for user_id in (1, 2):
+        pool[user_id] = _FakeAgent(user_id)
+        _talk(pool[user_id], f"hello from {user_id}")
+
+    pool[3] = _FakeAgent(3)
+    assert list(pool) == [1, 2, 3]  # access never evicts
+
+    assert pool.evict() == 1
+    assert list(pool) == [2, 3]
+    assert 1 in pool
+    assert (tmp_path / "sessions" / "1.json").exists()
+    assert pool.stats()["resident"] == 2
+    assert pool.stats()["hibernated"] == 1
+
+    restored = pool[1]
+
+    assert pool.created == [1]
+    assert restored.messages[0]["content"] == "system prompt v2 for 1"
+    assert restored.messages[1:] == [
+        {"role": "user", "content": "hello from 1"},
+        {"role": "assistant", "content": "re: hello from 1"},
+    ]
+    assert restored.last_prompt_tokens == 100
+    assert restored.total_prompt_tokens == 100
+    assert not (tmp_path / "sessions" / "1.json").exists()
+    assert pool.stats()["hibernated"] == 0
+    # The next pass pushes out the least recently used session (user 2).
+    pool.evict()
+    assert list(pool) == [3, 1]
+    assert pool.stats()["rehydrations"] == 1
+
+
+def test_idle_sessions_are_hibernated_after_ttl(tmp_path):
+    clock = _FakeClock()
+    pool = _pool(tmp_path, max_resident=0, idle_ttl=60, clock=clock)
+    pool["a"] = _FakeAgent("a")
+    clock.now = 30.0
+    pool["b"] = _FakeAgent("b")
+
+    clock.now = 61.0
+    assert pool.evict_idle() == 1
+    assert list(pool) == ["b"]
+    assert "a" in pool
+
+
+def test_pinned_session_is_never_evicted(tmp_path):
+    pool = _pool(tmp_path, max_resident=1, idle_ttl=0)
+    pool[1] = _FakeAgent(1)
+
+    with pool.pinned(1):
+        pool[2] = _FakeAgent(2)
+        pool.evict()
+        assert list(pool) == [1]
+
+    pool[3] = _FakeAgent(3)
+    pool.evict()
+    assert list(pool) == [3]
+
+
+def test_session_for_other_agent_is_not_restored(tmp_path):
+    pool = _pool(tmp_path, max_resident=1, idle_ttl=0)
+    pool[1] = _FakeAgent(1, agent_name="researcher")
+    _talk(pool[1], "secret research")
+    pool[2] = _FakeAgent(2)
+    pool.evict()
+
+    restored = pool[1]
+
+    assert len(restored.messages) == 1
+    assert not (tmp_path / "sessions" / "1.json").exists()
+
+
+def test_delete_removes_hibernated_session(tmp_path):
+    pool = _pool(tmp_path, max_resident=1, idle_ttl=0)
+    pool[1] = _FakeAgent(1)
+    pool[2] = _FakeAgent(2)
+    pool.evict()
+
+    del pool[1]
+
+    assert 1 not in pool
+    assert pool.stats()["hibernated"] == 0
+
+
+def test_hibernated_count_is_tracked_in_memory(tmp_path):
+    sessions_dir = tmp_path / "sessions"
+    sessions_dir.mkdir()
+    (sessions_dir / "old.json").write_text("{}", encoding="utf-8")
+    pool = _pool(tmp_path, max_resident=1, idle_ttl=0)
+    assert pool.hibernated_count() == 1
+
+    pool[1] = _FakeAgent(1)
+    pool[2] = _FakeAgent(2)
+    pool.evict()
+    (sessions_dir / "stray.json").write_text("{}", encoding="utf-8")
+
+    assert pool.hibernated_count() == 2
+    pool["old"]
+    assert pool.stats()["hibernated"] == 1
@@ -0,0 +1,141 @@
+"""Tests for the per-user agent turn queue used by messaging bots."""
+
+import asyncio
+import threading
+import time
+
+from flavia.interfaces.turn_queue import AgentTurnQueue, TurnSlots
+
+
+def _blocking(log: list[str], label: str, delay: float = 0.05) -> str:
+    log.append(f"start:{label}")
+    time.sleep(delay)
+    log.append(f"end:{label}")
+    return label
+
+
+def test_turns_of_one_user_run_in_order():
+    queue = AgentTurnQueue(max_concurrent=4)
+    log: list[str] = []
+    positions: list[int] = []
+
+    async def _turn(label: str) -> str:
+        async with queue.turn("alice", on_queued=positions.append) as turn:
+            return await turn.run(_blocking, log, label)
+
+    async def _main():
+        return await asyncio.gather(_turn("1"), _turn("2"), _turn("3"))
+
+    assert asyncio.run(_main()) == ["1", "2", "3"]
+    assert log == ["start:1", "end:1", "start:2", "end:2", "start:3", "end:3"]
+    assert positions == [1, 2]
+    assert queue.metrics()["waiting"] == 0
+    assert queue.metrics()["active_users"] == 0
+    assert queue.completed == 3
+
+
+def test_different_users_run_concurrently_within_cap():
+    queue = AgentTurnQueue(max_concurrent=2)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    threads: set[str] = set()
+
+    def _work() -> None:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+            threads.add(threading.current_thread().name)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+
+    queued: list[int] = []
+
+    async def _turn(user: str) -> None:
+        async with queue.turn(user, on_queued=queued.append) as turn:
+            await turn.run(_work)
+
+    async def _main():
+        await asyncio.gather(*(_turn(f"user{i}") for i in range(5)))
+
+    asyncio.run(_main())
+
+    assert peak == 2
+    assert queue.max_waiting >= 1
+    assert queued  # later users were told they are queued
+    assert all(name.startswith("flavia-agent") for name in threads)
+
+
+def test_event_loop_stays_responsive_during_turn():
+    queue = AgentTurnQueue(max_concurrent=1)
+    ticks: list[float] = []
+
+    async def _ticker(stop: asyncio.Event) -> None:
+        while not stop.is_set():
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    async def _main():
+        stop = asyncio.Event()
+        ticker = asyncio.create_task(_ticker(stop))
+        async with queue.turn("bob") as turn:
+            await turn.run(time.sleep, 0.2)
+        stop.set()
+        await ticker
+
+    asyncio.run(_main())
+
+    assert len(ticks) >= 5
+
+
+def test_queued_position_counts_only_the_users_own_turns():
+    queue = AgentTurnQueue(max_concurrent=1)
+    positions: dict[str, list[int]] = {"alice": [], "bob": []}
+
+    async def _turn(user: str) -> None:
+        async with queue.turn(user, on_queued=positions[user].append) as turn:
+            await turn.run(time.sleep, 0.02)
+
+    async def _main():
+        await asyncio.gather(_turn("alice"), _turn("alice"), _turn("bob"), _turn("alice"))
+
+    asyncio.run(_main())
+
+    # Bob waits for a global slot but has nothing of his own ahead of him.
+    assert positions == {"alice": [1, 2], "bob": [1]}
+    assert queue.max_waiting == 3
+
+
+def test_queues_sharing_slots_respect_one_global_cap():
+    slots = TurnSlots(max_concurrent=2)
+    queues = [AgentTurnQueue(slots=slots) for _ in range(3)]
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def _work() -> None:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+
+    async def _turn(queue: AgentTurnQueue, user: str) -> None:
+        async with queue.turn(user) as turn:
+            await turn.run(_work)
+
+    async def _main():
+        await asyncio.gather(*(_turn(q, f"user{i}") for q in queues for i in range(2)))
+
+    asyncio.run(_main())
+    for queue in queues:
+        queue.shutdown()  # shared slots stay usable until their owner shuts them down
+
+    assert peak == 2
+    assert sum(queue.completed for queue in queues) == 6
+    assert not slots.executor._shutdown
+    slots.shutdown()
@@ -157,3 +157,16 @@ def test_send_response_skips_files_when_message_send_fails():
     asyncio.run(bot._send_response(1, response))
 
     assert bot.sent_files == []
+
+
+def test_agents_are_kept_in_a_bounded_session_pool(tmp_path):
+    settings = Settings(base_dir=tmp_path, bot_max_resident_sessions=3, bot_session_idle_ttl=60)
+    bot = _DummyBot(
+        settings=settings,
+        bot_config=BotConfig(id="dummy-bot", platform="telegram", token="tok"),
+    )
+
+    assert bot.agents.max_resident == 3
+    assert bot.agents.idle_ttl == 60
+    assert bot.agents.sessions_dir == tmp_path / ".flavia" / "sessions" / "dummy-bot"
+    assert bot.session_stats()["resident"] == 0
@@ -130,7 +130,7 @@ def test_run_multiple_bots_async_propagates_exceptions(monkeypatch):
     """Bot task errors must not be silently swallowed."""
     bots = [BotConfig(id="bad", platform="telegram", token="bad-token")]
 
-    async def _fake_single(_settings, _bot_config):
+    async def _fake_single(_settings, _bot_config, _turn_slots=None):
         raise RuntimeError("boom")
 
     monkeypatch.setattr(bot_runner, "_run_single_telegram_bot_async", _fake_single)
@@ -139,6 +139,27 @@ def test_run_multiple_bots_async_propagates_exceptions(monkeypatch):
         asyncio.run(bot_runner._run_multiple_bots_async(SimpleNamespace(), bots))
 
 
+def test_run_multiple_bots_async_shares_one_turn_cap(monkeypatch):
+    """BOT_MAX_CONCURRENT_TURNS caps agent turns across every bot in the process."""
+    bots = [
+        BotConfig(id="one", platform="telegram", token="t1"),
+        BotConfig(id="two", platform="telegram", token="t2"),
+    ]
+    seen: list[object] = []
+
+    async def _fake_single(_settings, _bot_config, turn_slots=None):
+        seen.append(turn_slots)
+
+    monkeypatch.setattr(bot_runner, "_run_single_telegram_bot_async", _fake_single)
+
+    settings = SimpleNamespace(bot_max_concurrent_turns=3)
+    asyncio.run(bot_runner._run_multiple_bots_async(settings, bots))
+
+    assert len(seen) == 2
+    assert seen[0] is seen[1]
+    assert seen[0].max_concurrent == 3
+
+
 def test_legacy_run_telegram_bot_keeps_single_bot_entrypoint(monkeypatch):
     """Legacy helper should still delegate to telegram_interface.run_telegram_bot."""
     called: dict[str, object] = {}
@@ -4,7 +4,7 @@ import time
 from pathlib import Path
 from types import SimpleNamespace
 
-from flavia.cli import main, run_catalog_update
+from flavia.cli import main, run_catalog_storage_conversion, run_catalog_update
 from flavia.content.catalog import ContentCatalog
 
 
@@ -102,6 +102,7 @@ def test_main_passes_path_to_run_catalog_update(monkeypatch, tmp_path):
         update_convert=False,
         update_summarize=False,
         update_full=False,
+        verify=False,
         path=str(tmp_path),
     )
     called = {}
@@ -138,6 +139,8 @@ def test_run_catalog_update_uses_summary_model_override(monkeypatch, tmp_path):
     class _FakeSettings:
         default_model = "synthetic:hf:zai-org/GLM-4.7"
         summary_model = "synthetic:hf:moonshotai/Kimi-K2-Instruct-0905"
+        scan_workers = 2
+        summary_concurrency = 2
 
         @staticmethod
         def resolve_model_with_provider(model_ref):
@@ -152,3 +155,40 @@ def test_run_catalog_update_uses_summary_model_override(monkeypatch, tmp_path):
 
     assert run_catalog_update(summarize=True, base_dir=tmp_path) == 0
     assert calls == ["synthetic:hf:moonshotai/Kimi-K2-Instruct-0905"]
+
+
+def test_run_catalog_storage_conversion_round_trip(tmp_path, capsys):
+    (tmp_path / "notes.md").write_text("# Notes")
+    config_dir = tmp_path / ".flavia"
+    catalog = ContentCatalog(tmp_path)
+    catalog.build()
+    catalog.save(config_dir)
+
+    assert run_catalog_storage_conversion("sqlite", base_dir=tmp_path) == 0
+    assert (config_dir / "content_catalog.db").exists()
+    assert not (config_dir / "content_catalog.json").exists()
+
+    # --update keeps writing to the migrated store.
+    (tmp_path / "extra.md").write_text("# Extra")
+    assert run_catalog_update(base_dir=tmp_path) == 0
+    assert not (config_dir / "content_catalog.json").exists()
+    assert "extra.md" in ContentCatalog.load(config_dir).files
+
+    assert run_catalog_storage_conversion("json", base_dir=tmp_path) == 0
+    assert (config_dir / "content_catalog.json").exists()
+    assert not (config_dir / "content_catalog.db").exists()
+    assert "Catalog stored as json" in capsys.readouterr().out
+
+
+def test_run_catalog_storage_conversion_without_catalog(tmp_path, capsys):
+    (tmp_path / ".flavia").mkdir()
+
+    assert run_catalog_storage_conversion("sqlite", base_dir=tmp_path) == 1
+    assert "No content catalog found" in capsys.readouterr().out
+
+
+def test_run_catalog_watch_without_catalog(tmp_path, capsys):
+    from flavia.cli import run_catalog_watch
+
+    assert run_catalog_watch(base_dir=tmp_path) == 1
+    assert "No content catalog found" in capsys.readouterr().out
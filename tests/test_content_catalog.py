@@ -179,6 +179,50 @@ class TestFileScanner:
 
         assert by_name["file1.txt"].checksum_sha256 != by_name["file2.txt"].checksum_sha256
 
+    def test_parallel_scan_matches_serial_scan(self, tmp_path):
+        """Hashing on a thread pool yields the same entries, order and tree."""
+        for d in ("b_dir", "A_dir", "A_dir/nested"):
+            (tmp_path / d).mkdir()
+        for i in range(12):
+            (tmp_path / f"file{i}.txt").write_text(f"content {i}")
+        (tmp_path / "b_dir" / "doc.md").write_text("# doc")
+        (tmp_path / "A_dir" / "Zeta.py").write_text("print(1)")
+        (tmp_path / "A_dir" / "nested" / "data.csv").write_text("a,b")
+
+        serial_files, serial_tree = FileScanner(tmp_path, workers=1).scan()
+        parallel_files, parallel_tree = FileScanner(tmp_path, workers=4).scan()
+
+        def _comparable(entries):
+            return [{k: v for k, v in e.to_dict().items() if k != "indexed_at"} for e in entries]
+
+        assert _comparable(parallel_files) == _comparable(serial_files)
+        assert parallel_tree.to_dict() == serial_tree.to_dict()
+        assert parallel_tree.file_count == 15
+        assert [f.path for f in serial_files][:2] == ["A_dir/nested/data.csv", "A_dir/Zeta.py"]
+
+    def test_parallel_walk_splits_subtrees(self, tmp_path):
+        """Walking subtrees on the pool yields the same tree, order and snapshot."""
+        for i in range(6):
+            for j in range(4):
+                leaf = tmp_path / f"top{i}" / f"mid{j}" / "leaf"
+                leaf.mkdir(parents=True)
+                (leaf / "note.md").write_text(f"note {i}.{j}")
+                (leaf.parent / f"Doc{j}.txt").write_text(f"doc {i}.{j}")
+        (tmp_path / "top0" / ".git").mkdir()
+        (tmp_path / "top0" / ".git" / "HEAD").write_text("ref")
+        (tmp_path / "root.md").write_text("# root")
+
+        serial = FileScanner(tmp_path, workers=1)
+        parallel = FileScanner(tmp_path, workers=4)
+        serial_files, serial_tree = serial.scan()
+        parallel_files, parallel_tree = parallel.scan()
+
+        assert [f.path for f in parallel_files] == [f.path for f in serial_files]
+        assert parallel_tree.to_dict() == serial_tree.to_dict()
+        assert parallel_tree.file_count == 49
+        assert not any(".git" in f.path for f in parallel_files)
+        assert parallel.snapshot() == serial.snapshot()
+
 
 # ---------------------------------------------------------------------------
 # FileEntry serialization tests
@@ -345,6 +389,29 @@ class TestFileEntrySerialization:
         assert "source_metadata" not in d
         assert "fetch_status" not in d
 
+    def test_stat_signature_roundtrip(self):
+        """mtime_ns and inode are serialized only when known."""
+        entry = FileEntry(
+            path="file.py",
+            name="file.py",
+            extension=".py",
+            file_type="text",
+            category="python",
+            size_bytes=100,
+            created_at="2025-01-01T00:00:00+00:00",
+            modified_at="2025-01-01T00:00:00+00:00",
+            indexed_at="2025-01-01T00:00:00+00:00",
+            checksum_sha256="abc",
+        )
+        assert "mtime_ns" not in entry.to_dict()
+        assert "inode" not in entry.to_dict()
+
+        entry.mtime_ns = 1_700_000_000_123_456_789
+        entry.inode = 42
+        restored = FileEntry.from_dict(entry.to_dict())
+        assert restored.mtime_ns == entry.mtime_ns
+        assert restored.inode == 42
+
     def test_backwards_compatibility_from_old_catalog(self):
         """Old catalog entries without online fields load correctly."""
         old_data = {
@@ -816,6 +883,70 @@ class TestCatalogUpdate:
         assert result["counts"]["new"] == 0
         assert result["counts"]["modified"] == 0
 
+    def test_unchanged_files_are_not_rehashed(self, tmp_path, monkeypatch):
+        """Files with an unchanged size/mtime/inode reuse their stored checksum."""
+        (tmp_path / "stable.txt").write_text("stable content")
+        (tmp_path / "edited.txt").write_text("before")
+        config_dir = tmp_path / ".flavia"
+        config_dir.mkdir()
+
+        catalog = ContentCatalog(tmp_path)
+        catalog.build()
+        catalog.save(config_dir)
+
+        edited = tmp_path / "edited.txt"
+        edited.write_text("after!")
+        os.utime(edited, ns=(time.time_ns(), time.time_ns() + 5_000_000_000))
+
+        hashed: list[str] = []
+        original = FileScanner._compute_checksum
+
+        def _tracking_checksum(file_path, chunk_size=8192):
+            hashed.append(file_path.name)
+            return original(file_path, chunk_size)
+
+        monkeypatch.setattr(FileScanner, "_compute_checksum", staticmethod(_tracking_checksum))
+
+        catalog = ContentCatalog.load(config_dir)
+        result = catalog.update()
+
+        assert hashed == ["edited.txt"]
+        assert result["modified"] == ["edited.txt"]
+        assert result["checksums"] == {"computed": 1, "reused": 1}
+
+        hashed.clear()
+        result = catalog.update(verify=True)
+
+        assert sorted(hashed) == ["edited.txt", "stable.txt"]
+        assert result["checksums"] == {"computed": 2, "reused": 0}
+        assert result["counts"]["unchanged"] == 2
+
+    def test_verify_detects_content_change_with_preserved_stat(self, tmp_path):
+        """--verify should catch edits that restore size and mtime."""
+        target = tmp_path / "notes.txt"
+        target.write_text("version A")
+        catalog = ContentCatalog(tmp_path)
+        catalog.build()
+        stat = target.stat()
+
+        target.write_text("version B")
+        os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert catalog.update()["counts"]["modified"] == 0
+        assert catalog.update(verify=True)["modified"] == ["notes.txt"]
+
+    def test_legacy_entries_gain_stat_signature(self, tmp_path):
+        """Entries without mtime_ns/inode are hashed once, then take the fast path."""
+        (tmp_path / "a.txt").write_text("alpha")
+        catalog = ContentCatalog(tmp_path)
+        catalog.build()
+        catalog.files["a.txt"].mtime_ns = None
+        catalog.files["a.txt"].inode = None
+
+        assert catalog.update()["checksums"] == {"computed": 1, "reused": 0}
+        assert catalog.files["a.txt"].mtime_ns is not None
+        assert catalog.update()["checksums"] == {"computed": 0, "reused": 1}
+
     def test_get_files_needing_conversion(self, tmp_path):
         """Identify convertible files (docs/audio/video) without conversions."""
         (tmp_path / "doc.pdf").write_bytes(b"%PDF")
@@ -859,6 +990,169 @@ class TestCatalogUpdate:
         assert needs_conversion[0].name == "doc.pdf"
 
 
+class TestCatalogUpdatePaths:
+    """Tests for path-restricted catalog updates (vault watcher)."""
+
+    def _build(self, tmp_path):
+        config_dir = tmp_path / ".flavia"
+        config_dir.mkdir()
+        catalog = ContentCatalog(tmp_path)
+        catalog.build()
+        catalog.save(config_dir)
+        return ContentCatalog.load(config_dir)
+
+    def test_only_listed_paths_are_scanned(self, tmp_path):
+        """Files outside the listed paths are not re-hashed or reported."""
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "b.txt").write_text("b")
+        catalog = self._build(tmp_path)
+
+        time.sleep(0.05)
+        (tmp_path / "a.txt").write_text("a changed")
+        (tmp_path / "b.txt").write_text("b changed")
+        (tmp_path / "c.txt").write_text("c")
+
+        result = catalog.update_paths(["a.txt", "c.txt"])
+
+        assert result["modified"] == ["a.txt"]
+        assert result["new"] == ["c.txt"]
+        assert result["checksums"]["computed"] == 2
+        assert catalog.files["b.txt"].status == "current"
+        assert catalog.directory_tree.file_count == 3
+
+    def test_deleted_path_marked_missing(self, tmp_path):
+        """A listed path that no longer exists marks its entry missing."""
+        (tmp_path / "gone.txt").write_text("bye")
+        (tmp_path / "kept.txt").write_text("hi")
+        catalog = self._build(tmp_path)
+
+        (tmp_path / "gone.txt").unlink()
+        result = catalog.update_paths(["gone.txt"])
+
+        assert result["missing"] == ["gone.txt"]
+        assert catalog.files["gone.txt"].status == "missing"
+        assert catalog.directory_tree.file_count == 1
+
+    def test_directory_paths_cover_their_files(self, tmp_path):
+        """Directory paths add new files and drop deleted subdirectories."""
+        (tmp_path / "old").mkdir()
+        (tmp_path / "old" / "x.txt").write_text("x")
+        catalog = self._build(tmp_path)
+
+        (tmp_path / "old" / "x.txt").unlink()
+        (tmp_path / "old").rmdir()
+        (tmp_path / "new").mkdir()
+        (tmp_path / "new" / "y.txt").write_text("y")
+
+        result = catalog.update_paths(["old", "new"])
+
+        assert result["missing"] == ["old/x.txt"]
+        assert result["new"] == ["new/y.txt"]
+        assert [child.name for child in catalog.directory_tree.children] == ["new"]
+
+    def test_ignored_paths_are_skipped(self, tmp_path):
+        """Paths under ignored directories never enter the catalog."""
+        (tmp_path / "a.txt").write_text("a")
+        catalog = self._build(tmp_path)
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "pkg.js").write_text("x")
+
+        result = catalog.update_paths(["node_modules/pkg.js"])
+
+        assert result["counts"]["new"] == 0
+        assert "node_modules/pkg.js" not in catalog.files
+
+
+class TestCatalogDocIds:
+    """Tests for persisted retrieval doc_ids and the doc_id index."""
+
+    @staticmethod
+    def _expected_doc_id(base_dir, entry):
+        raw = f"{base_dir}:{entry.path}:{entry.checksum_sha256}"
+        return hashlib.sha1(raw.encode()).hexdigest()
+
+    @pytest.mark.parametrize("storage", ["json", "sqlite"])
+    def test_doc_id_persisted_through_save_and_load(self, tmp_path, storage):
+        """Build assigns doc_ids and both storage formats keep them."""
+        (tmp_path / "notes.md").write_text("# Notes")
+        config_dir = tmp_path / ".flavia"
+
+        catalog = ContentCatalog(tmp_path)
+        catalog.build()
+        catalog.save(config_dir)
+        ContentCatalog.convert_storage(config_dir, storage)
+
+        loaded = ContentCatalog.load(config_dir)
+        entry = loaded.files["notes.md"]
+        assert entry.doc_id == self._expected_doc_id(tmp_path, entry)
+
+    def test_doc_index_and_lookup(self, tmp_path):
+        """doc_index maps every doc_id to its entry and is reused."""
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "b.txt").write_text("b")
+
+        catalog = ContentCatalog(tmp_path)
+        catalog.build()
+
+        index = catalog.doc_index()
+        assert catalog.doc_index() is index
+        assert len(index) == 2
+        entry = catalog.files["a.txt"]
+        assert catalog.get_entry_by_doc_id(entry.doc_id) is entry
+        assert catalog.get_entry_by_doc_id("unknown") is None
+
+    def test_doc_index_for_other_base_dir_computes_ids(self, tmp_path):
+        """A different base_dir derives doc_ids without touching stored ones."""
+        (tmp_path / "a.txt").write_text("a")
+        catalog = ContentCatalog(tmp_path)
+        catalog.build()
+        entry = catalog.files["a.txt"]
+        stored = entry.doc_id
+
+        other = Path("/elsewhere")
+        assert catalog.get_entry_by_doc_id(self._expected_doc_id(other, entry), other) is entry
+        assert entry.doc_id == stored
+
+    def test_legacy_entry_without_doc_id(self, tmp_path):
+        """Entries saved before doc_ids were persisted get them on first use."""
+        (tmp_path / "a.txt").write_text("a")
+        config_dir = tmp_path / ".flavia"
+        catalog = ContentCatalog(tmp_path)
+        catalog.build()
+        catalog.save(config_dir)
+
+        catalog_path = config_dir / CATALOG_FILENAME
+        data = json.loads(catalog_path.read_text())
+        for file_data in data["files"]:
+            file_data.pop("doc_id", None)
+        catalog_path.write_text(json.dumps(data))
+
+        loaded = ContentCatalog.load(config_dir)
+        entry = loaded.files["a.txt"]
+        assert entry.doc_id is None
+        assert loaded.doc_id_for(entry) == self._expected_doc_id(tmp_path, entry)
+        assert entry.doc_id is not None
+
+    def test_update_refreshes_doc_id_of_modified_file(self, tmp_path):
+        """A content change changes the checksum and therefore the doc_id."""
+        test_file = tmp_path / "file.txt"
+        test_file.write_text("original")
+        catalog = ContentCatalog(tmp_path)
+        catalog.build()
+        old_doc_id = catalog.files["file.txt"].doc_id
+        assert catalog.get_entry_by_doc_id(old_doc_id) is not None
+
+        time.sleep(0.05)
+        test_file.write_text("modified content")
+        catalog.update()
+
+        entry = catalog.files["file.txt"]
+        assert entry.doc_id != old_doc_id
+        assert entry.doc_id == self._expected_doc_id(tmp_path, entry)
+        assert catalog.get_entry_by_doc_id(old_doc_id) is None
+        assert catalog.get_entry_by_doc_id(entry.doc_id) is entry
+
+
 # ---------------------------------------------------------------------------
 # Online Sources tests
 # ---------------------------------------------------------------------------
@@ -1186,7 +1480,10 @@ class TestPdfConverter:
         source_b.write_bytes(b"%PDF-b")
 
         converter = PdfConverter()
-        monkeypatch.setattr(converter, "extract_text", lambda _path: "PDF CONTENT")
+        monkeypatch.setattr(
+            "flavia.content.converters.pdf_converter._iter_pages",
+            lambda _path, start=0, stop=None: iter([(0, "PDF CONTENT")]),
+        )
 
         output_dir = tmp_path / "converted"
         out_a = converter.convert(source_a, output_dir)
@@ -0,0 +1,126 @@
+"""Tests for the process-wide content catalog cache."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from flavia.agent.context import _load_catalog_context
+from flavia.content.catalog import ContentCatalog
+from flavia.content.catalog_cache import CatalogCache, get_catalog_cache
+from flavia.content.indexer.retrieval import RetrievalSession
+
+
+def _make_vault(tmp_path: Path) -> Path:
+    (tmp_path / "notes.md").write_text("# Notes")
+    (tmp_path / "script.py").write_text("print('hi')")
+    config_dir = tmp_path / ".flavia"
+    catalog = ContentCatalog(tmp_path)
+    catalog.build()
+    catalog.save(config_dir)
+    return config_dir
+
+
+def _resave_with_summary(config_dir: Path, summary: str) -> None:
+    catalog = ContentCatalog.load(config_dir)
+    catalog.files["notes.md"].summary = summary
+    catalog.save(config_dir)
+
+
+class TestCatalogCache:
+    def test_returns_same_snapshot_until_file_changes(self, tmp_path):
+        config_dir = _make_vault(tmp_path)
+        cache = CatalogCache()
+
+        first = cache.get(config_dir)
+        assert cache.get(config_dir) is first
+        assert cache.get(tmp_path / ".flavia" / ".." / ".flavia") is first
+
+        _resave_with_summary(config_dir, "changed")
+        second = cache.get(config_dir)
+
+        assert second is not first
+        assert second.files["notes.md"].summary == "changed"
+        stats = cache.get_stats()
+        assert stats["loads"] == 2
+        assert stats["hits"] == 2
+        assert stats["invalidations"] == 1
+        assert stats["entries"] == 1
+
+    @pytest.mark.parametrize("storage", ["json", "sqlite"])
+    def test_same_size_rewrite_is_detected(self, tmp_path, storage):
+        config_dir = _make_vault(tmp_path)
+        ContentCatalog.convert_storage(config_dir, storage)
+        cache = CatalogCache()
+
+        assert cache.get(config_dir).files["notes.md"].summary is None
+        _resave_with_summary(config_dir, "aaaa")
+        assert cache.get(config_dir).files["notes.md"].summary == "aaaa"
+        _resave_with_summary(config_dir, "bbbb")
+        assert cache.get(config_dir).files["notes.md"].summary == "bbbb"
+
+    def test_snapshot_cannot_be_saved(self, tmp_path):
+        config_dir = _make_vault(tmp_path)
+        snapshot = CatalogCache().get(config_dir)
+
+        with pytest.raises(RuntimeError):
+            snapshot.save(config_dir)
+
+    def test_missing_catalog_returns_none_and_drops_entry(self, tmp_path):
+        config_dir = _make_vault(tmp_path)
+        cache = CatalogCache()
+        assert cache.get(config_dir) is not None
+
+        (config_dir / "content_catalog.json").unlink()
+
+        assert cache.get(config_dir) is None
+        assert cache.get_stats()["entries"] == 0
+
+    def test_concurrent_readers_share_one_load(self, tmp_path):
+        config_dir = _make_vault(tmp_path)
+        cache = CatalogCache()
+        results = []
+        barrier = threading.Barrier(8)
+
+        def _reader():
+            barrier.wait()
+            results.append(cache.get(config_dir))
+
+        threads = [threading.Thread(target=_reader) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(catalog) for catalog in results}) == 1
+        assert cache.get_stats()["loads"] == 1
+
+    def test_invalidate_forces_reload(self, tmp_path):
+        config_dir = _make_vault(tmp_path)
+        cache = CatalogCache()
+        first = cache.get(config_dir)
+
+        cache.invalidate(config_dir)
+
+        assert cache.get(config_dir) is not first
+        assert cache.get_stats()["loads"] == 2
+
+
+def test_prompt_context_and_retrieval_session_share_one_load(tmp_path):
+    """Catalog consumers in one turn should load the catalog once per change."""
+    config_dir = _make_vault(tmp_path)
+    cache = get_catalog_cache()
+    cache.reset_stats()
+
+    assert "2 files" in _load_catalog_context(tmp_path)
+    session = RetrievalSession(tmp_path)
+    catalog = session.catalog()
+    assert len(session.doc_entries()) == 2
+    assert session.catalog() is catalog
+
+    assert cache.get_stats()["loads"] == 1
+
+    _resave_with_summary(config_dir, "new summary")
+    assert session.catalog() is not catalog
+    _load_catalog_context(tmp_path)
+    assert cache.get_stats()["loads"] == 2
@@ -0,0 +1,192 @@
+"""Tests for the persistent catalog text search index."""
+
+from pathlib import Path
+
+import pytest
+
+from flavia.agent.context import AgentContext
+from flavia.agent.profile import AgentPermissions
+from flavia.content.catalog import ContentCatalog
+from flavia.content.catalog_search import (
+    CATALOG_SEARCH_DB_FILENAME,
+    CatalogSearchIndex,
+    open_catalog_search_index,
+)
+from flavia.tools.content.query_catalog import QueryCatalogTool
+
+
+def _make_vault(tmp_path: Path) -> ContentCatalog:
+    (tmp_path / "paper.pdf").write_bytes(b"%PDF-1.4")
+    (tmp_path / "kalman_notes.md").write_text("# Notes")
+    (tmp_path / "lecture.mp4").write_bytes(b"video")
+    converted_dir = tmp_path / ".converted"
+    frame_dir = converted_dir / "lecture_frames"
+    frame_dir.mkdir(parents=True)
+    (converted_dir / "paper.md").write_text(
+        "# Paper\n\nWe derive the Kalman Filter for nonlinear tracking."
+    )
+    (frame_dir / "frame_00m30s.md").write_text("The professor draws a Laplace transform.")
+
+    catalog = ContentCatalog(tmp_path)
+    catalog.build()
+    catalog.files["paper.pdf"].converted_to = ".converted/paper.md"
+    catalog.files["lecture.mp4"].frame_descriptions = [".converted/lecture_frames/frame_00m30s.md"]
+    catalog.files["kalman_notes.md"].summary = "Notes about state estimation"
+    catalog.save(tmp_path / ".flavia")
+    return catalog
+
+
+def _make_context(base_dir: Path) -> AgentContext:
+    return AgentContext(
+        agent_id="test",
+        name="test",
+        current_depth=0,
+        max_depth=3,
+        parent_id=None,
+        base_dir=base_dir,
+        available_tools=[],
+        subagents={},
+        model_id="test-model",
+        messages=[],
+        permissions=AgentPermissions(),
+    )
+
+
+class TestCatalogSearchIndex:
+    def test_substring_search_over_metadata_and_content(self, tmp_path):
+        catalog = _make_vault(tmp_path)
+        with CatalogSearchIndex(tmp_path) as index:
+            assert index.sync(catalog) == {"added": 3, "updated": 0, "removed": 0}
+
+            assert index.search("ALMAN FIL") == ["paper.pdf"]
+            assert index.search("laplace") == ["lecture.mp4"]
+            assert index.search("state estim") == ["kalman_notes.md"]
+            assert index.search("laplace", include_content=False) == []
+
+    def test_metadata_matches_rank_first(self, tmp_path):
+        catalog = _make_vault(tmp_path)
+        with CatalogSearchIndex(tmp_path) as index:
+            index.sync(catalog)
+
+            assert index.search("kalman") == ["kalman_notes.md", "paper.pdf"]
+
+    def test_sync_rereads_only_changed_entries(self, tmp_path):
+        catalog = _make_vault(tmp_path)
+        with CatalogSearchIndex(tmp_path) as index:
+            index.sync(catalog)
+            assert index.sync(catalog) == {"added": 0, "updated": 0, "removed": 0}
+
+            converted = tmp_path / ".converted" / "paper.md"
+            converted.write_text("Now about particle filters and resampling.")
+            del catalog.files["lecture.mp4"]
+
+            assert index.sync(catalog) == {"added": 0, "updated": 1, "removed": 1}
+            assert index.search("kalman filter") == []
+            assert index.search("resampling") == ["paper.pdf"]
+            assert index.search("laplace") == []
+            assert index.doc_count() == 2
+            fts_rows = index._get_connection().execute(
+                "SELECT COUNT(*) FROM catalog_search_fts"
+            ).fetchone()[0]
+            assert fts_rows == 2
+
+    def test_legacy_layout_without_rowids_is_rebuilt(self, tmp_path):
+        import sqlite3
+
+        catalog = _make_vault(tmp_path)
+        db_path = tmp_path / ".index" / CATALOG_SEARCH_DB_FILENAME
+        db_path.parent.mkdir(exist_ok=True)
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE VIRTUAL TABLE catalog_search_fts USING fts5("
+            "path UNINDEXED, metadata, content, tokenize = 'trigram')"
+        )
+        conn.execute("CREATE TABLE catalog_search_docs (path TEXT PRIMARY KEY, signature TEXT)")
+        conn.execute("INSERT INTO catalog_search_fts VALUES ('old.md', 'old', 'stale laplace')")
+        conn.execute("INSERT INTO catalog_search_docs VALUES ('old.md', 'sig')")
+        conn.commit()
+        conn.close()
+
+        with CatalogSearchIndex(tmp_path) as index:
+            assert index.doc_count() == 0
+            assert index.sync(catalog) == {"added": 3, "updated": 0, "removed": 0}
+            assert index.search("laplace") == ["lecture.mp4"]
+
+    def test_is_current_tracks_catalog_file(self, tmp_path):
+        catalog = _make_vault(tmp_path)
+        catalog_path = tmp_path / ".flavia" / "content_catalog.json"
+        with CatalogSearchIndex(tmp_path) as index:
+            assert not index.is_current(catalog_path, tmp_path)
+            index.sync(catalog, catalog_path)
+            assert index.is_current(catalog_path, tmp_path)
+
+            catalog.files["paper.pdf"].summary = "Tracking survey"
+            catalog.save(tmp_path / ".flavia")
+            # The save re-synced the existing index.
+            assert index.is_current(catalog_path, tmp_path)
+            assert index.search("tracking survey", include_content=False) == ["paper.pdf"]
+
+    def test_short_query_is_rejected(self, tmp_path):
+        with CatalogSearchIndex(tmp_path) as index:
+            with pytest.raises(ValueError):
+                index.search("ka")
+
+
+class TestQueryWithSearchIndex:
+    def test_indexed_query_matches_scan(self, tmp_path):
+        catalog = _make_vault(tmp_path)
+        index = open_catalog_search_index(catalog, tmp_path / ".flavia")
+        assert index is not None
+        try:
+            for text in ("kalman", "laplace", "paper", "nothing here"):
+                scanned = {e.path for e in catalog.query(text_search=text)}
+                indexed = {e.path for e in catalog.query(text_search=text, search_index=index)}
+                assert indexed == scanned
+
+            # Other filters still apply on top of the ranked matches.
+            results = catalog.query(text_search="kalman", file_type="text", search_index=index)
+            assert [e.path for e in results] == ["kalman_notes.md"]
+
+            # Queries shorter than a trigram scan the catalog instead.
+            results = catalog.query(text_search="mp", search_index=index)
+            assert [e.path for e in results] == ["lecture.mp4"]
+        finally:
+            index.close()
+
+    def test_offset_pages_through_results(self, tmp_path):
+        catalog = _make_vault(tmp_path)
+        everything = [e.path for e in catalog.query()]
+
+        assert [e.path for e in catalog.query(limit=2)] == everything[:2]
+        assert [e.path for e in catalog.query(limit=2, offset=2)] == everything[2:]
+        assert catalog.query(offset=10) == []
+
+    def test_open_without_saved_catalog_returns_none(self, tmp_path):
+        catalog = ContentCatalog(tmp_path)
+        assert open_catalog_search_index(catalog, tmp_path / ".flavia") is None
+
+
+class TestQueryCatalogTool:
+    def test_text_search_builds_index_and_pages(self, tmp_path):
+        _make_vault(tmp_path)
+        tool = QueryCatalogTool()
+        ctx = _make_context(tmp_path)
+
+        output = tool.execute({"text_search": "kalman", "limit": 1}, ctx)
+
+        assert (tmp_path / ".index" / CATALOG_SEARCH_DB_FILENAME).exists()
+        assert "Found 1 file(s):" in output
+        assert "kalman_notes.md" in output
+        assert "offset=1" in output
+
+        output = tool.execute({"text_search": "kalman", "limit": 1, "offset": 1}, ctx)
+        assert "(results 2-2)" in output
+        assert "paper.pdf" in output
+        assert "More results available" not in output
+
+    def test_metadata_only_query_does_not_create_index(self, tmp_path):
+        _make_vault(tmp_path)
+        output = QueryCatalogTool().execute({"file_type": "video"}, _make_context(tmp_path))
+
+        assert "lecture.mp4" in output
+        assert not (tmp_path / ".index" / CATALOG_SEARCH_DB_FILENAME).exists()
@@ -0,0 +1,239 @@
+"""Tests for the SQLite catalog storage backend."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from flavia.content.catalog import (
+    CATALOG_FILENAME,
+    ContentCatalog,
+    catalog_exists,
+    resolve_catalog_path,
+)
+from flavia.content.catalog_search import CatalogSearchIndex
+from flavia.content.catalog_store import (
+    CATALOG_DB_FILENAME,
+    CatalogStore,
+    LazyEntryMap,
+    catalog_doc_id,
+)
+from flavia.content.indexer.catalog_router import CatalogRouterIndex
+
+
+def _build_json_catalog(tmp_path: Path) -> Path:
+    (tmp_path / "notes.md").write_text("# Notes")
+    (tmp_path / "script.py").write_text("print('hi')")
+    sub = tmp_path / "papers"
+    sub.mkdir()
+    (sub / "paper.pdf").write_bytes(b"%PDF-1.4")
+    config_dir = tmp_path / ".flavia"
+    catalog = ContentCatalog(tmp_path)
+    catalog.build()
+    catalog.files["notes.md"].summary = "Meeting notes"
+    catalog.files["notes.md"].tags = ["meeting"]
+    catalog.save(config_dir)
+    return config_dir
+
+
+def _comparable(catalog: ContentCatalog) -> dict:
+    data = catalog.to_json_dict()
+    data.pop("stats")
+    return data
+
+
+class TestCatalogStorageConversion:
+    def test_convert_to_sqlite_is_lossless(self, tmp_path):
+        config_dir = _build_json_catalog(tmp_path)
+        original = ContentCatalog.load(config_dir)
+
+        db_path = ContentCatalog.convert_storage(config_dir, "sqlite")
+
+        assert db_path == config_dir / CATALOG_DB_FILENAME
+        assert db_path.exists()
+        assert not (config_dir / CATALOG_FILENAME).exists()
+        assert resolve_catalog_path(config_dir) == db_path
+        loaded = ContentCatalog.load(config_dir)
+        assert _comparable(loaded) == _comparable(original)
+
+    def test_convert_back_to_json(self, tmp_path):
+        config_dir = _build_json_catalog(tmp_path)
+        original = ContentCatalog.load(config_dir)
+        ContentCatalog.convert_storage(config_dir, "sqlite")
+
+        json_path = ContentCatalog.convert_storage(config_dir, "json")
+
+        assert json_path == config_dir / CATALOG_FILENAME
+        assert not (config_dir / CATALOG_DB_FILENAME).exists()
+        data = json.loads(json_path.read_text(encoding="utf-8"))
+        assert data["stats"]["total_files"] == 3
+        assert _comparable(ContentCatalog.load(config_dir)) == _comparable(original)
+
+    def test_convert_without_catalog_returns_none(self, tmp_path):
+        config_dir = tmp_path / ".flavia"
+        config_dir.mkdir()
+
+        assert ContentCatalog.convert_storage(config_dir, "sqlite") is None
+        assert not catalog_exists(config_dir)
+
+    def test_convert_rejects_unknown_format(self, tmp_path):
+        with pytest.raises(ValueError):
+            ContentCatalog.convert_storage(tmp_path, "yaml")
+
+    def test_export_json_from_sqlite(self, tmp_path):
+        config_dir = _build_json_catalog(tmp_path)
+        ContentCatalog.convert_storage(config_dir, "sqlite")
+        catalog = ContentCatalog.load(config_dir)
+
+        out = catalog.export_json(tmp_path / "export" / "catalog.json")
+
+        data = json.loads(out.read_text(encoding="utf-8"))
+        assert [f["path"] for f in data["files"]] == ["notes.md", "papers/paper.pdf", "script.py"]
+        assert (config_dir / CATALOG_DB_FILENAME).exists()
+
+
+class TestSqliteCatalogPersistence:
+    def test_entries_are_materialized_lazily(self, tmp_path):
+        config_dir = _build_json_catalog(tmp_path)
+        ContentCatalog.convert_storage(config_dir, "sqlite")
+
+        catalog = ContentCatalog.load(config_dir)
+
+        assert isinstance(catalog.files, LazyEntryMap)
+        assert len(catalog.files) == 3
+        assert "notes.md" in catalog.files
+        assert not catalog.files.is_materialized("notes.md")
+        assert catalog.files["notes.md"].summary == "Meeting notes"
+        assert catalog.files.is_materialized("notes.md")
+        assert not catalog.files.is_materialized("script.py")
+
+    def test_save_upserts_only_changed_entries(self, tmp_path, monkeypatch):
+        config_dir = _build_json_catalog(tmp_path)
+        ContentCatalog.convert_storage(config_dir, "sqlite")
+        catalog = ContentCatalog.load(config_dir)
+
+        writes = []
+        original_write = CatalogStore.write
+
+        def _recording_write(self, base_dir, meta, upserts, deletes=(), replace_all=False):
+            upserts = list(upserts)
+            deletes = list(deletes)
+            writes.append(([e.path for e, _ in upserts], deletes, sorted(meta), replace_all))
+            return original_write(self, base_dir, meta, upserts, deletes, replace_all)
+
+        monkeypatch.setattr(CatalogStore, "write", _recording_write)
+
+        _ = catalog.files["script.py"].summary  # read without modifying
+        catalog.files["notes.md"].summary = "Updated notes"
+        del catalog.files["papers/paper.pdf"]
+        catalog.save(config_dir)
+
+        assert writes == [(["notes.md"], ["papers/paper.pdf"], [], False)]
+        with CatalogStore(config_dir / CATALOG_DB_FILENAME) as store:
+            assert store.count() == 2
+            assert store.get_entry("notes.md").summary == "Updated notes"
+            assert store.get_entry("papers/paper.pdf") is None
+
+        # Nothing changed since the last save: nothing is written.
+        catalog.save(config_dir)
+        assert writes[-1] == ([], [], [], False)
+
+    def test_save_syncs_indexes_from_touched_entries_only(self, tmp_path):
+        config_dir = _build_json_catalog(tmp_path)
+        catalog = ContentCatalog.load(config_dir)
+        for path in ("notes.md", "papers/paper.pdf"):
+            catalog.files[path].converted_to = f".converted/{path}.md"
+        catalog.save(config_dir)
+        db_path = ContentCatalog.convert_storage(config_dir, "sqlite")
+        with CatalogSearchIndex(tmp_path) as index:
+            index.sync(ContentCatalog.load(config_dir), db_path)
+        with CatalogRouterIndex(tmp_path) as router:
+            router.sync(ContentCatalog.load(config_dir), tmp_path, db_path)
+
+        catalog = ContentCatalog.load(config_dir)
+        catalog.files["notes.md"].summary = "Quarterly planning"
+        del catalog.files["papers/paper.pdf"]
+        catalog.save(config_dir)
+
+        assert catalog.files.materialized_paths() == ["notes.md"]
+        with CatalogSearchIndex(tmp_path) as index:
+            assert index.is_current(db_path, tmp_path)
+            assert index.search("quarterly") == ["notes.md"]
+            assert index.search("script") == ["script.py"]
+            assert index.doc_count() == 2
+        with CatalogRouterIndex(tmp_path) as router:
+            assert router.is_current(db_path, tmp_path)
+            assert router.doc_count() == 1
+            assert len(router.search('"quarterly"', k=5)) == 1
+
+        # A second instance whose baseline the indexes no longer match does a full sync.
+        stale = ContentCatalog.load(config_dir)
+        catalog.files["notes.md"].summary = "Annual review"
+        catalog.save(config_dir)
+        stale.files["script.py"].tags = ["tooling"]
+        stale.save(config_dir)
+        assert stale.files.materialized_paths() == list(stale.files)
+        with CatalogSearchIndex(tmp_path) as index:
+            assert index.search("tooling") == ["script.py"]
+
+    def test_clear_does_not_materialize_entries(self):
+        entries = LazyEntryMap({"a.md": "not json", "b.md": "not json"})
+
+        entries.clear()
+
+        assert len(entries) == 0
+
+    def test_save_after_update_keeps_sqlite_storage(self, tmp_path):
+        config_dir = _build_json_catalog(tmp_path)
+        ContentCatalog.convert_storage(config_dir, "sqlite")
+        (tmp_path / "new.txt").write_text("fresh")
+
+        catalog = ContentCatalog.load(config_dir)
+        result = catalog.update()
+        saved_path = catalog.save(config_dir)
+
+        assert result["counts"]["new"] == 1
+        assert saved_path == config_dir / CATALOG_DB_FILENAME
+        assert not (config_dir / CATALOG_FILENAME).exists()
+        reloaded = ContentCatalog.load(config_dir)
+        assert "new.txt" in reloaded.files
+        assert reloaded.files["notes.md"].summary == "Meeting notes"
+        assert reloaded.directory_tree.file_count == 4
+
+    def test_save_with_replaced_files_dict(self, tmp_path):
+        config_dir = _build_json_catalog(tmp_path)
+        ContentCatalog.convert_storage(config_dir, "sqlite")
+        catalog = ContentCatalog.load(config_dir)
+
+        catalog.files = {"notes.md": catalog.files["notes.md"]}
+        catalog.save(config_dir)
+
+        assert list(ContentCatalog.load(config_dir).files) == ["notes.md"]
+
+    def test_corrupt_database_loads_as_none(self, tmp_path):
+        config_dir = tmp_path / ".flavia"
+        config_dir.mkdir()
+        (config_dir / CATALOG_DB_FILENAME).write_bytes(b"not a database")
+
+        assert ContentCatalog.load(config_dir) is None
+
+
+class TestCatalogStoreQueries:
+    def test_indexed_lookups(self, tmp_path):
+        config_dir = _build_json_catalog(tmp_path)
+        ContentCatalog.convert_storage(config_dir, "sqlite")
+        catalog = ContentCatalog.load(config_dir)
+        checksum = catalog.files["papers/paper.pdf"].checksum_sha256
+        doc_id = catalog_doc_id(catalog.base_dir, "papers/paper.pdf", checksum)
+
+        with CatalogStore(config_dir / CATALOG_DB_FILENAME) as store:
+            assert store.get_entry_by_doc_id(doc_id).path == "papers/paper.pdf"
+            assert store.get_entry_by_doc_id("missing") is None
+            assert [e.path for e in store.find_entries(file_type="text")] == [
+                "notes.md",
+                "script.py",
+            ]
+            assert [e.path for e in store.find_entries(category="pdf", status="current")] == [
+                "papers/paper.pdf"
+            ]
+            assert store.paths() == ["notes.md", "papers/paper.pdf", "script.py"]
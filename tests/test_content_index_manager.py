@@ -101,6 +101,66 @@ def test_process_document_handles_embedding_tuples_and_partial_failures(monkeypa
     assert existing_chunk_ids == {"chunk_ok"}
 
 
+def test_process_document_records_video_frames(monkeypatch, tmp_path: Path):
+    def _chunk(chunk_id, modality, time_start, text):
+        return {
+            "chunk_id": chunk_id,
+            "doc_id": "vid_1",
+            "modality": modality,
+            "heading_path": [],
+            "text": text,
+            "source": {
+                "converted_path": f".converted/{chunk_id}.md",
+                "name": "lecture.mp4",
+                "file_type": "video",
+                "locator": {"time_start": time_start, "time_end": time_start},
+            },
+        }
+
+    chunks = [
+        _chunk("t0", "video_transcript", "00:00:00", "spoken words"),
+        _chunk("f1", "video_frame", "00:01:05", "slide one"),
+    ]
+    monkeypatch.setattr(index_manager.chunker, "chunk_document", lambda *_a, **_k: chunks)
+    monkeypatch.setattr(
+        index_manager.embedder, "get_embedding_client", lambda _settings: (object(), "model")
+    )
+    monkeypatch.setattr(
+        index_manager.embedder,
+        "embed_chunks",
+        lambda input_chunks, *_a: [(c["chunk_id"], [1.0], None) for c in input_chunks],
+    )
+
+    class _FakeStore:
+        def __init__(self):
+            self.frames = {}
+
+        def upsert(self, items):
+            return len(items), 0
+
+        def replace_video_frames(self, doc_id, frames):
+            self.frames[doc_id] = frames
+            return len(frames)
+
+    fake_fts = _FakeStore()
+    index_manager.process_document(
+        entry=SimpleNamespace(name="lecture.mp4"),
+        base_dir=tmp_path,
+        settings=Settings(base_dir=tmp_path),
+        vector_store=_FakeStore(),
+        fts_index=fake_fts,
+        existing_chunk_ids=set(),
+        console=_console(),
+        show_progress=False,
+    )
+
+    assert fake_fts.frames == {
+        "vid_1": [
+            {"time_seconds": 65.0, "path": ".converted/f1.md", "description": "slide one"}
+        ]
+    }
+
+
 def test_get_entries_to_index_resolves_paths_and_filters(tmp_path: Path):
     converted_dir = tmp_path / ".converted"
     converted_dir.mkdir()
@@ -146,7 +206,7 @@ def test_update_index_calls_catalog_update_once_and_saves(monkeypatch, tmp_path:
             self.mark_current_called = False
             self.save_path = None
 
-        def update(self):
+        def update(self, verify=False, workers=None):
             self.update_calls += 1
             return {
                 "counts": {"new": 1, "modified": 0, "missing": 0, "unchanged": 0},
@@ -207,7 +267,9 @@ def test_update_index_calls_catalog_update_once_and_saves(monkeypatch, tmp_path:
         lambda *args, **kwargs: {"added": 1, "updated": 0, "skipped": 0},
     )
 
-    result = index_manager.update_index(tmp_path, Settings(base_dir=tmp_path), _console())
+    # Sequential mode: process_document is the unit under orchestration here.
+    settings = Settings(base_dir=tmp_path, embedder_concurrency=1, index_workers=1)
+    result = index_manager.update_index(tmp_path, settings, _console())
 
     assert result["documents_processed"] == 1
     assert result["chunks_added"] == 1
@@ -235,7 +297,7 @@ def test_update_index_removes_stale_chunks_for_modified_and_missing(monkeypatch,
         def __init__(self):
             self.files = {"doc.pdf": modified_entry, "old.pdf": missing_entry}
 
-        def update(self):
+        def update(self, verify=False, workers=None):
             return {
                 "counts": {"new": 0, "modified": 1, "missing": 1, "unchanged": 0},
                 "new": [],
@@ -299,8 +361,209 @@ def test_update_index_removes_stale_chunks_for_modified_and_missing(monkeypatch,
         lambda *args, **kwargs: {"added": 0, "updated": 0, "skipped": 0},
     )
 
-    result = index_manager.update_index(tmp_path, Settings(base_dir=tmp_path), _console())
+    from flavia.content.indexer.embedding_cache import EmbeddingCache
+
+    def _chunk(chunk_id, text):
+        return {"chunk_id": chunk_id, "text": text, "heading_path": [], "source": {}}
+
+    with EmbeddingCache(tmp_path) as cache:
+        cache.store_chunks(
+            {"chunk_a": _chunk("chunk_a", "stale text"), "chunk_c": _chunk("chunk_c", "kept")},
+            [("chunk_a", [1.0], None), ("chunk_c", [0.5], None)],
+            "model",
+        )
+
+    # Sequential mode: process_document is the unit under orchestration here.
+    settings = Settings(base_dir=tmp_path, embedder_concurrency=1, index_workers=1)
+    result = index_manager.update_index(tmp_path, settings, _console())
 
     assert result["chunks_removed"] == 2
     assert result["documents_processed"] == 1
     assert sorted(FakeVectorStore.last.paths_seen) == [".converted/doc.md", ".converted/old.md"]
+    # Only the vector of the removed chunk is dropped from the embedding cache.
+    assert result["embedding_cache_pruned"] == 1
+    with EmbeddingCache(tmp_path) as cache:
+        assert set(cache.lookup_chunks([_chunk("chunk_c", "kept")], "model")) == {"chunk_c"}
+        assert cache.get_stats()["entry_count"] == 1
+
+
+def test_process_document_reuses_cached_embeddings(monkeypatch, tmp_path: Path):
+    from flavia.content.indexer.embedding_cache import EmbeddingCache
+
+    entry = SimpleNamespace(name="doc.pdf")
+
+    def _chunk(chunk_id: str, text: str) -> dict:
+        return {
+            "chunk_id": chunk_id,
+            "doc_id": "doc_2",
+            "modality": "text",
+            "heading_path": [],
+            "text": text,
+            "source": {"converted_path": ".converted/doc.md", "name": "doc.pdf"},
+        }
+
+    # Same texts as a previous version of the document, but new chunk IDs
+    # (the doc checksum changed), plus one edited chunk.
+    chunks = [_chunk("new_a", "unchanged paragraph"), _chunk("new_b", "edited paragraph")]
+
+    monkeypatch.setattr(index_manager.chunker, "chunk_document", lambda *_args, **_kwargs: chunks)
+    monkeypatch.setattr(
+        index_manager.embedder,
+        "get_embedding_client",
+        lambda _settings: (object(), "model"),
+    )
+
+    embedded_ids: list[str] = []
+
+    def _fake_embed_chunks(input_chunks, _client, _model):
+        for chunk in input_chunks:
+            embedded_ids.append(chunk["chunk_id"])
+            yield (chunk["chunk_id"], [0.5, 0.5], None)
+
+    monkeypatch.setattr(index_manager.embedder, "embed_chunks", _fake_embed_chunks)
+
+    class _FakeStore:
+        def __init__(self):
+            self.items = []
+
+        def upsert(self, items):
+            self.items = items
+            return len(items), 0
+
+    fake_vs = _FakeStore()
+
+    with EmbeddingCache(tmp_path) as cache:
+        cache.store_chunks(
+            {"old_a": _chunk("old_a", "unchanged paragraph")},
+            [("old_a", [1.0, 0.0], None)],
+            "model",
+        )
+
+        stats = index_manager.process_document(
+            entry=entry,
+            base_dir=tmp_path,
+            settings=Settings(base_dir=tmp_path),
+            vector_store=fake_vs,
+            fts_index=_FakeStore(),
+            existing_chunk_ids=set(),
+            console=_console(),
+            show_progress=False,
+            emb_cache=cache,
+        )
+
+        assert embedded_ids == ["new_b"]
+        assert stats["cache_hits"] == 1
+        assert stats["cache_misses"] == 1
+        assert stats["added"] == 2
+        vectors = {item[0]: item[1] for item in fake_vs.items}
+        assert vectors["new_a"] == [1.0, 0.0]
+
+        # The freshly embedded chunk is now cached as well.
+        assert set(cache.lookup_chunks(chunks, "model")) == {"new_a", "new_b"}
+
+
+def test_process_documents_pipelined_writes_every_document_from_caller_thread(
+    monkeypatch, tmp_path: Path
+):
+    import threading
+
+    entries = [SimpleNamespace(name=f"doc{i}.pdf", idx=i) for i in range(7)]
+
+    def _fake_chunk_document(entry, *_args, **_kwargs):
+        return [
+            {
+                "chunk_id": f"{entry.idx}-{n}",
+                "doc_id": f"doc_{entry.idx}",
+                "modality": "text",
+                "heading_path": [],
+                "text": f"text {entry.idx} {n}",
+                "source": {"converted_path": f".converted/{entry.name}.md", "name": entry.name},
+            }
+            for n in range(entry.idx)  # doc0 has no chunks
+        ]
+
+    monkeypatch.setattr(index_manager.chunker, "chunk_document", _fake_chunk_document)
+    monkeypatch.setattr(
+        index_manager.embedder,
+        "get_embedding_client",
+        lambda _settings: (object(), "model"),
+    )
+
+    batch_sizes: list[int] = []
+
+    def _fake_embed_chunk_batch(batch, _client, _model, limiter=None):
+        with limiter:
+            batch_sizes.append(len(batch))
+            return [
+                (c["chunk_id"], None, "boom")
+                if c["chunk_id"] == "3-1"
+                else (c["chunk_id"], [1.0], None)
+                for c in batch
+            ]
+
+    monkeypatch.setattr(index_manager.embedder, "embed_chunk_batch", _fake_embed_chunk_batch)
+
+    writer_threads: set[int] = set()
+
+    class _FakeStore:
+        def __init__(self):
+            self.ids: list[str] = []
+
+        def upsert(self, items):
+            writer_threads.add(threading.get_ident())
+            ids = [item[0] if isinstance(item, tuple) else item["chunk_id"] for item in items]
+            self.ids.extend(ids)
+            return len(ids), 0
+
+    fake_vs = _FakeStore()
+    fake_fts = _FakeStore()
+    done: dict[str, dict] = {}
+    existing_chunk_ids = {"6-0"}
+
+    index_manager.process_documents_pipelined(
+        entries,
+        tmp_path,
+        Settings(base_dir=tmp_path, embedder_batch_size=2, embedder_concurrency=3, index_workers=2),
+        fake_vs,
+        fake_fts,
+        existing_chunk_ids,
+        _console(),
+        on_document_done=lambda entry, stats: done.__setitem__(entry.name, stats),
+    )
+
+    assert set(done) == {e.name for e in entries}
+    assert writer_threads == {threading.get_ident()}
+    assert max(batch_sizes) == 2
+    expected = {f"{i}-{n}" for i in range(7) for n in range(i)} - {"6-0", "3-1"}
+    assert set(fake_vs.ids) == expected
+    assert sorted(fake_fts.ids) == sorted(fake_vs.ids)
+    assert done["doc0.pdf"]["chunked"] == 0
+    assert done["doc3.pdf"]["embed_failed"] == 1
+    assert done["doc6.pdf"]["skipped"] == 1
+    assert done["doc5.pdf"]["added"] == 5
+    assert expected <= existing_chunk_ids
+
+
+def test_process_documents_pipelined_propagates_chunking_errors(monkeypatch, tmp_path: Path):
+    import pytest
+
+    def _broken_chunk_document(*_args, **_kwargs):
+        raise RuntimeError("corrupt converted file")
+
+    monkeypatch.setattr(index_manager.chunker, "chunk_document", _broken_chunk_document)
+    monkeypatch.setattr(
+        index_manager.embedder,
+        "get_embedding_client",
+        lambda _settings: (object(), "model"),
+    )
+
+    with pytest.raises(RuntimeError, match="corrupt converted file"):
+        index_manager.process_documents_pipelined(
+            [SimpleNamespace(name="doc.pdf")],
+            tmp_path,
+            Settings(base_dir=tmp_path),
+            object(),
+            object(),
+            set(),
+            _console(),
+        )
@@ -0,0 +1,103 @@
+"""Tests for rank fusion strategies used by hybrid retrieval."""
+
+import pytest
+
+from flavia.content.indexer.fusion import (
+    FUSION_STRATEGIES,
+    CombSUMFusion,
+    RRFFusion,
+    WeightedRRFFusion,
+    _rrf_score,
+    fuse_rankings,
+    get_fusion_strategy,
+)
+
+
+def _vector(*chunk_ids, distances=None):
+    distances = distances or [0.1 * (i + 1) for i in range(len(chunk_ids))]
+    return [{"chunk_id": c, "doc_id": "d", "distance": d} for c, d in zip(chunk_ids, distances)]
+
+
+def _fts(*chunk_ids, scores=None):
+    scores = scores or [-10.0 + i for i in range(len(chunk_ids))]
+    return [{"chunk_id": c, "doc_id": "d", "bm25_score": s} for c, s in zip(chunk_ids, scores)]
+
+
+class TestFuseRankings:
+    """Tests for fuse_rankings ordering and rank bookkeeping."""
+
+    def test_rrf_matches_reference_formula(self):
+        """RRF scores should equal Σ 1/(k + rank) over both sources."""
+        fused = fuse_rankings(_vector("a", "b"), _fts("b", "c"), RRFFusion(k=60))
+
+        by_id = {chunk_id: (score, v, f) for chunk_id, score, v, f in fused}
+        assert by_id["b"] == (_rrf_score([2, 1], k=60), 2, 1)
+        assert by_id["a"] == (_rrf_score([1, None], k=60), 1, None)
+        assert by_id["c"] == (_rrf_score([None, 2], k=60), None, 2)
+        assert [c for c, *_ in fused] == ["b", "a", "c"]
+
+    def test_ties_break_by_best_rank_then_chunk_id(self):
+        """Equal scores should order by best rank, then chunk_id."""
+        fused = fuse_rankings(_vector("z", "y"), _fts("a", "x"), RRFFusion(k=60))
+        assert [c for c, *_ in fused] == ["a", "z", "x", "y"]
+
+    def test_duplicate_chunk_ids_keep_first_rank(self):
+        """A chunk repeated in one source keeps its best (first) rank."""
+        fused = fuse_rankings(_vector("a", "b", "a"), [], RRFFusion())
+        assert [(c, v) for c, _, v, _ in fused] == [("a", 1), ("b", 2)]
+
+
+class TestStrategies:
+    """Tests for the individual fusion strategies."""
+
+    def test_weighted_rrf_with_unit_weights_equals_rrf(self):
+        """Unit weights should reproduce plain RRF."""
+        vector, fts = _vector("a", "b", "c"), _fts("c", "d")
+        assert fuse_rankings(vector, fts, WeightedRRFFusion(k=60)) == fuse_rankings(
+            vector, fts, RRFFusion(k=60)
+        )
+
+    def test_weighted_rrf_favours_heavier_source(self):
+        """A heavier FTS weight should lift the top FTS hit above the top vector hit."""
+        fused = fuse_rankings(
+            _vector("a"), _fts("b"), WeightedRRFFusion(vector_weight=1.0, fts_weight=2.0)
+        )
+        assert fused[0][0] == "b"
+
+    def test_combsum_normalizes_raw_scores(self):
+        """CombSUM should sum min-max normalized distances and BM25 scores."""
+        vector = _vector("a", "b", "c", distances=[0.2, 0.4, 0.6])
+        fts = _fts("c", "a", scores=[-8.0, -2.0])
+
+        scores = {c: s for c, s, _, _ in fuse_rankings(vector, fts, CombSUMFusion())}
+
+        assert scores["a"] == pytest.approx(1.0)  # best vector, worst FTS
+        assert scores["b"] == pytest.approx(0.5)
+        assert scores["c"] == pytest.approx(1.0)  # worst vector, best FTS
+
+    def test_combsum_handles_uniform_and_missing_scores(self):
+        """Uniform scores normalize to 1.0; missing raw scores fall back to rank."""
+        scores = {
+            c: s
+            for c, s, _, _ in fuse_rankings(
+                [{"chunk_id": "a"}, {"chunk_id": "b"}],
+                _fts("a", scores=[-3.0]),
+                CombSUMFusion(),
+            )
+        }
+        assert scores == {"a": pytest.approx(2.0), "b": pytest.approx(0.0)}
+
+
+class TestGetFusionStrategy:
+    """Tests for the strategy registry."""
+
+    @pytest.mark.parametrize("name", sorted(FUSION_STRATEGIES))
+    def test_known_names(self, name):
+        """Every registered name should build its strategy class."""
+        strategy = get_fusion_strategy(name, rrf_k=30, vector_weight=2.0)
+        assert isinstance(strategy, FUSION_STRATEGIES[name])
+        assert strategy.name == name
+
+    def test_unknown_name_returns_none(self):
+        """Unknown names should return None."""
+        assert get_fusion_strategy("bogus") is None
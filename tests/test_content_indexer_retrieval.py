@@ -1,5 +1,6 @@
 """Tests for hybrid retrieval engine combining vector and FTS search."""
 
+import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -7,13 +8,19 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from flavia.content.catalog import ContentCatalog
+from flavia.content.indexer.catalog_router import CatalogRouterIndex
+from flavia.content.indexer.fusion import RRFFusion
 from flavia.content.indexer.retrieval import (
+    RetrievalSession,
     _catalog_doc_id,
     _get_doc_id,
+    _index_results,
     _merge_chunk_data,
+    _resolve_fusion,
     _route_doc_ids_from_catalog,
     _rrf_score,
     retrieve,
+    retrieve_doc_coverage,
 )
 from flavia.content.scanner import FileEntry
 from flavia.config import Settings
@@ -111,7 +118,7 @@ class TestGetDocId:
         ]
         fts_results = []
 
-        doc_id = _get_doc_id("c1", vector_results, fts_results)
+        doc_id = _get_doc_id("c1", _index_results(vector_results), _index_results(fts_results))
         assert doc_id == "doc1"
 
     def test_get_doc_id_from_fts_results(self):
@@ -119,7 +126,7 @@ class TestGetDocId:
         vector_results = [{"chunk_id": "c1", "doc_id": "doc1"}]
         fts_results = [{"chunk_id": "c2", "doc_id": "doc2"}]
 
-        doc_id = _get_doc_id("c2", vector_results, fts_results)
+        doc_id = _get_doc_id("c2", _index_results(vector_results), _index_results(fts_results))
         assert doc_id == "doc2"
 
     def test_get_doc_id_prefers_vector(self):
@@ -127,12 +134,12 @@ class TestGetDocId:
         vector_results = [{"chunk_id": "c1", "doc_id": "doc_from_vector"}]
         fts_results = [{"chunk_id": "c1", "doc_id": "doc_from_fts"}]
 
-        doc_id = _get_doc_id("c1", vector_results, fts_results)
+        doc_id = _get_doc_id("c1", _index_results(vector_results), _index_results(fts_results))
         assert doc_id == "doc_from_vector"
 
     def test_get_doc_id_not_found(self):
         """Return empty string when chunk not found."""
-        doc_id = _get_doc_id("nonexistent", [], [])
+        doc_id = _get_doc_id("nonexistent", {}, {})
         assert doc_id == ""
 
 
@@ -156,7 +163,9 @@ class TestMergeChunkData:
             "text": "Example text",
         }]
 
-        result = _merge_chunk_data("c1", 0.5, 1, 2, vector_results, fts_results)
+        result = _merge_chunk_data(
+            "c1", 0.5, 1, 2, _index_results(vector_results), _index_results(fts_results)
+        )
 
         assert result["chunk_id"] == "c1"
         assert result["doc_id"] == "doc1"
@@ -182,7 +191,9 @@ class TestMergeChunkData:
             "text": "Example text",
         }]
 
-        result = _merge_chunk_data("c1", 0.5, None, 1, vector_results, fts_results)
+        result = _merge_chunk_data(
+            "c1", 0.5, None, 1, _index_results(vector_results), _index_results(fts_results)
+        )
 
         assert result["doc_id"] == "doc1"
         assert result["modality"] == "text"
@@ -203,7 +214,9 @@ class TestMergeChunkData:
         }]
         fts_results = []
 
-        result = _merge_chunk_data("c1", 0.5, 1, None, vector_results, fts_results)
+        result = _merge_chunk_data(
+            "c1", 0.5, 1, None, _index_results(vector_results), _index_results(fts_results)
+        )
 
         assert result["text"] == ""
 
@@ -296,6 +309,175 @@ class TestVectorStoreLifecycle:
         mock_get_client.assert_not_called()
 
 
+class TestRetrievalSession:
+    """Tests for warm state reuse across retrieve() calls."""
+
+    @patch("flavia.content.indexer.retrieval.embed_query", return_value=[0.0] * 768)
+    @patch("flavia.content.indexer.retrieval.get_embedding_client")
+    @patch("flavia.content.indexer.retrieval.FTSIndex")
+    @patch("flavia.content.indexer.retrieval.VectorStore")
+    def test_session_reuses_connections_and_client(
+        self, mock_vs, mock_fts, mock_get_client, _mock_embed, tmp_path: Path
+    ):
+        """Repeated searches in one session should open stores and the client once."""
+        mock_vs.return_value.knn_search.return_value = []
+        mock_fts.return_value.search.return_value = []
+        mock_get_client.return_value = (MagicMock(), "model")
+        settings = Settings()
+
+        with RetrievalSession(tmp_path, settings) as session:
+            for question in ("first question", "second question", "third question"):
+                retrieve(question, tmp_path, settings, session=session)
+
+        assert mock_fts.call_count == 1
+        assert mock_vs.call_count == 1
+        assert mock_get_client.call_count == 1
+        mock_fts.return_value.close.assert_called_once()
+        mock_vs.return_value.close.assert_called_once()
+
+    @patch("flavia.content.indexer.retrieval.embed_query", return_value=[0.0] * 768)
+    @patch("flavia.content.indexer.retrieval.get_embedding_client")
+    @patch("flavia.content.indexer.retrieval.FTSIndex")
+    @patch("flavia.content.indexer.retrieval.VectorStore")
+    def test_repeated_question_uses_query_embedding_cache(
+        self, mock_vs, mock_fts, mock_get_client, mock_embed, tmp_path: Path
+    ):
+        """Repeated questions should be embedded once and report cache stats."""
+        mock_vs.return_value.knn_search.return_value = []
+        mock_fts.return_value.search.return_value = []
+        mock_get_client.return_value = (MagicMock(), "model")
+        settings = Settings(rag_query_cache_persist=False)
+
+        first_trace: dict = {}
+        second_trace: dict = {}
+        retrieve("kalman filter", tmp_path, settings, debug_info=first_trace)
+        retrieve("kalman filter", tmp_path, settings, debug_info=second_trace)
+
+        assert mock_embed.call_count == 1
+        assert first_trace["query_cache"]["source"] == "api"
+        assert second_trace["query_cache"]["source"] == "memory"
+        assert second_trace["query_cache"]["hit_rate"] == 0.5
+
+    @patch("flavia.content.indexer.retrieval.FTSIndex")
+    def test_session_reopens_connections_when_index_changes(self, mock_fts, tmp_path: Path):
+        """A rewritten index.db should invalidate the session's connections."""
+        index_db = tmp_path / ".index" / "index.db"
+        index_db.parent.mkdir()
+        index_db.write_bytes(b"")
+
+        session = RetrievalSession(tmp_path)
+        session.refresh()
+        session.fts_index()
+        session.refresh()
+        session.fts_index()
+        assert mock_fts.call_count == 1
+
+        index_db.write_bytes(b"rebuilt")
+        session.refresh()
+        session.fts_index()
+        assert mock_fts.call_count == 2
+        mock_fts.return_value.close.assert_called_once()
+
+    def test_session_reloads_catalog_and_doc_map_on_change(self, tmp_path: Path):
+        """The parsed catalog and doc_id map should follow content_catalog.json."""
+        first = _make_catalog_entry(path="docs/a.md", summary="alpha", checksum_sha256="sha_a")
+        _write_catalog(tmp_path, [first])
+        session = RetrievalSession(tmp_path)
+
+        catalog = session.catalog()
+        assert session.catalog() is catalog
+        assert set(session.doc_entries()) == {
+            _catalog_doc_id(tmp_path, first.path, first.checksum_sha256)
+        }
+
+        second = _make_catalog_entry(path="docs/b.md", summary="beta", checksum_sha256="sha_b")
+        _write_catalog(tmp_path, [first, second])
+        assert session.catalog() is not catalog
+        assert len(session.doc_entries()) == 2
+
+    def test_session_follows_sqlite_catalog(self, tmp_path: Path):
+        """After migration the session reads and tracks content_catalog.db."""
+        first = _make_catalog_entry(path="docs/a.md", summary="alpha", checksum_sha256="sha_a")
+        _write_catalog(tmp_path, [first])
+        ContentCatalog.convert_storage(tmp_path / ".flavia", "sqlite")
+        session = RetrievalSession(tmp_path)
+
+        catalog = session.catalog()
+        assert catalog is not None
+        assert len(session.doc_entries()) == 1
+
+        second = _make_catalog_entry(path="docs/b.md", summary="beta", checksum_sha256="sha_b")
+        _write_catalog(tmp_path, [first, second])
+        assert not (tmp_path / ".flavia" / "content_catalog.json").exists()
+        assert session.catalog() is not catalog
+        assert len(session.doc_entries()) == 2
+
+
+class TestRetrieveDocCoverage:
+    """Tests for batched per-document coverage retrieval."""
+
+    @patch("flavia.content.indexer.retrieval.embed_query", return_value=[0.0] * 768)
+    @patch("flavia.content.indexer.retrieval.get_embedding_client")
+    @patch("flavia.content.indexer.retrieval.FTSIndex")
+    @patch("flavia.content.indexer.retrieval.VectorStore")
+    def test_one_embedding_and_one_query_per_index(
+        self, mock_vs, mock_fts, mock_get_client, mock_embed, tmp_path: Path
+    ):
+        """Covering several docs should embed once and query each index once."""
+        mock_get_client.return_value = (MagicMock(), "model")
+        doc_ids = [f"doc_{i}" for i in range(6)]
+        mock_vs.return_value.knn_search_per_doc.return_value = {
+            doc_id: [
+                {
+                    "chunk_id": f"{doc_id}_v{j}",
+                    "doc_id": doc_id,
+                    "modality": "text",
+                    "heading_path": [],
+                    "doc_name": f"{doc_id}.pdf",
+                    "file_type": "pdf",
+                    "locator": {},
+                    "converted_path": "",
+                }
+                for j in range(3)
+            ]
+            for doc_id in doc_ids[:5]
+        }
+        mock_fts.return_value.search_per_doc.return_value = {
+            "doc_0": [
+                {
+                    "chunk_id": "doc_0_v2",
+                    "doc_id": "doc_0",
+                    "modality": "text",
+                    "heading_path": [],
+                    "text": "matched text",
+                }
+            ]
+        }
+
+        coverage = retrieve_doc_coverage(
+            "compare item by item",
+            tmp_path,
+            Settings(rag_query_cache_persist=False, rag_query_cache_size=0),
+            doc_ids,
+            per_doc_k=2,
+        )
+
+        assert mock_embed.call_count == 1
+        mock_vs.return_value.knn_search_per_doc.assert_called_once()
+        mock_fts.return_value.search_per_doc.assert_called_once()
+        assert list(coverage) == doc_ids[:5]
+        assert all(len(results) == 2 for results in coverage.values())
+        # Hits found by both indexes rank first within their document.
+        assert coverage["doc_0"][0]["chunk_id"] == "doc_0_v2"
+        assert coverage["doc_0"][0]["text"] == "matched text"
+
+    @patch("flavia.content.indexer.retrieval.get_embedding_client")
+    def test_empty_doc_ids_skip_all_work(self, mock_get_client, tmp_path: Path):
+        """No documents to cover should return {} without embedding."""
+        assert retrieve_doc_coverage("question", tmp_path, Settings(), []) == {}
+        mock_get_client.assert_not_called()
+
+
 class TestCatalogRouterStageA:
     """Tests for Stage A catalog routing behavior."""
 
@@ -325,6 +507,117 @@ class TestCatalogRouterStageA:
 
         assert routed == [converted_doc_id]
 
+    def test_catalog_router_persists_corpus_between_queries(self, tmp_path: Path):
+        """Stage A should not re-parse the catalog while the router table is current."""
+        entry = _make_catalog_entry(
+            path="docs/quantum.md",
+            summary="quantum entanglement notes",
+            checksum_sha256="sha_quantum",
+        )
+        _write_catalog(tmp_path, [entry])
+        doc_id = _catalog_doc_id(tmp_path, entry.path, entry.checksum_sha256)
+
+        assert _route_doc_ids_from_catalog("quantum", tmp_path) == [doc_id]
+        with patch(
+            "flavia.content.indexer.retrieval.ContentCatalog.load",
+            side_effect=AssertionError("catalog should not be reloaded"),
+        ):
+            assert _route_doc_ids_from_catalog("entanglement", tmp_path) == [doc_id]
+
+    def test_catalog_router_tracks_catalog_saves(self, tmp_path: Path):
+        """Saving the catalog should update the persistent router corpus incrementally."""
+        quantum_entry = _make_catalog_entry(
+            path="docs/quantum.md",
+            summary="quantum entanglement notes",
+            checksum_sha256="sha_quantum",
+        )
+        _write_catalog(tmp_path, [quantum_entry])
+        assert _route_doc_ids_from_catalog("cooking", tmp_path) == []
+
+        cooking_entry = _make_catalog_entry(
+            path="docs/cooking.md",
+            summary="Italian cooking recipes",
+            checksum_sha256="sha_cooking",
+        )
+        _write_catalog(tmp_path, [cooking_entry])
+        cooking_doc_id = _catalog_doc_id(
+            tmp_path, cooking_entry.path, cooking_entry.checksum_sha256
+        )
+
+        with patch(
+            "flavia.content.indexer.retrieval.ContentCatalog.load",
+            side_effect=AssertionError("save should have synced the router"),
+        ):
+            assert _route_doc_ids_from_catalog("cooking", tmp_path) == [cooking_doc_id]
+            assert _route_doc_ids_from_catalog("quantum", tmp_path) == []
+
+    def test_catalog_router_picks_up_summary_edits(self, tmp_path: Path):
+        """Summary edits keep catalog_updated_at but must still reach the router."""
+        entry = _make_catalog_entry(
+            path="docs/notes.md",
+            summary="quantum entanglement notes",
+            checksum_sha256="sha_notes",
+        )
+        catalog = ContentCatalog(tmp_path)
+        catalog.catalog_updated_at = "2026-01-01T00:00:00+00:00"
+        catalog.files = {entry.path: entry}
+        catalog.save(tmp_path / ".flavia")
+        doc_id = _catalog_doc_id(tmp_path, entry.path, entry.checksum_sha256)
+        assert _route_doc_ids_from_catalog("cooking", tmp_path) == []
+
+        catalog.files[entry.path].summary = "Italian cooking recipes"
+        catalog.save(tmp_path / ".flavia")
+
+        assert catalog.catalog_updated_at == "2026-01-01T00:00:00+00:00"
+        assert _route_doc_ids_from_catalog("cooking", tmp_path) == [doc_id]
+
+    def test_catalog_router_sync_only_touches_changed_docs(self, tmp_path: Path):
+        """Router sync should diff documents and skip work for an unchanged catalog."""
+        entries = [
+            _make_catalog_entry(
+                path=f"docs/{i}.md", summary=f"topic {i}", checksum_sha256=f"sha{i}"
+            )
+            for i in range(3)
+        ]
+        catalog = ContentCatalog(tmp_path)
+        catalog.catalog_updated_at = "2026-01-01T00:00:00+00:00"
+        catalog.files = {entry.path: entry for entry in entries}
+
+        with CatalogRouterIndex(tmp_path) as router:
+            assert router.sync(catalog, tmp_path) == {"added": 3, "updated": 0, "removed": 0}
+            assert router.sync(catalog, tmp_path) == {"added": 0, "updated": 0, "removed": 0}
+
+            catalog.files["docs/0.md"].summary = "rewritten topic"
+            del catalog.files["docs/1.md"]
+            catalog.catalog_updated_at = "2026-01-02T00:00:00+00:00"
+            assert router.sync(catalog, tmp_path) == {"added": 0, "updated": 1, "removed": 1}
+            assert router.doc_count() == 2
+            conn = router._get_connection()
+            assert conn.execute("SELECT COUNT(*) FROM catalog_fts").fetchone()[0] == 2
+
+    def test_catalog_router_rebuilds_legacy_layout(self, tmp_path: Path):
+        """A docs table without FTS rowids is dropped and the corpus re-synced."""
+        entry = _make_catalog_entry(path="docs/a.md", summary="topic", checksum_sha256="sha_a")
+        catalog = ContentCatalog(tmp_path)
+        catalog.catalog_updated_at = "2026-01-01T00:00:00+00:00"
+        catalog.files = {entry.path: entry}
+        (tmp_path / ".index").mkdir()
+
+        conn = sqlite3.connect(tmp_path / ".index" / "index.db")
+        conn.execute("CREATE VIRTUAL TABLE catalog_fts USING fts5(doc_id UNINDEXED, content)")
+        conn.execute(
+            "CREATE TABLE catalog_router_docs (doc_id TEXT PRIMARY KEY, content_hash TEXT NOT NULL)"
+        )
+        conn.execute("INSERT INTO catalog_fts (doc_id, content) VALUES ('stale', 'old')")
+        conn.execute("INSERT INTO catalog_router_docs VALUES ('stale', 'x')")
+        conn.commit()
+        conn.close()
+
+        with CatalogRouterIndex(tmp_path) as router:
+            assert router.sync(catalog, tmp_path) == {"added": 1, "updated": 0, "removed": 0}
+            conn = router._get_connection()
+            assert conn.execute("SELECT COUNT(*) FROM catalog_fts").fetchone()[0] == 1
+
     @patch("flavia.content.indexer.retrieval.FTSIndex")
     @patch("flavia.content.indexer.retrieval.VectorStore")
     @patch("flavia.content.indexer.retrieval.get_embedding_client")
@@ -768,6 +1061,58 @@ class TestRRFFusionOrdering:
 
         assert [r["chunk_id"] for r in results[:2]] == ["a_chunk", "b_chunk"]
 
+    @patch("flavia.content.indexer.retrieval.FTSIndex")
+    @patch("flavia.content.indexer.retrieval.VectorStore")
+    @patch("flavia.content.indexer.retrieval.get_embedding_client")
+    def test_settings_select_fusion_strategy(self, mock_get_client, mock_vs, mock_fts):
+        """rag_fusion_strategy should pick the strategy and be recorded in the trace."""
+        mock_get_client.return_value = (MagicMock(), "model")
+
+        vector_results = [
+            {"chunk_id": "v1", "doc_id": "doc1", "modality": "text", "heading_path": [],
+             "doc_name": "doc1", "file_type": "txt", "locator": {}, "converted_path": "",
+             "distance": 0.1},
+        ]
+        fts_results = [
+            {"chunk_id": "f1", "doc_id": "doc2", "modality": "text", "heading_path": [],
+             "text": "text", "bm25_score": -5.0},
+        ]
+
+        mock_vs_instance = MagicMock()
+        mock_vs_instance.knn_search.return_value = vector_results
+        mock_fts_instance = MagicMock()
+        mock_fts_instance.search.return_value = fts_results
+        mock_vs.return_value = mock_vs_instance
+        mock_fts.return_value = mock_fts_instance
+
+        settings = Settings(
+            rag_fusion_strategy="weighted_rrf",
+            rag_fusion_vector_weight=1.0,
+            rag_fusion_fts_weight=3.0,
+        )
+        trace: dict = {}
+        with patch("flavia.content.indexer.retrieval.embed_query", return_value=[0.0] * 768):
+            results = retrieve("question", Path("/tmp"), settings, top_k=10, debug_info=trace)
+
+        assert trace["params"]["fusion"] == "weighted_rrf"
+        assert [r["chunk_id"] for r in results] == ["f1", "v1"]
+        assert results[0]["score"] == pytest.approx(3.0 / 61)
+
+    def test_unknown_fusion_strategy_warns_and_falls_back_to_rrf(self, caplog):
+        """An unknown strategy name should be logged once with the valid options."""
+        settings = Settings(rag_fusion_strategy="reciprocal")
+
+        with caplog.at_level("WARNING", logger="flavia.content.indexer.retrieval"):
+            first = _resolve_fusion(None, settings, rrf_k=42)
+            second = _resolve_fusion(None, settings, rrf_k=42)
+
+        assert isinstance(first, RRFFusion) and first.k == 42
+        assert isinstance(second, RRFFusion)
+        warnings = [r.getMessage() for r in caplog.records]
+        assert len(warnings) == 1
+        assert "'reciprocal'" in warnings[0]
+        assert "rrf, weighted_rrf, combsum" in warnings[0]
+
 
 class TestRetrieveIntegration:
     """Integration tests with real index structures."""
@@ -0,0 +1,157 @@
+"""Tests for the parallel conversion scheduler."""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from flavia.content.catalog import ContentCatalog
+from flavia.content.converters import ConversionScheduler
+from flavia.content.converters.base import BaseConverter
+
+
+class _LocalConverter(BaseConverter):
+    """Picklable process-pool converter (module-level for spawn workers)."""
+
+    supported_extensions = {".pdf"}
+    conversion_pool = "process"
+
+    def convert(self, source_path: Path, output_dir: Path, output_format: str = "md"):
+        if source_path.name.startswith("crash"):
+            os._exit(1)
+        output_file = output_dir / source_path.with_suffix(f".{output_format}").name
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        output_file.write_text(f"pid {os.getpid()}", encoding="utf-8")
+        return output_file
+
+    def extract_text(self, source_path: Path):
+        return None
+
+
+class _ApiConverter(BaseConverter):
+    """Thread-pool converter that records its peak concurrency."""
+
+    supported_extensions = {".mp3"}
+    max_concurrency = 2
+
+    def __init__(self):
+        self.calls: list[Path] = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def convert(self, source_path: Path, output_dir: Path, output_format: str = "md"):
+        with self._lock:
+            self.calls.append(source_path)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+        if source_path.name.startswith("bad"):
+            raise RuntimeError("transcription failed")
+        output_file = output_dir / source_path.with_suffix(f".{output_format}").name
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        output_file.write_text("transcript", encoding="utf-8")
+        return output_file
+
+    def extract_text(self, source_path: Path):
+        return None
+
+
+def _catalog_with(tmp_path: Path, names: list[str]) -> ContentCatalog:
+    for name in names:
+        (tmp_path / name).write_bytes(name.encode())
+    catalog = ContentCatalog(tmp_path)
+    catalog.build()
+    return catalog
+
+
+def _use_converters(monkeypatch, api: _ApiConverter) -> None:
+    local = _LocalConverter()
+    monkeypatch.setattr(
+        "flavia.content.converters.converter_registry.get_for_file",
+        lambda path: local if path.suffix == ".pdf" else api,
+    )
+
+
+def test_api_converters_respect_max_concurrency(monkeypatch, tmp_path):
+    names = [f"talk{i}.mp3" for i in range(6)] + ["bad.mp3"]
+    catalog = _catalog_with(tmp_path, names)
+    api = _ApiConverter()
+    _use_converters(monkeypatch, api)
+
+    scheduler = ConversionScheduler(tmp_path, process_workers=0, thread_workers=8)
+    summary = scheduler.run(catalog.get_files_needing_conversion())
+
+    assert summary["converted"] == 6
+    assert summary["failed"] == 1
+    assert api.peak == 2
+    assert catalog.files["talk0.mp3"].converted_to == ".converted/talk0.md"
+    assert catalog.files["bad.mp3"].converted_to is None
+    assert summary["by_converter"]["_ApiConverter"]["converted"] == 6
+    assert summary["files_per_minute"] > 0
+    assert not (tmp_path / ".flavia" / "conversion_progress.json").exists()
+
+
+def test_process_pool_isolates_crashing_converter(monkeypatch, tmp_path):
+    catalog = _catalog_with(tmp_path, ["a.pdf", "b.pdf", "crash.pdf"])
+    _use_converters(monkeypatch, _ApiConverter())
+
+    results = []
+    scheduler = ConversionScheduler(tmp_path, process_workers=2, thread_workers=2)
+    summary = scheduler.run(catalog.get_files_needing_conversion(), on_result=results.append)
+
+    by_path = {result.path: result for result in results}
+    assert by_path["a.pdf"].status == "converted"
+    assert by_path["b.pdf"].status == "converted"
+    assert by_path["crash.pdf"].status == "failed"
+    assert by_path["crash.pdf"].error == "worker process crashed"
+    assert summary["converted"] == 2
+    # Conversions ran outside the parent process.
+    assert (tmp_path / ".converted" / "a.md").read_text() != f"pid {os.getpid()}"
+
+
+def test_resumes_from_progress_checkpoint(monkeypatch, tmp_path):
+    catalog = _catalog_with(tmp_path, ["done.mp3", "todo.mp3"])
+    api = _ApiConverter()
+    _use_converters(monkeypatch, api)
+
+    (tmp_path / ".converted").mkdir()
+    (tmp_path / ".converted" / "done.md").write_text("transcript")
+    (tmp_path / ".flavia").mkdir()
+    (tmp_path / ".flavia" / "conversion_progress.json").write_text(
+        json.dumps(
+            {
+                "done.mp3": {
+                    "checksum": catalog.files["done.mp3"].checksum_sha256,
+                    "converted_to": ".converted/done.md",
+                    "converter": "_ApiConverter",
+                }
+            }
+        )
+    )
+
+    scheduler = ConversionScheduler(tmp_path, process_workers=0, thread_workers=2)
+    summary = scheduler.run(catalog.get_files_needing_conversion())
+
+    assert api.calls == [tmp_path / "todo.mp3"]
+    assert summary["resumed"] == 1
+    assert summary["converted"] == 1
+    assert catalog.files["done.mp3"].converted_to == ".converted/done.md"
+
+
+def test_skips_converters_with_missing_dependencies(monkeypatch, tmp_path):
+    catalog = _catalog_with(tmp_path, ["talk.mp3"])
+    api = _ApiConverter()
+    monkeypatch.setattr(api, "check_dependencies", lambda: (False, ["mistralai"]))
+    _use_converters(monkeypatch, api)
+
+    results = []
+    scheduler = ConversionScheduler(tmp_path, process_workers=0, thread_workers=2)
+    summary = scheduler.run(catalog.get_files_needing_conversion(), on_result=results.append)
+
+    assert summary["skipped"] == 1
+    assert results[0].error == "missing dependencies (mistralai)"
+    assert api.calls == []
@@ -9,8 +9,10 @@ from flavia.content.indexer.embedder import (
     DEFAULT_BATCH_SIZE,
     EMBEDDING_DIMENSION,
     EMBEDDING_MODEL,
+    AdaptiveConcurrencyLimiter,
     _format_chunk_for_embedding,
     _l2_normalize,
+    embed_chunk_batch,
     embed_chunks,
     embed_query,
     get_embedding_client,
@@ -445,3 +447,67 @@ class TestConstants:
     def test_default_batch_size_constant(self):
         """Should have reasonable default batch size."""
         assert DEFAULT_BATCH_SIZE == 64
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Tests for AdaptiveConcurrencyLimiter."""
+
+    def test_halves_limit_on_rate_limit_and_recovers(self):
+        """429s should halve the limit; sustained successes should grow it back."""
+        limiter = AdaptiveConcurrencyLimiter(8, increase_after=2)
+
+        limiter.record_rate_limited()
+        assert limiter.limit == 4
+        limiter.record_rate_limited()
+        limiter.record_rate_limited()
+        limiter.record_rate_limited()
+        assert limiter.limit == 1
+
+        for _ in range(4):
+            limiter.record_success()
+        assert limiter.limit == 3
+        assert limiter.rate_limited_count == 4
+
+    def test_blocks_when_limit_reached(self):
+        """acquire() should wait until a slot is released."""
+        import threading
+
+        limiter = AdaptiveConcurrencyLimiter(1)
+        limiter.acquire()
+        acquired = threading.Event()
+
+        def _worker():
+            with limiter:
+                acquired.set()
+
+        thread = threading.Thread(target=_worker)
+        thread.start()
+        assert not acquired.wait(0.1)
+        limiter.release()
+        assert acquired.wait(2)
+        thread.join()
+        assert limiter.in_flight == 0
+
+
+class TestEmbedChunkBatch:
+    """Tests for embed_chunk_batch function."""
+
+    def test_rate_limit_shrinks_shared_limiter(self):
+        """A 429 response should be reported to the limiter before retrying."""
+        mock_client = MagicMock()
+        ok_response = MagicMock()
+        ok_embedding = MagicMock()
+        ok_embedding.embedding = [1.0] * EMBEDDING_DIMENSION
+        ok_response.data = [ok_embedding]
+        mock_client.embeddings.create.side_effect = [Exception("Error 429: slow down"), ok_response]
+
+        limiter = AdaptiveConcurrencyLimiter(4)
+        chunks = [{"chunk_id": "c1", "source": {}, "heading_path": [], "text": "T"}]
+
+        with patch("flavia.content.indexer.embedder.time.sleep"):
+            results = embed_chunk_batch(chunks, mock_client, limiter=limiter)
+
+        assert results[0][0] == "c1"
+        assert results[0][2] is None
+        assert limiter.limit == 2
+        assert limiter.in_flight == 0
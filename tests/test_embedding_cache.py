@@ -0,0 +1,187 @@
+"""Tests for the content-addressed embedding cache."""
+
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from flavia.content.indexer.embedding_cache import (
+    EmbeddingCache,
+    QueryEmbeddingCache,
+    get_query_embedding_cache,
+)
+
+
+def _make_chunk(chunk_id, text, name="doc.pdf", heading_path=None):
+    return {
+        "chunk_id": chunk_id,
+        "doc_id": "d1",
+        "modality": "text",
+        "text": text,
+        "heading_path": heading_path or [],
+        "source": {"name": name, "file_type": "pdf"},
+    }
+
+
+class TestEmbeddingCacheInit:
+    """Tests for EmbeddingCache initialization."""
+
+    def test_creates_cache_database_in_index_dir(self, tmp_path: Path):
+        """Should create .index/embedding_cache.db separate from index.db."""
+        with EmbeddingCache(tmp_path) as cache:
+            cache._get_connection()
+            assert (tmp_path / ".index" / "embedding_cache.db").exists()
+            assert not (tmp_path / ".index" / "index.db").exists()
+
+
+class TestPrune:
+    """Tests for dropping entries no indexed chunk references."""
+
+    def test_prune_keeps_entries_referenced_by_live_chunks(self, tmp_path: Path):
+        """Entries survive while any live chunk still uses them."""
+        chunks = {
+            "a": _make_chunk("a", "shared text"),
+            "b": _make_chunk("b", "shared text"),
+            "c": _make_chunk("c", "gone text"),
+        }
+        with EmbeddingCache(tmp_path) as cache:
+            cache.store_chunks(chunks, [(cid, [1.0], None) for cid in chunks], "m1")
+            assert cache.get_stats()["entry_count"] == 2
+
+            assert cache.prune({"b"}) == 1
+            assert set(cache.lookup_chunks(list(chunks.values()), "m1")) == {"a", "b"}
+
+            assert cache.prune(set()) == 1
+            assert cache.get_stats()["entry_count"] == 0
+
+    def test_lookup_hits_reference_entries(self, tmp_path: Path):
+        """A cache hit for a new chunk ID keeps the entry alive for that chunk."""
+        with EmbeddingCache(tmp_path) as cache:
+            cache.store_chunks({"old": _make_chunk("old", "text")}, [("old", [1.0], None)], "m1")
+            assert cache.lookup_chunks([_make_chunk("new", "text")], "m1") == {"new": [1.0]}
+
+            assert cache.prune({"new"}) == 0
+            assert cache.get_stats()["entry_count"] == 1
+
+
+class TestLookupAndStore:
+    """Tests for text-keyed lookup/store."""
+
+    def test_roundtrip(self, tmp_path: Path):
+        """Stored vectors should be returned for the same text and model."""
+        with EmbeddingCache(tmp_path) as cache:
+            assert cache.store([("hello", [0.5, 0.25])], "m1") == 1
+            found = cache.lookup(["hello", "other"], "m1")
+
+            assert found == {EmbeddingCache.cache_key("hello", "m1"): [0.5, 0.25]}
+
+    def test_keyed_by_model(self, tmp_path: Path):
+        """A vector stored for one model must not be served for another."""
+        with EmbeddingCache(tmp_path) as cache:
+            cache.store([("hello", [0.5, 0.25])], "m1")
+            assert cache.lookup(["hello"], "m2") == {}
+
+    def test_persists_across_instances(self, tmp_path: Path):
+        """Cache contents should survive reopening the database."""
+        with EmbeddingCache(tmp_path) as cache:
+            cache.store([("hello", [1.0])], "m1")
+
+        with EmbeddingCache(tmp_path) as cache:
+            assert cache.get_stats()["entry_count"] == 1
+            assert len(cache.lookup(["hello"], "m1")) == 1
+
+
+class TestChunkHelpers:
+    """Tests for chunk-level helpers and hit/miss counters."""
+
+    def test_lookup_chunks_matches_on_formatted_text_not_chunk_id(self, tmp_path: Path):
+        """Chunks with new IDs but identical embedding input should hit."""
+        old = _make_chunk("old", "same text", heading_path=["Intro"])
+        new = _make_chunk("new", "same text", heading_path=["Intro"])
+        renamed = _make_chunk("renamed", "same text", name="other.pdf", heading_path=["Intro"])
+
+        with EmbeddingCache(tmp_path) as cache:
+            cache.store_chunks({"old": old}, [("old", [0.1, 0.2], None)], "m1")
+            found = cache.lookup_chunks([new, renamed], "m1")
+
+            assert list(found) == ["new"]
+            assert cache.hits == 1
+            assert cache.misses == 1
+
+    def test_store_chunks_skips_failures(self, tmp_path: Path):
+        """Failed embeddings must not be cached."""
+        chunk = _make_chunk("c1", "text")
+        with EmbeddingCache(tmp_path) as cache:
+            written = cache.store_chunks(
+                {"c1": chunk}, [("c1", None, "rate limited"), ("unknown", [1.0], None)], "m1"
+            )
+            assert written == 0
+            assert cache.get_stats()["entry_count"] == 0
+
+
+class TestQueryEmbeddingCache:
+    """Tests for the query embedding LRU with SQLite backing."""
+
+    def test_memory_hit_skips_embedding(self):
+        """Identical queries should only be embedded once."""
+        cache = QueryEmbeddingCache(max_entries=4)
+        calls = []
+
+        def _embed(text):
+            calls.append(text)
+            return [1.0, 0.0]
+
+        assert cache.get_or_embed("what is  kalman?", "m", _embed) == ([1.0, 0.0], "api")
+        assert cache.get_or_embed(" what is kalman? ", "m", _embed) == ([1.0, 0.0], "memory")
+        assert calls == ["what is kalman?"]
+        assert cache.get_stats()["hit_rate"] == 0.5
+
+    def test_keyed_by_model(self):
+        """A different model must not reuse another model's vector."""
+        cache = QueryEmbeddingCache(max_entries=4)
+        cache.store("q", "model-a", [1.0])
+        assert cache.lookup("q", "model-b") == (None, None)
+
+    def test_lru_evicts_least_recently_used(self):
+        """The in-memory cache should hold at most max_entries vectors."""
+        cache = QueryEmbeddingCache(max_entries=2)
+        cache.store("a", "m", [1.0])
+        cache.store("b", "m", [2.0])
+        cache.lookup("a", "m")
+        cache.store("c", "m", [3.0])
+
+        assert cache.lookup("b", "m") == (None, None)
+        assert cache.lookup("a", "m") == ([1.0], "memory")
+        assert cache.get_stats()["entries"] == 2
+
+    def test_ttl_expires_entries(self):
+        """Entries older than ttl_seconds should be treated as misses."""
+        cache = QueryEmbeddingCache(max_entries=4, ttl_seconds=60)
+        with patch("flavia.content.indexer.embedding_cache.time.time", return_value=1000.0):
+            cache.store("q", "m", [1.0])
+        with patch("flavia.content.indexer.embedding_cache.time.time", return_value=1030.0):
+            assert cache.lookup("q", "m")[1] == "memory"
+        with patch("flavia.content.indexer.embedding_cache.time.time", return_value=1100.0):
+            assert cache.lookup("q", "m") == (None, None)
+
+    def test_disk_backing_survives_new_instance(self, tmp_path: Path):
+        """Persisted vectors should be served from disk by a fresh cache."""
+        db_path = tmp_path / ".index" / "embedding_cache.db"
+        first = QueryEmbeddingCache(max_entries=4, db_path=db_path)
+        first.store("q", "m", [0.5, 0.25])
+        first.close()
+
+        second = QueryEmbeddingCache(max_entries=4, db_path=db_path)
+        assert second.lookup("q", "m") == ([0.5, 0.25], "disk")
+        assert second.lookup("q", "m") == ([0.5, 0.25], "memory")
+        second.close()
+
+    def test_registry_shares_instances_and_honors_disable(self, tmp_path: Path):
+        """One cache per vault/config; size 0 without persistence disables it."""
+        settings = SimpleNamespace(
+            rag_query_cache_size=8, rag_query_cache_ttl=0, rag_query_cache_persist=False
+        )
+        assert get_query_embedding_cache(tmp_path, settings) is get_query_embedding_cache(
+            tmp_path, settings
+        )
+        settings.rag_query_cache_size = 0
+        assert get_query_embedding_cache(tmp_path, settings) is None
@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pytest
 
+from flavia.content.indexer import fts
 from flavia.content.indexer.fts import FTSIndex
 
 
@@ -120,6 +121,51 @@ class TestUpsert:
             assert results[0]["text"] == "second version"
 
 
+class TestBulkUpsert:
+    """Tests for FTSIndex.bulk_upsert method."""
+
+    def test_mixed_batch_reports_inserts_and_updates(self, tmp_path: Path):
+        """One batch with new and existing chunks should split counts correctly."""
+        with FTSIndex(tmp_path) as idx:
+            idx.bulk_upsert([_make_chunk("c1", text="alpha"), _make_chunk("c2", text="beta")])
+
+            inserted, updated = idx.bulk_upsert(
+                [_make_chunk("c2", text="gamma"), _make_chunk("c3", text="delta")]
+            )
+
+            assert inserted == 1
+            assert updated == 1
+            assert idx.get_existing_chunk_ids() == {"c1", "c2", "c3"}
+            assert idx.search("beta") == []
+            assert idx.search("gamma")[0]["chunk_id"] == "c2"
+
+    def test_empty_batch_is_noop(self, tmp_path: Path):
+        """An empty batch should not touch the database."""
+        with FTSIndex(tmp_path) as idx:
+            assert idx.bulk_upsert([]) == (0, 0)
+
+    def test_enables_wal_journal(self, tmp_path: Path):
+        """Bulk ingest should switch the shared index.db to WAL mode."""
+        with FTSIndex(tmp_path) as idx:
+            idx.bulk_upsert([_make_chunk("c1", text="alpha")])
+            mode = idx._get_connection().execute("PRAGMA journal_mode").fetchone()[0]
+            assert mode == "wal"
+
+    def test_rolls_back_on_failure(self, tmp_path: Path):
+        """A failing batch should leave previously committed rows intact."""
+        with FTSIndex(tmp_path) as idx:
+            idx.bulk_upsert([_make_chunk("c1", text="alpha")])
+
+            bad_chunk = _make_chunk("c2", text="beta")
+            bad_chunk["text"] = object()  # not bindable by sqlite3
+
+            with pytest.raises(Exception):
+                idx.bulk_upsert([_make_chunk("c1", text="replaced"), bad_chunk])
+
+            assert idx.get_existing_chunk_ids() == {"c1"}
+            assert idx.search("alpha")[0]["chunk_id"] == "c1"
+
+
 class TestSearch:
     """Tests for FTSIndex.search method."""
 
@@ -263,6 +309,78 @@ class TestSearch:
             assert results[0]["chunk_id"] == "c1"
 
 
+class TestSearchPerDoc:
+    """Tests for FTSIndex.search_per_doc method."""
+
+    def test_returns_top_hits_for_each_doc(self, tmp_path: Path):
+        """Each requested document should get its own top-k hits."""
+        with FTSIndex(tmp_path) as idx:
+            idx.upsert([
+                _make_chunk("a1", doc_id="doc_a", text="kalman filter kalman filter"),
+                _make_chunk("a2", doc_id="doc_a", text="kalman notes"),
+                _make_chunk("a3", doc_id="doc_a", text="kalman appendix"),
+                _make_chunk("b1", doc_id="doc_b", text="kalman filter derivation"),
+                _make_chunk("c1", doc_id="doc_c", text="kalman filter elsewhere"),
+            ])
+
+            grouped = idx.search_per_doc("kalman filter", ["doc_a", "doc_b"], k_per_doc=2)
+
+            assert set(grouped) == {"doc_a", "doc_b"}
+            assert [r["chunk_id"] for r in grouped["doc_a"]][0] == "a1"
+            assert len(grouped["doc_a"]) == 2
+            assert [r["chunk_id"] for r in grouped["doc_b"]] == ["b1"]
+
+    def test_matches_single_doc_search(self, tmp_path: Path):
+        """Per-doc ranking should agree with a doc-scoped search()."""
+        with FTSIndex(tmp_path) as idx:
+            idx.upsert([
+                _make_chunk(f"c{i}", doc_id=f"doc_{i % 2}", text="entropy " * (i + 1) + "gradient")
+                for i in range(8)
+            ])
+
+            grouped = idx.search_per_doc("entropy gradient", ["doc_0", "doc_1"], k_per_doc=3)
+            for doc_id in ("doc_0", "doc_1"):
+                scoped = idx.search("entropy gradient", k=3, doc_ids_filter=[doc_id])
+                assert [r["chunk_id"] for r in grouped[doc_id]] == [
+                    r["chunk_id"] for r in scoped
+                ]
+
+    def test_empty_inputs_return_empty(self, tmp_path: Path):
+        """Blank queries, empty scopes and non-positive k should return {}."""
+        with FTSIndex(tmp_path) as idx:
+            idx.upsert([_make_chunk("c1", doc_id="doc_a", text="kalman")])
+
+            assert idx.search_per_doc("", ["doc_a"]) == {}
+            assert idx.search_per_doc("kalman", []) == {}
+            assert idx.search_per_doc("kalman", ["doc_a"], k_per_doc=0) == {}
+            assert idx.search_per_doc("missing", ["doc_a"]) == {}
+
+    def test_plain_cte_matches_materialized(self, tmp_path: Path, monkeypatch):
+        """SQLite < 3.35 (no AS MATERIALIZED) should rank the same hits."""
+        with FTSIndex(tmp_path) as idx:
+            idx.upsert([
+                _make_chunk(f"c{i}", doc_id=f"doc_{i % 2}", text="entropy " * (i + 1) + "gradient")
+                for i in range(8)
+            ])
+            expected = idx.search_per_doc("entropy gradient", ["doc_0", "doc_1"], k_per_doc=3)
+
+            monkeypatch.setattr(fts, "CTE_AS", "AS")
+            assert idx.search_per_doc("entropy gradient", ["doc_0", "doc_1"], k_per_doc=3) == (
+                expected
+            )
+
+    def test_query_errors_are_logged(self, tmp_path: Path, monkeypatch, caplog):
+        """A failing query variant should be logged, not silently skipped."""
+        with FTSIndex(tmp_path) as idx:
+            idx.upsert([_make_chunk("c1", doc_id="doc_a", text="kalman")])
+            monkeypatch.setattr(fts, "CTE_AS", "AS NOT VALID SQL")
+
+            with caplog.at_level("WARNING", logger="flavia.content.indexer.fts"):
+                assert idx.search_per_doc("kalman", ["doc_a"]) == {}
+
+            assert "Per-document FTS query" in caplog.text
+
+
 class TestGetExistingChunkIds:
     """Tests for FTSIndex.get_existing_chunk_ids method."""
 
@@ -312,6 +430,66 @@ class TestDeleteChunks:
             assert idx.delete_chunks([]) == 0
 
 
+class TestVideoFrames:
+    """Tests for the video_frames table used by temporal expansion."""
+
+    def _frames(self):
+        return [
+            {"time_seconds": t, "path": f"frames/f{t}.md", "description": f"Frame {t}"}
+            for t in (10.0, 20.0, 45.0, 90.0)
+        ]
+
+    def test_range_query_returns_sorted_frames(self, tmp_path: Path):
+        """Frames inside the window should be returned in time order."""
+        with FTSIndex(tmp_path) as idx:
+            assert idx.replace_video_frames("vid", self._frames()) == 4
+
+            frames = idx.get_video_frames("vid", 15.0, 50.0)
+            assert [f["time_start"] for f in frames] == [20.0, 45.0]
+            assert frames[0]["text"] == "Frame 20.0"
+            assert idx.get_video_frames("other", 0.0, 100.0) == []
+
+    def test_nearest_frames_respect_max_distance(self, tmp_path: Path):
+        """Nearest lookups should pick the closest frame on each side."""
+        with FTSIndex(tmp_path) as idx:
+            idx.replace_video_frames("vid", self._frames())
+
+            before, after = idx.get_nearest_video_frames("vid", 60.0, max_distance=30.0)
+            assert before["time_start"] == 45.0
+            assert after["time_start"] == 90.0
+
+            before, after = idx.get_nearest_video_frames("vid", 5.0, max_distance=5.0)
+            assert before is None
+            assert after["time_start"] == 10.0
+
+    def test_replace_and_recorded_flag(self, tmp_path: Path):
+        """Replacing should drop old frames; empty documents still count as recorded."""
+        with FTSIndex(tmp_path) as idx:
+            assert idx.video_frames_recorded("vid") is False
+            idx.replace_video_frames("vid", self._frames())
+            idx.replace_video_frames("vid", self._frames()[:1])
+            assert [f["time_start"] for f in idx.get_video_frames("vid", 0, 100)] == [10.0]
+
+            idx.replace_video_frames("silent", [])
+            assert idx.video_frames_recorded("silent") is True
+
+    def test_delete_chunks_prunes_orphaned_frames(self, tmp_path: Path):
+        """Frames should be dropped once their document has no chunks left."""
+        with FTSIndex(tmp_path) as idx:
+            idx.upsert([
+                _make_chunk("v1", doc_id="vid", modality="video_frame", text="slide"),
+                _make_chunk("w1", doc_id="keep", modality="video_frame", text="slide"),
+            ])
+            idx.replace_video_frames("vid", self._frames())
+            idx.replace_video_frames("keep", self._frames())
+
+            idx.delete_chunks(["v1"])
+
+            assert idx.video_frames_recorded("vid") is False
+            assert idx.get_video_frames("vid", 0, 100) == []
+            assert len(idx.get_video_frames("keep", 0, 100)) == 4
+
+
 class TestGetStats:
     """Tests for FTSIndex.get_stats method."""
 
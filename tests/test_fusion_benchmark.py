@@ -0,0 +1,120 @@
+"""Benchmark: hybrid-retrieval fusion at growing candidate counts.
+
+Times the fused ranking plus result assembly done by ``retrieve()`` for each
+fusion strategy at k=15 (default), k=120 (exhaustive mode) and k=1000
+candidates per source, and compares it with the former linear-scan lookups.
+
+These tests are opt-in and skipped by default.
+
+Run with:
+  FLAVIA_BENCHMARK=1 pytest -q -s tests/test_fusion_benchmark.py
+
+Optional env vars:
+  FLAVIA_BENCHMARK_REPEATS (default: 20)
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import time
+
+import pytest
+
+from flavia.content.indexer.fusion import FUSION_STRATEGIES, fuse_rankings, get_fusion_strategy
+from flavia.content.indexer.retrieval import _get_doc_id, _index_results, _merge_chunk_data
+
+
+def _enabled() -> bool:
+    return os.getenv("FLAVIA_BENCHMARK", "").strip() == "1"
+
+
+def _repeats() -> int:
+    return int(os.getenv("FLAVIA_BENCHMARK_REPEATS", "20"))
+
+
+pytestmark = pytest.mark.skipif(
+    not _enabled(), reason="Set FLAVIA_BENCHMARK=1 to run benchmarks."
+)
+
+
+def _results(k: int, seed: int) -> tuple[list[dict], list[dict]]:
+    """Build vector/FTS result lists of size k that overlap by about half."""
+    rng = random.Random(seed)
+    pool = [f"c{i}" for i in range(int(k * 1.5))]
+    vector_ids = rng.sample(pool, k)
+    fts_ids = rng.sample(pool, k)
+    vector = [
+        {
+            "chunk_id": c,
+            "doc_id": f"d{int(c[1:]) % 40}",
+            "distance": 0.01 * i,
+            "modality": "text",
+            "heading_path": [],
+            "doc_name": "doc.pdf",
+            "file_type": "pdf",
+            "locator": {},
+            "converted_path": "",
+        }
+        for i, c in enumerate(vector_ids)
+    ]
+    fts = [
+        {
+            "chunk_id": c,
+            "doc_id": f"d{int(c[1:]) % 40}",
+            "bm25_score": -20.0 + 0.01 * i,
+            "modality": "text",
+            "heading_path": [],
+            "text": "body",
+        }
+        for i, c in enumerate(fts_ids)
+    ]
+    return vector, fts
+
+
+def _fuse_indexed(vector: list[dict], fts: list[dict], strategy) -> list[dict]:
+    fused = fuse_rankings(vector, fts, strategy)
+    vector_by_id = _index_results(vector)
+    fts_by_id = _index_results(fts)
+    results = []
+    for chunk_id, score, v_rank, f_rank in fused:
+        _get_doc_id(chunk_id, vector_by_id, fts_by_id)
+        results.append(_merge_chunk_data(chunk_id, score, v_rank, f_rank, vector_by_id, fts_by_id))
+    return results
+
+
+def _fuse_linear(vector: list[dict], fts: list[dict], strategy) -> list[dict]:
+    """Former shape: scan both result lists for every fused candidate."""
+    results = []
+    for chunk_id, score, v_rank, f_rank in fuse_rankings(vector, fts, strategy):
+        v_data = next((r for r in vector if r["chunk_id"] == chunk_id), None)
+        f_data = next((r for r in fts if r["chunk_id"] == chunk_id), None)
+        v_map = {chunk_id: v_data} if v_data else {}
+        f_map = {chunk_id: f_data} if f_data else {}
+        results.append(_merge_chunk_data(chunk_id, score, v_rank, f_rank, v_map, f_map))
+    return results
+
+
+def _time(fn, *args) -> float:
+    repeats = _repeats()
+    started = time.perf_counter()
+    for _ in range(repeats):
+        fn(*args)
+    return (time.perf_counter() - started) / repeats
+
+
+@pytest.mark.parametrize("k", [15, 120, 1000])
+@pytest.mark.parametrize("name", sorted(FUSION_STRATEGIES))
+def test_fusion_throughput(k: int, name: str):
+    vector, fts = _results(k, seed=k)
+    strategy = get_fusion_strategy(name)
+
+    indexed = _fuse_indexed(vector, fts, strategy)
+    assert indexed == _fuse_linear(vector, fts, strategy)
+
+    indexed_s = _time(_fuse_indexed, vector, fts, strategy)
+    linear_s = _time(_fuse_linear, vector, fts, strategy)
+    print(
+        f"\nfusion[{name}] k={k}: {len(indexed)} candidates | indexed {indexed_s * 1000:.3f} ms "
+        f"| linear scan {linear_s * 1000:.3f} ms | speedup x{linear_s / indexed_s:.1f}"
+    )
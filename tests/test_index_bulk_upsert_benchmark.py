@@ -0,0 +1,114 @@
+"""Benchmark: per-row vs bulk upsert throughput for VectorStore and FTSIndex.
+
+Compares calling ``upsert`` once per chunk (one transaction per row, the
+shape of the old ingest path) against a single ``bulk_upsert`` call, and
+prints rows/sec for both.
+
+These tests are opt-in and skipped by default.
+
+Run with:
+  FLAVIA_BENCHMARK=1 pytest -q -s tests/test_index_bulk_upsert_benchmark.py
+
+Optional env vars:
+  FLAVIA_BENCHMARK_ROWS (default: 5000)
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import time
+from importlib.util import find_spec
+from pathlib import Path
+
+import pytest
+
+from flavia.content.indexer.fts import FTSIndex
+from flavia.content.indexer.vector_store import VectorStore
+
+
+def _enabled() -> bool:
+    return os.getenv("FLAVIA_BENCHMARK", "").strip() == "1"
+
+
+def _row_count() -> int:
+    return int(os.getenv("FLAVIA_BENCHMARK_ROWS", "5000"))
+
+
+pytestmark = pytest.mark.skipif(
+    not _enabled(), reason="Set FLAVIA_BENCHMARK=1 to run benchmarks."
+)
+
+
+def _fts_chunks(n: int) -> list[dict]:
+    words = ["matrix", "kalman", "filter", "entropy", "gradient", "lecture", "proof", "rfc"]
+    rng = random.Random(0)
+    return [
+        {
+            "chunk_id": f"c{i}",
+            "doc_id": f"d{i // 50}",
+            "modality": "text",
+            "text": " ".join(rng.choice(words) for _ in range(120)),
+            "heading_path": ["Chapter", f"Section {i % 7}"],
+        }
+        for i in range(n)
+    ]
+
+
+def _vector_items(n: int) -> list[tuple[str, list[float], dict]]:
+    rng = random.Random(0)
+    return [
+        (
+            f"c{i}",
+            [rng.random() for _ in range(768)],
+            {"doc_id": f"d{i // 50}", "modality": "text", "doc_name": f"doc{i // 50}.pdf"},
+        )
+        for i in range(n)
+    ]
+
+
+def _report(label: str, rows: int, per_row_s: float, bulk_s: float) -> None:
+    print(
+        f"\n{label}: {rows} rows | per-row {rows / per_row_s:,.0f} rows/s "
+        f"({per_row_s:.2f}s) | bulk {rows / bulk_s:,.0f} rows/s ({bulk_s:.2f}s) "
+        f"| speedup x{per_row_s / bulk_s:.1f}"
+    )
+
+
+def test_fts_bulk_upsert_throughput(tmp_path: Path):
+    rows = _row_count()
+    chunks = _fts_chunks(rows)
+
+    with FTSIndex(tmp_path / "per_row") as idx:
+        started = time.perf_counter()
+        for chunk in chunks:
+            idx.upsert([chunk])
+        per_row_s = time.perf_counter() - started
+
+    with FTSIndex(tmp_path / "bulk") as idx:
+        started = time.perf_counter()
+        inserted, updated = idx.bulk_upsert(chunks)
+        bulk_s = time.perf_counter() - started
+
+    assert (inserted, updated) == (rows, 0)
+    _report("FTSIndex", rows, per_row_s, bulk_s)
+
+
+@pytest.mark.skipif(find_spec("sqlite_vec") is None, reason="sqlite-vec not installed")
+def test_vector_bulk_upsert_throughput(tmp_path: Path):
+    rows = _row_count()
+    items = _vector_items(rows)
+
+    with VectorStore(tmp_path / "per_row") as store:
+        started = time.perf_counter()
+        for item in items:
+            store.upsert([item])
+        per_row_s = time.perf_counter() - started
+
+    with VectorStore(tmp_path / "bulk") as store:
+        started = time.perf_counter()
+        inserted, updated = store.bulk_upsert(items)
+        bulk_s = time.perf_counter() - started
+
+    assert (inserted, updated) == (rows, 0)
+    _report("VectorStore", rows, per_row_s, bulk_s)
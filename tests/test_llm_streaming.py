@@ -0,0 +1,259 @@
+"""Tests for streamed LLM responses (STREAM_RESPONSES)."""
+
+import asyncio
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+import openai
+
+from flavia.agent.base import BaseAgent
+from flavia.agent.profile import AgentProfile
+from flavia.agent.status import StatusPhase, ToolStatus, format_llm_metrics
+from flavia.agent.streaming import StreamAssembler
+from flavia.config.settings import Settings
+from flavia.interfaces.telegram_interface import _StreamPreview
+
+
+class _DummyAgent(BaseAgent):
+    def run(self, user_message: str) -> str:
+        return user_message
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _chunk(content=None, tool_calls=None, usage=None, finish_reason=None):
+    choices = []
+    if content is not None or tool_calls is not None or finish_reason is not None:
+        delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+        choices.append(SimpleNamespace(delta=delta, finish_reason=finish_reason))
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+def _tool_delta(index, call_id=None, name=None, arguments=None):
+    return SimpleNamespace(
+        index=index,
+        id=call_id,
+        function=SimpleNamespace(name=name, arguments=arguments),
+    )
+
+
+def _tool_call_chunks():
+    return [
+        _chunk(content="Let me "),
+        _chunk(content="check."),
+        _chunk(tool_calls=[_tool_delta(0, "call-1", "read_file", '{"pa')]),
+        _chunk(tool_calls=[_tool_delta(0, arguments='th": "a.md"}')]),
+        _chunk(tool_calls=[_tool_delta(1, "call-2", "list_files")]),
+        _chunk(finish_reason="tool_calls"),
+        _chunk(usage=SimpleNamespace(prompt_tokens=120, completion_tokens=9)),
+    ]
+
+
+def test_assembler_joins_content_and_tool_call_deltas():
+    clock = _FakeClock()
+    assembler = StreamAssembler(clock=clock)
+    texts = []
+    for index, chunk in enumerate(_tool_call_chunks()):
+        clock.now = 0.5 + index * 0.25
+        texts.append(assembler.add(chunk))
+    message = assembler.finish()
+
+    assert "".join(texts) == "Let me check."
+    assert message.content == "Let me check."
+    assert [call.id for call in message.tool_calls] == ["call-1", "call-2"]
+    assert message.tool_calls[0].function.name == "read_file"
+    assert message.tool_calls[0].function.arguments == '{"path": "a.md"}'
+    assert message.tool_calls[1].function.arguments == "{}"
+    assert assembler.finish_reason == "tool_calls"
+    assert assembler.ttft == 0.5
+    assert assembler.completion_tokens == 9
+    assert assembler.tokens_per_second == 9 / 1.5
+
+
+def test_assembler_estimates_tokens_without_usage():
+    clock = _FakeClock()
+    assembler = StreamAssembler(clock=clock)
+    for chunk in (_chunk(content="a"), _chunk(content="b"), _chunk(finish_reason="stop")):
+        clock.now += 1.0
+        assembler.add(chunk)
+    message = assembler.finish()
+
+    assert message.content == "ab"
+    assert message.tool_calls is None
+    assert assembler.usage is None
+    assert assembler.completion_tokens == 2
+
+
+def test_call_llm_streams_deltas_and_reports_metrics():
+    settings = Settings(
+        api_key="test-key",
+        api_base_url="https://api.synthetic.new/openai/v1",
+        stream_responses=True,
+    )
+    profile = AgentProfile(context="test", base_dir=Path.cwd(), tools=[], subagents={}, name="main")
+    agent = _DummyAgent(settings=settings, profile=profile)
+    requests = []
+
+    def _create(**kwargs):
+        requests.append(kwargs)
+        return iter(_tool_call_chunks())
+
+    agent.client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=_create))
+    )
+    deltas: list[str] = []
+    statuses = []
+    agent.stream_callback = deltas.append
+    agent.status_callback = statuses.append
+
+    message = agent._call_llm([{"role": "user", "content": "hi"}])
+
+    assert requests[0]["stream"] is True
+    assert requests[0]["stream_options"] == {"include_usage": True}
+    assert deltas == ["Let me ", "check."]
+    assert agent.last_prompt_tokens == 120
+    assert agent.last_completion_tokens == 9
+    assert agent._assistant_message_to_dict(message)["tool_calls"][0]["function"] == {
+        "name": "read_file",
+        "arguments": '{"path": "a.md"}',
+    }
+    phases = [status.phase for status in statuses]
+    assert phases == [StatusPhase.STREAMING_LLM, StatusPhase.LLM_COMPLETED]
+    assert statuses[0].ttft is not None
+    assert statuses[1].tokens_per_second is not None
+    assert "TTFT" in format_llm_metrics(statuses[1])
+
+
+def test_call_llm_retries_without_stream_options_when_rejected():
+    settings = Settings(
+        api_key="test-key",
+        api_base_url="https://api.synthetic.new/openai/v1",
+        stream_responses=True,
+    )
+    profile = AgentProfile(context="test", base_dir=Path.cwd(), tools=[], subagents={}, name="main")
+    agent = _DummyAgent(settings=settings, profile=profile)
+    requests = []
+
+    def _create(**kwargs):
+        requests.append(kwargs)
+        if "stream_options" in kwargs:
+            response = httpx.Response(400, request=httpx.Request("POST", "https://example.test"))
+            raise openai.BadRequestError(
+                "unknown field: stream_options", response=response, body=None
+            )
+        return iter([_chunk(content="a"), _chunk(content="b"), _chunk(finish_reason="stop")])
+
+    agent.client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=_create))
+    )
+
+    message = agent._call_llm([{"role": "user", "content": "hi"}])
+    agent._call_llm([{"role": "user", "content": "again"}])
+
+    assert message.content == "ab"
+    assert ["stream_options" in request for request in requests] == [True, False, False]
+    assert agent.last_completion_tokens == 2
+    assert agent.last_prompt_tokens == 0
+
+
+class _FakePreviewMessage:
+    def __init__(self, text):
+        self.texts = [text]
+        self.deleted = False
+
+    async def edit_text(self, text):
+        self.texts.append(text)
+
+    async def delete(self):
+        self.deleted = True
+
+
+def test_telegram_stream_preview_rate_limits_edits():
+    clock = _FakeClock()
+    sent: list[_FakePreviewMessage] = []
+
+    async def _reply_text(text):
+        message = _FakePreviewMessage(text)
+        sent.append(message)
+        return message
+
+    update = SimpleNamespace(message=SimpleNamespace(reply_text=_reply_text))
+
+    async def _main():
+        preview = _StreamPreview(update, asyncio.get_running_loop(), interval=1.5, clock=clock)
+
+        def _worker():
+            for index, word in enumerate(["Hello", " there", ",", " friend", "!"]):
+                clock.now = index * 1.0
+                preview.feed(word)
+                if preview._pending is not None:
+                    preview._pending.result(timeout=5)
+
+        thread = threading.Thread(target=_worker)
+        thread.start()
+        while thread.is_alive():
+            await asyncio.sleep(0.01)
+        edits = preview.edits
+        await preview.close()
+        return edits
+
+    edits = asyncio.run(_main())
+
+    # Deltas at t=0..4 with a 1.5s interval: flushes at t=0, 2 and 4.
+    assert edits == 3
+    assert len(sent) == 1
+    assert sent[0].texts[0].startswith("Hello")
+    assert sent[0].texts[-1].startswith("Hello there, friend!")
+    assert sent[0].deleted
+
+
+def test_telegram_stream_preview_resets_on_each_llm_call():
+    clock = _FakeClock()
+    sent: list[_FakePreviewMessage] = []
+
+    async def _reply_text(text):
+        message = _FakePreviewMessage(text)
+        sent.append(message)
+        return message
+
+    update = SimpleNamespace(message=SimpleNamespace(reply_text=_reply_text))
+
+    async def _main():
+        preview = _StreamPreview(update, asyncio.get_running_loop(), interval=1.5, clock=clock)
+
+        def _feed(text, now):
+            clock.now = now
+            preview.feed(text)
+            if preview._pending is not None:
+                preview._pending.result(timeout=5)
+
+        def _worker():
+            # First LLM call narrates a tool call; the second writes the answer.
+            preview.on_status(ToolStatus.waiting_llm())
+            _feed("Let me search", 0.0)
+            _feed(" the notes.", 1.0)
+            preview.on_status(ToolStatus.waiting_llm(agent_id="main.sub", depth=1))
+            preview.on_status(ToolStatus.waiting_llm())
+            _feed("The answer", 2.0)
+            _feed(" is 42.", 4.0)
+
+        thread = threading.Thread(target=_worker)
+        thread.start()
+        while thread.is_alive():
+            await asyncio.sleep(0.01)
+        await preview.close()
+
+    asyncio.run(_main())
+
+    assert len(sent) == 1
+    assert sent[0].texts[0].startswith("Let me search")
+    assert sent[0].texts[-1] == "The answer is 42." + _StreamPreview.CURSOR
+    assert all("Let me search" not in text for text in sent[0].texts[1:])
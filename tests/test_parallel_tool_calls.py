@@ -0,0 +1,137 @@
+"""Tests for concurrent execution of side-effect-free tool calls."""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from flavia.agent.context import AgentContext
+from flavia.agent.recursive import RecursiveAgent
+from flavia.agent.status import StatusPhase
+from flavia.tools import registry
+from flavia.tools.base import BaseTool, ToolSchema
+
+
+class _FakeTool(BaseTool):
+    def __init__(self, name: str, concurrency_safe: bool):
+        self.name = name
+        self.concurrency_safe = concurrency_safe
+
+    def get_schema(self, **context) -> ToolSchema:
+        return ToolSchema(name=self.name, description=self.name)
+
+    def execute(self, args, agent_context) -> str:  # pragma: no cover - agent stub executes
+        return ""
+
+
+@pytest.fixture
+def fake_tools():
+    tools = [_FakeTool("fake_read", True), _FakeTool("fake_write", False)]
+    for tool in tools:
+        registry.register(tool)
+    yield
+    for tool in tools:
+        registry._tools.pop(tool.name, None)
+
+
+class _Recorder:
+    def __init__(self, delays=None, sizes=None):
+        self.delays = delays or {}
+        self.sizes = sizes or {}
+        self.events: list[str] = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, name, args):
+        label = args["label"]
+        with self.lock:
+            self.events.append(f"start:{label}")
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delays.get(label, 0.05))
+        with self.lock:
+            self.active -= 1
+            self.events.append(f"end:{label}")
+        return label * self.sizes.get(label, 1)
+
+
+def _agent(recorder: _Recorder, workers: int = 4) -> RecursiveAgent:
+    agent = RecursiveAgent.__new__(RecursiveAgent)
+    agent.settings = SimpleNamespace(verbose=False, tool_call_workers=workers)
+    agent.context = AgentContext(agent_id="main", current_depth=0, max_depth=3)
+    agent.max_context_tokens = 1_000
+    agent.last_prompt_tokens = 0
+    agent.statuses = []
+    agent.status_callback = agent.statuses.append
+    agent._execute_tool = recorder
+    return agent
+
+
+def _calls(*specs):
+    return [
+        SimpleNamespace(
+            id=f"call-{index}",
+            function=SimpleNamespace(name=name, arguments=f'{{"label": "{label}"}}'),
+        )
+        for index, (name, label) in enumerate(specs)
+    ]
+
+
+def test_read_only_calls_run_concurrently_in_order(fake_tools):
+    recorder = _Recorder(delays={"a": 0.15, "b": 0.05, "c": 0.1})
+    agent = _agent(recorder)
+
+    results, spawns = agent._process_tool_calls_with_spawns(
+        _calls(("fake_read", "a"), ("fake_read", "b"), ("fake_read", "c"))
+    )
+
+    assert recorder.peak == 3
+    assert [r["content"] for r in results] == ["a", "b", "c"]
+    assert [r["tool_call_id"] for r in results] == ["call-0", "call-1", "call-2"]
+    assert spawns == []
+    assert [s.phase for s in agent.statuses] == [StatusPhase.EXECUTING_TOOL] * 3
+
+
+def test_write_calls_stay_serial_between_read_batches(fake_tools):
+    recorder = _Recorder()
+    agent = _agent(recorder)
+
+    results, _ = agent._process_tool_calls_with_spawns(
+        _calls(
+            ("fake_read", "r1"),
+            ("fake_read", "r2"),
+            ("fake_write", "w"),
+            ("fake_read", "r3"),
+        )
+    )
+
+    events = recorder.events
+    assert events.index("start:w") > max(events.index("end:r1"), events.index("end:r2"))
+    assert events.index("start:r3") > events.index("end:w")
+    assert [r["content"] for r in results] == ["r1", "r2", "w", "r3"]
+
+
+def test_guard_budget_is_applied_in_call_order(fake_tools):
+    # The first call finishes last; budgeting must still follow call order.
+    recorder = _Recorder(delays={"x": 0.15, "y": 0.01}, sizes={"x": 800, "y": 800})
+    agent = _agent(recorder)
+    agent.last_prompt_tokens = 500
+
+    results, _ = agent._process_tool_calls_with_spawns(
+        _calls(("fake_read", "x"), ("fake_read", "y"))
+    )
+
+    assert results[0]["content"] == "x" * 800
+    assert "TOOL RESULT TRUNCATED" in results[1]["content"]
+
+
+def test_single_worker_keeps_calls_serial(fake_tools):
+    recorder = _Recorder()
+    agent = _agent(recorder, workers=1)
+
+    agent._process_tool_calls_with_spawns(_calls(("fake_read", "a"), ("fake_read", "b")))
+
+    assert recorder.peak == 1
+    assert recorder.events == ["start:a", "end:a", "start:b", "end:b"]
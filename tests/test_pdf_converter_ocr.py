@@ -6,38 +6,102 @@ from flavia.content.converters.mistral_ocr_converter import MistralOcrConverter
 from flavia.content.converters.pdf_converter import PdfConverter
 
 
+def _make_pdf(path: Path, pages: list[str]) -> Path:
+    """Write a minimal PDF with one line of Helvetica text per page ("" = blank page)."""
+    count = len(pages)
+    kids = " ".join(f"{3 + 2 * i} 0 R" for i in range(count))
+    font_id = 3 + 2 * count
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {count} >>",
+    ]
+    for i, text in enumerate(pages):
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {4 + 2 * i} 0 R "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> >>"
+        )
+        stream = f"BT /F1 10 Tf 20 720 Td ({text}) Tj ET" if text else ""
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+    objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    data = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(data))
+        data += f"{number} 0 obj\n{body}\nendobj\n".encode()
+    xref = len(data)
+    data += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    data += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    data += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    )
+    path.write_bytes(data)
+    return path
+
+
+def _text(label: str) -> str:
+    return f"{label} has enough text to count as a native text page."
+
+
+def _fail_ocr(*_args, **_kwargs):
+    raise AssertionError("OCR should not be used")
+
+
 def test_pdf_converter_convert_does_not_use_ocr_without_opt_in(monkeypatch, tmp_path):
-    source = tmp_path / "slides.pdf"
-    source.write_bytes(b"%PDF-1.4")
+    source = _make_pdf(tmp_path / "slides.pdf", [_text("Page one"), "", _text("Page three")])
     output_dir = tmp_path / ".converted"
 
-    monkeypatch.setattr(PdfConverter, "_is_scanned_pdf", staticmethod(lambda _p: True))
-    monkeypatch.setattr(PdfConverter, "_extract_with_pdfplumber", staticmethod(lambda _p: "Plain text"))
+    monkeypatch.setattr(MistralOcrConverter, "convert", _fail_ocr)
+    monkeypatch.setattr(MistralOcrConverter, "ocr_pages", _fail_ocr)
+
+    result = PdfConverter().convert(source, output_dir, allow_ocr=False)
+
+    assert result == output_dir / "slides.md"
+    content = result.read_text(encoding="utf-8")
+    assert content.startswith("# slides\n\nPage one has enough text")
+    assert content.index("Page one") < content.index("Page three")
+    assert [p.name for p in output_dir.iterdir()] == ["slides.md"]
+
+
+def test_pdf_converter_opens_pdf_once_and_ocrs_only_scanned_pages(monkeypatch, tmp_path):
+    import pdfplumber
+
+    source = _make_pdf(tmp_path / "mixed.pdf", [_text("Intro"), "", _text("Results"), "fig"])
+    output_dir = tmp_path / ".converted"
+
+    opened = []
+    real_open = pdfplumber.open
     monkeypatch.setattr(
-        MistralOcrConverter,
-        "convert",
-        lambda *_args, **_kwargs: (_ for _ in ()).throw(AssertionError("OCR should not be used")),
+        pdfplumber, "open", lambda *a, **kw: opened.append(a) or real_open(*a, **kw)
     )
+    requested = []
 
-    result = PdfConverter().convert(source, output_dir, allow_ocr=False)
+    def _fake_ocr_pages(_self, _pdf, pages=None):
+        requested.append(pages)
+        return {1: "OCR text of page two ![chart](img-1)"}, [("img-1", b"\x89PNG\r\n\x1a\n")]
 
-    assert result is not None
-    assert result.exists()
-    assert result.read_text(encoding="utf-8").startswith("# slides")
+    monkeypatch.setattr(MistralOcrConverter, "ocr_pages", _fake_ocr_pages)
+    monkeypatch.setattr(MistralOcrConverter, "convert", _fail_ocr)
+
+    result = PdfConverter().convert(source, output_dir, allow_ocr=True)
+
+    assert len(opened) == 1
+    assert requested == [[1, 3]]
+    content = result.read_text(encoding="utf-8")
+    assert content.index("Intro") < content.index("OCR text of page two")
+    assert content.index("OCR text of page two") < content.index("Results")
+    # Page 4 could not be OCR'd, so its own (short) text is kept.
+    assert content.rstrip().endswith("fig")
+    assert "mixed_images/img-0001.png" in content
+    assert (output_dir / "mixed_images" / "img-0001.png").exists()
 
 
 def test_pdf_converter_convert_routes_to_ocr_when_opted_in(monkeypatch, tmp_path):
-    source = tmp_path / "scan.pdf"
-    source.write_bytes(b"%PDF-1.4")
+    source = _make_pdf(tmp_path / "scan.pdf", ["", ""])
     output_dir = tmp_path / ".converted"
     expected = output_dir / "scan.md"
 
-    monkeypatch.setattr(PdfConverter, "_is_scanned_pdf", staticmethod(lambda _p: True))
-    monkeypatch.setattr(
-        PdfConverter,
-        "_extract_with_pdfplumber",
-        staticmethod(lambda _p: (_ for _ in ()).throw(AssertionError("Local extractor should not run"))),
-    )
+    monkeypatch.setattr(MistralOcrConverter, "ocr_pages", _fail_ocr)
     monkeypatch.setattr(MistralOcrConverter, "convert", lambda *_args, **_kwargs: expected)
 
     result = PdfConverter().convert(source, output_dir, allow_ocr=True)
@@ -45,6 +109,41 @@ def test_pdf_converter_convert_routes_to_ocr_when_opted_in(monkeypatch, tmp_path
     assert result == expected
 
 
+def test_pdf_converter_returns_none_for_pdf_without_text(tmp_path):
+    source = _make_pdf(tmp_path / "blank.pdf", ["", ""])
+    output_dir = tmp_path / ".converted"
+
+    assert PdfConverter().convert(source, output_dir) is None
+    assert list(output_dir.iterdir()) == []
+
+
+def test_pdf_converter_parallel_page_ranges_match_single_process(monkeypatch, tmp_path):
+    from flavia.content.converters import pdf_converter
+
+    pages = [_text(f"Page {i}") for i in range(7)]
+    source = _make_pdf(tmp_path / "long.pdf", pages)
+
+    sequential = PdfConverter().convert(source, tmp_path / "seq", output_format="txt")
+
+    monkeypatch.setattr(PdfConverter, "get_page_workers", classmethod(lambda cls: 3))
+    monkeypatch.setattr(pdf_converter, "PARALLEL_MIN_PAGES", 2)
+    parallel = PdfConverter().convert(source, tmp_path / "par", output_format="txt")
+
+    assert parallel.read_text(encoding="utf-8") == sequential.read_text(encoding="utf-8")
+    assert parallel.read_text(encoding="utf-8").count("\n\n") == 6
+
+
+def test_pdf_converter_extract_text_replaces_scanned_pages(monkeypatch, tmp_path):
+    source = _make_pdf(tmp_path / "doc.pdf", [_text("First"), ""])
+
+    monkeypatch.setattr(
+        MistralOcrConverter, "ocr_pages", lambda _self, _pdf, pages=None: ({1: "Scanned"}, [])
+    )
+
+    assert PdfConverter().extract_text(source) == _text("First")
+    assert PdfConverter().extract_text(source, allow_ocr=True) == f"{_text('First')}\n\nScanned"
+
+
 def test_mistral_ocr_converter_stores_images_next_to_nested_output(monkeypatch, tmp_path):
     source = tmp_path / "papers" / "doc.pdf"
     source.parent.mkdir(parents=True)
@@ -83,6 +83,22 @@ default_provider: openai
     assert provider.models[0].compact_threshold == 0.74
 
 
+def test_load_provider_config_parses_rate_limits():
+    from flavia.config.providers import load_provider_config
+
+    provider = load_provider_config(
+        {
+            "api_base_url": "https://api.example/v1",
+            "requests_per_minute": 60,
+            "tokens_per_minute": "invalid",
+        },
+        "example",
+    )
+
+    assert provider.requests_per_minute == 60
+    assert provider.tokens_per_minute is None
+
+
 def test_apply_args_uses_provider_index_when_registry_is_loaded():
     registry = ProviderRegistry(
         providers={
@@ -77,3 +77,18 @@ def test_read_recent_rag_debug_traces_can_filter_by_turn_id(tmp_path: Path):
     assert len(filtered) == 1
     assert filtered[0]["trace_id"] == keep_id
     assert filtered[0]["query_raw"] == "q2"
+
+
+def test_format_rag_debug_trace_includes_query_cache_stats():
+    rendered = format_rag_debug_trace(
+        {
+            "query_cache": {
+                "source": "memory",
+                "memory_hits": 3,
+                "disk_hits": 1,
+                "misses": 4,
+                "hit_rate": 0.5,
+            }
+        }
+    )
+    assert "query_cache: source=memory hit_rate=50% memory_hits=3 disk_hits=1 misses=4" in rendered
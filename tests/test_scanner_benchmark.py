@@ -0,0 +1,112 @@
+"""Benchmark: baseline serial walker vs the parallel FileScanner over a synthetic tree.
+
+Builds a tree of small files spread across nested directories and times a
+full scan with the original walker (serial ``Path.iterdir()`` walk that stats
+and hashes each file inline) against ``FileScanner.scan()`` with the default
+worker count, asserting both produce the same catalog.
+
+These tests are opt-in and skipped by default.
+
+Run with:
+  FLAVIA_BENCHMARK=1 pytest -q -s tests/test_scanner_benchmark.py
+
+Optional env vars:
+  FLAVIA_BENCHMARK_FILES (default: 100000)
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from flavia.content.scanner import DEFAULT_SCAN_WORKERS, DirectoryNode, FileEntry, FileScanner
+
+
+def _enabled() -> bool:
+    return os.getenv("FLAVIA_BENCHMARK", "").strip() == "1"
+
+
+def _file_count() -> int:
+    return int(os.getenv("FLAVIA_BENCHMARK_FILES", "100000"))
+
+
+pytestmark = pytest.mark.skipif(
+    not _enabled(), reason="Set FLAVIA_BENCHMARK=1 to run benchmarks."
+)
+
+
+class _BaselineScanner(FileScanner):
+    """The walker FileScanner shipped with before scans were parallelised."""
+
+    def scan(self) -> tuple[list[FileEntry], DirectoryNode]:
+        files: list[FileEntry] = []
+        root_node = self._baseline_tree(self.base_dir, files)
+        return files, root_node
+
+    def _baseline_tree(self, directory: Path, files: list[FileEntry]) -> DirectoryNode:
+        rel_path = str(directory.relative_to(self.base_dir))
+        node = DirectoryNode(path=rel_path, name=directory.name or str(self.base_dir))
+
+        try:
+            entries = sorted(directory.iterdir(), key=lambda e: (not e.is_dir(), e.name.lower()))
+        except PermissionError:
+            return node
+
+        file_count = 0
+        for entry in entries:
+            if entry.is_dir():
+                if entry.name in self.ignore_dirs or self._matches_ignore_pattern(entry.name):
+                    continue
+                child_node = self._baseline_tree(entry, files)
+                node.children.append(child_node)
+                file_count += child_node.file_count
+            elif entry.is_file():
+                if entry.name in self.ignore_files or self._matches_ignore_pattern(entry.name):
+                    continue
+                file_entry = self._create_file_entry(entry)
+                if file_entry:
+                    files.append(file_entry)
+                    file_count += 1
+
+        node.file_count = file_count
+        return node
+
+
+def _build_tree(base_dir: Path, n_files: int, files_per_dir: int = 200) -> None:
+    for i in range(n_files):
+        group = i // files_per_dir
+        directory = base_dir / f"group_{group // 10:03d}" / f"dir_{group:05d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"note_{i:06d}.md").write_text(f"# Note {i}\n\n" + "lorem ipsum " * 64)
+
+
+def _timed_scan(scanner: FileScanner):
+    started = time.perf_counter()
+    files, tree = scanner.scan()
+    return files, tree, time.perf_counter() - started
+
+
+def test_benchmark_parallel_scan(tmp_path: Path):
+    n_files = _file_count()
+    _build_tree(tmp_path, n_files)
+
+    baseline_files, baseline_tree, baseline_s = _timed_scan(_BaselineScanner(tmp_path))
+    parallel_files, parallel_tree, parallel_s = _timed_scan(
+        FileScanner(tmp_path, workers=DEFAULT_SCAN_WORKERS)
+    )
+
+    assert [f.path for f in parallel_files] == [f.path for f in baseline_files]
+    assert [f.checksum_sha256 for f in parallel_files] == [
+        f.checksum_sha256 for f in baseline_files
+    ]
+    assert parallel_tree.to_dict() == baseline_tree.to_dict()
+    assert baseline_tree.file_count == n_files
+
+    print(
+        f"\nfiles={n_files} baseline={baseline_s:.2f}s ({n_files / baseline_s:.0f} files/s) "
+        f"workers={DEFAULT_SCAN_WORKERS} parallel={parallel_s:.2f}s "
+        f"({n_files / parallel_s:.0f} files/s) speedup={baseline_s / parallel_s:.2f}x"
+    )
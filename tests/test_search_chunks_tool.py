@@ -2,6 +2,7 @@
 
 import hashlib
 import json
+import threading
 from pathlib import Path
 
 from flavia.agent.context import AgentContext
@@ -270,6 +271,52 @@ def test_search_chunks_persists_citation_entries(tmp_path: Path, monkeypatch) ->
     assert payload["doc_name"] == "paper.pdf"
 
 
+def test_search_chunks_reuses_retrieval_session_across_calls(tmp_path: Path, monkeypatch) -> None:
+    _create_catalog_and_index(tmp_path)
+    tool = SearchChunksTool()
+    ctx = _make_context(tmp_path)
+
+    monkeypatch.setattr("flavia.config.settings.get_settings", _make_settings_stub)
+    sessions = []
+
+    def _fake_retrieve(*, question, base_dir, settings, doc_ids_filter, top_k, **kwargs):
+        sessions.append(kwargs["session"])
+        return []
+
+    monkeypatch.setattr("flavia.content.indexer.retrieve", _fake_retrieve)
+    tool.execute({"query": "first"}, ctx)
+    tool.execute({"query": "second", "file_type_filter": "pdf"}, ctx)
+
+    assert len(sessions) == 2
+    assert sessions[0] is sessions[1] is ctx.retrieval_session
+
+
+def test_search_chunks_keeps_session_across_threads(tmp_path: Path, monkeypatch) -> None:
+    _create_catalog_and_index(tmp_path)
+    tool = SearchChunksTool()
+    ctx = _make_context(tmp_path)
+
+    monkeypatch.setattr("flavia.config.settings.get_settings", _make_settings_stub)
+    sessions = []
+
+    def _fake_retrieve(*, question, base_dir, settings, doc_ids_filter, top_k, **kwargs):
+        session = kwargs["session"]
+        with session.lock:
+            session.catalog_router().doc_count()
+        sessions.append(session)
+        return []
+
+    monkeypatch.setattr("flavia.content.indexer.retrieve", _fake_retrieve)
+    for query in ("first", "second"):
+        worker = threading.Thread(target=tool.execute, args=({"query": query}, ctx))
+        worker.start()
+        worker.join()
+
+    assert len(sessions) == 2
+    assert sessions[0] is sessions[1] is ctx.retrieval_session
+    ctx.retrieval_session.close()
+
+
 def test_search_chunks_scopes_by_at_file_reference(tmp_path: Path, monkeypatch) -> None:
     _create_catalog_and_index(tmp_path)
     tool = SearchChunksTool()
@@ -322,6 +369,28 @@ def test_search_chunks_at_file_intersects_with_filters(tmp_path: Path, monkeypat
     assert "No documents remain after combining @file references" in result
 
 
+def test_search_chunks_resolves_path_suffix_and_stem_mentions(tmp_path: Path) -> None:
+    from flavia.tools.content.search_chunks import _resolve_doc_ids_from_mentions
+
+    (tmp_path / "papers" / "2024").mkdir(parents=True)
+    (tmp_path / "papers" / "2024" / "attention.pdf").write_bytes(b"%PDF-1.4 fake")
+    (tmp_path / "draft.pdf").write_bytes(b"%PDF-1.4 draft")
+    catalog = ContentCatalog(tmp_path)
+    catalog.build()
+    entry = catalog.files["papers/2024/attention.pdf"]
+    entry.converted_to = ".converted/papers/2024/attention.md"
+
+    resolved, unresolved, unindexed = _resolve_doc_ids_from_mentions(
+        ["2024/attention.pdf", "attention", "draft.pdf", "nothing.pdf"],
+        catalog=catalog,
+        base_dir=tmp_path,
+    )
+
+    assert resolved == [catalog.doc_id_for(entry)]
+    assert unresolved == ["nothing.pdf"]
+    assert unindexed == ["draft.pdf"]
+
+
 def test_search_chunks_reports_unknown_at_file_reference(tmp_path: Path, monkeypatch) -> None:
     _create_catalog_and_index(tmp_path)
     tool = SearchChunksTool()
@@ -416,8 +485,14 @@ def test_search_chunks_exhaustive_backfills_missing_docs_in_multi_doc_scope(
                     "text": "Expected criteria excerpt.",
                 }
             ]
-        if doc_ids_filter == [lecture_doc_id]:
-            return [
+        return []
+
+    coverage_calls: list[list[str]] = []
+
+    def _fake_retrieve_doc_coverage(*, question, base_dir, settings, doc_ids, **kwargs):
+        coverage_calls.append(list(doc_ids))
+        return {
+            lecture_doc_id: [
                 {
                     "chunk_id": "lecture-1",
                     "doc_id": lecture_doc_id,
@@ -428,9 +503,12 @@ def test_search_chunks_exhaustive_backfills_missing_docs_in_multi_doc_scope(
                     "text": "Submitted evidence excerpt.",
                 }
             ]
-        return []
+        }
 
     monkeypatch.setattr("flavia.content.indexer.retrieve", _fake_retrieve)
+    monkeypatch.setattr(
+        "flavia.content.indexer.retrieve_doc_coverage", _fake_retrieve_doc_coverage
+    )
     output = tool.execute(
         {
             "query": "@paper.pdf @lecture.mp4 compare item by item",
@@ -439,6 +517,7 @@ def test_search_chunks_exhaustive_backfills_missing_docs_in_multi_doc_scope(
         ctx,
     )
 
-    assert any(call.get("doc_ids_filter") == [lecture_doc_id] for call in calls)
+    assert len(calls) == 1
+    assert coverage_calls == [[lecture_doc_id]]
     assert "[C-test-0001] paper.pdf" in output
     assert "lecture.mp4" in output
@@ -0,0 +1,242 @@
+"""Tests for eager sub-agent dispatch and the tree-wide fan-out cap."""
+
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from flavia.agent.context import AgentContext
+from flavia.agent.profile import AgentProfile
+from flavia.agent.recursive import RecursiveAgent, _SpawnSlots
+from flavia.config.settings import Settings
+from flavia.tools import registry
+from flavia.tools.base import BaseTool, ToolSchema
+
+
+class _SlowWriteTool(BaseTool):
+    name = "fake_slow_write"
+
+    def get_schema(self, **context) -> ToolSchema:
+        return ToolSchema(name=self.name, description=self.name)
+
+    def execute(self, args, agent_context) -> str:  # pragma: no cover - agent stub executes
+        return ""
+
+
+@pytest.fixture
+def slow_tool():
+    registry.register(_SlowWriteTool())
+    yield
+    registry._tools.pop(_SlowWriteTool.name, None)
+
+
+def _agent(parallel_workers: int = 4) -> RecursiveAgent:
+    agent = RecursiveAgent.__new__(RecursiveAgent)
+    agent.settings = SimpleNamespace(
+        verbose=False, tool_call_workers=4, parallel_workers=parallel_workers
+    )
+    agent.context = AgentContext(agent_id="main", current_depth=0, max_depth=3)
+    agent.max_context_tokens = 1_000
+    agent.last_prompt_tokens = 0
+    agent.status_callback = None
+    return agent
+
+
+def test_spawn_starts_before_later_tool_calls_finish(slow_tool):
+    agent = _agent()
+    events: list[str] = []
+    lock = threading.Lock()
+
+    def _execute_tool(name, args):
+        if name == "spawn_agent":
+            return '__SPAWN_AGENT__:{"task": "dig", "context": "ctx"}'
+        with lock:
+            events.append("start:write")
+        time.sleep(0.2)
+        with lock:
+            events.append("end:write")
+        return "written"
+
+    def _execute_single_spawn(spawn):
+        with lock:
+            events.append(f"spawn:{spawn['task']}")
+        return "[sub-agent]: done"
+
+    agent._execute_tool = _execute_tool
+    agent._execute_single_spawn = _execute_single_spawn
+    tool_calls = [
+        SimpleNamespace(
+            id="call-0",
+            function=SimpleNamespace(name="spawn_agent", arguments='{"task": "dig"}'),
+        ),
+        SimpleNamespace(
+            id="call-1",
+            function=SimpleNamespace(name="fake_slow_write", arguments="{}"),
+        ),
+    ]
+
+    results, spawns = agent._process_tool_calls_with_spawns(tool_calls, dispatch_spawns=True)
+
+    assert events.index("spawn:dig") < events.index("end:write")
+    assert results[0]["content"] == "[Spawning sub-agent...]"
+    assert [spawn["tool_call_id"] for spawn in spawns] == ["call-0"]
+    assert agent._collect_spawn_results(spawns) == [
+        {"tool_call_id": "call-0", "content": "[sub-agent]: done"}
+    ]
+
+
+def test_collect_spawn_results_keeps_call_order_and_reports_errors():
+    agent = _agent()
+
+    def _execute_single_spawn(spawn):
+        time.sleep(spawn["delay"])
+        if spawn["task"] == "boom":
+            raise RuntimeError("failed")
+        return spawn["task"]
+
+    agent._execute_single_spawn = _execute_single_spawn
+    spawns = [
+        {"tool_call_id": "a", "type": "dynamic", "task": "slow", "delay": 0.1},
+        {"tool_call_id": "b", "type": "dynamic", "task": "boom", "delay": 0.0},
+        {"tool_call_id": "c", "type": "dynamic", "task": "queued", "delay": 0.0},
+    ]
+    for spawn in spawns[:2]:
+        spawn["future"] = agent._dispatch_spawn(spawn)
+
+    results = agent._collect_spawn_results(spawns)
+
+    assert [item["tool_call_id"] for item in results] == ["a", "b", "c"]
+    assert [item["content"] for item in results] == [
+        "slow",
+        "Error in sub-agent: failed",
+        "queued",
+    ]
+
+
+def test_spawn_slots_cap_fan_out_across_nested_levels():
+    slots = _SpawnSlots(2)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def _leaf() -> None:
+        nonlocal active, peak
+        with slots.hold():
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+
+    def _parent() -> None:
+        with slots.hold():
+            children = [threading.Thread(target=_leaf) for _ in range(3)]
+            for child in children:
+                child.start()
+            # Waiting for children must not pin a slot, or two parents would deadlock.
+            with slots.released():
+                for child in children:
+                    child.join()
+
+    parents = [threading.Thread(target=_parent) for _ in range(2)]
+    for parent in parents:
+        parent.start()
+    for parent in parents:
+        parent.join(timeout=5)
+
+    assert not any(parent.is_alive() for parent in parents)
+    assert peak == 2
+    assert slots.peak == 2
+    assert slots.running == 0
+
+
+def test_child_agents_share_client_schemas_and_slots(monkeypatch, tmp_path):
+    settings = Settings(
+        api_key="test-key",
+        api_base_url="https://api.synthetic.new/openai/v1",
+        parallel_workers=3,
+    )
+    profile = AgentProfile(
+        context="parent",
+        base_dir=Path(tmp_path),
+        tools=["read_file", "list_files"],
+        subagents={},
+        name="main",
+    )
+    parent = RecursiveAgent(settings=settings, profile=profile)
+    children: list[RecursiveAgent] = []
+    monkeypatch.setattr(RecursiveAgent, "run", lambda self, task: children.append(self) or "done")
+
+    for task in ("one", "two"):
+        assert parent._spawn_dynamic(task, "context") == "[sub-agent]: done"
+
+    assert len(children) == 2
+    assert all(child.client is parent.client for child in children)
+    assert all(child.tool_schemas is parent.tool_schemas for child in children)
+    assert all(child._spawn_slots is parent._tree_spawn_slots() for child in children)
+    assert parent._tree_spawn_slots().limit == 3
+
+
+def test_early_return_stops_and_waits_for_running_spawns(tmp_path):
+    (tmp_path / ".index").mkdir()
+    (tmp_path / ".index" / "index.db").write_bytes(b"")
+    agent = _agent()
+    agent.context = AgentContext(
+        agent_id="main",
+        current_depth=0,
+        max_depth=3,
+        base_dir=tmp_path,
+        available_tools=["search_chunks", "spawn_agent"],
+    )
+    agent.messages = []
+    agent.max_context_tokens = 100_000
+    agent.profile = SimpleNamespace(compact_threshold=0.9)
+    agent.log = lambda _msg: None
+    agent.MAX_MENTION_GROUNDING_REMINDERS = 0
+    agent._call_llm = lambda _messages: SimpleNamespace(
+        content=None,
+        tool_calls=[
+            SimpleNamespace(
+                id="call-0",
+                type="function",
+                function=SimpleNamespace(name="spawn_agent", arguments='{"task": "dig"}'),
+            )
+        ],
+    )
+    agent._execute_tool = lambda _name, _args: '__SPAWN_AGENT__:{"task": "dig", "context": ""}'
+    started = threading.Event()
+    llm_calls: list[int] = []
+
+    def _execute_single_spawn(spawn):
+        # Stand-in for a sub-agent that checks for cancellation between LLM calls.
+        started.set()
+        while not spawn["cancel"].is_set():
+            llm_calls.append(1)
+            time.sleep(0.01)
+        return "stopped"
+
+    agent._execute_single_spawn = _execute_single_spawn
+
+    result = agent.run("Summarize @paper.md")
+
+    assert result == agent._mention_grounding_error_message()
+    assert started.is_set()
+    calls_at_return = len(llm_calls)
+    time.sleep(0.05)
+    assert len(llm_calls) == calls_at_return
+    assert agent._inflight_spawns == []
+    assert agent._tree_spawn_slots().running == 0
+
+
+def test_cancelled_sub_agent_returns_before_next_llm_call():
+    agent = _agent()
+    agent.messages = []
+    agent.log = lambda _msg: None
+    agent._cancel_event = threading.Event()
+    agent._cancel_event.set()
+    agent._call_llm = lambda _messages: pytest.fail("cancelled agent called the LLM")
+
+    assert agent.run("task") == RecursiveAgent.CANCELLED_MESSAGE
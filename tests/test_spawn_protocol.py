@@ -79,7 +79,7 @@ def test_spawn_dynamic_inherits_parent_permissions(monkeypatch, tmp_path):
     captured: dict[str, AgentProfile] = {}
 
     class FakeChildAgent:
-        def __init__(self, settings, profile, agent_id, depth, parent_id):
+        def __init__(self, settings, profile, agent_id, depth, parent_id, **_shared):
             captured["profile"] = profile
 
         def run(self, user_message: str) -> str:
@@ -127,7 +127,7 @@ def test_spawn_dynamic_assigns_consistent_id_and_profile_name_under_concurrency(
     captured_lock = threading.Lock()
 
     class FakeChildAgent:
-        def __init__(self, settings, profile, agent_id, depth, parent_id):
+        def __init__(self, settings, profile, agent_id, depth, parent_id, **_shared):
             with captured_lock:
                 captured.append((agent_id, profile.name or ""))
 
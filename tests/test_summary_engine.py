@@ -0,0 +1,162 @@
+"""Tests for concurrent, rate-limited batch summarization."""
+
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from flavia.content import summarizer
+from flavia.content.catalog import ContentCatalog
+from flavia.content.summary_engine import SummarizationEngine, TokenBucket
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _catalog_with(tmp_path: Path, names: list[str]) -> ContentCatalog:
+    for name in names:
+        (tmp_path / name).write_text(f"content of {name}", encoding="utf-8")
+    catalog = ContentCatalog(tmp_path)
+    catalog.build()
+    return catalog
+
+
+def _engine(tmp_path: Path, **kwargs) -> SummarizationEngine:
+    return SummarizationEngine(
+        tmp_path, api_key="key", api_base_url="https://example.invalid/v1", model="m", **kwargs
+    )
+
+
+# ---------------------------------------------------------------------------
+# TokenBucket
+# ---------------------------------------------------------------------------
+
+
+def test_token_bucket_waits_for_refill():
+    clock = _FakeClock()
+    bucket = TokenBucket(60, capacity=2, clock=clock, sleep=clock.sleep)
+
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 1.0
+    assert clock.sleeps == [1.0]
+
+
+def test_token_bucket_pause_blocks_until_deadline():
+    clock = _FakeClock()
+    bucket = TokenBucket(600, clock=clock, sleep=clock.sleep)
+
+    bucket.pause(5.0)
+    waited = bucket.acquire()
+
+    assert waited >= 5.0
+    assert clock.now >= 5.0
+
+
+def test_token_bucket_clamps_oversized_requests():
+    clock = _FakeClock()
+    bucket = TokenBucket(60, capacity=10, clock=clock, sleep=clock.sleep)
+
+    assert bucket.acquire(50) == 0.0
+
+
+# ---------------------------------------------------------------------------
+# SummarizationEngine
+# ---------------------------------------------------------------------------
+
+
+def test_run_summarizes_concurrently_with_shared_client(monkeypatch, tmp_path):
+    names = [f"doc{i}.md" for i in range(6)] + ["empty.md"]
+    catalog = _catalog_with(tmp_path, names)
+    shared_client = object()
+    monkeypatch.setattr(summarizer, "create_llm_client", lambda *args, **kwargs: shared_client)
+
+    clients = []
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def _fake_summarize(entry, base_dir, **kwargs):
+        nonlocal active, peak
+        with lock:
+            clients.append(kwargs["client"])
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        if entry.path == "empty.md":
+            return None, None
+        return f"summary of {entry.path}", "good"
+
+    monkeypatch.setattr(summarizer, "summarize_file_with_quality", _fake_summarize)
+
+    checkpoints = []
+    results = []
+    engine = _engine(tmp_path, concurrency=3)
+    stats = engine.run(
+        catalog.get_files_needing_summary(),
+        on_result=results.append,
+        checkpoint=lambda: checkpoints.append(True),
+    )
+
+    assert stats["summarized"] == 6
+    assert stats["failed"] == 1
+    assert stats["files_per_minute"] > 0
+    assert peak == 3
+    assert all(client is shared_client for client in clients)
+    assert catalog.files["doc0.md"].summary == "summary of doc0.md"
+    assert catalog.files["doc0.md"].extraction_quality == "good"
+    assert catalog.files["empty.md"].summary is None
+    assert len(results) == 7
+    assert checkpoints == [True]
+
+
+def test_rate_limited_request_is_retried(monkeypatch, tmp_path):
+    catalog = _catalog_with(tmp_path, ["notes.md"])
+    monkeypatch.setattr(summarizer, "create_llm_client", lambda *args, **kwargs: None)
+    calls = []
+
+    def _fake_summarize(entry, base_dir, **kwargs):
+        calls.append(entry.path)
+        if len(calls) == 1:
+            summarizer._set_last_llm_call_info(status="Rate limited", api_status=429)
+            return None, None
+        return "summary", None
+
+    monkeypatch.setattr(summarizer, "summarize_file_with_quality", _fake_summarize)
+
+    engine = _engine(tmp_path, requests_per_minute=6000, rate_limit_backoff=0.01)
+    stats = engine.run(catalog.get_files_needing_summary())
+
+    assert calls == ["notes.md", "notes.md"]
+    assert stats["summarized"] == 1
+    assert stats["rate_limited"] == 1
+
+
+def test_from_provider_reads_rate_limits(tmp_path):
+    provider = SimpleNamespace(
+        api_key="key",
+        api_base_url="https://example.invalid/v1",
+        headers={},
+        requests_per_minute=30,
+        tokens_per_minute=None,
+    )
+
+    engine = SummarizationEngine.from_provider(tmp_path, provider, "m", concurrency=2)
+
+    assert engine.concurrency == 2
+    assert engine.request_bucket is not None
+    assert engine.request_bucket.capacity == 30
+    assert engine.token_bucket is None
+    assert engine.headers is None
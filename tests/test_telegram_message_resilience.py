@@ -1,6 +1,7 @@
 """Resilience tests for Telegram message handling under network hiccups."""
 
 import asyncio
+import time
 from types import SimpleNamespace
 
 from flavia.config.settings import Settings
@@ -72,3 +73,35 @@ def test_handle_message_continues_when_typing_indicator_fails():
 
     assert update.message.replies
     assert "echo:ola" in update.message.replies[0]
+
+
+class _SlowAgent(_DummyAgent):
+    def __init__(self):
+        super().__init__()
+        self.calls: list[str] = []
+
+    def run(self, message: str) -> str:
+        self.calls.append(message)
+        time.sleep(0.05)
+        return f"echo:{message}"
+
+
+def test_messages_from_one_user_are_queued_and_answered_in_order():
+    bot = _make_bot()
+    agent = _SlowAgent()
+    bot._get_or_create_agent = lambda user_id: agent  # type: ignore[assignment]
+    first = _DummyUpdate(text="first")
+    second = _DummyUpdate(text="second")
+
+    async def _main():
+        await asyncio.gather(
+            bot._handle_message(first, context=None),
+            bot._handle_message(second, context=None),
+        )
+
+    asyncio.run(_main())
+
+    assert agent.calls == ["first", "second"]
+    assert "echo:first" in first.message.replies[0]
+    assert second.message.replies[0] == ("Busy right now, your message is queued at position 1.")
+    assert "echo:second" in second.message.replies[1]
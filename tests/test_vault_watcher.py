@@ -0,0 +1,230 @@
+"""Tests for the vault watcher (continuous catalog/index freshness)."""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from flavia.config import Settings
+from flavia.content.catalog import ContentCatalog
+from flavia.content.watcher import ChangeQueue, VaultWatcher
+
+
+def _build_catalog(base_dir: Path) -> Path:
+    config_dir = base_dir / ".flavia"
+    config_dir.mkdir()
+    catalog = ContentCatalog(base_dir)
+    catalog.build()
+    catalog.save(config_dir)
+    return config_dir
+
+
+class _FakeConverter:
+    calls: list[Path] = []
+
+    @staticmethod
+    def check_dependencies():
+        return True, []
+
+    @classmethod
+    def convert(cls, source_path: Path, output_dir: Path, output_format: str = "md"):
+        cls.calls.append(source_path)
+        output_file = output_dir / source_path.with_suffix(f".{output_format}").name
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        output_file.write_text("converted", encoding="utf-8")
+        return output_file
+
+
+# ---------------------------------------------------------------------------
+# ChangeQueue
+# ---------------------------------------------------------------------------
+
+
+def test_change_queue_waits_for_quiet_period():
+    queue = ChangeQueue(debounce=1.0)
+    queue.add(["a.txt"], now=0.0)
+    queue.add(["b.txt", "a.txt"], now=0.8)
+
+    assert queue.pop_ready(now=1.5) == []
+    assert queue.pop_ready(now=1.8) == ["a.txt", "b.txt"]
+    assert len(queue) == 0
+    assert queue.pop_ready(now=10.0) == []
+
+
+def test_change_queue_releases_overdue_batch():
+    queue = ChangeQueue(debounce=1.0, max_delay=3.0)
+    for tick in range(4):
+        queue.add([f"f{tick}.txt"], now=float(tick))
+
+    assert queue.pop_ready(now=3.0) == ["f0.txt", "f1.txt", "f2.txt", "f3.txt"]
+
+
+# ---------------------------------------------------------------------------
+# VaultWatcher
+# ---------------------------------------------------------------------------
+
+
+def test_first_poll_detects_changes_since_catalog_save(tmp_path):
+    (tmp_path / "kept.txt").write_text("kept")
+    (tmp_path / "gone.txt").write_text("gone")
+    _build_catalog(tmp_path)
+
+    (tmp_path / "gone.txt").unlink()
+    (tmp_path / "added.txt").write_text("added")
+
+    watcher = VaultWatcher(tmp_path, Settings())
+
+    assert watcher.poll() == ["added.txt", "gone.txt"]
+    assert watcher.poll() == []
+
+
+def test_poll_reports_modified_files(tmp_path):
+    (tmp_path / "notes.md").write_text("v1")
+    _build_catalog(tmp_path)
+    watcher = VaultWatcher(tmp_path, Settings())
+    watcher.poll()
+
+    time.sleep(0.05)
+    (tmp_path / "notes.md").write_text("version 2")
+    (tmp_path / ".converted").mkdir()
+    (tmp_path / ".converted" / "notes.md").write_text("ignored")
+
+    assert watcher.poll() == ["notes.md"]
+
+
+def test_process_updates_only_changed_entries(tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "b.txt").write_text("b")
+    config_dir = _build_catalog(tmp_path)
+
+    time.sleep(0.05)
+    (tmp_path / "a.txt").write_text("a changed")
+    (tmp_path / "b.txt").unlink()
+    (tmp_path / "c.txt").write_text("c")
+
+    watcher = VaultWatcher(tmp_path, Settings(), convert=False, index=False)
+    summary = watcher.process(["a.txt", "b.txt", "c.txt"])
+
+    assert summary["new"] == 1
+    assert summary["modified"] == 1
+    assert summary["missing"] == 1
+
+    catalog = ContentCatalog.load(config_dir)
+    assert sorted(catalog.files) == ["a.txt", "c.txt"]
+    assert {entry.status for entry in catalog.files.values()} == {"current"}
+
+
+def test_process_converts_and_indexes_changed_files(monkeypatch, tmp_path):
+    (tmp_path / "old.pdf").write_bytes(b"%PDF-1.4 old")
+    _build_catalog(tmp_path)
+    (tmp_path / ".index").mkdir()
+    (tmp_path / ".index" / "index.db").write_bytes(b"")
+    (tmp_path / "new.pdf").write_bytes(b"%PDF-1.4 new")
+
+    _FakeConverter.calls = []
+    monkeypatch.setattr(
+        "flavia.content.converters.converter_registry.get_for_file",
+        lambda _path: _FakeConverter(),
+    )
+    indexed: list[list[str]] = []
+
+    def _fake_index(catalog, base_dir, settings, console, start_time=None):
+        indexed.append(sorted(e.path for e in catalog.get_modified_files()))
+        catalog.mark_all_current()
+        return {"documents_processed": len(indexed[-1])}
+
+    monkeypatch.setattr(
+        "flavia.content.indexer.index_manager.index_catalog_changes", _fake_index
+    )
+
+    watcher = VaultWatcher(tmp_path, Settings(), debounce=0.0)
+    summary = watcher.run_once()
+
+    # old.pdf was never converted, but only the changed file is processed.
+    assert _FakeConverter.calls == [tmp_path / "new.pdf"]
+    assert indexed == [["new.pdf"]]
+    assert summary["converted"] == 1
+    assert summary["indexed"] == 1
+    assert watcher.run_once() is None
+
+
+def test_failed_batch_is_retried(monkeypatch, tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+    config_dir = _build_catalog(tmp_path)
+    (tmp_path / "b.txt").write_text("b")
+
+    watcher = VaultWatcher(tmp_path, Settings(), debounce=0.0, index=False)
+    process = watcher.process
+    attempts: list[list[str]] = []
+
+    def _flaky_process(paths):
+        attempts.append(paths)
+        if len(attempts) == 1:
+            raise RuntimeError("transient")
+        return process(paths)
+
+    monkeypatch.setattr(watcher, "process", _flaky_process)
+
+    with pytest.raises(RuntimeError, match="transient"):
+        watcher.run_once()
+    summary = watcher.run_once()
+
+    assert attempts == [["b.txt"], ["b.txt"]]
+    assert summary["new"] == 1
+    assert "b.txt" in ContentCatalog.load(config_dir).files
+
+
+def test_start_and_stop_background_thread(tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+    config_dir = _build_catalog(tmp_path)
+    watcher = VaultWatcher(tmp_path, Settings(), interval=0.05, debounce=0.0, index=False)
+
+    watcher.start()
+    try:
+        (tmp_path / "b.txt").write_text("b")
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            if "b.txt" in ContentCatalog.load(config_dir).files:
+                break
+            time.sleep(0.05)
+    finally:
+        watcher.stop(timeout=5)
+
+    assert "b.txt" in ContentCatalog.load(config_dir).files
+    assert watcher.batches_processed >= 1
+
+
+def test_update_paths_decodes_only_the_changed_entries(tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "b.txt").write_text("b")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "c.txt").write_text("c")
+    (tmp_path / "sub" / "d.txt").write_text("d")
+    config_dir = _build_catalog(tmp_path)
+    ContentCatalog.convert_storage(config_dir, "sqlite")
+
+    time.sleep(0.05)
+    (tmp_path / "a.txt").write_text("a changed")
+    for name in ("c.txt", "d.txt"):
+        (tmp_path / "sub" / name).unlink()
+    (tmp_path / "sub").rmdir()
+
+    catalog = ContentCatalog.load(config_dir)
+    result = catalog.update_paths(["a.txt", "sub"])
+
+    assert result["modified"] == ["a.txt"]
+    assert result["missing"] == ["sub/c.txt", "sub/d.txt"]
+    assert sorted(catalog.files.materialized_paths()) == ["a.txt", "sub/c.txt", "sub/d.txt"]
+
+
+def test_fs_events_queue_vault_paths_only(tmp_path):
+    (tmp_path / "notes.md").write_text("notes")
+    _build_catalog(tmp_path)
+    watcher = VaultWatcher(tmp_path, Settings(), debounce=0.0)
+
+    watcher.on_fs_event(str(tmp_path / "notes.md"))
+    watcher.on_fs_event(str(tmp_path / "old.md"), str(tmp_path / "new.md"))
+    watcher.on_fs_event(str(tmp_path / ".flavia" / "content_catalog.json"))
+    watcher.on_fs_event(str(tmp_path.parent / "elsewhere.md"))
+
+    assert watcher.queue.pop_ready() == ["new.md", "notes.md", "old.md"]
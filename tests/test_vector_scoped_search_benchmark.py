@@ -0,0 +1,98 @@
+"""Benchmark: scoped vs full-table kNN for doc_id-filtered vector search.
+
+Builds a synthetic vault and times ``VectorStore.knn_search`` with
+``doc_ids_filter`` of 1, 20 and 500 documents, forcing each strategy:
+
+- full:   vec0 kNN, then ``doc_id IN (...)`` filter
+- scoped: score only the scoped chunks via the doc_id index
+
+The full strategy asks vec0 for min(vault size, VEC0_MAX_K) neighbours, so on
+vaults above VEC0_MAX_K (4096) it is approximate and rankings are only
+compared on smaller vaults. The output also reports which strategy the
+automatic choice (SCOPED_SEARCH_MAX_CHUNKS) takes for each scope.
+
+These tests are opt-in and skipped by default.
+
+Run with:
+  FLAVIA_BENCHMARK=1 pytest -q -s tests/test_vector_scoped_search_benchmark.py
+
+Optional env vars:
+  FLAVIA_BENCHMARK_DOCS (default: 200)
+  FLAVIA_BENCHMARK_CHUNKS_PER_DOC (default: 20)
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import time
+from importlib.util import find_spec
+from pathlib import Path
+
+import pytest
+
+from flavia.content.indexer.vector_store import (
+    SCOPED_SEARCH_MAX_CHUNKS,
+    VEC0_MAX_K,
+    VectorStore,
+)
+
+
+def _enabled() -> bool:
+    return os.getenv("FLAVIA_BENCHMARK", "").strip() == "1"
+
+
+pytestmark = [
+    pytest.mark.skipif(not _enabled(), reason="Set FLAVIA_BENCHMARK=1 to run benchmarks."),
+    pytest.mark.skipif(find_spec("sqlite_vec") is None, reason="sqlite-vec not installed"),
+]
+
+REPEATS = 5
+
+
+def _unit_vector(rng: random.Random) -> list[float]:
+    vec = [rng.gauss(0.0, 1.0) for _ in range(768)]
+    norm = sum(x * x for x in vec) ** 0.5
+    return [x / norm for x in vec]
+
+
+def _time_search(store: VectorStore, query: list[float], doc_ids: list[str], scoped: bool) -> float:
+    started = time.perf_counter()
+    for _ in range(REPEATS):
+        store.knn_search(query, k=15, doc_ids_filter=doc_ids, scoped_search=scoped)
+    return (time.perf_counter() - started) / REPEATS
+
+
+def test_scoped_vs_full_knn_latency(tmp_path: Path):
+    docs = int(os.getenv("FLAVIA_BENCHMARK_DOCS", "200"))
+    per_doc = int(os.getenv("FLAVIA_BENCHMARK_CHUNKS_PER_DOC", "20"))
+    rng = random.Random(0)
+
+    with VectorStore(tmp_path) as store:
+        store.bulk_upsert(
+            [
+                (f"d{d}-c{c}", _unit_vector(rng), {"doc_id": f"d{d}", "modality": "text"})
+                for d in range(docs)
+                for c in range(per_doc)
+            ]
+        )
+        query = _unit_vector(rng)
+
+        total = docs * per_doc
+        print(f"\nVault: {docs} docs x {per_doc} chunks = {total} vectors")
+        for scope in (1, 20, 500):
+            doc_ids = [f"d{d}" for d in rng.sample(range(docs), min(scope, docs))]
+
+            if total <= VEC0_MAX_K:
+                full = store.knn_search(query, k=15, doc_ids_filter=doc_ids, scoped_search=False)
+                scoped = store.knn_search(query, k=15, doc_ids_filter=doc_ids, scoped_search=True)
+                assert [r["chunk_id"] for r in scoped] == [r["chunk_id"] for r in full]
+
+            full_s = _time_search(store, query, doc_ids, scoped=False)
+            scoped_s = _time_search(store, query, doc_ids, scoped=True)
+            auto = "scoped" if len(doc_ids) * per_doc <= SCOPED_SEARCH_MAX_CHUNKS else "full"
+            print(
+                f"scope={scope:>3} docs | full {full_s * 1000:8.1f} ms | "
+                f"scoped {scoped_s * 1000:8.1f} ms | speedup x{full_s / scoped_s:.1f} | "
+                f"auto={auto}"
+            )
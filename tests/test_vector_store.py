@@ -5,7 +5,8 @@ from pathlib import Path
 
 import pytest
 
-from flavia.content.indexer.vector_store import VectorStore
+from flavia.content.indexer import vector_store
+from flavia.content.indexer.vector_store import VEC0_MAX_K, VectorStore
 
 SQLITE_VEC_AVAILABLE = find_spec("sqlite_vec") is not None
 
@@ -144,6 +145,56 @@ class TestUpsert:
             assert updated2 == 2
 
 
+class TestBulkUpsert:
+    """Tests for VectorStore.bulk_upsert method."""
+
+    def test_mixed_batch_reports_inserts_and_updates(self, tmp_path: Path):
+        """One batch with new and existing chunks should split counts correctly."""
+        with VectorStore(tmp_path) as store:
+            store.bulk_upsert(
+                [
+                    ("c1", [0.1] * 768, {"doc_id": "d1", "modality": "text"}),
+                    ("c2", [0.2] * 768, {"doc_id": "d1", "modality": "text"}),
+                ]
+            )
+
+            inserted, updated = store.bulk_upsert(
+                [
+                    ("c2", [0.3] * 768, {"doc_id": "d1", "modality": "text_v2"}),
+                    ("c3", [0.4] * 768, {"doc_id": "d2", "modality": "text"}),
+                ]
+            )
+
+            assert inserted == 1
+            assert updated == 1
+            assert store.get_existing_chunk_ids() == {"c1", "c2", "c3"}
+            conn = store._get_connection()
+            row = conn.execute("SELECT modality FROM chunks_meta WHERE chunk_id = 'c2'").fetchone()
+            assert row["modality"] == "text_v2"
+            assert conn.execute("SELECT COUNT(*) FROM chunks_vec").fetchone()[0] == 3
+
+    def test_repeated_chunk_id_in_same_batch_keeps_last_version(self, tmp_path: Path):
+        """Repeated chunk IDs in one batch should count as updates, last one wins."""
+        with VectorStore(tmp_path) as store:
+            inserted, updated = store.bulk_upsert(
+                [
+                    ("c1", [0.1] * 768, {"doc_id": "d1", "modality": "first"}),
+                    ("c1", [0.2] * 768, {"doc_id": "d1", "modality": "second"}),
+                ]
+            )
+
+            assert inserted == 1
+            assert updated == 1
+            conn = store._get_connection()
+            row = conn.execute("SELECT modality FROM chunks_meta WHERE chunk_id = 'c1'").fetchone()
+            assert row["modality"] == "second"
+
+    def test_empty_batch_is_noop(self, tmp_path: Path):
+        """An empty batch should return zero counts."""
+        with VectorStore(tmp_path) as store:
+            assert store.bulk_upsert([]) == (0, 0)
+
+
 class TestKnnSearch:
     """Tests for VectorStore.knn_search method."""
 
@@ -204,6 +255,79 @@ class TestKnnSearch:
             assert results[0]["chunk_id"] == "far_filtered"
             assert results[0]["doc_id"] == "doc_filtered"
 
+    @pytest.mark.parametrize("scoped_search", [None, True, False])
+    def test_scoped_and_full_paths_agree(self, tmp_path: Path, scoped_search):
+        """Scoped scoring and full kNN should return the same ranking and distances."""
+        with VectorStore(tmp_path) as store:
+            items = []
+            for i in range(30):
+                vec = [0.0] * 768
+                vec[i % 7] = 1.0
+                vec[7] = i / 30
+                items.append((f"c{i}", vec, {"doc_id": f"doc_{i % 6}", "modality": "text"}))
+            store.upsert(items)
+
+            query_vec = [1.0] + [0.0] * 767
+            baseline = store.knn_search(query_vec, k=4, doc_ids_filter=["doc_1", "doc_4"])
+            results = store.knn_search(
+                query_vec, k=4, doc_ids_filter=["doc_1", "doc_4"], scoped_search=scoped_search
+            )
+
+            assert [r["chunk_id"] for r in results] == [r["chunk_id"] for r in baseline]
+            for got, expected in zip(results, baseline):
+                assert got["distance"] == pytest.approx(expected["distance"], abs=1e-5)
+                assert got["doc_id"] in {"doc_1", "doc_4"}
+
+    def test_wide_scope_uses_vec0_with_same_ranking(self, tmp_path: Path, monkeypatch):
+        """Scopes above the scoped-chunk cap go through vec0 and rank the same."""
+        monkeypatch.setattr(vector_store, "SCOPED_SEARCH_MAX_CHUNKS", 2)
+        with VectorStore(tmp_path) as store:
+            items = []
+            for i in range(30):
+                vec = [0.0] * 768
+                vec[i % 7] = 1.0
+                vec[7] = i / 30
+                items.append((f"c{i}", vec, {"doc_id": f"doc_{i % 6}", "modality": "text"}))
+            store.upsert(items)
+
+            query_vec = [1.0] + [0.0] * 767
+            scope = ["doc_1", "doc_4"]
+            auto = store.knn_search(query_vec, k=4, doc_ids_filter=scope)
+            scoped = store.knn_search(query_vec, k=4, doc_ids_filter=scope, scoped_search=True)
+
+            assert [r["chunk_id"] for r in auto] == [r["chunk_id"] for r in scoped]
+
+    def test_search_past_vec0_k_limit(self, tmp_path: Path):
+        """Stores larger than the vec0 k limit should over-fetch for wide scopes and cap k."""
+        with VectorStore(tmp_path) as store:
+            items = []
+            for i in range(VEC0_MAX_K + 200):
+                vec = [0.0] * 768
+                vec[i % 5] = 1.0
+                vec[5] = i / (VEC0_MAX_K + 200)
+                items.append((f"c{i}", vec, {"doc_id": f"doc_{i % 4}", "modality": "text"}))
+            store.bulk_upsert(items)
+
+            query_vec = [1.0] + [0.0] * 767
+            scope = ["doc_0", "doc_1", "doc_2"]
+            forced_full = store.knn_search(
+                query_vec, k=5, doc_ids_filter=scope, scoped_search=False
+            )
+            scoped = store.knn_search(query_vec, k=5, doc_ids_filter=scope, scoped_search=True)
+            unscoped = store.knn_search(query_vec, k=VEC0_MAX_K + 100)
+
+            assert [r["chunk_id"] for r in forced_full] == [r["chunk_id"] for r in scoped]
+            assert len(forced_full) == 5
+            assert len(unscoped) == VEC0_MAX_K
+
+    def test_scoped_search_with_unknown_doc_returns_empty(self, tmp_path: Path):
+        """A scope with no indexed chunks should return no results."""
+        with VectorStore(tmp_path) as store:
+            store.upsert([("c1", [1.0] + [0.0] * 767, {"doc_id": "doc_a", "modality": "text"})])
+
+            query_vec = [1.0] + [0.0] * 767
+            assert store.knn_search(query_vec, k=5, doc_ids_filter=["doc_missing"]) == []
+
     def test_empty_doc_ids_filter_returns_empty(self, tmp_path: Path):
         """Explicit empty doc_ids_filter should return no results."""
         with VectorStore(tmp_path) as store:
@@ -249,6 +373,39 @@ class TestKnnSearch:
             assert "distance" in result
 
 
+class TestKnnSearchPerDoc:
+    """Tests for VectorStore.knn_search_per_doc method."""
+
+    def test_returns_nearest_chunks_for_each_doc(self, tmp_path: Path):
+        """Each requested document should get its own k nearest chunks."""
+        with VectorStore(tmp_path) as store:
+            store.upsert([
+                ("a1", [1.0] + [0.0] * 767, {"doc_id": "doc_a", "modality": "text"}),
+                ("a2", [0.0, 1.0] + [0.0] * 766, {"doc_id": "doc_a", "modality": "text"}),
+                ("a3", [0.0, 0.0, 1.0] + [0.0] * 765, {"doc_id": "doc_a", "modality": "text"}),
+                ("b1", [0.0, 1.0] + [0.0] * 766, {"doc_id": "doc_b", "modality": "text"}),
+                ("c1", [1.0] + [0.0] * 767, {"doc_id": "doc_c", "modality": "text"}),
+            ])
+
+            query_vec = [0.9, 0.1] + [0.0] * 766
+            grouped = store.knn_search_per_doc(query_vec, ["doc_a", "doc_b"], k_per_doc=2)
+
+            assert set(grouped) == {"doc_a", "doc_b"}
+            assert [r["chunk_id"] for r in grouped["doc_a"]] == ["a1", "a2"]
+            assert [r["chunk_id"] for r in grouped["doc_b"]] == ["b1"]
+            assert grouped["doc_a"][0]["distance"] <= grouped["doc_a"][1]["distance"]
+
+    def test_empty_inputs_return_empty(self, tmp_path: Path):
+        """Empty scopes, unknown docs and non-positive k should return {}."""
+        with VectorStore(tmp_path) as store:
+            store.upsert([("c1", [1.0] + [0.0] * 767, {"doc_id": "doc_a", "modality": "text"})])
+
+            query_vec = [1.0] + [0.0] * 767
+            assert store.knn_search_per_doc(query_vec, []) == {}
+            assert store.knn_search_per_doc(query_vec, ["doc_a"], k_per_doc=0) == {}
+            assert store.knn_search_per_doc(query_vec, ["doc_missing"]) == {}
+
+
 class TestGetExistingChunkIds:
     """Tests for VectorStore.get_existing_chunk_ids method."""
 
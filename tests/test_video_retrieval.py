@@ -4,6 +4,8 @@ import hashlib
 from pathlib import Path
 from unittest.mock import Mock
 
+from flavia.content.catalog import ContentCatalog
+from flavia.content.indexer.fts import FTSIndex
 from flavia.content.indexer.video_retrieval import (
     _format_evidence_bundle,
     _get_all_frames_for_doc,
@@ -228,13 +230,12 @@ def test_get_all_frames_for_doc_matches_hashed_doc_id(tmp_path: Path, monkeypatc
         ],
     )
 
-    class _CatalogStub:
-        def __init__(self, e):
-            self.files = {e.path: e}
+    catalog = ContentCatalog(tmp_path)
+    catalog.files = {entry.path: entry}
 
     monkeypatch.setattr(
-        "flavia.content.indexer.video_retrieval.ContentCatalog.load",
-        lambda _: _CatalogStub(entry),
+        "flavia.content.indexer.video_retrieval.load_catalog_snapshot",
+        lambda _: catalog,
     )
 
     doc_id = hashlib.sha1(f"{tmp_path}:{entry.path}:{entry.checksum_sha256}".encode()).hexdigest()
@@ -312,10 +313,50 @@ def test_expand_temporal_window_includes_overlapping_transcript(monkeypatch):
         lambda doc_id, base_dir: [],
     )
 
-    bundle = expand_temporal_window(anchor_chunk, Path("/fake"), mock_vs, Mock())
+    mock_fts = Mock()
+    mock_fts.video_frames_recorded.return_value = False
+
+    bundle = expand_temporal_window(anchor_chunk, Path("/fake"), mock_vs, mock_fts)
     assert bundle is not None
     assert any(
         item["modality"] == "video_transcript"
         and "crossing the anchor window" in item["text"]
         for item in bundle
     )
+
+
+def test_expand_temporal_window_uses_indexed_frames(tmp_path: Path, monkeypatch):
+    """Recorded frames should be served from index.db without touching the catalog."""
+    anchor_chunk = {
+        "modality": "video_transcript",
+        "doc_id": "doc_1",
+        "locator": {"time_start": "00:01:00"},
+    }
+    mock_vs = Mock()
+    mock_vs.get_chunks_by_doc_id.return_value = []
+
+    def _fail_load(_config_dir):
+        raise AssertionError("catalog should not be loaded")
+
+    monkeypatch.setattr(
+        "flavia.content.indexer.video_retrieval.load_catalog_snapshot", _fail_load
+    )
+
+    with FTSIndex(tmp_path) as fts:
+        fts.replace_video_frames(
+            "doc_1",
+            [
+                {"time_seconds": 50.0, "path": "f1.md", "description": "Slide one."},
+                {"time_seconds": 70.0, "path": "f2.md", "description": "Slide two."},
+                {"time_seconds": 200.0, "path": "f3.md", "description": "Far away."},
+            ],
+        )
+        bundle = expand_temporal_window(anchor_chunk, tmp_path, mock_vs, fts)
+
+        assert [item["text"] for item in bundle] == ["Slide one.", "Slide two."]
+
+        # Nothing within the window: fall back to the nearest frame within 30s.
+        anchor_chunk["locator"] = {"time_start": "00:03:00"}
+        bundle = expand_temporal_window(anchor_chunk, tmp_path, mock_vs, fts)
+
+        assert [item["text"] for item in bundle] == ["Far away."]